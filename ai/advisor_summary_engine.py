@@ -11,10 +11,26 @@ This module creates four narrative "drawers" for advisor stakeholders:
 4. Financial Overview - Budget and funding timeline
 
 Target audience: Internal business and advisor stakeholders
+
+Context comes from st.session_state (build_advisor_context_from_session) or,
+for batch jobs such as tools/precompute_advisor_summaries.py, from a
+persisted user document (build_advisor_context_from_user).
+
+Performance:
+- generate_all_drawers() fans the four LLM calls out in parallel
+  (ai.llm_async.fan_out) under one overall deadline; a drawer that fails or
+  misses the deadline gets its static fallback. ADVISOR_SUMMARY_PARALLEL=off
+  restores the sequential loop.
+- Narratives are cached in the shared prompt cache (ai.llm_cache, namespace
+  "advisor_drawer") keyed by a hash of the drawer template and the context,
+  so the CRM and the advisor prep page reuse unchanged drawers across
+  sessions. Fallbacks are never cached.
 """
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+import os
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
 
 try:
     import streamlit as st
@@ -30,7 +46,7 @@ except ImportError:
     st = MockStreamlit()
 
 try:
-    from ai.llm_client import LLMClient
+    from ai.llm_client import DEFAULT_MODEL, DEFAULT_TEMPERATURE, LLMClient
     LLM_CLIENT_AVAILABLE = True
 except ImportError:
     LLM_CLIENT_AVAILABLE = False
@@ -39,16 +55,98 @@ except ImportError:
         def generate_completion(self, prompt, max_tokens=200, temperature=0.7):
             return "Mock LLM response for testing purposes."
     LLMClient = MockLLMClient
+    DEFAULT_MODEL, DEFAULT_TEMPERATURE = "mock", 0.0
 
 from ai.advisor_summary_templates import (
     ABOUT_PERSON_TEMPLATE,
-    HOUSING_PREFERENCES_TEMPLATE, 
-    MEDICAL_CARE_TEMPLATE,
     FINANCIAL_OVERVIEW_TEMPLATE,
-    AdvisorSummaryContext
+    HOUSING_PREFERENCES_TEMPLATE,
+    MEDICAL_CARE_TEMPLATE,
+    AdvisorSummaryContext,
 )
+from ai.llm_async import fan_out
+from ai.llm_cache import get_prompt_cache, prompt_cache_key
 from core.name_utils import first_name, possessive
 
+DRAWER_TYPES = ["about_person", "housing_preferences", "medical_care", "financial_overview"]
+
+# Overall time budget for generate_all_drawers() in parallel mode (seconds)
+DEFAULT_DRAWER_DEADLINE = float(os.getenv("ADVISOR_SUMMARY_DEADLINE", "15"))
+
+
+def user_document_state(user_doc: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Session-shaped view of a persisted user document.
+    
+    The document keeps MCIP contracts, profile, flags and Cost Planner
+    assessments rather than the session keys the context builder reads;
+    this derives those keys. Session-shaped keys already present in the
+    document take precedence.
+    """
+    state = dict(user_doc)
+    profile = user_doc.get("profile") or {}
+    contracts = user_doc.get("mcip_contracts") or {}
+    flags = user_doc.get("flags") or {}
+    
+    person_name = profile.get("person_name") or profile.get("name") or user_doc.get("person_name")
+    if person_name:
+        state.setdefault("person_a_name", person_name)
+    for key in ("person_a_age_range", "relationship_type"):
+        if profile.get(key):
+            state.setdefault(key, profile[key])
+    zip_code = profile.get("zip_code") or profile.get("zip")
+    if zip_code:
+        state.setdefault("geo_zip", zip_code)
+    
+    care_recommendation = contracts.get("care_recommendation")
+    if isinstance(care_recommendation, dict) and care_recommendation.get("tier"):
+        state.setdefault("care_recommendation", care_recommendation)
+        if care_recommendation.get("allowed_tiers"):
+            state.setdefault("gcp_results", {"allowed_tiers": care_recommendation["allowed_tiers"]})
+    
+    state.setdefault("flag_manager_flags", {name: value for name, value in flags.items() if value is True})
+    qualifiers = profile.get("qualifiers") or {}
+    if flags.get("is_veteran") or qualifiers.get("is_veteran"):
+        state.setdefault("va_benefits_eligible", True)
+    
+    # Cost Planner v2 assessments (top-level keys, or the demo tile layout)
+    assessments = ((user_doc.get("tiles") or {}).get("cost_planner_v2") or {}).get("assessments") or {}
+    income = user_doc.get("cost_planner_v2_income") or assessments.get("income") or {}
+    assets = user_doc.get("cost_planner_v2_assets") or assessments.get("assets") or {}
+    financial_profile = contracts.get("financial_profile") or {}
+    if income or assets or financial_profile:
+        state.setdefault("financial_assessment_complete", {
+            "cost_summary": {"monthly_total": float(financial_profile.get("estimated_monthly_cost") or 0.0)},
+            "household_income": float(income.get("total_monthly_income") or 0.0),
+            "total_assets": float(assets.get("total_asset_value") or 0.0),
+            "income_breakdown": {
+                "social_security": income.get("ss_monthly", 0.0),
+                "pension": income.get("pension_monthly", 0.0),
+                "employment": income.get("employment_income", 0.0),
+            },
+            "asset_breakdown": {
+                "checking": assets.get("checking_balance", 0.0),
+                "savings": assets.get("savings_cds_balance", 0.0),
+                "traditional_ira_balance": assets.get("retirement_traditional", 0.0),
+                "roth_ira_balance": assets.get("retirement_roth", 0.0),
+                "primary_residence": assets.get("home_equity_estimate", 0.0),
+            },
+            "debt_breakdown": {
+                "mortgage": assets.get("primary_residence_mortgage", 0.0),
+                "auto_loans": assets.get("secured_loans", 0.0),
+                "other_debt": assets.get("unsecured_debt", 0.0),
+            },
+        })
+    return state
+
+
+def parallel_drawers_enabled() -> bool:
+    """Whether generate_all_drawers() fans out (ADVISOR_SUMMARY_PARALLEL, default on)."""
+    # Lazy: keeps streamlit (via core.flags) out of headless importers
+    from core.flags import get_flag_value
+
+    return get_flag_value("ADVISOR_SUMMARY_PARALLEL").strip().lower() not in ("off", "0", "false")
+
 
 class AdvisorSummaryEngine:
     """LLM engine for generating advisor summary narratives."""
@@ -80,36 +178,63 @@ class AdvisorSummaryEngine:
         return personalized_template
     
     @staticmethod
-    def build_advisor_context_from_session() -> Optional[AdvisorSummaryContext]:
+    def build_advisor_context_from_session() -> AdvisorSummaryContext | None:
         """
         Build AdvisorSummaryContext from current Streamlit session state.
         
+        Returns:
+            AdvisorSummaryContext object or None if insufficient data
+        """
+        return AdvisorSummaryEngine.build_advisor_context(st.session_state)
+    
+    @staticmethod
+    def build_advisor_context_from_user(user_doc: Mapping[str, Any]) -> AdvisorSummaryContext | None:
+        """
+        Build AdvisorSummaryContext from a persisted user document
+        (data/users/<uid>.json), without a Streamlit session.
+        
+        Args:
+            user_doc: User document as saved by core.session_store.save_user
+            
+        Returns:
+            AdvisorSummaryContext object or None if insufficient data
+        """
+        return AdvisorSummaryEngine.build_advisor_context(user_document_state(user_doc))
+    
+    @staticmethod
+    def build_advisor_context(state: Mapping[str, Any]) -> AdvisorSummaryContext | None:
+        """
+        Build AdvisorSummaryContext from session-shaped state.
+        
+        Args:
+            state: st.session_state, or user_document_state() of a user document
+            
         Returns:
             AdvisorSummaryContext object or None if insufficient data
         """
         try:
             # Get profile context
-            person_a_name = st.session_state.get("person_a_name", "the care recipient")
-            person_a_age_range = st.session_state.get("person_a_age_range", "their eighties")
-            relationship_type = st.session_state.get("relationship_type", "family member")
-            geo_zip = st.session_state.get("geo_zip", "their local area")
+            person_a_name = state.get("person_a_name", "the care recipient")
+            person_a_age_range = state.get("person_a_age_range", "their eighties")
+            relationship_type = state.get("relationship_type", "family member")
+            geo_zip = state.get("geo_zip", "their local area")
             
             # Support and access flags
-            support_network_low = st.session_state.get("support_network_low", False)
-            low_access = st.session_state.get("low_access", False) 
-            home_carry = st.session_state.get("home_carry", True)
-            dual_household = st.session_state.get("dual_household", False)
+            support_network_low = state.get("support_network_low", False)
+            low_access = state.get("low_access", False) 
+            home_carry = state.get("home_carry", True)
+            dual_household = state.get("dual_household", False)
             
             # GCP data
-            care_recommendation = st.session_state.get("care_recommendation", {})
+            care_recommendation = state.get("care_recommendation", {})
             recommended_tier = care_recommendation.get("tier", "assisted_living")
             
             # Get allowed tiers from GCP results
-            gcp_results = st.session_state.get("gcp_results", {})
+            gcp_results = state.get("gcp_results", {})
             allowed_tiers = gcp_results.get("allowed_tiers", [recommended_tier])
             
-            move_timeline = st.session_state.get("move_timeline", "flexible")
-            room_type = st.session_state.get("room_type", "one_bedroom")
+            move_timeline = state.get("move_timeline", "flexible")
+            room_type = state.get("room_type", "one_bedroom")
             
             # Care flags from various sources
             care_flags = []
@@ -121,7 +246,7 @@ class AdvisorSummaryEngine:
                     care_flags.extend(tier_flags)
             
             # Add flags from session state flag manager
-            flag_manager_flags = st.session_state.get("flag_manager_flags", {})
+            flag_manager_flags = state.get("flag_manager_flags", {})
             for flag_name, flag_value in flag_manager_flags.items():
                 if flag_value and flag_name not in care_flags:
                     care_flags.append(flag_name)
@@ -136,11 +261,11 @@ class AdvisorSummaryEngine:
             ]
             
             for flag in common_flags:
-                if st.session_state.get(flag, False) and flag not in care_flags:
+                if state.get(flag, False) and flag not in care_flags:
                     care_flags.append(flag)
             
             # Cost Planner data with detailed breakdown
-            financial_data = st.session_state.get("financial_assessment_complete", {})
+            financial_data = state.get("financial_assessment_complete", {})
             cost_data = financial_data.get("cost_summary", {})
             
             # Extract detailed income breakdown
@@ -202,14 +327,14 @@ class AdvisorSummaryEngine:
                 years_funded = total_assets / (monthly_cost * 12)
             
             # Benefits and asset flags
-            va_benefits_eligible = st.session_state.get("va_benefits_eligible", False)
-            assets_low = st.session_state.get("assets_low", False)
-            assets_high = st.session_state.get("assets_high", False) 
-            benefits_present = st.session_state.get("benefits_present", False)
-            rx_costs_high = st.session_state.get("rx_costs_high", False)
-            transportation_needed = st.session_state.get("transportation_needed", False)
-            auto_present = st.session_state.get("auto_present", True)
-            family_travel_needed = st.session_state.get("family_travel_needed", False)
+            va_benefits_eligible = state.get("va_benefits_eligible", False)
+            assets_low = state.get("assets_low", False)
+            assets_high = state.get("assets_high", False) 
+            benefits_present = state.get("benefits_present", False)
+            rx_costs_high = state.get("rx_costs_high", False)
+            transportation_needed = state.get("transportation_needed", False)
+            auto_present = state.get("auto_present", True)
+            family_travel_needed = state.get("family_travel_needed", False)
             
             return AdvisorSummaryContext(
                 # Profile Context
@@ -293,57 +418,52 @@ class AdvisorSummaryEngine:
             return None
     
     @staticmethod
-    def generate_drawer_narrative(
-        drawer_type: str, 
+    def _drawer_request(
+        drawer_type: str,
         context: AdvisorSummaryContext
-    ) -> Optional[str]:
+    ) -> tuple[str, str, str] | None:
         """
-        Generate a single drawer narrative using LLM.
-        
-        Args:
-            drawer_type: One of 'about_person', 'housing_preferences', 
-                        'medical_care', 'financial_overview'
-            context: AdvisorSummaryContext with structured data
-            
+        Build the LLM request for one drawer.
+
         Returns:
-            Generated narrative paragraph or None if generation fails
+            (system_prompt, user_prompt, prompt cache key), or None for an
+            unknown drawer type
         """
-        try:
-            # Get appropriate template
-            templates = {
-                "about_person": ABOUT_PERSON_TEMPLATE,
-                "housing_preferences": HOUSING_PREFERENCES_TEMPLATE,
-                "medical_care": MEDICAL_CARE_TEMPLATE, 
-                "financial_overview": FINANCIAL_OVERVIEW_TEMPLATE
-            }
-            
-            template = templates.get(drawer_type)
-            if not template:
-                print(f"[ADVISOR_SUMMARY] Unknown drawer type: {drawer_type}")
-                return None
-            
-            # Personalize the template with name context
-            personalized_template = AdvisorSummaryEngine._personalize_template(
-                template, context.person_a_name
-            )
-            
-            # Build context variables for template substitution
-            context_vars = asdict(context)
-            
-            # Format care flags as readable list
-            if context_vars["care_flags"]:
-                context_vars["care_flags"] = ", ".join(context_vars["care_flags"])
-            else:
-                context_vars["care_flags"] = "none identified"
-            
-            # Format monetary values
-            context_vars["monthly_cost"] = f"{context_vars['monthly_cost']:,.0f}"
-            context_vars["household_income"] = f"{context_vars['household_income']:,.0f}"
-            context_vars["total_assets"] = f"{context_vars['total_assets']:,.0f}"
-            context_vars["years_funded"] = f"{context_vars['years_funded']:.1f}"
-            
-            # Create system and user prompts for LLM API
-            system_prompt = f"""You are an expert geriatric care advisor generating comprehensive assessment reports for professional review. 
+        # Get appropriate template
+        templates = {
+            "about_person": ABOUT_PERSON_TEMPLATE,
+            "housing_preferences": HOUSING_PREFERENCES_TEMPLATE,
+            "medical_care": MEDICAL_CARE_TEMPLATE, 
+            "financial_overview": FINANCIAL_OVERVIEW_TEMPLATE
+        }
+
+        template = templates.get(drawer_type)
+        if not template:
+            print(f"[ADVISOR_SUMMARY] Unknown drawer type: {drawer_type}")
+            return None
+
+        # Personalize the template with name context
+        personalized_template = AdvisorSummaryEngine._personalize_template(
+            template, context.person_a_name
+        )
+
+        # Build context variables for template substitution
+        context_vars = asdict(context)
+
+        # Format care flags as readable list
+        if context_vars["care_flags"]:
+            context_vars["care_flags"] = ", ".join(context_vars["care_flags"])
+        else:
+            context_vars["care_flags"] = "none identified"
+
+        # Format monetary values
+        context_vars["monthly_cost"] = f"{context_vars['monthly_cost']:,.0f}"
+        context_vars["household_income"] = f"{context_vars['household_income']:,.0f}"
+        context_vars["total_assets"] = f"{context_vars['total_assets']:,.0f}"
+        context_vars["years_funded"] = f"{context_vars['years_funded']:.1f}"
+
+        # Create system and user prompts for LLM API
+        system_prompt = f"""You are an expert geriatric care advisor generating comprehensive assessment reports for professional review. 
 Generate natural-language paragraphs following template guidelines with warm, empathetic, factual tone suitable for internal advisor reports. 
 Focus on specific captured data rather than generic descriptions. Return only the paragraph text, no additional formatting or explanation.
 
@@ -353,8 +473,8 @@ PERSONALIZATION STYLE RULES:
 - Avoid generic "the client" or "this person" language
 - Example: "{first_name(context.person_a_name) if context.person_a_name != "the care recipient" else "The care recipient"} has Medicare coverage..." not "The client has Medicare coverage..."
 """
-            
-            user_prompt = f"""
+
+        user_prompt = f"""
 {personalized_template}
 
 Context Data:
@@ -362,7 +482,52 @@ Context Data:
 
 Generate a comprehensive assessment paragraph following the template guidelines above using the specific context data provided.
 """
-            
+
+        cache_key = prompt_cache_key(
+            "advisor_drawer", DEFAULT_MODEL, DEFAULT_TEMPERATURE, system_prompt,
+            {"drawer": drawer_type, "template": personalized_template, "context": context_vars},
+        )
+        return system_prompt, user_prompt, cache_key
+
+    @staticmethod
+    def uncached_drawers(context: AdvisorSummaryContext) -> list[str]:
+        """Drawer types whose narrative for this context is not in the prompt cache."""
+        cache = get_prompt_cache()
+        missing = []
+        for drawer_type in DRAWER_TYPES:
+            request = AdvisorSummaryEngine._drawer_request(drawer_type, context)
+            if request and not cache.get(request[2]):
+                missing.append(drawer_type)
+        return missing
+
+    @staticmethod
+    def generate_drawer_narrative(
+        drawer_type: str, 
+        context: AdvisorSummaryContext
+    ) -> str | None:
+        """
+        Generate a single drawer narrative using LLM.
+
+        Args:
+            drawer_type: One of 'about_person', 'housing_preferences', 
+                        'medical_care', 'financial_overview'
+            context: AdvisorSummaryContext with structured data
+
+        Returns:
+            Generated narrative paragraph or None if generation fails
+        """
+        try:
+            request = AdvisorSummaryEngine._drawer_request(drawer_type, context)
+            if request is None:
+                return None
+            system_prompt, user_prompt, cache_key = request
+
+            # Unchanged drawers are served from the shared prompt cache
+            cache = get_prompt_cache()
+            cached = cache.get(cache_key)
+            if cached:
+                return cached
+
             # Generate using LLM
             client = LLMClient()
             response = client.generate_completion(
@@ -371,6 +536,7 @@ Generate a comprehensive assessment paragraph following the template guidelines
             )
             
             if response and response.strip():
+                cache.put(cache_key, response.strip())
                 return response.strip()
             else:
                 print(f"[ADVISOR_SUMMARY] Empty response for {drawer_type}")
@@ -381,12 +547,31 @@ Generate a comprehensive assessment paragraph following the template guidelines
             return None
     
     @staticmethod
-    def generate_all_drawers(context: Optional[AdvisorSummaryContext] = None) -> Dict[str, str]:
+    def fallback_narrative(drawer_type: str, context: AdvisorSummaryContext) -> str:
+        """Static narrative for a drawer whose generation failed."""
+        fallbacks = {
+            "about_person": f"This plan is for {context.person_a_name}, who is in their {context.person_a_age_range}.",
+            "housing_preferences": f"{context.person_a_name} is exploring {context.recommended_tier.replace('_', ' ')} options.",
+            "medical_care": f"{context.person_a_name}'s care needs are being assessed.",
+            "financial_overview": f"Financial planning is in progress for {context.person_a_name}."
+        }
+        return fallbacks[drawer_type]
+
+    @staticmethod
+    def generate_all_drawers(
+        context: AdvisorSummaryContext | None = None,
+        parallel: bool | None = None,
+        deadline: float | None = None,
+    ) -> dict[str, str]:
         """
         Generate all four advisor summary drawers.
         
         Args:
             context: Optional pre-built context, otherwise built from session
+            parallel: Run the four LLM calls concurrently (default:
+                      ADVISOR_SUMMARY_PARALLEL, on)
+            deadline: Overall time budget in seconds for parallel mode
+                      (default: ADVISOR_SUMMARY_DEADLINE, 15s)
             
         Returns:
             Dictionary with drawer names as keys and generated narratives as values
@@ -402,23 +587,33 @@ Generate a comprehensive assessment paragraph following the template guidelines
                 "financial_overview": "Financial information not available."
             }
         
-        results = {}
-        drawer_types = ["about_person", "housing_preferences", "medical_care", "financial_overview"]
+        if parallel is None:
+            parallel = parallel_drawers_enabled()
         
-        for drawer_type in drawer_types:
-            narrative = AdvisorSummaryEngine.generate_drawer_narrative(drawer_type, context)
-            
+        if parallel:
+            # Drawers that fail or miss the deadline come back as None
+            narratives = fan_out(
+                {
+                    drawer_type: (lambda d=drawer_type: AdvisorSummaryEngine.generate_drawer_narrative(d, context))
+                    for drawer_type in DRAWER_TYPES
+                },
+                timeout=DEFAULT_DRAWER_DEADLINE if deadline is None else deadline,
+                max_workers=len(DRAWER_TYPES),
+            )
+        else:
+            narratives = {
+                drawer_type: AdvisorSummaryEngine.generate_drawer_narrative(drawer_type, context)
+                for drawer_type in DRAWER_TYPES
+            }
+
+        results = {}
+        for drawer_type in DRAWER_TYPES:
+            narrative = narratives.get(drawer_type)
             if narrative:
                 results[drawer_type] = narrative
             else:
                 # Fallback messages
-                fallbacks = {
-                    "about_person": f"This plan is for {context.person_a_name}, who is in their {context.person_a_age_range}.",
-                    "housing_preferences": f"{context.person_a_name} is exploring {context.recommended_tier.replace('_', ' ')} options.",
-                    "medical_care": f"{context.person_a_name}'s care needs are being assessed.",
-                    "financial_overview": f"Financial planning is in progress for {context.person_a_name}."
-                }
-                results[drawer_type] = fallbacks[drawer_type]
+                results[drawer_type] = AdvisorSummaryEngine.fallback_narrative(drawer_type, context)
         
         return results
 
@@ -0,0 +1,401 @@
+"""
+Answer cache for LLM-backed FAQ and corporate knowledge answers.
+
+The FAQ page sees the same handful of questions over and over with small
+wording changes ("how much does assisted living cost" vs "How much does
+assisted living cost?"). Every one of those used to be a blocking
+gpt-4o-mini round trip. This cache sits in front of `answer_faq` and
+`answer_corp` in ai/llm_mediator.py.
+
+Keying:
+- kind ("faq" | "corp", with a ":stream" suffix for streamed answers)
+- normalized query (lowercase, punctuation stripped, whitespace collapsed)
+- retrieved source IDs (sorted) - a different retrieval means a different answer
+- policy version (faq_policy.json "version" + content hash)
+- display name used for personalization
+- tenant is NOT part of the key: tenants share answers, only metrics are split
+
+Lookup:
+1. Exact key match
+2. Optional near-duplicate match: token Jaccard similarity >= threshold,
+   restricted to entries with the same kind/sources/policy/name scope so a
+   near hit can never surface an answer built from different sources.
+
+Storage:
+- In-memory OrderedDict (LRU order), persisted to .cache/answer_cache.json
+- Atomic writes (tmp file + os.replace), filelock when available
+- Writes are debounced: a put marks the cache dirty and the file is rewritten
+  at most once per flush interval; flush() (registered atexit for the
+  singleton) persists whatever is pending
+- TTL expiry and max-entry LRU eviction
+
+Metrics:
+- Exact hits, near hits and misses per tenant (see get_metrics())
+
+Environment:
+- FAQ_ANSWER_CACHE: "on" (default) | "off"
+- FAQ_ANSWER_CACHE_NEAR_DUP: Jaccard threshold (default 0.8, "0" disables)
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import filelock
+    HAS_FILELOCK = True
+except ImportError:
+    HAS_FILELOCK = False
+
+
+# ====================================================================
+# CONFIGURATION
+# ====================================================================
+
+DEFAULT_CACHE_PATH = Path(".cache/answer_cache.json")
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # canned answers change rarely
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_NEAR_DUP_THRESHOLD = 0.8
+DEFAULT_FLUSH_INTERVAL = 5.0  # seconds between disk rewrites
+DEFAULT_TENANT = "default"
+SCHEMA_VERSION = 1
+
+_PUNCT = re.compile(r"[^\w\s]")
+_WS = re.compile(r"\s+")
+
+# Words that carry no meaning for near-duplicate matching
+_STOPWORDS = frozenset({
+    "a", "an", "the", "is", "are", "do", "does", "can", "i", "we", "my", "our",
+    "to", "of", "for", "in", "on", "and", "or", "me", "you", "your", "it",
+    "what", "how", "please", "tell", "about",
+})
+
+
+# ====================================================================
+# KEY HELPERS
+# ====================================================================
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a user question for cache keying.
+
+    Lowercases, strips punctuation and collapses whitespace so trivial
+    wording variants share one key.
+    """
+    text = _PUNCT.sub(" ", (query or "").lower())
+    return _WS.sub(" ", text).strip()
+
+
+def query_tokens(query: str) -> frozenset[str]:
+    """Content tokens of a normalized query (stopwords removed)."""
+    tokens = normalize_query(query).split()
+    content = frozenset(t for t in tokens if t not in _STOPWORDS)
+    # Very short questions may be all stopwords - keep them distinguishable
+    return content or frozenset(tokens)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two token sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def policy_version(policy: dict[str, Any] | None) -> str:
+    """Version string for a FAQ policy dict.
+
+    Combines the declared "version" with a short content hash so edits to
+    the policy invalidate cached answers even without a version bump.
+    """
+    policy = policy or {}
+    blob = json.dumps(policy, sort_keys=True, default=str).encode("utf-8")
+    digest = hashlib.sha256(blob).hexdigest()[:10]
+    return f"{policy.get('version', 'unversioned')}:{digest}"
+
+
+def _scope(kind: str, source_ids: list[str], policy_ver: str, name: str | None) -> str:
+    """Everything in the key except the query text."""
+    sources = ",".join(sorted(str(s) for s in source_ids))
+    return f"{kind}|{sources}|{policy_ver}|{(name or '').strip().lower()}"
+
+
+def _make_key(scope: str, query_norm: str) -> str:
+    return hashlib.sha256(f"{scope}|{query_norm}".encode()).hexdigest()
+
+
+# ====================================================================
+# CACHE
+# ====================================================================
+
+
+class AnswerCache:
+    """Disk-persisted LRU cache of mediated LLM answers.
+
+    Thread-safe within a process. Entries are JSON-serializable answer dicts
+    as returned by answer_faq/answer_corp.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        near_dup_threshold: float = DEFAULT_NEAR_DUP_THRESHOLD,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Initialize cache.
+
+        Args:
+            path: JSON file for persistence (None = memory only)
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: LRU capacity
+            near_dup_threshold: Jaccard threshold for near-duplicate hits (0 disables)
+            flush_interval: Minimum seconds between disk writes (0 = write every put)
+        """
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.near_dup_threshold = near_dup_threshold
+        self.flush_interval = flush_interval
+
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._metrics: dict[str, dict[str, int]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._last_save = 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        kind: str,
+        query: str,
+        source_ids: list[str],
+        policy_ver: str,
+        name: str | None = None,
+        tenant: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Look up a cached answer.
+
+        Args:
+            tenant: Label the lookup is counted under in get_metrics()
+
+        Returns:
+            Copy of the cached answer dict, or None on miss
+        """
+        query_norm = normalize_query(query)
+        scope = _scope(kind, source_ids, policy_ver, name)
+        key = _make_key(scope, query_norm)
+        now = time.time()
+
+        with self._lock:
+            self._ensure_loaded()
+
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                del self._entries[key]
+                entry = None
+
+            hit_type = "hit" if entry is not None else None
+
+            if entry is None and self.near_dup_threshold > 0:
+                entry = self._near_duplicate(scope, query_tokens(query), now)
+                if entry is not None:
+                    hit_type = "near_hit"
+
+            self._record(tenant, hit_type or "miss")
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(entry["key"])
+            print(f"[ANSWER_CACHE] {hit_type} kind={kind} q='{query_norm[:50]}'")
+            return json.loads(json.dumps(entry["answer"]))
+
+    def put(
+        self,
+        kind: str,
+        query: str,
+        source_ids: list[str],
+        policy_ver: str,
+        answer: dict[str, Any],
+        name: str | None = None,
+    ) -> None:
+        """Store an answer; the file is rewritten at most once per flush interval."""
+        query_norm = normalize_query(query)
+        scope = _scope(kind, source_ids, policy_ver, name)
+        key = _make_key(scope, query_norm)
+
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = {
+                "key": key,
+                "scope": scope,
+                "query": query_norm,
+                "tokens": sorted(query_tokens(query)),
+                "answer": answer,
+                "created_at": time.time(),
+            }
+            self._entries.move_to_end(key)
+            self._evict()
+            self._dirty = True
+            if time.time() - self._last_save >= self.flush_interval:
+                self._save()
+
+    def flush(self) -> None:
+        """Persist pending puts now."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def clear(self) -> None:
+        """Drop all entries (memory and disk)."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._save()
+
+    def get_metrics(self, tenant: str | None = None) -> dict[str, Any]:
+        """Hit-rate metrics.
+
+        Args:
+            tenant: Return only this tenant's summary (None = all tenants)
+
+        Returns:
+            {"hits", "near_hits", "misses", "lookups", "hit_rate"} for one
+            tenant, or {tenant: summary} for all of them
+        """
+        with self._lock:
+            if tenant is not None:
+                return self._summarize(self._metrics.get(tenant, {}))
+            return {t: self._summarize(c) for t, c in self._metrics.items()}
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _expired(self, entry: dict[str, Any], now: float) -> bool:
+        return now - entry.get("created_at", 0) > self.ttl_seconds
+
+    def _near_duplicate(
+        self, scope: str, tokens: frozenset[str], now: float
+    ) -> dict[str, Any] | None:
+        """Best same-scope entry above the Jaccard threshold."""
+        best, best_score = None, self.near_dup_threshold
+        for entry in self._entries.values():
+            if entry["scope"] != scope or self._expired(entry, now):
+                continue
+            score = jaccard(tokens, frozenset(entry["tokens"]))
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def _evict(self) -> None:
+        now = time.time()
+        for key in [k for k, e in self._entries.items() if self._expired(e, now)]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _record(self, tenant: str | None, outcome: str) -> None:
+        field = {"hit": "hits", "near_hit": "near_hits", "miss": "misses"}[outcome]
+        counters = self._metrics.setdefault(tenant or DEFAULT_TENANT, {})
+        counters[field] = counters.get(field, 0) + 1
+
+    @staticmethod
+    def _summarize(counters: dict[str, int]) -> dict[str, Any]:
+        hits = counters.get("hits", 0)
+        near_hits = counters.get("near_hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + near_hits + misses
+        return {
+            "hits": hits,
+            "near_hits": near_hits,
+            "misses": misses,
+            "lookups": lookups,
+            "hit_rate": round((hits + near_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+    @contextmanager
+    def _file_lock(self):
+        if HAS_FILELOCK and self.path is not None:
+            lock = filelock.FileLock(str(self.path) + ".lock", timeout=5)
+            with lock:
+                yield
+        else:
+            yield
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with self._file_lock(), open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[ANSWER_CACHE] Could not read {self.path}: {e}")
+            return
+        if data.get("schema") != SCHEMA_VERSION:
+            return
+        for entry in data.get("entries", []):
+            if "key" in entry and "scope" in entry:
+                self._entries[entry["key"]] = entry
+        self._evict()
+
+    def _save(self) -> None:
+        self._dirty = False
+        self._last_save = time.time()
+        if self.path is None:
+            return
+        payload = {"schema": SCHEMA_VERSION, "entries": list(self._entries.values())}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock():
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[ANSWER_CACHE] Could not persist {self.path}: {e}")
+
+
+# ====================================================================
+# SINGLETON
+# ====================================================================
+
+
+def answer_cache_enabled() -> bool:
+    """Whether the FAQ answer cache is on (FAQ_ANSWER_CACHE, default on)."""
+    return os.getenv("FAQ_ANSWER_CACHE", "on").strip().lower() != "off"
+
+
+@cache
+def get_answer_cache() -> AnswerCache:
+    """Get the process-wide answer cache (cached singleton)."""
+    try:
+        threshold = float(os.getenv("FAQ_ANSWER_CACHE_NEAR_DUP", DEFAULT_NEAR_DUP_THRESHOLD))
+    except ValueError:
+        threshold = DEFAULT_NEAR_DUP_THRESHOLD
+    answer_cache = AnswerCache(near_dup_threshold=threshold)
+    atexit.register(answer_cache.flush)
+    return answer_cache
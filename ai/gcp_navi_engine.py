@@ -10,7 +10,8 @@ import json
 from typing import Literal
 
 from ai.gcp_schemas import CANONICAL_TIERS, FORBIDDEN_TERMS, GCPAdvice, GCPContext, normalize_tier
-from ai.llm_client import get_client
+from ai.llm_async import get_sync_client
+from ai.llm_cache import get_prompt_cache, prompt_cache_key, schema_fingerprint
 
 # ====================================================================
 # PROMPTS
@@ -140,7 +141,7 @@ def generate_gcp_advice(
         return (False, None)
 
     # Get LLM client
-    client = get_client()
+    client = get_sync_client()
     if client is None:
         print(f"[GCP_LLM_{mode.upper()}] Could not create LLM client - skipping")
         return (False, None)
@@ -157,11 +158,21 @@ def generate_gcp_advice(
 
         user_prompt = _build_gcp_prompt(context)
 
-        # Generate JSON response (uses client's configured timeout, currently 10s)
-        response_text = client.generate_json(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
+        # Reruns with identical context are served from the prompt cache
+        cache = get_prompt_cache()
+        cache_key = prompt_cache_key(
+            "gcp_advice", client.model, client.temperature, system_prompt,
+            context, schema_fingerprint(GCPAdvice),
         )
+        response_text = cache.get(cache_key)
+        from_cache = response_text is not None
+
+        # Generate JSON response (uses client's configured timeout, currently 10s)
+        if not from_cache:
+            response_text = client.generate_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+            )
 
         if response_text is None:
             print(f"[GCP_LLM_{mode.upper()}] LLM returned None - skipping")
@@ -191,6 +202,8 @@ def generate_gcp_advice(
             # Post-guard: Double-check for forbidden terms in final output
             advice = _filter_forbidden_terms(advice)
 
+            if not from_cache:
+                cache.put(cache_key, response_text)
             return (True, advice)
 
         except Exception as e:
@@ -362,7 +375,7 @@ def generate_section_advice(
         return (False, None)
 
     # Get LLM client
-    client = get_client()
+    client = get_sync_client()
     if client is None:
         print(f"[GCP_LLM_SECTION] Could not create LLM client - skipping section={section}")
         return (False, None)
@@ -379,11 +392,21 @@ def generate_section_advice(
 
         user_prompt = _build_section_user_prompt(context, section)
 
-        # Generate JSON response (uses client's configured timeout, currently 10s)
-        response_text = client.generate_json(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
+        # Reruns/back-navigation with identical answers are served from the prompt cache
+        cache = get_prompt_cache()
+        cache_key = prompt_cache_key(
+            "gcp_section", client.model, client.temperature, system_prompt,
+            {"section": section, "context": context}, schema_fingerprint(GCPAdvice),
         )
+        response_text = cache.get(cache_key)
+        from_cache = response_text is not None
+
+        # Generate JSON response (uses client's configured timeout, currently 10s)
+        if not from_cache:
+            response_text = client.generate_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+            )
 
         if response_text is None:
             print(f"[GCP_LLM_SECTION] LLM returned None - section={section}")
@@ -420,6 +443,8 @@ def generate_section_advice(
                 f"reasons={len(advice.reasons)}"
             )
 
+            if not from_cache:
+                cache.put(cache_key, response_text)
             return (True, advice)
 
         except Exception as e:
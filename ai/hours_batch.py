@@ -0,0 +1,308 @@
+"""
+Columnar weighted-hours calculator.
+
+Vectorized counterpart of hours_engine.compute_weighted_hours() for N cases
+at once: re-banding the historical case set after hours_weights.py is tuned,
+and what-if sweeps that evaluate many variants of one case.
+
+Cases are encoded once into a HoursBatch (integer code matrices and flag
+columns). Weight tables are resolved at compute time through the
+hours_weights getters for the distinct values present in the batch, then
+gathered with NumPy, so a re-tuned weight table re-bands an existing batch
+without re-encoding it.
+
+Results are bit-for-bit identical to the scalar path. ADL hours are summed
+column by column in the original list order (float addition is not
+associative, so a bitmask · weights product would drift by an ulp and can
+flip a band at a threshold); the cognitive multiplier is evaluated once per
+distinct (level, behavior bitmask) combination.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ai.hours_schemas import HoursBand
+from ai.hours_weights import (
+    get_badl_hours,
+    get_cognitive_multiplier,
+    get_fall_risk_multiplier,
+    get_iadl_hours,
+    get_mobility_hours,
+)
+
+BANDS: tuple[HoursBand, ...] = ("<1h", "1-3h", "4-8h", "12-16h", "24h")
+
+# Lower edges of bands 1..4 (must match hours_engine.hours_to_band)
+BAND_EDGES = np.array([1.0, 4.0, 10.0, 20.0])
+
+OVERNIGHT_FLOOR_HOURS = 16.0
+
+# Behavior flags in get_cognitive_multiplier() argument order; bit i of the
+# behavior mask is BEHAVIORS[i]
+BEHAVIORS = (
+    "wandering",
+    "aggression",
+    "sundowning",
+    "repetitive_questions",
+    "elopement",
+    "confusion",
+    "judgment",
+    "hoarding",
+    "sleep",
+)
+
+_CATEGORICAL = ("cognitive_level", "falls", "mobility", "meds_complexity", "primary_support")
+
+# Clinical escalation value sets (see hours_engine.clinical_escalation)
+_COGNITIVE_MODERATE_PLUS = {"moderate", "severe", "advanced"}
+_FALLS_REPEATED = {"multiple", "frequent"}
+_MOBILITY_HIGH_RISK = {"wheelchair", "bedbound"}
+_MOBILITY_AIDED = {"walker", "wheelchair", "bedbound"}
+_MEDS_COMPLEX = {"moderate", "complex"}
+_NO_SUPPORT = {"none", None}
+
+
+@dataclass(frozen=True)
+class Categorical:
+    """Codes into a tuple of distinct values (None allowed)."""
+
+    codes: np.ndarray
+    values: tuple
+
+    @classmethod
+    def encode(cls, raw: list) -> "Categorical":
+        index: dict[Any, int] = {}
+        codes = np.fromiter((index.setdefault(v, len(index)) for v in raw), dtype=np.int32, count=len(raw))
+        return cls(codes, tuple(index))
+
+    def lookup(self, fn) -> np.ndarray:
+        """fn(value) for every case, evaluating fn once per distinct value."""
+        table = np.array([fn(v) for v in self.values] or [0.0], dtype=np.float64)
+        return table[self.codes]
+
+    def isin(self, values: set) -> np.ndarray:
+        table = np.array([v in values for v in self.values] or [False], dtype=bool)
+        return table[self.codes]
+
+
+@dataclass(frozen=True)
+class HoursBatch:
+    """N hours contexts encoded column-wise.
+
+    ADL/IADL selections are (N, max_len) code matrices into per-batch
+    vocabularies, padded with -1, so list order and duplicates survive.
+    """
+
+    size: int
+    badl_codes: np.ndarray
+    badl_vocab: tuple[str, ...]
+    iadl_codes: np.ndarray
+    iadl_vocab: tuple[str, ...]
+    badls_count: np.ndarray
+    iadls_count: np.ndarray
+    behavior_mask: np.ndarray  # uint16, bit i = BEHAVIORS[i]
+    overnight_needed: np.ndarray
+    categorical: dict[str, Categorical]
+
+    @classmethod
+    def from_contexts(cls, contexts: Iterable[Any]) -> "HoursBatch":
+        """Encode HoursContext instances (or dicts with the same fields)."""
+        contexts = list(contexts)
+        n = len(contexts)
+
+        def field(ctx, name, default=None):
+            if isinstance(ctx, Mapping):
+                return ctx.get(name, default)
+            return getattr(ctx, name, default)
+
+        badl_codes, badl_vocab = _encode_lists([field(c, "badls_list") or [] for c in contexts])
+        iadl_codes, iadl_vocab = _encode_lists([field(c, "iadls_list") or [] for c in contexts])
+
+        behavior_mask = np.zeros(n, dtype=np.uint16)
+        for bit, name in enumerate(BEHAVIORS):
+            flags = np.fromiter((bool(field(c, name, False)) for c in contexts), dtype=bool, count=n)
+            behavior_mask |= flags.astype(np.uint16) << bit
+
+        return cls(
+            size=n,
+            badl_codes=badl_codes,
+            badl_vocab=badl_vocab,
+            iadl_codes=iadl_codes,
+            iadl_vocab=iadl_vocab,
+            badls_count=np.fromiter((field(c, "badls_count", 0) or 0 for c in contexts), dtype=np.int32, count=n),
+            iadls_count=np.fromiter((field(c, "iadls_count", 0) or 0 for c in contexts), dtype=np.int32, count=n),
+            behavior_mask=behavior_mask,
+            overnight_needed=np.fromiter(
+                (bool(field(c, "overnight_needed", False)) for c in contexts), dtype=bool, count=n
+            ),
+            categorical={name: Categorical.encode([field(c, name) for c in contexts]) for name in _CATEGORICAL},
+        )
+
+    def behavior(self, name: str) -> np.ndarray:
+        return (self.behavior_mask >> BEHAVIORS.index(name)) & 1 == 1
+
+    def has_badl(self, name: str) -> np.ndarray:
+        if name not in self.badl_vocab:
+            return np.zeros(self.size, dtype=bool)
+        return (self.badl_codes == self.badl_vocab.index(name)).any(axis=1)
+
+
+def _encode_lists(lists: list[list[str]]) -> tuple[np.ndarray, tuple[str, ...]]:
+    index: dict[str, int] = {}
+    width = max((len(items) for items in lists), default=0)
+    codes = np.full((len(lists), width), -1, dtype=np.int32)
+    for row, items in enumerate(lists):
+        for col, item in enumerate(items):
+            codes[row, col] = index.setdefault(item, len(index))
+    return codes, tuple(index)
+
+
+def _ordered_sum(codes: np.ndarray, vocab: tuple[str, ...], weight_fn) -> np.ndarray:
+    """Row sums of weight_fn(item) in list order (matches Python's sum())."""
+    # Trailing 0.0 is the weight of the -1 padding code
+    weights = np.array([weight_fn(item) for item in vocab] + [0.0], dtype=np.float64)
+    gathered = weights[codes]
+    total = np.zeros(codes.shape[0], dtype=np.float64)
+    for col in range(codes.shape[1]):
+        total = total + gathered[:, col]
+    return total
+
+
+def _cognitive_multipliers(batch: HoursBatch) -> np.ndarray:
+    levels = batch.categorical["cognitive_level"]
+    keys = levels.codes.astype(np.int64) << len(BEHAVIORS) | batch.behavior_mask
+    unique, inverse = np.unique(keys, return_inverse=True)
+    table = np.empty(len(unique), dtype=np.float64)
+    for i, key in enumerate(unique.tolist()):
+        mask = key & ((1 << len(BEHAVIORS)) - 1)
+        table[i] = get_cognitive_multiplier(
+            levels.values[key >> len(BEHAVIORS)],
+            **{f"has_{name}": bool(mask >> bit & 1) for bit, name in enumerate(BEHAVIORS)},
+        )
+    return table[inverse.reshape(-1)]
+
+
+def bands_for_hours(hours: np.ndarray) -> np.ndarray:
+    """Band index (into BANDS) for weighted hours."""
+    return np.searchsorted(BAND_EDGES, hours, side="right")
+
+
+def clinical_escalation_batch(batch: HoursBatch, band: np.ndarray) -> np.ndarray:
+    """Vectorized hours_engine.clinical_escalation() on band indices."""
+    cat = batch.categorical
+    band = band.copy()
+    # 12-16h / 24h from the calculation are trusted as-is
+    open_ = band <= 2
+
+    cognitive_moderate = cat["cognitive_level"].isin(_COGNITIVE_MODERATE_PLUS)
+    falls_repeated = cat["falls"].isin(_FALLS_REPEATED)
+
+    # Rule 1: toileting needs availability
+    band[open_ & (band <= 1) & batch.has_badl("toileting")] = 2
+
+    # Rule 2: moderate+ cognition with safety risks
+    risk_count = (
+        batch.behavior("wandering").astype(np.int32)
+        + batch.behavior("aggression")
+        + batch.behavior("sundowning")
+        + batch.behavior("elopement")
+        + batch.behavior("confusion")
+        + falls_repeated
+        + cat["mobility"].isin(_MOBILITY_HIGH_RISK)
+    )
+    # (if/elif on the same band: a case lifted to 4-8h here is not lifted again)
+    lift_low = open_ & cognitive_moderate & (risk_count >= 2) & (band <= 1)
+    lift_mid = open_ & cognitive_moderate & (risk_count >= 3) & (band == 2)
+    band[lift_low] = 2
+    band[lift_mid] = 3
+
+    # Rule 3: overnight needs
+    band[open_ & batch.overnight_needed & (band <= 2)] = 3
+
+    # Rule 4: repeated falls + mobility aid + ADL needs
+    aided = falls_repeated & cat["mobility"].isin(_MOBILITY_AIDED) & (batch.badls_count >= 2)
+    band[open_ & aided & (band <= 1)] = 2
+
+    # Rule 5: complex meds + moderate+ cognition
+    band[open_ & cat["meds_complexity"].isin(_MEDS_COMPLEX) & cognitive_moderate & (band == 1)] = 2
+
+    # Rule 6: no regular support with moderate needs
+    needs = (batch.badls_count >= 2) | (batch.iadls_count >= 3)
+    band[open_ & cat["primary_support"].isin(_NO_SUPPORT) & needs & (band == 1)] = 2
+
+    return band
+
+
+@dataclass(frozen=True)
+class HoursBatchResult:
+    """Per-case weighted hours breakdown (arrays of length N)."""
+
+    hours: np.ndarray
+    band_index: np.ndarray
+    calculated_band_index: np.ndarray  # Before clinical escalation
+    badl_hours: np.ndarray
+    iadl_hours: np.ndarray
+    cognitive_multiplier: np.ndarray
+    fall_multiplier: np.ndarray
+    mobility_hours: np.ndarray
+    overnight_floor_applied: np.ndarray
+
+    @property
+    def bands(self) -> list[HoursBand]:
+        return [BANDS[i] for i in self.band_index.tolist()]
+
+
+def compute_weighted_hours_batch(batch: HoursBatch) -> HoursBatchResult:
+    """Weighted hours and bands for every case in the batch.
+
+    Same steps as hours_engine.compute_weighted_hours(), with weight tables
+    read from ai.hours_weights at call time.
+    """
+    cat = batch.categorical
+    badl_hours = _ordered_sum(batch.badl_codes, batch.badl_vocab, get_badl_hours)
+    iadl_hours = _ordered_sum(batch.iadl_codes, batch.iadl_vocab, get_iadl_hours)
+    total = badl_hours + iadl_hours
+
+    cognitive_mult = _cognitive_multipliers(batch)
+    total = np.where(cognitive_mult > 1.0, total * cognitive_mult, total)
+
+    fall_mult = cat["falls"].lookup(get_fall_risk_multiplier)
+    total = np.where(fall_mult > 1.0, total * fall_mult, total)
+
+    mobility_hours = cat["mobility"].lookup(get_mobility_hours)
+    total = np.where(mobility_hours > 0, total + mobility_hours, total)
+
+    overnight_floor = batch.overnight_needed & (total < OVERNIGHT_FLOOR_HOURS)
+    total = np.where(overnight_floor, OVERNIGHT_FLOOR_HOURS, total)
+
+    calculated = bands_for_hours(total)
+    return HoursBatchResult(
+        hours=total,
+        band_index=clinical_escalation_batch(batch, calculated),
+        calculated_band_index=calculated,
+        badl_hours=badl_hours,
+        iadl_hours=iadl_hours,
+        cognitive_multiplier=cognitive_mult,
+        fall_multiplier=fall_mult,
+        mobility_hours=mobility_hours,
+        overnight_floor_applied=overnight_floor,
+    )
+
+
+def weighted_hours_batch(contexts: Iterable[Any]) -> HoursBatchResult:
+    """Encode and compute in one step."""
+    return compute_weighted_hours_batch(HoursBatch.from_contexts(contexts))
+
+
+__all__ = [
+    "BANDS",
+    "HoursBatch",
+    "HoursBatchResult",
+    "bands_for_hours",
+    "clinical_escalation_batch",
+    "compute_weighted_hours_batch",
+    "weighted_hours_batch",
+]
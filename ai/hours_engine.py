@@ -4,12 +4,11 @@ Hours/day suggestion engine (baseline + LLM refinement).
 Provides:
 - baseline_hours(): Transparent rule-based suggestion (legacy simple thresholds)
 - calculate_baseline_hours_weighted(): Realistic weighted scoring based on actual care tasks
+- compute_weighted_hours(): Same scoring without logging (batch evaluation)
 - generate_hours_advice(): Schema-validated LLM refinement
 """
 import json
-import os
-
-import streamlit as st
+from dataclasses import dataclass, field
 
 from ai.hours_schemas import HoursAdvice, HoursBand, HoursContext
 from ai.hours_weights import (
@@ -19,14 +18,44 @@ from ai.hours_weights import (
     get_fall_risk_multiplier,
     get_mobility_hours,
 )
+from ai.llm_async import get_sync_client
+from ai.llm_cache import get_prompt_cache, prompt_cache_key, schema_fingerprint
+
 
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
+_BAND_ORDER = ["<1h", "1-3h", "4-8h", "12-16h", "24h"]
 
 
-def _apply_clinical_rules(context: HoursContext, band: HoursBand, total_hours: float) -> HoursBand:
+@dataclass
+class WeightedHours:
+    """Breakdown of the weighted hours calculation (no side effects)."""
+
+    band: HoursBand
+    hours: float
+    calculated_band: HoursBand  # Band from hours alone, before clinical rules
+    badl_hours: float
+    iadl_hours: float
+    cognitive_multiplier: float
+    fall_multiplier: float
+    mobility_hours: float
+    overnight_floor_applied: bool
+    escalations: list[tuple[str, str, str]] = field(default_factory=list)  # (from, to, reason)
+
+
+def hours_to_band(total_hours: float) -> HoursBand:
+    """Convert weighted hours to a band (CRITICAL: Must match production thresholds)."""
+    # Thresholds designed to avoid edge cases pushing into higher bands
+    if total_hours < 1.0:
+        return "<1h"
+    if total_hours < 4.0:
+        return "1-3h"
+    if total_hours < 10.0:  # 4-8h band extends to 10h to avoid edge case escalation
+        return "4-8h"
+    if total_hours < 20.0:  # 12-16h band for true around-the-clock cases (10-20h)
+        return "12-16h"
+    return "24h"
+
+
+def clinical_escalation(context: HoursContext, band: HoursBand) -> tuple[HoursBand, list[tuple[str, str, str]]]:
     """
     Apply clinical escalation rules that match LLM reasoning.
     
@@ -40,30 +69,21 @@ def _apply_clinical_rules(context: HoursContext, band: HoursBand, total_hours: f
     IMPORTANT: Rules only escalate LOW bands. If calculation already places
     you in 12-16h or 24h, TRUST IT. Don't second-guess the weighted calculation.
     
-    Args:
-        context: HoursContext with all care signals
-        band: Initial band from weighted calculation
-        total_hours: Calculated hours for reference
-    
     Returns:
-        Escalated band if clinical rules apply, otherwise original band
+        (band, escalations) where escalations lists (from, to, reason) steps
     """
-    _BAND_ORDER = ["<1h", "1-3h", "4-8h", "12-16h", "24h"]
-    
+    escalations: list[tuple[str, str, str]] = []
+
     def escalate(current: HoursBand, target: HoursBand, reason: str) -> HoursBand:
-        """Helper to escalate band with logging."""
         if _BAND_ORDER.index(target) > _BAND_ORDER.index(current):
-            print(f"[HOURS_CLINICAL] Escalate {current} → {target}: {reason}")
+            escalations.append((current, target, reason))
             return target
         return current
-    
-    original_band = band
-    
+
     # CRITICAL: If calculation already put us in 12-16h or 24h, TRUST IT
     # These bands mean the weighted calculation found significant needs
     if band in ["12-16h", "24h"]:
-        print(f"[HOURS_CLINICAL] Band {band} from calculation - trusting weighted result")
-        return band
+        return band, escalations
     
     # Rule 1: Toileting requires 24/7 availability (minimum 4-8h)
     if "toileting" in context.badls_list and band in ["<1h", "1-3h"]:
@@ -108,15 +128,26 @@ def _apply_clinical_rules(context: HoursContext, band: HoursBand, total_hours: f
             if band == "1-3h":
                 band = escalate(band, "4-8h", "No regular support with moderate needs")
     
-    if band != original_band:
-        print(f"[HOURS_CLINICAL] Final: {original_band} → {band} (clinical rules applied)")
-    
-    return band
+    return band, escalations
 
 
-def calculate_baseline_hours_weighted(context: HoursContext) -> HoursBand:
+def _apply_clinical_rules(context: HoursContext, band: HoursBand, total_hours: float) -> HoursBand:
+    """Clinical escalation with logging (see clinical_escalation)."""
+    if band in ["12-16h", "24h"]:
+        print(f"[HOURS_CLINICAL] Band {band} from calculation - trusting weighted result")
+        return band
+
+    final, escalations = clinical_escalation(context, band)
+    for current, target, reason in escalations:
+        print(f"[HOURS_CLINICAL] Escalate {current} → {target}: {reason}")
+    if final != band:
+        print(f"[HOURS_CLINICAL] Final: {band} → {final} (clinical rules applied)")
+    return final
+
+
+def compute_weighted_hours(context: HoursContext) -> WeightedHours:
     """
-    Calculate realistic hours/day using weighted scoring system.
+    Weighted hours/day and band, without logging.
     
     Uses actual care task times rather than simple thresholds:
     - BADLs weighted by task/availability time (toileting→2.0h, bathing→0.5h)
@@ -125,21 +156,11 @@ def calculate_baseline_hours_weighted(context: HoursContext) -> HoursBand:
     - Behavior adjustments added (wandering+0.3h, aggression+0.2h, etc.)
     - Fall risk multiplier (once→1.1x, multiple→1.3x, frequent→1.5x)
     - Mobility aid hours added (cane→0.2h, walker→0.5h, wheelchair→1.0h)
-    
-    Returns:
-        HoursBand: "<1h", "1-3h", "4-8h", or "24h"
+    - Overnight floor of 16h, then clinical escalation rules
     """
     # Start with base hours from weighted ADL/IADL tasks
-    total_hours = 0.0
-    
-    # Sum BADL hours
     badl_hours = sum(get_badl_hours(badl) for badl in context.badls_list)
-    print(f"[HOURS_WEIGHTED] BADL hours: {badl_hours:.1f}h from {context.badls_list}")
-    
-    # Sum IADL hours
     iadl_hours = sum(get_iadl_hours(iadl) for iadl in context.iadls_list)
-    print(f"[HOURS_WEIGHTED] IADL hours: {iadl_hours:.1f}h from {context.iadls_list}")
-    
     total_hours = badl_hours + iadl_hours
     
     # Apply cognitive multiplier (supervision overhead including ALL behaviors)
@@ -156,45 +177,75 @@ def calculate_baseline_hours_weighted(context: HoursContext) -> HoursBand:
         has_sleep=getattr(context, 'sleep', False),
     )
     if cognitive_mult > 1.0:
-        print(f"[HOURS_WEIGHTED] Cognitive multiplier: {cognitive_mult}x for {context.cognitive_level} + behaviors")
         total_hours *= cognitive_mult
     
     # Apply fall risk multiplier
     fall_mult = get_fall_risk_multiplier(context.falls)
     if fall_mult > 1.0:
-        print(f"[HOURS_WEIGHTED] Fall risk multiplier: {fall_mult}x for {context.falls}")
         total_hours *= fall_mult
     
     # Add mobility aid hours
     mobility_hours = get_mobility_hours(context.mobility)
     if mobility_hours > 0:
-        print(f"[HOURS_WEIGHTED] +{mobility_hours}h for {context.mobility} mobility aid")
         total_hours += mobility_hours
     
     # Apply overnight floor if needed
-    if context.overnight_needed and total_hours < 16.0:
-        print(f"[HOURS_WEIGHTED] Overnight floor: {total_hours:.1f}h → 16.0h")
+    overnight_floor = bool(context.overnight_needed and total_hours < 16.0)
+    if overnight_floor:
         total_hours = 16.0
     
-    print(f"[HOURS_WEIGHTED] Total weighted hours: {total_hours:.1f}h")
-    
-    # Convert to band (CRITICAL: Must match production thresholds)
-    # Thresholds designed to avoid edge cases pushing into higher bands
-    if total_hours < 1.0:
-        band = "<1h"
-    elif total_hours < 4.0:
-        band = "1-3h"
-    elif total_hours < 10.0:  # 4-8h band extends to 10h to avoid edge case escalation
-        band = "4-8h"
-    elif total_hours < 20.0:  # 12-16h band for true around-the-clock cases (10-20h)
-        band = "12-16h"
-    else:
-        band = "24h"
+    calculated_band = hours_to_band(total_hours)
+    band, escalations = clinical_escalation(context, calculated_band)
+
+    return WeightedHours(
+        band=band,
+        hours=total_hours,
+        calculated_band=calculated_band,
+        badl_hours=badl_hours,
+        iadl_hours=iadl_hours,
+        cognitive_multiplier=cognitive_mult,
+        fall_multiplier=fall_mult,
+        mobility_hours=mobility_hours,
+        overnight_floor_applied=overnight_floor,
+        escalations=escalations,
+    )
+
+
+def _log_clinical(result: WeightedHours) -> None:
+    if result.calculated_band in ["12-16h", "24h"]:
+        print(f"[HOURS_CLINICAL] Band {result.calculated_band} from calculation - trusting weighted result")
+        return
+    for current, target, reason in result.escalations:
+        print(f"[HOURS_CLINICAL] Escalate {current} → {target}: {reason}")
+    if result.band != result.calculated_band:
+        print(f"[HOURS_CLINICAL] Final: {result.calculated_band} → {result.band} (clinical rules applied)")
+
+
+def calculate_baseline_hours_weighted(context: HoursContext) -> HoursBand:
+    """
+    Calculate realistic hours/day using weighted scoring system.
     
-    # Apply clinical escalation rules (matches LLM logic)
-    band = _apply_clinical_rules(context, band, total_hours)
+    Logging wrapper around compute_weighted_hours().
     
-    return band
+    Returns:
+        HoursBand: "<1h", "1-3h", "4-8h", "12-16h" or "24h"
+    """
+    result = compute_weighted_hours(context)
+
+    print(f"[HOURS_WEIGHTED] BADL hours: {result.badl_hours:.1f}h from {context.badls_list}")
+    print(f"[HOURS_WEIGHTED] IADL hours: {result.iadl_hours:.1f}h from {context.iadls_list}")
+    if result.cognitive_multiplier > 1.0:
+        print(f"[HOURS_WEIGHTED] Cognitive multiplier: {result.cognitive_multiplier}x for {context.cognitive_level} + behaviors")
+    if result.fall_multiplier > 1.0:
+        print(f"[HOURS_WEIGHTED] Fall risk multiplier: {result.fall_multiplier}x for {context.falls}")
+    if result.mobility_hours > 0:
+        print(f"[HOURS_WEIGHTED] +{result.mobility_hours}h for {context.mobility} mobility aid")
+    if result.overnight_floor_applied:
+        print("[HOURS_WEIGHTED] Overnight floor applied → 16.0h")
+    print(f"[HOURS_WEIGHTED] Total weighted hours: {result.hours:.1f}h")
+    _log_clinical(result)
+
+    return result.band
 
 
 def calculate_baseline_hours_with_value(context: HoursContext) -> tuple[HoursBand, float]:
@@ -207,63 +258,9 @@ def calculate_baseline_hours_with_value(context: HoursContext) -> tuple[HoursBan
     Returns:
         Tuple of (HoursBand, float hours)
     """
-    # Start with base hours from weighted ADL/IADL tasks
-    total_hours = 0.0
-    
-    # Sum BADL hours
-    badl_hours = sum(get_badl_hours(badl) for badl in context.badls_list)
-    
-    # Sum IADL hours
-    iadl_hours = sum(get_iadl_hours(iadl) for iadl in context.iadls_list)
-    
-    total_hours = badl_hours + iadl_hours
-    
-    # Apply cognitive multiplier
-    cognitive_mult = get_cognitive_multiplier(
-        context.cognitive_level,
-        has_wandering=context.wandering,
-        has_aggression=context.aggression,
-        has_sundowning=context.sundowning,
-        has_repetitive_questions=context.repetitive_questions,
-        has_elopement=getattr(context, 'elopement', False),
-        has_confusion=getattr(context, 'confusion', False),
-        has_judgment=getattr(context, 'judgment', False),
-        has_hoarding=getattr(context, 'hoarding', False),
-        has_sleep=getattr(context, 'sleep', False),
-    )
-    if cognitive_mult > 1.0:
-        total_hours *= cognitive_mult
-    
-    # Apply fall risk multiplier
-    fall_mult = get_fall_risk_multiplier(context.falls)
-    if fall_mult > 1.0:
-        total_hours *= fall_mult
-    
-    # Add mobility aid hours
-    mobility_hours = get_mobility_hours(context.mobility)
-    if mobility_hours > 0:
-        total_hours += mobility_hours
-    
-    # Apply overnight floor if needed
-    if context.overnight_needed and total_hours < 16.0:
-        total_hours = 16.0
-    
-    # Convert to band
-    if total_hours < 1.0:
-        band = "<1h"
-    elif total_hours < 4.0:
-        band = "1-3h"
-    elif total_hours < 10.0:
-        band = "4-8h"
-    elif total_hours < 20.0:
-        band = "12-16h"
-    else:
-        band = "24h"
-    
-    # Apply clinical escalation rules
-    band = _apply_clinical_rules(context, band, total_hours)
-    
-    return band, total_hours
+    result = compute_weighted_hours(context)
+    _log_clinical(result)
+    return result.band, result.hours
 
 
 def baseline_hours(context: HoursContext) -> HoursBand:
@@ -317,20 +314,10 @@ def generate_hours_advice(
     if mode == "off":
         return (False, None)
 
-    if OpenAI is None:
-        print("[GCP_HOURS_WARN] OpenAI not available; falling back to baseline only")
-        return (False, None)
-
-    # Get API key
-    api_key = None
-    try:
-        api_key = st.secrets.get("OPENAI_API_KEY")
-    except Exception:
-        pass
-    if not api_key:
-        api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("[GCP_HOURS_WARN] No OpenAI API key; falling back to baseline only")
+    # Shared client: concurrency-limited and coalesced with other LLM calls
+    client = get_sync_client()
+    if client is None:
+        print("[GCP_HOURS_WARN] No LLM client (OpenAI or API key missing); falling back to baseline only")
         return (False, None)
 
     # Build prompt with clinical context
@@ -443,15 +430,16 @@ CRITICAL: Output ONLY valid JSON. Do not invent band values. Be specific in reas
 """
 
     try:
-        client = OpenAI(api_key=api_key, timeout=10.0)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.2,
-            max_tokens=300,
+        # Reruns with identical signals are served from the prompt cache.
+        # The whole prompt is single-message, so its hash stands in for the
+        # system prompt (template edits invalidate cached responses).
+        cache = get_prompt_cache()
+        cache_key = prompt_cache_key(
+            "hours_advice", client.model, 0.2, prompt, context, schema_fingerprint(HoursAdvice)
         )
-
-        raw = (response.choices[0].message.content or "").strip()
+        cached = cache.get(cache_key)
+        response_text = cached or client.generate_completion(None, prompt, temperature=0.2, max_tokens=300) or ""
+        raw = response_text.strip()
 
         # Parse JSON
         if raw.startswith("```json"):
@@ -463,6 +451,8 @@ CRITICAL: Output ONLY valid JSON. Do not invent band values. Be specific in reas
 
         # Validate against schema
         advice = HoursAdvice(**data)
+        if cached is None:
+            cache.put(cache_key, response_text)
         return (True, advice)
 
     except Exception as e:
@@ -517,24 +507,12 @@ def generate_hours_nudge_text(
     if mode == "off":
         return None
 
-    if OpenAI is None:
+    client = get_sync_client()
+    if client is None:
+        print("[GCP_HOURS_WARN] No LLM client; skipping nudge")
         return None
 
-    # Get API key
-    api_key = None
     try:
-        api_key = st.secrets.get("OPENAI_API_KEY")
-    except Exception:
-        pass
-    if not api_key:
-        api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("[GCP_HOURS_WARN] No API key; skipping nudge")
-        return None
-
-    try:
-        client = OpenAI(api_key=api_key, timeout=10.0)
-
         # Build minimal, guardrailed system prompt (CONCISE VERSION)
         system_prompt = """You are 'Navi', a clinical care planning assistant. Your job is to suggest daily in-home care hours.
 
@@ -569,17 +547,12 @@ RULES:
             }
         }
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"Generate nudge for: {json.dumps(user_message)}"}
-            ],
-            max_tokens=80,  # Reduced from 160 for conciseness
+        text = (client.generate_completion(
+            system_prompt,
+            f"Generate nudge for: {json.dumps(user_message)}",
             temperature=0.2,
-        )
-
-        text = (response.choices[0].message.content or "").strip()
+            max_tokens=80,  # Reduced from 160 for conciseness
+        ) or "").strip()
         if not text:
             return None
 
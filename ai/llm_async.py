@@ -0,0 +1,455 @@
+"""
+Async OpenAI LLM client with request coalescing and concurrency limits.
+
+The synchronous LLMClient blocks the Streamlit script thread for each call,
+so pages that need several independent completions (GCP advice + hours
+advice, Navi journey message + contextual tips) pay for them one after
+another. This module provides:
+
+- AsyncLLMClient: asyncio client on the OpenAI async SDK
+  - process-wide concurrency limit (LLM_MAX_CONCURRENCY, default 4)
+  - single-flight coalescing: identical in-flight prompts share one request
+  - deadline propagation: llm_deadline() sets an absolute deadline that
+    every call made inside it (including fanned-out calls) respects
+- SyncLLMFacade: LLMClient-compatible sync interface that runs the async
+  client on one background event loop, so existing call sites keep their
+  blocking API but share the semaphore and coalescing
+- fan_out(): run several independent sync LLM call sites in parallel with
+  one overall deadline
+
+Usage:
+    from ai.llm_async import fan_out, llm_deadline
+
+    with llm_deadline(8.0):
+        results = fan_out({
+            "gcp": lambda: generate_gcp_advice(ctx, mode="shadow"),
+            "hours": lambda: generate_hours_advice(hours_ctx, "shadow"),
+        })
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections.abc import Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from contextlib import contextmanager, nullcontext
+from functools import cache
+from typing import Any
+
+from ai.llm_client import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MODEL,
+    DEFAULT_TEMPERATURE,
+    DEFAULT_TIMEOUT,
+    get_api_key,
+)
+
+try:
+    from openai import AsyncOpenAI, OpenAIError
+    HAS_OPENAI = True
+except ImportError:
+    HAS_OPENAI = False
+    AsyncOpenAI = None
+    OpenAIError = Exception
+
+# ====================================================================
+# CONFIGURATION
+# ====================================================================
+
+DEFAULT_FAN_OUT_WORKERS = 8
+
+
+# ====================================================================
+# DEADLINES
+# ====================================================================
+
+# Absolute time.monotonic() deadline for LLM calls in the current context
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "llm_deadline", default=None
+)
+
+
+@contextmanager
+def llm_deadline(seconds: float) -> Iterator[float]:
+    """Bound every LLM call made inside the block by one shared deadline.
+
+    Nested blocks can only tighten the deadline, never extend it.
+
+    Args:
+        seconds: Time budget from now
+
+    Yields:
+        The absolute monotonic deadline
+    """
+    requested = time.monotonic() + seconds
+    current = _deadline.get()
+    effective = min(requested, current) if current is not None else requested
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time(default: float | None = None) -> float | None:
+    """Seconds left before the current deadline (default if none is set)."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    return deadline - time.monotonic()
+
+
+# ====================================================================
+# PER-LOOP STATE (semaphore + in-flight requests)
+# ====================================================================
+
+
+class _LoopState:
+    """Concurrency primitives bound to one event loop."""
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.inflight: dict[str, asyncio.Task] = {}
+
+
+_loop_states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = (
+    weakref.WeakKeyDictionary()
+)
+_loop_states_lock = threading.Lock()
+
+
+def _state_for_running_loop(max_concurrency: int) -> _LoopState:
+    loop = asyncio.get_running_loop()
+    with _loop_states_lock:
+        state = _loop_states.get(loop)
+        if state is None:
+            state = _LoopState(max_concurrency)
+            _loop_states[loop] = state
+        return state
+
+
+def _request_key(kwargs: dict[str, Any]) -> str:
+    """Content hash identifying an identical completion request."""
+    blob = json.dumps(kwargs, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+# ====================================================================
+# ASYNC CLIENT
+# ====================================================================
+
+
+class AsyncLLMClient:
+    """Asyncio OpenAI client with coalescing, concurrency limit and deadlines.
+
+    Mirrors LLMClient: failures are logged and return None so callers can
+    fall back to deterministic behavior.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = DEFAULT_MODEL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_concurrency: int | None = None,
+        base_url: str | None = None,
+    ):
+        """Initialize async client.
+
+        Args:
+            api_key: OpenAI API key (defaults to get_api_key() priority order)
+            model: Model to use (default: gpt-4o-mini)
+            timeout: Per-request timeout in seconds (capped by any deadline)
+            max_retries: Max retry attempts
+            temperature: Sampling temperature
+            max_concurrency: Max simultaneous requests per event loop
+                (default: LLM_MAX_CONCURRENCY flag)
+            base_url: Optional API base URL (local fake server in tests)
+
+        Raises:
+            RuntimeError: If openai package not installed
+            ValueError: If API key not provided or found
+        """
+        if not HAS_OPENAI:
+            raise RuntimeError("openai package not installed. Install with: pip install openai")
+
+        self.api_key = api_key or get_api_key()
+        if not self.api_key:
+            raise ValueError("OpenAI API key required (see ai.llm_client.get_api_key)")
+
+        self.model = model
+        self.timeout = timeout
+        self.temperature = temperature
+        if max_concurrency is None:
+            # Lazy: keeps streamlit (via core.flags) out of headless importers
+            from core.flags import get_flag_value
+
+            max_concurrency = int(get_flag_value("LLM_MAX_CONCURRENCY"))
+        self.max_concurrency = max_concurrency
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            base_url=base_url,
+        )
+
+    async def generate_completion(
+        self,
+        system_prompt: str | None,
+        user_prompt: str,
+        response_format: dict | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str | None:
+        """Generate a completion, sharing identical in-flight requests.
+
+        Args:
+            system_prompt: System message (None to send only the user message)
+            user_prompt: User message with context/question
+            response_format: Optional response format (e.g. JSON mode)
+            temperature: Override the client's sampling temperature
+            max_tokens: Optional completion token limit
+
+        Returns:
+            Response text, or None on failure or when the deadline passes
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_prompt})
+
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature if temperature is None else temperature,
+        }
+        if response_format:
+            kwargs["response_format"] = response_format
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+
+        budget = remaining_time(default=self.timeout)
+        if budget is not None and budget <= 0:
+            print("[LLM_ASYNC] Deadline already passed - skipping call")
+            return None
+        budget = min(budget, self.timeout)
+
+        state = _state_for_running_loop(self.max_concurrency)
+        key = _request_key(kwargs)
+        task = state.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(state, kwargs, budget))
+            state.inflight[key] = task
+            task.add_done_callback(
+                lambda t: state.inflight.pop(key, None) if state.inflight.get(key) is t else None
+            )
+        else:
+            print("[LLM_ASYNC] Coalesced identical in-flight request")
+
+        try:
+            # shield(): a caller with a tighter deadline must not cancel the
+            # shared request other waiters still depend on
+            return await asyncio.wait_for(asyncio.shield(task), timeout=budget)
+        except TimeoutError:
+            print(f"[LLM_ASYNC] Deadline exceeded after {budget:.1f}s")
+            return None
+
+    async def generate_json(self, system_prompt: str | None, user_prompt: str) -> str | None:
+        """Generate JSON-formatted completion (OpenAI JSON mode)."""
+        return await self.generate_completion(
+            system_prompt, user_prompt, response_format={"type": "json_object"}
+        )
+
+    async def _request(
+        self, state: _LoopState, kwargs: dict[str, Any], budget: float
+    ) -> str | None:
+        try:
+            async with state.semaphore:
+                response = await self.client.chat.completions.create(timeout=budget, **kwargs)
+            if response.choices:
+                return response.choices[0].message.content
+            return None
+        except OpenAIError as e:
+            print(f"[LLM_ERROR] OpenAI API error: {e}")
+            return None
+        except Exception as e:
+            print(f"[LLM_ERROR] Unexpected error: {e}")
+            return None
+
+
+# ====================================================================
+# BACKGROUND EVENT LOOP
+# ====================================================================
+
+
+class _LoopThread:
+    """One daemon thread running an event loop for all sync-facade calls."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="llm-async-loop", daemon=True
+        )
+        self.thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise
+
+
+@cache
+def _background_loop() -> _LoopThread:
+    return _LoopThread()
+
+
+def run_sync(coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+    """Run a coroutine on the shared LLM event loop and wait for it."""
+    return _background_loop().run(coro, timeout=timeout)
+
+
+# ====================================================================
+# SYNC FACADE
+# ====================================================================
+
+
+class SyncLLMFacade:
+    """LLMClient-compatible blocking interface backed by AsyncLLMClient.
+
+    All calls run on one background loop, so the concurrency limit and
+    single-flight coalescing apply across every thread in the process.
+    The caller's deadline (llm_deadline) is carried into the loop.
+    """
+
+    def __init__(self, async_client: AsyncLLMClient):
+        self.async_client = async_client
+        self.model = async_client.model
+        self.temperature = async_client.temperature
+        self.timeout = async_client.timeout
+
+    def generate_completion(
+        self,
+        system_prompt: str | None,
+        user_prompt: str,
+        response_format: dict | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str | None:
+        """Blocking generate_completion (same contract as LLMClient)."""
+        budget = min(remaining_time(default=self.timeout), self.timeout)
+        if budget <= 0:
+            return None
+
+        deadline = _deadline.get()
+
+        async def _call() -> str | None:
+            # Tasks on the background loop don't inherit the caller's context,
+            # so carry the deadline over explicitly
+            _deadline.set(deadline)
+            return await self.async_client.generate_completion(
+                system_prompt, user_prompt, response_format, temperature, max_tokens
+            )
+
+        try:
+            return run_sync(_call(), timeout=budget + 1.0)
+        except FutureTimeout:
+            print("[LLM_ASYNC] Sync facade timed out")
+            return None
+        except Exception as e:
+            print(f"[LLM_ERROR] Sync facade error: {e}")
+            return None
+
+    def generate_json(self, system_prompt: str | None, user_prompt: str) -> str | None:
+        """Blocking JSON-mode completion."""
+        return self.generate_completion(
+            system_prompt, user_prompt, response_format={"type": "json_object"}
+        )
+
+
+@cache
+def get_async_client(
+    model: str = DEFAULT_MODEL,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> AsyncLLMClient | None:
+    """Get shared AsyncLLMClient (cached). None if it cannot be created."""
+    try:
+        return AsyncLLMClient(model=model, timeout=timeout)
+    except (RuntimeError, ValueError) as e:
+        print(f"[LLM_WARN] Could not create async LLM client: {e}")
+        return None
+
+
+@cache
+def get_sync_client(
+    model: str = DEFAULT_MODEL,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> SyncLLMFacade | None:
+    """Get shared SyncLLMFacade (cached). None if no client is available.
+
+    Drop-in replacement for ai.llm_client.get_client() at call sites that
+    use generate_completion/generate_json.
+    """
+    async_client = get_async_client(model=model, timeout=timeout)
+    return SyncLLMFacade(async_client) if async_client else None
+
+
+# ====================================================================
+# FAN-OUT
+# ====================================================================
+
+
+def fan_out(
+    calls: dict[str, Callable[[], Any]],
+    timeout: float | None = None,
+    max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+) -> dict[str, Any]:
+    """Run independent blocking LLM call sites in parallel.
+
+    Each callable runs in a worker thread inside a copy of the caller's
+    context, so llm_deadline() applies to every call. Results that miss
+    the deadline (or raise) come back as None.
+
+    Args:
+        calls: Name -> zero-arg callable (e.g. lambda: generate_hours_advice(...))
+        timeout: Overall time budget in seconds (tightens any active deadline)
+        max_workers: Thread pool size
+
+    Returns:
+        Name -> result (None on timeout/failure)
+    """
+    if not calls:
+        return {}
+
+    scope = llm_deadline(timeout) if timeout is not None else nullcontext(_deadline.get())
+    with scope as deadline:
+        results: dict[str, Any] = dict.fromkeys(calls)
+        pool = ThreadPoolExecutor(max_workers=min(max_workers, len(calls)))
+        try:
+            futures = {
+                name: pool.submit(contextvars.copy_context().run, fn)
+                for name, fn in calls.items()
+            }
+            for name, future in futures.items():
+                left = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    results[name] = future.result(timeout=left)
+                except FutureTimeout:
+                    print(f"[LLM_FAN_OUT] '{name}' missed the deadline")
+                except Exception as e:
+                    print(f"[LLM_FAN_OUT] '{name}' failed: {e}")
+        finally:
+            # Don't wait for stragglers past the deadline
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
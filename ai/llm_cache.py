@@ -0,0 +1,324 @@
+"""
+Content-addressed prompt/response cache for deterministic LLM calls.
+
+The GCP and hours engines call the LLM in shadow/assist mode at low
+temperature, usually with exactly the same context on every rerun of the
+same page (back-navigation, widget reruns, revisiting results). This cache
+makes those reruns free.
+
+Key (sha256 of canonical JSON):
+- namespace (e.g. "gcp_section", "hours_advice")
+- model and temperature
+- system prompt hash
+- canonicalized context JSON (sorted keys, compact separators)
+- schema fingerprint of the response model + CACHE_FORMAT_VERSION
+
+Only low-temperature calls are cacheable (<= MAX_CACHEABLE_TEMPERATURE);
+prompt_cache_key() returns None otherwise and get/put become no-ops.
+
+Backends (pluggable, see CacheBackend):
+- MemoryLRUBackend: per-process OrderedDict LRU
+- SQLiteBackend: .cache/llm_prompt_cache.sqlite3, shared across sessions
+- TieredBackend: memory first, SQLite second, promotes on hit
+
+Schema-version invalidation:
+- Changing a response model (e.g. GCPAdvice fields) changes its fingerprint,
+  so old entries no longer match; SQLite also drops rows of a namespace
+  whose schema differs from the one being written.
+- Bumping CACHE_FORMAT_VERSION clears the SQLite store on open.
+
+Environment:
+- LLM_PROMPT_CACHE: "tiered" (default) | "memory" | "off"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from typing import Any, Protocol
+
+# ====================================================================
+# CONFIGURATION
+# ====================================================================
+
+CACHE_FORMAT_VERSION = 1
+MAX_CACHEABLE_TEMPERATURE = 0.3
+DEFAULT_MEMORY_ENTRIES = 512
+DEFAULT_SQLITE_ENTRIES = 20000
+DEFAULT_SQLITE_PATH = Path(".cache/llm_prompt_cache.sqlite3")
+
+
+# ====================================================================
+# KEYS
+# ====================================================================
+
+
+def canonical_json(value: Any) -> str:
+    """Deterministic JSON encoding (sorted keys, compact, sets sorted)."""
+
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=str)
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump()
+        return str(obj)
+
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_default)
+
+
+@cache
+def schema_fingerprint(model_cls: type) -> str:
+    """Short hash of a Pydantic model's JSON schema (cached per class)."""
+    schema = model_cls.model_json_schema() if hasattr(model_cls, "model_json_schema") else repr(model_cls)
+    return hashlib.sha256(canonical_json(schema).encode()).hexdigest()[:12]
+
+
+def prompt_cache_key(
+    namespace: str,
+    model: str,
+    temperature: float,
+    system_prompt: str | None,
+    context: Any,
+    schema: str = "",
+) -> str | None:
+    """Build the content-addressed key for an LLM call.
+
+    Args:
+        namespace: Call site identifier
+        model: Model name
+        temperature: Sampling temperature
+        system_prompt: System prompt (hashed)
+        context: Context dict/model the user prompt is rendered from
+        schema: Response schema fingerprint (see schema_fingerprint)
+
+    Returns:
+        Hex key, or None if the call is not deterministic enough to cache
+    """
+    if temperature is None or temperature > MAX_CACHEABLE_TEMPERATURE:
+        return None
+    system_hash = hashlib.sha256((system_prompt or "").encode()).hexdigest()
+    material = canonical_json({
+        "v": CACHE_FORMAT_VERSION,
+        "ns": namespace,
+        "model": model,
+        "temperature": round(float(temperature), 3),
+        "system": system_hash,
+        "context": context,
+        "schema": schema,
+    })
+    return f"{namespace}:{schema}:{hashlib.sha256(material.encode()).hexdigest()}"
+
+
+def _split_key(key: str) -> tuple[str, str]:
+    """(namespace, schema) encoded in a key."""
+    namespace, schema, _ = (key.split(":", 2) + ["", ""])[:3]
+    return namespace, schema
+
+
+# ====================================================================
+# BACKENDS
+# ====================================================================
+
+
+class CacheBackend(Protocol):
+    """Storage interface for PromptCache."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryLRUBackend:
+    """In-process LRU (thread-safe)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteBackend:
+    """Disk tier shared by all sessions/processes on the host."""
+
+    def __init__(self, path: Path | str = DEFAULT_SQLITE_PATH, max_entries: int = DEFAULT_SQLITE_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._seen_schemas: set[tuple[str, str]] = set()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5)
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+            if version != CACHE_FORMAT_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS prompt_cache")
+                self._conn.execute(f"PRAGMA user_version = {CACHE_FORMAT_VERSION}")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS prompt_cache (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    schema TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_prompt_cache_access ON prompt_cache(last_access)"
+            )
+
+    def get(self, key: str) -> str | None:
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM prompt_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE prompt_cache SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        namespace, schema = _split_key(key)
+        now = time.time()
+        with self._lock, self._conn:
+            if (namespace, schema) not in self._seen_schemas:
+                # First write for this schema: drop entries from older schemas
+                self._conn.execute(
+                    "DELETE FROM prompt_cache WHERE namespace = ? AND schema != ?", (namespace, schema)
+                )
+                self._seen_schemas.add((namespace, schema))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, schema, value, now, now),
+            )
+            self._conn.execute(
+                """DELETE FROM prompt_cache WHERE key IN (
+                    SELECT key FROM prompt_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM prompt_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM prompt_cache").fetchone()[0]
+
+
+class TieredBackend:
+    """Read-through chain of backends; hits are promoted to faster tiers."""
+
+    def __init__(self, *tiers: CacheBackend):
+        self.tiers = tiers
+
+    def get(self, key: str) -> str | None:
+        for i, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for faster in self.tiers[:i]:
+                    faster.set(key, value)
+                return value
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        for tier in self.tiers:
+            tier.set(key, value)
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+
+# ====================================================================
+# CACHE FACADE
+# ====================================================================
+
+
+class PromptCache:
+    """Prompt/response cache over a pluggable backend.
+
+    Backend errors are logged and treated as misses; the cache must never
+    break an LLM call site.
+    """
+
+    def __init__(self, backend: CacheBackend | None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str | None) -> str | None:
+        if key is None or self.backend is None:
+            return None
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            print(f"[LLM_CACHE] get failed: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            print(f"[LLM_CACHE] hit {key.split(':', 1)[0]}")
+        return value
+
+    def put(self, key: str | None, value: str | None) -> None:
+        if key is None or value is None or self.backend is None:
+            return
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            print(f"[LLM_CACHE] put failed: {e}")
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+
+
+@cache
+def get_prompt_cache() -> PromptCache:
+    """Process-wide prompt cache configured from LLM_PROMPT_CACHE."""
+    mode = os.getenv("LLM_PROMPT_CACHE", "tiered").strip().lower()
+    if mode == "off":
+        return PromptCache(None)
+    memory = MemoryLRUBackend()
+    if mode == "memory":
+        return PromptCache(memory)
+    try:
+        return PromptCache(TieredBackend(memory, SQLiteBackend()))
+    except Exception as e:
+        print(f"[LLM_CACHE] SQLite tier unavailable, using memory only: {e}")
+        return PromptCache(memory)
@@ -12,6 +12,8 @@ PRODUCTION KEY HANDLING:
 
 import logging
 import os
+import time
+from collections.abc import Iterator
 from functools import cache
 from pathlib import Path
 
@@ -286,6 +288,10 @@ def _maybe_debug_model(model: str | None) -> None:
 # ====================================================================
 
 
+class LLMStreamError(RuntimeError):
+    """A streamed completion failed before it finished."""
+
+
 class LLMClient:
     """OpenAI LLM client with shadow mode optimizations.
     
@@ -394,6 +400,58 @@ class LLMClient:
             print(f"[LLM_ERROR] Unexpected error: {e}")
             return None
 
+    def stream_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Stream completion text from OpenAI API as it is generated.
+        
+        Streaming variant of generate_completion(): yields content deltas as
+        soon as they arrive so callers can render the first tokens while the
+        rest is still being produced.
+        
+        Args:
+            system_prompt: System message defining assistant behavior
+            user_prompt: User message with context/question
+            max_tokens: Optional completion token limit
+        
+        Yields:
+            Text deltas
+        
+        Raises:
+            LLMStreamError: If the request fails or the stream breaks off, so
+                callers can tell a truncated answer from a complete one
+        """
+        try:
+            kwargs = {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": self.temperature,
+                "stream": True,
+            }
+            if max_tokens:
+                kwargs["max_tokens"] = max_tokens
+
+            for chunk in self.client.chat.completions.create(**kwargs):
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+        except OpenAIError as e:
+            print(f"[LLM_ERROR] OpenAI streaming error: {e}")
+            raise LLMStreamError(str(e)) from e
+
+        except Exception as e:
+            print(f"[LLM_ERROR] Unexpected streaming error: {e}")
+            raise LLMStreamError(str(e)) from e
+
     def generate_json(
         self,
         system_prompt: str,
@@ -417,6 +475,76 @@ class LLMClient:
         )
 
 
+class FakeLLMClient:
+    """Offline stand-in for LLMClient (tests, benchmarks, local demos).
+    
+    Returns canned responses through the same generate_completion /
+    generate_json / stream_completion interface, with optional injected
+    latency so callers' timing behavior can be exercised without network.
+    """
+
+    def __init__(
+        self,
+        responses: str | list[str] = "",
+        chunk_size: int = 4,
+        latency: float = 0.0,
+        token_delay: float = 0.0,
+        model: str = DEFAULT_MODEL,
+        temperature: float = DEFAULT_TEMPERATURE,
+    ):
+        """Initialize fake client.
+        
+        Args:
+            responses: Response text, or list cycled through on each call
+            chunk_size: Characters per streamed delta
+            latency: Seconds before the first token / full response
+            token_delay: Seconds between streamed deltas
+            model: Reported model name
+            temperature: Reported temperature
+        """
+        self.responses = [responses] if isinstance(responses, str) else list(responses)
+        self.chunk_size = max(1, chunk_size)
+        self.latency = latency
+        self.token_delay = token_delay
+        self.model = model
+        self.temperature = temperature
+        self.calls: list[dict[str, str]] = []
+
+    def _next_response(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls.append({"system_prompt": system_prompt, "user_prompt": user_prompt})
+        if not self.responses:
+            return ""
+        return self.responses[(len(self.calls) - 1) % len(self.responses)]
+
+    def generate_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_format: dict | None = None,
+    ) -> str | None:
+        text = self._next_response(system_prompt, user_prompt)
+        if self.latency:
+            time.sleep(self.latency)
+        return text or None
+
+    def generate_json(self, system_prompt: str, user_prompt: str) -> str | None:
+        return self.generate_completion(system_prompt, user_prompt, {"type": "json_object"})
+
+    def stream_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        text = self._next_response(system_prompt, user_prompt)
+        if self.latency:
+            time.sleep(self.latency)
+        for i in range(0, len(text), self.chunk_size):
+            if i and self.token_delay:
+                time.sleep(self.token_delay)
+            yield text[i:i + self.chunk_size]
+
+
 @cache
 def get_client(
     model: str = DEFAULT_MODEL,
@@ -12,6 +12,7 @@ Provides guardrails and quality controls around LLM recommendations by:
 This ensures LLM adds nuance while staying within safe, appropriate bounds.
 """
 
+import collections.abc
 import json
 import pathlib
 import uuid
@@ -676,6 +677,190 @@ def _strip_html_shell(text: str) -> str:
     return _normalize_answer(text)
 
 
+# ==============================================================================
+# ANSWER CACHE HELPERS
+# ==============================================================================
+
+def _corp_chunk_id(chunk: dict[str, Any]) -> str:
+    """Stable identifier for a retrieved corp chunk."""
+    return str(chunk.get("doc_id") or chunk.get("id") or chunk.get("url", ""))
+
+
+def _cache_kind(kind: str, stream: bool) -> str:
+    """Answer-cache kind for a mediator output mode.
+
+    Streamed and blocking answers are formatted differently (Markdown with a
+    SOURCES trailer vs parsed JSON), so they never share cache entries.
+    """
+    return f"{kind}:stream" if stream else kind
+
+
+def _cache_get(
+    kind: str,
+    query: str,
+    source_ids: list[str],
+    policy: dict[str, Any],
+    name: str | None,
+    tenant: str | None,
+    stream: bool = False,
+) -> dict[str, Any] | None:
+    """Look up a mediated answer in the answer cache (never raises)."""
+    try:
+        from ai.answer_cache import answer_cache_enabled, get_answer_cache, policy_version
+        if not answer_cache_enabled():
+            return None
+        return get_answer_cache().get(
+            _cache_kind(kind, stream), query, source_ids, policy_version(policy), name=name, tenant=tenant
+        )
+    except Exception as e:
+        print(f"[ANSWER_CACHE] lookup failed: {e}")
+        return None
+
+
+def _cache_put(
+    kind: str,
+    query: str,
+    source_ids: list[str],
+    policy: dict[str, Any],
+    name: str | None,
+    result: dict[str, Any],
+    stream: bool = False,
+) -> None:
+    """Store a successful mediated answer in the answer cache (never raises)."""
+    try:
+        from ai.answer_cache import answer_cache_enabled, get_answer_cache, policy_version
+        if not answer_cache_enabled():
+            return
+        get_answer_cache().put(
+            _cache_kind(kind, stream), query, source_ids, policy_version(policy), result, name=name
+        )
+    except Exception as e:
+        print(f"[ANSWER_CACHE] store failed: {e}")
+
+
+# ==============================================================================
+# FAQ / CORP PROMPTS (shared by blocking and streaming mediators)
+# ==============================================================================
+# Blocking mediators ask the model for JSON; streaming mediators ask for the
+# Markdown answer followed by a "SOURCES:" trailer line. Everything else in
+# the prompt is shared.
+
+_SOURCES_MARKER = "SOURCES:"
+
+
+def _faq_prompts(
+    query: str,
+    name: str | None,
+    faqs: list[dict[str, Any]],
+    policy: dict[str, Any],
+    stream: bool = False,
+) -> tuple[str, str]:
+    """System and user prompt for an FAQ answer.
+
+    Args:
+        stream: Ask for streamed Markdown + SOURCES trailer instead of JSON
+
+    Returns:
+        (system_prompt, user_prompt)
+    """
+    allowed_products = policy.get("allowed_products", [])
+    allowed_terms = policy.get("allowed_terms", [])
+    banned_phrases = policy.get("banned_phrases", [])
+    fallback_name = policy.get("fallback_name", "the person you're helping")
+
+    if stream:
+        output_format = f"""OUTPUT FORMAT: Write the answer directly (no JSON). On the last line write
+{_SOURCES_MARKER} followed by the comma-separated FAQ IDs you used."""
+    else:
+        output_format = """OUTPUT FORMAT (valid JSON only):
+{"answer": "your concise answer here", "sources": ["faq_id_1", "faq_id_2"], "cta": {"label": "...", "route": "..."}}"""
+
+    system_prompt = f"""You are a concise assistant for Senior Navigator's FAQ.
+
+STRICT RULES:
+- Use ONLY the provided FAQ entries below. Never invent information.
+- Only mention products from this list: {', '.join(allowed_products)}
+- Use domain terms: {', '.join(allowed_terms)}
+- NEVER use these banned phrases: {', '.join(banned_phrases)}
+- Use "{name or fallback_name}" when referring to the care recipient
+- Maximum 120 words
+- Plain, warm, professional language
+- No medical advice or diagnoses
+- **Return Markdown only. Do not use HTML tags or inline styles. Do not wrap answers in <div> or other containers.**
+
+{output_format}
+
+FAQ CONTEXT:
+"""
+    for faq in faqs[:3]:  # Max 3 sources
+        system_prompt += f"\n[{faq['id']}] Q: {faq['question']}\nA: {faq['answer'][:300]}...\n"
+
+    user_prompt = f"Question: {query}\n\nProvide a concise answer using only the FAQ context above."
+    return system_prompt, user_prompt
+
+
+def _corp_prompts(
+    query: str,
+    name: str | None,
+    chunks: list[dict[str, Any]],
+    policy: dict[str, Any],
+    stream: bool = False,
+) -> tuple[str, str]:
+    """System and user prompt for a corporate knowledge answer.
+
+    Args:
+        stream: Ask for streamed Markdown + SOURCES trailer instead of JSON
+
+    Returns:
+        (system_prompt, user_prompt)
+    """
+    allowed_products = policy.get("allowed_products", [])
+    allowed_terms = policy.get("allowed_terms", [])
+    banned_phrases = policy.get("banned_phrases", [])
+    fallback_name = policy.get("fallback_name", "the person you're helping")
+
+    if stream:
+        output_rules = ""
+        output_format = f"""
+OUTPUT FORMAT: Write the answer directly (no JSON). On the last line write
+{_SOURCES_MARKER} followed by the comma-separated chunk_id numbers you used.
+"""
+    else:
+        output_rules = """- Cite sources by title with URLs.
+- Return JSON: {"answer":"...","sources":[{"title":"...","url":"..."}]}
+"""
+        output_format = ""
+
+    system_prompt = f"""You are a concise company explainer for Senior Navigator / Concierge Care Advisors.
+
+STRICT RULES:
+- Use the provided website chunks as your PRIMARY source. Extract relevant details.
+- If chunks partially answer, synthesize what's there and be transparent about coverage.
+- Only mention products from this list: {', '.join(allowed_products)}
+- Use domain terms: {', '.join(allowed_terms)}
+- NEVER use these phrases: {', '.join(banned_phrases)}. Use "{fallback_name}" instead.
+- Answer in ≤120 words, plain language.
+{output_rules}- **Return Markdown only. Do not use HTML tags or inline styles. Do not wrap answers in <div> or other containers.**
+
+FALLBACK ONLY IF: Chunks are completely unrelated to question (e.g., asking about pets when chunks are about care).
+Otherwise, answer with: "Based on our guides/resources: [answer using chunk info]"
+{output_format}"""
+
+    # Format chunks for LLM
+    chunk_context = [
+        {
+            "chunk_id": i,
+            "title": c.get("title", ""),
+            "heading": c.get("heading") or c.get("section", ""),  # Handle both formats
+            "url": c.get("url", ""),
+            "text": c.get("text", "")[:500],  # Truncate long text
+        }
+        for i, c in enumerate(chunks, 1)
+    ]
+    user_prompt = json.dumps({"question": query, "name": name or fallback_name, "chunks": chunk_context})
+    return system_prompt, user_prompt
+
+
 # ==============================================================================
 # FAQ MEDIATOR (Stage 3)
 # ==============================================================================
@@ -683,16 +868,22 @@ def answer_faq(
     query: str,
     name: str | None,
     faqs: list[dict[str, Any]],
-    policy: dict[str, Any]
+    policy: dict[str, Any],
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Generate LLM-powered FAQ answer with policy guardrails.
     
+    Answers are served from the answer cache (ai/answer_cache.py) when the
+    same (or a near-duplicate) question was answered from the same FAQ
+    sources under the same policy version.
+    
     Args:
         query: User's natural language question
         name: User's name for personalization (or None)
         faqs: List of retrieved FAQ dicts from retrieval layer
         policy: Policy dict from load_faq_policy()
+        tenant: Optional tenant label for cache hit-rate metrics
         
     Returns:
         Dict with schema:
@@ -703,37 +894,17 @@ def answer_faq(
         }
     """
     try:
-        # Build system prompt with policy constraints
-        allowed_products = policy.get("allowed_products", [])
-        allowed_terms = policy.get("allowed_terms", [])
         banned_phrases = policy.get("banned_phrases", [])
         fallback_name = policy.get("fallback_name", "the person you're helping")
         default_cta = policy.get("default_cta", {"label": "Open Guided Care Plan", "route": "gcp_intro"})
         
-        system_prompt = f"""You are a concise assistant for Senior Navigator's FAQ.
-
-STRICT RULES:
-- Use ONLY the provided FAQ entries below. Never invent information.
-- Only mention products from this list: {', '.join(allowed_products)}
-- Use domain terms: {', '.join(allowed_terms)}
-- NEVER use these banned phrases: {', '.join(banned_phrases)}
-- Use "{name or fallback_name}" when referring to the care recipient
-- Maximum 120 words
-- Plain, warm, professional language
-- No medical advice or diagnoses
-- **Return Markdown only. Do not use HTML tags or inline styles. Do not wrap answers in <div> or other containers.**
-
-OUTPUT FORMAT (valid JSON only):
-{{"answer": "your concise answer here", "sources": ["faq_id_1", "faq_id_2"], "cta": {{"label": "...", "route": "..."}}}}
-
-FAQ CONTEXT:
-"""
-        
-        # Add FAQ context
-        for faq in faqs[:3]:  # Max 3 sources
-            system_prompt += f"\n[{faq['id']}] Q: {faq['question']}\nA: {faq['answer'][:300]}...\n"
+        # Answer cache (exact or near-duplicate question, same sources + policy)
+        source_ids = [faq["id"] for faq in faqs[:3]]
+        cached = _cache_get("faq", query, source_ids, policy, name, tenant)
+        if cached is not None:
+            return cached
         
-        user_prompt = f"Question: {query}\n\nProvide a concise answer using only the FAQ context above."
+        system_prompt, user_prompt = _faq_prompts(query, name, faqs, policy)
         
         # Call LLM
         client = get_client()
@@ -802,11 +973,13 @@ FAQ CONTEXT:
         if not isinstance(sources, list):
             sources = []
             
-        return {
+        result = {
             "answer": answer_text[:800],  # Hard cap at 800 chars
             "sources": sources[:3],  # Max 3 sources
             "cta": cta
         }
+        _cache_put("faq", query, source_ids, policy, name, result)
+        return result
         
     except Exception as e:
         print(f"[FAQ_LLM_ERROR] {e}")
@@ -825,18 +998,21 @@ def answer_corp(
     query: str,
     name: str | None,
     chunks: list[dict[str, Any]],
-    policy: dict[str, Any]
+    policy: dict[str, Any],
+    tenant: str | None = None,
 ) -> dict[str, Any]:
     """
     Generate LLM-powered corporate knowledge answer with policy guardrails.
     
     Used for queries about CCA: company info, leadership, history, services.
+    Served from the answer cache when possible (see answer_faq).
     
     Args:
         query: User's natural language question
         name: User's name for personalization (or None)
         chunks: List of retrieved corp knowledge chunks from retrieve_corp()
         policy: Policy dict from load_faq_policy()
+        tenant: Optional tenant label for cache hit-rate metrics
         
     Returns:
         Dict with schema:
@@ -848,51 +1024,22 @@ def answer_corp(
     try:
         from ai.llm_client import get_client
         
-        # Build system prompt with policy constraints
-        allowed_products = policy.get("allowed_products", [])
-        allowed_terms = policy.get("allowed_terms", [])
         banned_phrases = policy.get("banned_phrases", [])
         fallback_name = policy.get("fallback_name", "the person you're helping")
         
-        system_prompt = f"""You are a concise company explainer for Senior Navigator / Concierge Care Advisors.
-
-STRICT RULES:
-- Use the provided website chunks as your PRIMARY source. Extract relevant details.
-- If chunks partially answer, synthesize what's there and be transparent about coverage.
-- Only mention products from this list: {', '.join(allowed_products)}
-- Use domain terms: {', '.join(allowed_terms)}
-- NEVER use these phrases: {', '.join(banned_phrases)}. Use "{fallback_name}" instead.
-- Answer in ≤120 words, plain language.
-- Cite sources by title with URLs.
-- Return JSON: {{"answer":"...","sources":[{{"title":"...","url":"..."}}]}}
-- **Return Markdown only. Do not use HTML tags or inline styles. Do not wrap answers in <div> or other containers.**
-
-FALLBACK ONLY IF: Chunks are completely unrelated to question (e.g., asking about pets when chunks are about care).
-Otherwise, answer with: "Based on our guides/resources: [answer using chunk info]"
-"""
-        
-        # Format chunks for LLM
-        chunk_context = []
-        for i, c in enumerate(chunks, 1):
-            chunk_context.append({
-                "chunk_id": i,
-                "title": c.get("title", ""),
-                "heading": c.get("heading") or c.get("section", ""),  # Handle both formats
-                "url": c.get("url", ""),
-                "text": c.get("text", "")[:500]  # Truncate long text
-            })
+        # Answer cache (exact or near-duplicate question, same chunks + policy)
+        source_ids = [_corp_chunk_id(c) for c in chunks]
+        cached = _cache_get("corp", query, source_ids, policy, name, tenant)
+        if cached is not None:
+            return cached
         
-        user_prompt = {
-            "question": query,
-            "name": name or fallback_name,
-            "chunks": chunk_context,
-        }
+        system_prompt, user_prompt = _corp_prompts(query, name, chunks, policy)
         
         # Call LLM using our LLMClient wrapper
         client = get_client()
         raw_text = client.generate_completion(
             system_prompt=system_prompt,
-            user_prompt=json.dumps(user_prompt),
+            user_prompt=user_prompt,
         )
         
         if not raw_text:
@@ -944,10 +1091,12 @@ Otherwise, answer with: "Based on our guides/resources: [answer using chunk info
         # Normalize to clean Markdown (strip HTML shells and unescape entities)
         answer_text = _normalize_answer(answer_text)
             
-        return {
+        result = {
             "answer": answer_text[:800],  # Hard cap at 800 chars
             "sources": sources[:5],  # Max 5 sources
         }
+        _cache_put("corp", query, source_ids, policy, name, result)
+        return result
         
     except Exception as e:
         print(f"[CORP_LLM_ERROR] {e}")
@@ -957,3 +1106,358 @@ Otherwise, answer with: "Based on our guides/resources: [answer using chunk info
             "sources": [],
         }
 
+
+
+# ==============================================================================
+# STREAMING MEDIATORS (FAQ / Corp)
+# ==============================================================================
+# Streaming variants of answer_faq/answer_corp. The blocking versions ask the
+# model for JSON, which cannot be shown until it is complete. In streaming
+# mode the model writes the Markdown answer directly and ends with a
+# "SOURCES:" trailer line, and StreamingAnswerGuard applies the same
+# guardrails (banned phrases, 120-word cap, HTML stripping) incrementally.
+
+_STREAM_MAX_WORDS = 120
+_STREAM_MAX_CHARS = 800
+_OPEN_A_TAG = re.compile(r"<a\s[^>]*>(?![\s\S]*</a>)", re.I)
+_ANY_TAG = re.compile(r"<[^>]+>")
+_LI_TAG = re.compile(r"<li\s*>", re.I)
+
+
+class StreamingAnswerGuard:
+    """Incremental guardrails for a streamed LLM answer.
+    
+    feed() accepts raw token deltas and returns the text that is safe to show
+    so far. Text is held back while it could still change meaning:
+    - a partial word (may be the start of a banned phrase)
+    - an unclosed HTML tag, link or entity
+    - a possible partial "SOURCES:" trailer
+    
+    Once the word or character cap is reached, the answer is closed with
+    "..." and further deltas are ignored. Everything after the SOURCES:
+    marker is collected separately in `trailer`.
+    """
+
+    def __init__(
+        self,
+        banned_phrases: list[str] | None = None,
+        fallback_name: str = "the person you're helping",
+        max_words: int = _STREAM_MAX_WORDS,
+        max_chars: int = _STREAM_MAX_CHARS,
+    ):
+        self.banned = [b for b in (banned_phrases or []) if b]
+        self.fallback_name = fallback_name
+        self.max_words = max_words
+        self.max_chars = max_chars
+        self._banned_re = (
+            re.compile("|".join(re.escape(b) for b in self.banned), re.I) if self.banned else None
+        )
+        self._hold = max([len(b) for b in self.banned] + [len(_SOURCES_MARKER)])
+        self._pending = ""
+        self._overflow = ""
+        self._words = 0
+        self._emitted: list[str] = []
+        self.trailer = ""
+        self.done = False  # word/char cap hit
+        self.closed = False  # SOURCES trailer reached
+
+    @property
+    def text(self) -> str:
+        """Everything emitted so far."""
+        return "".join(self._emitted).strip()
+
+    def feed(self, delta: str) -> str:
+        """Add a raw delta; return newly releasable safe text."""
+        if self.closed:
+            self.trailer += delta
+            return ""
+        if self.done:
+            # Past the cap: only watch for the SOURCES trailer
+            self._overflow += delta
+            marker_at = self._overflow.find(_SOURCES_MARKER)
+            if marker_at >= 0:
+                self.trailer = self._overflow[marker_at + len(_SOURCES_MARKER):]
+                self.closed = True
+            return ""
+        self._pending += delta
+        if self._banned_re is not None:
+            # Replace on the whole buffer so phrases spanning deltas are caught;
+            # a still-incomplete phrase sits inside the held-back tail.
+            self._pending = self._banned_re.sub(self.fallback_name, self._pending)
+
+        marker_at = self._pending.find(_SOURCES_MARKER)
+        if marker_at >= 0:
+            self.trailer = self._pending[marker_at + len(_SOURCES_MARKER):]
+            self._pending = self._pending[:marker_at]
+            self.closed = True
+            return self._release(len(self._pending), final=True)
+
+        return self._release(self._safe_cut())
+
+    def finish(self) -> str:
+        """Flush held-back text at end of stream."""
+        if self.done:
+            return ""
+        return self._release(len(self._pending), final=True)
+
+    def _safe_cut(self) -> int:
+        """Largest prefix of the pending buffer that can no longer change."""
+        s = self._pending
+        cut = len(s) - self._hold
+        if cut <= 0:
+            return 0
+        # Snap back to a whitespace boundary so words are never split
+        boundary = max(s.rfind(" ", 0, cut + 1), s.rfind("\n", 0, cut + 1))
+        cut = boundary + 1 if boundary >= 0 else 0
+
+        # Don't release inside a tag, an open link or an entity
+        lt = s.rfind("<", 0, cut)
+        if lt > s.rfind(">", 0, cut):
+            cut = lt
+        open_a = _OPEN_A_TAG.search(s[:cut])
+        if open_a:
+            cut = open_a.start()
+        amp = s.rfind("&", 0, cut)
+        if amp >= 0 and ";" not in s[amp:cut] and cut - amp < 10:
+            cut = amp
+        return cut
+
+    def _release(self, cut: int, final: bool = False) -> str:
+        ready, self._pending = self._pending[:cut], self._pending[cut:]
+        if not ready:
+            return ""
+        return self._cap(self._sanitize(ready, final))
+
+    def _sanitize(self, chunk: str, final: bool) -> str:
+        """Streaming-safe subset of _html_to_markdown (keeps chunk-edge whitespace)."""
+        chunk = _CHAT_WRAPPERS_OPEN.sub("", chunk)
+        chunk = _CHAT_WRAPPERS_CLOSE.sub("", chunk)
+
+        def _a2md(m):
+            url = m.group(1).strip()
+            inner = _ANY_TAG.sub("", m.group(2)).strip()
+            return f"[{inner}]({url})" if inner else f"<{url}>"
+
+        chunk = _A_TAG.sub(_a2md, chunk)
+        chunk = _BR_TAG.sub("\n", chunk)
+        chunk = _P_CLOSE.sub("\n\n", chunk)
+        chunk = _LI_TAG.sub("\n- ", chunk)
+        chunk = _BLOCK_TAGS.sub("", chunk)
+        if final:
+            # Drop anything still looking like a tag at end of stream
+            chunk = re.sub(r"<(?!https?://)[^>]*>?$", "", chunk)
+        return html.unescape(chunk)
+
+    def _cap(self, chunk: str) -> str:
+        """Enforce the word and character caps on released text."""
+        emitted_chars = sum(len(e) for e in self._emitted)
+        out: list[str] = []
+        for piece in re.split(r"(\s+)", chunk):
+            if not piece:
+                continue
+            if not piece.isspace():
+                if self._words >= self.max_words or emitted_chars + len(piece) > self.max_chars:
+                    self.done = True
+                    self._overflow, self._pending = self._pending, ""
+                    out.append("...")
+                    break
+                self._words += 1
+            out.append(piece)
+            emitted_chars += len(piece)
+        released = "".join(out)
+        if self.done:
+            released = released.rstrip().removesuffix("...").rstrip() + "..."
+            if not self._emitted and released == "...":
+                released = ""
+        self._emitted.append(released)
+        return released
+
+
+class AnswerStream(collections.abc.Iterator):
+    """Iterator of guarded answer deltas with the final result dict.
+    
+    Iterate (e.g. with st.write_stream) to receive text as it is produced;
+    after exhaustion `result` holds the same dict answer_faq/answer_corp
+    would have returned.
+    """
+
+    def __init__(self, gen_factory: collections.abc.Callable[["AnswerStream"], collections.abc.Iterator[str]]):
+        self.result: dict[str, Any] | None = None
+        self._gen = gen_factory(self)
+
+    def __next__(self) -> str:
+        return next(self._gen)
+
+
+def _faq_sources_from_trailer(trailer: str, faqs: list[dict[str, Any]]) -> list[str]:
+    """Parse "faq_1, faq_2" trailer into known FAQ IDs."""
+    known = {faq["id"] for faq in faqs[:3]}
+    ids = [t.strip(" []`\n") for t in trailer.split(",")]
+    return [i for i in ids if i in known][:3]
+
+
+def _corp_sources_from_trailer(trailer: str, chunks: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """Parse "1, 3" chunk-number trailer into title/url source dicts."""
+    sources, seen = [], set()
+    for n in re.findall(r"\d+", trailer):
+        idx = int(n) - 1
+        if 0 <= idx < len(chunks) and idx not in seen:
+            seen.add(idx)
+            sources.append({"title": chunks[idx].get("title", ""), "url": chunks[idx].get("url", "")})
+    return sources[:5]
+
+
+def _guarded_stream(
+    stream: AnswerStream,
+    client: Any,
+    system_prompt: str,
+    user_prompt: str,
+    guard: StreamingAnswerGuard,
+    build_result: collections.abc.Callable[[str, str], dict[str, Any]],
+    cache_result: collections.abc.Callable[[dict[str, Any]], None],
+    fallback: dict[str, Any],
+    max_tokens: int = 250,
+) -> collections.abc.Iterator[str]:
+    """Drive client.stream_completion through the guard, then set stream.result.
+    
+    The result is cached only if the stream finished cleanly; an answer cut
+    off by an error is shown once but never served to later callers.
+    """
+    if client is None:
+        stream.result = fallback
+        yield fallback["answer"]
+        return
+    complete = False
+    try:
+        for delta in client.stream_completion(system_prompt, user_prompt, max_tokens=max_tokens):
+            safe = guard.feed(delta)
+            if safe:
+                yield safe
+        complete = True
+    except Exception as e:
+        print(f"[FAQ_STREAM_ERROR] {e}")
+    tail = guard.finish()
+    if tail:
+        yield tail
+
+    answer_text = guard.text
+    if not answer_text:
+        stream.result = fallback
+        yield fallback["answer"]
+        return
+    stream.result = build_result(answer_text, guard.trailer)
+    if complete:
+        cache_result(stream.result)
+
+
+def stream_answer_faq(
+    query: str,
+    name: str | None,
+    faqs: list[dict[str, Any]],
+    policy: dict[str, Any],
+    tenant: str | None = None,
+    client: Any = None,
+) -> AnswerStream:
+    """
+    Streaming variant of answer_faq().
+    
+    Yields guarded Markdown deltas; `.result` has the answer_faq() dict once
+    the stream is exhausted. Cache hits are yielded in one piece.
+    
+    Args:
+        query: User's natural language question
+        name: User's name for personalization (or None)
+        faqs: List of retrieved FAQ dicts from retrieval layer
+        policy: Policy dict from load_faq_policy()
+        tenant: Optional tenant label for cache hit-rate metrics
+        client: Streaming client (defaults to get_client())
+    """
+    banned_phrases = policy.get("banned_phrases", [])
+    fallback_name = policy.get("fallback_name", "the person you're helping")
+    default_cta = policy.get("default_cta", {"label": "Open Guided Care Plan", "route": "gcp_intro"})
+    source_ids = [faq["id"] for faq in faqs[:3]]
+    system_prompt, user_prompt = _faq_prompts(query, name, faqs, policy, stream=True)
+
+    fallback = {
+        "answer": "We don't have that in our FAQ yet. You can start the Guided Care Plan to learn more.",
+        "sources": [],
+        "cta": default_cta,
+    }
+
+    def _top_cta() -> dict[str, Any]:
+        for faq in faqs[:1]:
+            for cta in faq.get("ctas") or []:
+                if isinstance(cta, dict) and "route" in cta:
+                    return cta
+        return default_cta
+
+    def _build(answer_text: str, trailer: str) -> dict[str, Any]:
+        result = {
+            "answer": answer_text[:_STREAM_MAX_CHARS],
+            "sources": _faq_sources_from_trailer(trailer, faqs),
+            "cta": _top_cta(),
+        }
+        return result
+
+    def _cache(result: dict[str, Any]) -> None:
+        _cache_put("faq", query, source_ids, policy, name, result, stream=True)
+
+    def _gen(stream: AnswerStream) -> collections.abc.Iterator[str]:
+        cached = _cache_get("faq", query, source_ids, policy, name, tenant, stream=True)
+        if cached is not None:
+            stream.result = cached
+            yield cached.get("answer", "")
+            return
+        guard = StreamingAnswerGuard(banned_phrases, fallback_name)
+        yield from _guarded_stream(
+            stream, client or get_client(), system_prompt, user_prompt, guard, _build, _cache, fallback
+        )
+
+    return AnswerStream(_gen)
+
+
+def stream_answer_corp(
+    query: str,
+    name: str | None,
+    chunks: list[dict[str, Any]],
+    policy: dict[str, Any],
+    tenant: str | None = None,
+    client: Any = None,
+) -> AnswerStream:
+    """
+    Streaming variant of answer_corp().
+    
+    Same contract as stream_answer_faq(); `.result` matches answer_corp().
+    """
+    banned_phrases = policy.get("banned_phrases", [])
+    fallback_name = policy.get("fallback_name", "the person you're helping")
+    source_ids = [_corp_chunk_id(c) for c in chunks]
+    system_prompt, user_prompt = _corp_prompts(query, name, chunks, policy, stream=True)
+
+    fallback = {
+        "answer": "I'm having trouble accessing our knowledge base right now. Please try again in a moment.",
+        "sources": [],
+    }
+
+    def _build(answer_text: str, trailer: str) -> dict[str, Any]:
+        result = {
+            "answer": answer_text[:_STREAM_MAX_CHARS],
+            "sources": _corp_sources_from_trailer(trailer, chunks),
+        }
+        return result
+
+    def _cache(result: dict[str, Any]) -> None:
+        _cache_put("corp", query, source_ids, policy, name, result, stream=True)
+
+    def _gen(stream: AnswerStream) -> collections.abc.Iterator[str]:
+        cached = _cache_get("corp", query, source_ids, policy, name, tenant, stream=True)
+        if cached is not None:
+            stream.result = cached
+            yield cached.get("answer", "")
+            return
+        guard = StreamingAnswerGuard(banned_phrases, fallback_name)
+        yield from _guarded_stream(
+            stream, client or get_client(), system_prompt, user_prompt, guard, _build, _cache, fallback
+        )
+
+    return AnswerStream(_gen)
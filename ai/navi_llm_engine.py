@@ -14,7 +14,7 @@ import json
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from ai.llm_client import get_client
+from ai.llm_async import get_sync_client
 from core.flags import get_flag_value
 from pydantic import BaseModel, Field
 
@@ -98,7 +98,7 @@ class NaviLLMEngine:
             return None
             
         try:
-            client = get_client()
+            client = get_sync_client()
             if not client:
                 return None
                 
@@ -138,7 +138,7 @@ class NaviLLMEngine:
             return None
             
         try:
-            client = get_client()
+            client = get_sync_client()
             if not client:
                 return None
                 
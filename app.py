@@ -78,8 +78,10 @@ observer.observe(document.body, {childList: true, subtree: true});
 </script>
 """
 
+from core.config_registry import warm_configs
+from core.css_bundle import build_bundles
 from core.events import log_event
-from core.nav import current_route, load_nav
+from core.nav import current_route, likely_next_routes, load_nav, warm_routes
 
 # Session persistence
 from core.session_store import (
@@ -193,6 +195,12 @@ def _cleanup_legacy_gcp_state() -> None:
 # Ensure CSS loads once per session (guard now inside inject_css)
 inject_css()
 
+# Content-hashed hub/pill CSS bundles under static/css (built once per process)
+build_bundles()
+
+# Parse config/*.json and module manifests in the background (once per process)
+warm_configs()
+
 # Force scroll to top on page load (fixes mobile scroll position issue)
 st.markdown(
     """
@@ -407,11 +415,13 @@ log_event("nav.page_change", {"to": route})
 # Log route resolution for key flows
 log_routes = ("cost_intro", "cost_quick_estimate", "auth_start", "login", "fa_intro", "pfma_v3")
 if route in log_routes:
-    module_path = PAGES[route]["render"].__module__ + ":" + PAGES[route]["render"].__name__
-    print(f"[ROUTER] page={route} -> {module_path}")
+    print(f"[ROUTER] page={route} -> {PAGES[route]['module']}")
 
 PAGES[route]["render"]()
 
+# Import likely-next routes in the background now that the page is painted
+warm_routes(PAGES, likely_next_routes(route, PAGES))
+
 # Inject footer removal JavaScript in production
 if IS_PRODUCTION:
     st.components.v1.html(FOOTER_REMOVAL_JS, height=0)
@@ -6,6 +6,7 @@ import streamlit as st
 from datetime import datetime
 from shared.data_access.navigator_reader import NavigatorDataReader
 from shared.data_access.crm_repository import CrmRepository
+from shared.data_access.advisor_summary_store import AdvisorSummaryStore
 from core.adapters.streamlit_crm import get_crm_customer_by_id, delete_crm_customer
 
 # Set page config first - constrain layout
@@ -324,6 +325,38 @@ def render_navigator_status(navigator_data):
     st.markdown(html, unsafe_allow_html=True)
 
 
+DRAWER_TITLES = {
+    'about_person': '👤 About the Person',
+    'housing_preferences': '🏠 Housing Preferences',
+    'medical_care': '🩺 Medical & Care',
+    'financial_overview': '💰 Financial Overview',
+}
+
+
+def render_advisor_summary(customer_id, reader):
+    """Render precomputed advisor summary drawers (never generated live here)"""
+    user_doc = reader.get_customer_raw_data(customer_id) if reader else None
+    if not user_doc:
+        return
+    
+    store = AdvisorSummaryStore()
+    record = store.get_current(customer_id, user_doc)
+    st.markdown("### 📝 Advisor Summary")
+    if not record:
+        previous = store.get(customer_id)
+        if previous:
+            st.caption("Assessment changed since this summary was generated; an updated summary is on its way.")
+            record = previous
+        else:
+            st.caption("Summary not generated yet. It will appear after the next precompute run.")
+            return
+    
+    for drawer_type, narrative in record.get('drawers', {}).items():
+        with st.expander(DRAWER_TITLES.get(drawer_type, drawer_type.replace('_', ' ').title())):
+            st.markdown(narrative)
+    st.caption(f"Generated {record.get('generated_at', '')[:16].replace('T', ' ')} UTC")
+
+
 def render_medical_profile(customer_data):
     """Render medical profile with conditions, medications, and assessments"""
     
@@ -808,6 +841,11 @@ def render():
     except Exception as e:
         st.error(f"Error rendering Navigator status: {e}")
     
+    try:
+        render_advisor_summary(customer_id, reader if navigator_data else None)
+    except Exception as e:
+        st.error(f"Error rendering advisor summary: {e}")
+    
     try:
         render_relationship_info(navigator_data)
     except Exception as e:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
+from core.config_registry import get_json
+from core.service_rules import RuleEvaluator, RuleSet, compile_service
+
 Tile = dict[str, Any]
-Rule = dict[str, Any]
 
 # ==============================================================================
 # ADDITIONAL SERVICES CONFIGURATION
@@ -21,6 +22,8 @@ Rule = dict[str, Any]
 # - Checks unlock_requires against GCP completion and flags
 # - Converts partner data to service tiles
 # - Only shows partners when unlock requirements are met
+# - unlock_requires and visible_when are compiled once (core/service_rules.py)
+#   and only rules whose inputs changed are re-checked on later calls
 #
 # MCIP v2 INTEGRATION:
 # - Reads care recommendation from MCIP.get_care_recommendation()
@@ -54,82 +57,21 @@ PARTNERS_FILE = Path(__file__).resolve().parents[1] / "config" / "partners.json"
 def _load_partners() -> list[dict[str, Any]]:
     """Load partner configurations from partners.json.
 
+    Parsed once and shared until the file changes (core.config_registry);
+    callers must not mutate it.
+
     Returns:
         List of partner dictionaries
     """
-    if not PARTNERS_FILE.exists():
-        return []
-
     try:
-        with PARTNERS_FILE.open() as f:
-            return json.load(f)
-    except Exception as e:
+        return get_json(PARTNERS_FILE)
+    except FileNotFoundError:
+        return []
+    except ValueError as e:
         print(f"⚠️  ERROR loading partners.json: {e}")
         return []
 
 
-def _parse_unlock_requirement(req: str, ctx: dict[str, Any]) -> bool:
-    """Parse and evaluate a single unlock requirement.
-
-    Formats:
-    - "gcp:complete" - GCP must be 100% complete
-    - "gcp:>=50" - GCP must be at least 50% complete
-    - "flag:flag_name" - Single flag must be True
-    - "flag:flag1|flag2|flag3" - ANY of the flags must be True (OR logic)
-
-    Args:
-        req: Unlock requirement string
-        ctx: Context with progress and flags
-
-    Returns:
-        True if requirement is met
-    """
-    if req.startswith("gcp:"):
-        gcp_req = req.replace("gcp:", "")
-        gcp_progress = _get(ctx, "progress.gcp", 0)
-
-        if gcp_req == "complete":
-            return gcp_progress >= 100
-        elif gcp_req.startswith(">="):
-            threshold = int(gcp_req.replace(">=", ""))
-            return gcp_progress >= threshold
-        else:
-            return False
-
-    elif req.startswith("flag:"):
-        flag_expr = req.replace("flag:", "")
-        flags = _get(ctx, "flags", {})
-
-        # Handle OR logic (flag1|flag2|flag3)
-        if "|" in flag_expr:
-            flag_names = flag_expr.split("|")
-            return any(flags.get(flag_name.strip(), False) for flag_name in flag_names)
-        else:
-            return flags.get(flag_expr, False)
-
-    return False
-
-
-def _partner_unlocked(partner: dict[str, Any], ctx: dict[str, Any]) -> bool:
-    """Check if partner unlock requirements are met.
-
-    Args:
-        partner: Partner configuration dict
-        ctx: Context with progress and flags
-
-    Returns:
-        True if ALL unlock requirements are met (AND logic across requirements)
-    """
-    unlock_requires = partner.get("unlock_requires", [])
-
-    # No requirements = always unlocked
-    if not unlock_requires:
-        return True
-
-    # ALL requirements must be met (AND logic)
-    return all(_parse_unlock_requirement(req, ctx) for req in unlock_requires)
-
-
 def _convert_partner_to_tile(partner: dict[str, Any], order: int) -> Tile:
     """Convert partner configuration to service tile format.
 
@@ -163,16 +105,6 @@ def _convert_partner_to_tile(partner: dict[str, Any], order: int) -> Tile:
     }
 
 
-def _get(ctx: dict[str, Any], dotted: str, default: Any = None) -> Any:
-    cur: Any = ctx
-    for part in dotted.split("."):
-        if isinstance(cur, dict) and part in cur:
-            cur = cur[part]
-        else:
-            return default
-    return cur
-
-
 def _ctx() -> dict[str, Any]:
     """Build context from MCIP v2 and session state.
 
@@ -236,94 +168,6 @@ def _ctx() -> dict[str, Any]:
     }
 
 
-def _passes(rule: Rule, ctx: dict[str, Any]) -> bool:
-    """Check if a visibility rule passes.
-
-    Rule Types:
-    - equals: path equals value
-    - includes: value in container (list/dict)
-    - exists: path exists and is not None
-    - min_progress: numeric value >= threshold
-    - role_in: role in list of allowed roles
-    - cost_gap: financial gap >= threshold (uses MCIP financial profile)
-    - runway_low: runway months <= threshold (uses MCIP financial profile)
-    """
-    if not rule:
-        return True
-
-    if "equals" in rule:
-        spec = rule["equals"]
-        return _get(ctx, spec["path"]) == spec.get("value")
-
-    if "includes" in rule:
-        spec = rule["includes"]
-        # Handle both lists and dicts (for flags)
-        container = _get(ctx, spec["path"], [])
-        value = spec.get("value")
-        if isinstance(container, dict):
-            # For flags dict, check if flag key exists and is truthy
-            return container.get(value, False)
-        elif isinstance(container, (list, tuple, set)):
-            return value in container
-        return False
-
-    if "exists" in rule:
-        spec = rule["exists"]
-        return _get(ctx, spec["path"]) is not None
-
-    if "min_progress" in rule:
-        spec = rule["min_progress"]
-        try:
-            return float(_get(ctx, spec["path"], 0)) >= float(spec.get("value", 0))
-        except Exception:
-            return False
-
-    if "role_in" in rule:
-        roles = rule["role_in"] or []
-        return _get(ctx, "role") in roles
-
-    # MCIP Financial Profile Rules
-    if "cost_gap" in rule:
-        spec = rule["cost_gap"]
-        financial = _get(ctx, "mcip.financial_profile")
-        if not financial:
-            return False
-        try:
-            gap = financial.gap_amount
-            threshold = float(spec.get("value", 0))
-            return gap >= threshold
-        except Exception:
-            return False
-
-    if "runway_low" in rule:
-        spec = rule["runway_low"]
-        financial = _get(ctx, "mcip.financial_profile")
-        if not financial:
-            return False
-        try:
-            runway = financial.runway_months
-            threshold = float(spec.get("value", 0))
-            return runway <= threshold
-        except Exception:
-            return False
-
-    return False
-
-
-def _visible(tile: dict[str, Any], ctx: dict[str, Any]) -> bool:
-    rules = tile.get("visible_when", [])
-
-    if not rules:
-        return True
-
-    # OR logic: Any rule satisfied → visible
-    for rule in rules:
-        if _passes(rule, ctx):
-            return True
-
-    return False
-
-
 REGISTRY: list[Tile] = [
     # === FLAG-BASED PARTNER SERVICES ===
     {
@@ -630,6 +474,50 @@ REGISTRY: list[Tile] = [
 ]
 
 
+# Partner services now loaded from partners.json (skipped in REGISTRY)
+_PARTNER_KEYS = {"hpone", "omcare", "seniorlife_ai", "lantern", "ncoa", "home_instead"}
+
+# Compiled rules for one partners list (by identity; _load_partners reuses it until the file changes)
+_RULES: tuple[list[dict[str, Any]], RuleSet] | None = None
+
+# Session key holding the per-session incremental evaluator
+_EVALUATOR_KEY = "_additional_services_rules"
+
+
+def _partner_service_key(partner: dict[str, Any]) -> str:
+    return f"partner_{partner.get('id', 'unknown')}"
+
+
+def _rule_set(partners: list[dict[str, Any]]) -> RuleSet:
+    """Compiled rules for partners + REGISTRY, built once per partners list."""
+    global _RULES
+
+    if _RULES is not None and _RULES[0] is partners:
+        return _RULES[1]
+    services = [
+        compile_service(_partner_service_key(p), unlock_requires=p.get("unlock_requires"))
+        for p in partners
+    ]
+    services += [
+        compile_service(tile["key"], visible_when=tile.get("visible_when"))
+        for tile in REGISTRY
+        if tile.get("key") not in _PARTNER_KEYS
+    ]
+    rules = RuleSet.build(services)
+    _RULES = (partners, rules)
+    return rules
+
+
+def _evaluate_rules(partners: list[dict[str, Any]], ctx: dict[str, Any]) -> dict[str, tuple[bool, bool]]:
+    """(visible, personalized) by service key, re-testing only rules whose inputs changed."""
+    rules = _rule_set(partners)
+    evaluator = st.session_state.get(_EVALUATOR_KEY)
+    if not isinstance(evaluator, RuleEvaluator) or evaluator.rules is not rules:
+        evaluator = RuleEvaluator(rules)
+        st.session_state[_EVALUATOR_KEY] = evaluator
+    return evaluator.evaluate(ctx)
+
+
 def get_additional_services(hub: str = "concierge", limit: int | None = None) -> list[Tile]:
     """Get additional service tiles for a hub, filtered by MCIP data and flags.
 
@@ -676,22 +564,19 @@ def get_additional_services(hub: str = "concierge", limit: int | None = None) ->
     partners = _load_partners()
     partner_order = 500  # Start partners at order 500
 
+    # Unlock requirements and visible_when rules, compiled once and re-checked incrementally
+    results = _evaluate_rules(partners, ctx)
+
     for partner in partners:
         partner_id = partner.get("id")
 
         # Check visibility rules:
         # 1. If visible: false, only show if unlocked by flags
         # 2. If visible: true or missing, always check unlock_requires
+        #    (for progressive disclosure)
         is_visible_by_default = partner.get("visible", True)
-
-        if not is_visible_by_default:
-            # Hidden by default - only show if unlock requirements met
-            if not _partner_unlocked(partner, ctx):
-                continue
-        else:
-            # Visible by default - still check unlock requirements (for progressive disclosure)
-            if not _partner_unlocked(partner, ctx):
-                continue
+        if not results[_partner_service_key(partner)][0]:
+            continue
 
         # Convert partner to tile
         partner_tile = _convert_partner_to_tile(partner, partner_order)
@@ -721,15 +606,14 @@ def get_additional_services(hub: str = "concierge", limit: int | None = None) ->
     # STATIC SERVICES: Load from REGISTRY (non-partner services)
     for tile in REGISTRY:
         # Skip ALL partner services that are now dynamically loaded from partners.json
-        # Partners: hpone, omcare, seniorlife_ai, lantern, ncoa, home_instead
-        partner_keys = ["hpone", "omcare", "seniorlife_ai", "lantern", "ncoa", "home_instead"]
-        if tile.get("key") in partner_keys:
+        if tile.get("key") in _PARTNER_KEYS:
             continue
 
         hubs = tile.get("hubs")
         if hubs and hub not in hubs:
             continue
-        if not _visible(tile, ctx):
+        visible, personalized = results[tile["key"]]
+        if not visible:
             continue
 
         # Interpolate subtitle with context
@@ -737,8 +621,8 @@ def get_additional_services(hub: str = "concierge", limit: int | None = None) ->
         subtitle = subtitle.replace("{name}", name)
         subtitle = subtitle.replace("{recommendation}", recommendation_display)
 
-        # Detect personalization type
-        personalization = _detect_personalization(tile, ctx)
+        # "Navi Recommended" when a care/cost flag rule made it visible (core/service_rules.py)
+        personalization = "personalized" if personalized else None
 
         tiles.append(
             {
@@ -768,80 +652,3 @@ def get_additional_services(hub: str = "concierge", limit: int | None = None) ->
         tiles = tiles[:limit]
 
     return tiles
-
-
-def _detect_personalization(tile: dict[str, Any], ctx: dict[str, Any]) -> str | None:
-    """Detect whether a tile is Navi-recommended based on care/cost flags.
-
-    CRITICAL RULES:
-    - Only flag-triggered services get "personalized" → Shows "Navi Recommended" label + blue gradient
-    - General utilities (Learning Center, Care Network) → No label, no gradient
-    - Care flags come from GCP care_recommendation
-    - Cost flags will come from Cost Planner (not yet implemented)
-
-    Returns:
-        - "personalized": Triggered by specific care/cost flags → "Navi Recommended"
-        - None: General utility or always-visible service → No label/gradient
-    """
-    rules = tile.get("visible_when", [])
-
-    # No rules OR min_progress rules only → General utility (no label/gradient)
-    if not rules:
-        return None
-
-    # Check if ALL rules are just min_progress (utility services like care_network)
-    if all("min_progress" in rule for rule in rules):
-        return None
-
-    # CARE FLAGS (from GCP - these trigger personalized services)
-    # These match the actual flag IDs in core/flags.py FLAG_REGISTRY
-    # Source: products/gcp_v4/modules/care_recommendation/module.json
-    care_flags = [
-        # Cognitive & Memory
-        "mild_cognitive_decline",
-        "moderate_cognitive_decline",
-        "severe_cognitive_risk",
-        # Fall & Safety
-        "moderate_safety_concern",
-        "high_safety_concern",
-        "falls_multiple",
-        # Mobility
-        "moderate_mobility",
-        "high_mobility_dependence",
-        # Dependence & ADL
-        "moderate_dependence",
-        "high_dependence",
-        "veteran_aanda_risk",
-        # Mental Health
-        "moderate_risk",
-        "high_risk",
-        "mental_health_concern",
-        # Health
-        "chronic_present",
-        # Support System
-        "no_support",
-        "limited_support",
-        # Geographic
-        "low_access",
-        "very_low_access",
-        "geo_isolated",
-    ]
-
-    # COST FLAGS (to be added later - cost-based personalization)
-    cost_flag_rules = ["cost_gap", "runway_low"]
-
-    # Check if tile was triggered by care or cost flags
-    for rule in rules:
-        if "includes" in rule:
-            flag_value = rule["includes"].get("value")
-            if flag_value in care_flags:
-                # Check if this flag is actually present in context
-                if _passes(rule, ctx):
-                    return "personalized"
-        elif any(cost_rule in rule for cost_rule in cost_flag_rules):
-            # Financial triggers are also personalized
-            if _passes(rule, ctx):
-                return "personalized"
-
-    # If tile is visible but not triggered by care/cost flags → No label (general utility)
-    return None
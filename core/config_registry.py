@@ -0,0 +1,382 @@
+"""
+Config registry: every JSON config parsed once per process.
+
+get_config("nav.json") / get_json("products/.../module.json") return the
+parsed file as an immutable structure (FrozenDict / FrozenList: dict and
+list subclasses that raise on mutation, so isinstance checks and
+json.dumps keep working). Use copy.deepcopy() or thaw() for a mutable copy.
+
+- Hot reload: a file is re-stat'ed at most every CONFIG_RELOAD_INTERVAL
+  seconds and re-parsed when its mtime or size changes. If the new content
+  fails to parse or validate, the last good value is kept.
+- Validation: SCHEMAS maps a repo-relative path (or glob) to a validator
+  that raises ConfigError; module manifests are checked on load.
+- Warm-up: warm_configs() parses config/*.json and every product module
+  JSON (manifests, assessments) up front, in a background thread from
+  app.py (FEATURE_CONFIG_WARMUP=off disables it).
+- config_report() lists load time, file size and in-memory size per config.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.paths import REPO_ROOT
+
+CONFIG_DIR = REPO_ROOT / "config"
+
+# Seconds between mtime checks for one file (0 = check on every access)
+CONFIG_RELOAD_INTERVAL = float(os.getenv("CONFIG_RELOAD_INTERVAL", "1.0"))
+
+
+class ConfigError(ValueError):
+    """Raised when a config file does not match its expected shape."""
+
+
+# ====================================================================
+# IMMUTABLE STRUCTURES
+# ====================================================================
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only; use copy.deepcopy() or thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """A dict that refuses mutation. Pickles and deep-copies as a plain dict."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenList(list):
+    """A list that refuses mutation. Pickles and deep-copies as a plain list."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen (or plain) JSON structure."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _deep_sizeof(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(k) + _deep_sizeof(v) for k, v in value.items())
+    elif isinstance(value, list):
+        size += sum(_deep_sizeof(v) for v in value)
+    return size
+
+
+# ====================================================================
+# SCHEMAS
+# ====================================================================
+
+
+def _require(data: Any, typ: type, where: str) -> None:
+    if not isinstance(data, typ):
+        raise ConfigError(f"{where} must be {typ.__name__}, got {type(data).__name__}")
+
+
+def _require_keys(item: Any, keys: tuple[str, ...], where: str) -> None:
+    _require(item, dict, where)
+    missing = [k for k in keys if k not in item]
+    if missing:
+        raise ConfigError(f"{where} is missing {', '.join(missing)}")
+
+
+def _validate_nav(data: Any) -> None:
+    _require_keys(data, ("groups",), "nav.json")
+    for g, group in enumerate(data["groups"]):
+        _require_keys(group, ("label", "items"), f"nav.json groups[{g}]")
+        for i, item in enumerate(group["items"]):
+            _require_keys(item, ("key", "label", "module"), f"nav.json groups[{g}].items[{i}]")
+
+
+def _validate_partners(data: Any) -> None:
+    _require(data, list, "partners.json")
+    for i, partner in enumerate(data):
+        _require_keys(partner, ("id",), f"partners.json[{i}]")
+        _require(partner.get("unlock_requires", []), list, f"partners.json[{i}].unlock_requires")
+
+
+def _validate_modules_list(name: str) -> Callable[[Any], None]:
+    def validate(data: Any) -> None:
+        _require_keys(data, ("modules",), name)
+        for i, module in enumerate(data["modules"]):
+            _require_keys(module, ("key",), f"{name} modules[{i}]")
+
+    return validate
+
+
+def _validate_conditions(data: Any) -> None:
+    _require_keys(data, ("conditions",), "conditions.json")
+    for i, condition in enumerate(data["conditions"]):
+        _require_keys(condition, ("code",), f"conditions.json conditions[{i}]")
+
+
+def _validate_faq(data: Any) -> None:
+    _require(data, list, "faq.json")
+    for i, item in enumerate(data):
+        _require_keys(item, ("id", "question"), f"faq.json[{i}]")
+
+
+def _validate_module_manifest(data: Any) -> None:
+    _require(data, dict, "module.json")
+
+
+def _validate_assessment(data: Any) -> None:
+    _require_keys(data, ("key", "title"), "assessment")
+    _require(data.get("sections", []), list, f"assessment {data['key']} sections")
+
+
+# Repo-relative path (fnmatch pattern) → validator
+SCHEMAS: dict[str, Callable[[Any], None]] = {
+    "config/nav.json": _validate_nav,
+    "config/partners.json": _validate_partners,
+    "config/cost_planner_v2_modules.json": _validate_modules_list("cost_planner_v2_modules.json"),
+    "config/conditions/conditions.json": _validate_conditions,
+    "config/navi_dialogue.json": lambda data: _require_keys(data, ("journey_phases",), "navi_dialogue.json"),
+    "config/faq.json": _validate_faq,
+    "config/faq_policy.json": lambda data: _require(data, dict, "faq_policy.json"),
+    "config/faq_recommended.json": lambda data: _require_keys(data, ("items",), "faq_recommended.json"),
+    "products/*/modules/*/module.json": _validate_module_manifest,
+    "products/cost_planner_v2/modules/assessments/*.json": _validate_assessment,
+}
+
+
+def _validator(rel: str) -> Callable[[Any], None] | None:
+    for pattern, validate in SCHEMAS.items():
+        if fnmatch.fnmatchcase(rel, pattern):
+            return validate
+    return None
+
+
+# ====================================================================
+# REGISTRY
+# ====================================================================
+
+
+@dataclass
+class ConfigEntry:
+    path: Path
+    data: Any
+    signature: tuple[int, int]  # (mtime_ns, size)
+    checked_at: float
+    load_ms: float
+    memory_bytes: int
+    loads: int = 1
+
+
+class ConfigRegistry:
+    """Process-wide cache of parsed, validated, frozen JSON files."""
+
+    def __init__(self, root: Path = REPO_ROOT, reload_interval: float = CONFIG_RELOAD_INTERVAL) -> None:
+        self.root = root
+        self.reload_interval = reload_interval
+        self._entries: dict[Path, ConfigEntry] = {}
+        self._lock = threading.RLock()
+
+    def _resolve(self, path: str | Path) -> Path:
+        path = Path(path)
+        return path if path.is_absolute() else self.root / path
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _load(self, path: Path, signature: tuple[int, int], previous: ConfigEntry | None) -> ConfigEntry:
+        start = time.perf_counter()
+        with path.open(encoding="utf-8") as f:
+            raw = json.load(f)
+        validate = _validator(self._rel(path))
+        if validate is not None:
+            validate(raw)
+        data = freeze(raw)
+        return ConfigEntry(
+            path=path,
+            data=data,
+            signature=signature,
+            checked_at=time.monotonic(),
+            load_ms=(time.perf_counter() - start) * 1000,
+            memory_bytes=_deep_sizeof(data),
+            loads=previous.loads + 1 if previous else 1,
+        )
+
+    def get(self, path: str | Path) -> Any:
+        """Parsed content of a JSON file (repo-relative or absolute path).
+
+        Raises:
+            FileNotFoundError: the file does not exist (and was never loaded)
+            json.JSONDecodeError / ConfigError: first load is invalid
+        """
+        path = self._resolve(path)
+        entry = self._entries.get(path)
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < self.reload_interval:
+            return entry.data
+
+        with self._lock:
+            entry = self._entries.get(path)
+            try:
+                stat = path.stat()
+            except OSError:
+                if entry is not None:
+                    entry.checked_at = now
+                    return entry.data
+                raise FileNotFoundError(f"Config file not found: {path}") from None
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if entry is not None and entry.signature == signature:
+                entry.checked_at = now
+                return entry.data
+            try:
+                new_entry = self._load(path, signature, entry)
+            except (ValueError, OSError) as e:
+                if entry is None:
+                    raise
+                print(f"[CONFIG] Reload of {self._rel(path)} failed ({e}); keeping previous version")
+                entry.signature = signature
+                entry.checked_at = now
+                return entry.data
+            if entry is not None:
+                print(f"[CONFIG] Reloaded {self._rel(path)} ({new_entry.load_ms:.1f} ms)")
+            self._entries[path] = new_entry
+            return new_entry.data
+
+    def discover(self) -> list[Path]:
+        """config/*.json, config/*/*.json and products/*/modules/**.json under root."""
+        config_dir = self.root / "config"
+        paths = sorted(config_dir.glob("*.json")) + sorted(config_dir.glob("*/*.json"))
+        return paths + sorted((self.root / "products").glob("*/modules/**/*.json"))
+
+    def warm(self, paths: list[str | Path] | None = None) -> int:
+        """Load paths (default: discover()); returns the count loaded."""
+        if paths is None:
+            paths = self.discover()
+        loaded = 0
+        for path in paths:
+            try:
+                self.get(path)
+                loaded += 1
+            except Exception as e:
+                print(f"[CONFIG] Could not warm {self._rel(self._resolve(path))}: {e}")
+        return loaded
+
+    def report(self) -> list[dict[str, Any]]:
+        """Load time and size per loaded config, largest in memory first."""
+        with self._lock:
+            entries = list(self._entries.values())
+        rows = [
+            {
+                "path": self._rel(e.path),
+                "load_ms": round(e.load_ms, 2),
+                "file_bytes": e.signature[1],
+                "memory_bytes": e.memory_bytes,
+                "loads": e.loads,
+            }
+            for e in entries
+        ]
+        return sorted(rows, key=lambda r: r["memory_bytes"], reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+REGISTRY = ConfigRegistry()
+
+
+def get_json(path: str | Path) -> Any:
+    """Parsed JSON file (repo-relative or absolute path), shared and read-only."""
+    return REGISTRY.get(path)
+
+
+def get_config(name: str) -> Any:
+    """Parsed config/<name>, shared and read-only."""
+    return REGISTRY.get(CONFIG_DIR / name)
+
+
+def get_module_manifest(product: str, module: str) -> Any:
+    """Parsed products/<product>/modules/<module>/module.json."""
+    return REGISTRY.get(Path("products") / product / "modules" / module / "module.json")
+
+
+_WARMUP_THREAD: threading.Thread | None = None
+
+
+def warm_configs(background: bool = True) -> threading.Thread | None:
+    """Parse every config up front, once per process; disabled with FEATURE_CONFIG_WARMUP=off."""
+    global _WARMUP_THREAD
+    # Lazy: core.flags imports streamlit; this module stays importable headless
+    from core.flags import get_flag_value
+
+    if get_flag_value("FEATURE_CONFIG_WARMUP").strip().lower() == "off":
+        return None
+    if not background:
+        REGISTRY.warm()
+        return None
+    with REGISTRY._lock:
+        if _WARMUP_THREAD is None:
+            _WARMUP_THREAD = threading.Thread(target=REGISTRY.warm, name="config-warmup", daemon=True)
+            _WARMUP_THREAD.start()
+    return _WARMUP_THREAD
+
+
+def config_report() -> list[dict[str, Any]]:
+    return REGISTRY.report()
+
+
+__all__ = [
+    "CONFIG_DIR",
+    "REGISTRY",
+    "ConfigError",
+    "ConfigRegistry",
+    "FrozenDict",
+    "FrozenList",
+    "config_report",
+    "freeze",
+    "get_config",
+    "get_json",
+    "get_module_manifest",
+    "thaw",
+    "warm_configs",
+]
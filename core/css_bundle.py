@@ -0,0 +1,221 @@
+"""CSS bundle manager.
+
+Concatenates and minifies stylesheets into content-hashed files under
+static/css/ (served by Streamlit static serving at app/static/css/), so
+pages reference a browser-cached URL instead of re-sending the CSS text
+over the websocket on every rerun.
+
+Two delivery modes:
+
+- inject_css_bundle(name): page-scoped CSS (the hub dashboard styles set
+  html/body/h2 rules that must not leak onto other pages). Emits a ~100
+  byte <link> per render; Streamlit drops it with the rest of the page.
+- inject_css_once(bundle): session-wide CSS (radio pills, module CSS).
+  Added to the parent document once per browser session; an element id
+  carrying the bundle digest is the sentinel, so reruns and repeated
+  calls are no-ops.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import streamlit as st
+
+from core.ui import ASSET_BASE_URL
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+STYLES_DIR = _REPO_ROOT / "core" / "styles"
+OUTPUT_DIR = _REPO_ROOT / "static" / "css"
+
+
+@dataclass(frozen=True)
+class CssBundle:
+    name: str
+    css: str  # Minified text
+    digest: str
+    url: str | None  # None if the static file could not be written
+
+
+# ====================================================================
+# MINIFY
+# ====================================================================
+
+_STRING_OR_COMMENT = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S)
+_SPACE_AROUND = re.compile(r"\s*([{};,>])\s*")
+_SPACE_AFTER_COLON = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace; string literals are kept verbatim.
+
+    Only whitespace next to { } ; , > and after : is removed, so descendant
+    combinators ("a :hover") and calc() operators keep their spaces.
+    """
+    strings: list[str] = []
+
+    def protect(match: re.Match) -> str:
+        if match.group(1) is None:
+            return " "  # Comment
+        strings.append(match.group(1))
+        return f"\x00{len(strings) - 1}\x00"
+
+    code = _STRING_OR_COMMENT.sub(protect, css)
+    code = re.sub(r"\s+", " ", code)
+    code = _SPACE_AROUND.sub(r"\1", code)
+    code = _SPACE_AFTER_COLON.sub(":", code)
+    code = code.replace(";}", "}").strip()
+    return re.sub(r"\x00(\d+)\x00", lambda m: strings[int(m.group(1))], code)
+
+
+# ====================================================================
+# BUILD
+# ====================================================================
+
+
+def _bundle_sources(name: str) -> list[str]:
+    if name == "hubs":
+        return [p.read_text(encoding="utf-8") for p in sorted(STYLES_DIR.glob("*.css"))]
+    if name == "pills":
+        from core.ui_css import PILL_CSS
+
+        return [PILL_CSS]
+    raise KeyError(f"Unknown CSS bundle: {name}")
+
+
+BUNDLES = ("hubs", "pills")
+
+
+def build_bundle(name: str, css: str, *, prune: bool = False) -> CssBundle:
+    """Write css to static/css/<name>.<digest>.css (if not already there)."""
+    digest = hashlib.sha1(css.encode("utf-8")).hexdigest()[:10]
+    filename = f"{name}.{digest}.css"
+    path = OUTPUT_DIR / filename
+    try:
+        if not path.exists():
+            OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(css, encoding="utf-8")
+            tmp.replace(path)
+        if prune:
+            for old in OUTPUT_DIR.glob(f"{name}.*.css"):
+                if old.name != filename:
+                    old.unlink(missing_ok=True)
+        url = f"{ASSET_BASE_URL}/css/{filename}"
+    except OSError as e:
+        print(f"[CSS_BUNDLE] Could not write {path}: {e}; falling back to inline CSS")
+        url = None
+    return CssBundle(name, css, digest, url)
+
+
+@functools.cache
+def get_bundle(name: str) -> CssBundle:
+    """Named bundle, built once per process."""
+    css = "\n".join(minify_css(source) for source in _bundle_sources(name))
+    return build_bundle(name, css, prune=True)
+
+
+@functools.cache
+def bundle_from_text(name: str, css_text: str) -> CssBundle:
+    """Bundle for CSS supplied at runtime (e.g. module CSS)."""
+    return build_bundle(name, minify_css(css_text))
+
+
+def build_bundles() -> list[CssBundle]:
+    """Build every named bundle (call at startup)."""
+    return [get_bundle(name) for name in BUNDLES]
+
+
+# ====================================================================
+# INJECT
+# ====================================================================
+
+
+def inject_css_bundle(name: str) -> None:
+    """Reference a page-scoped bundle from the current render."""
+    bundle = get_bundle(name)
+    if bundle.url:
+        st.markdown(f'<link rel="stylesheet" href="{bundle.url}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{bundle.css}</style>", unsafe_allow_html=True)
+
+
+_INJECT_ONCE_JS = """
+<script>
+(function() {
+  const doc = window.parent.document;
+  const id = %(id)s, digest = %(digest)s, url = %(url)s, css = %(css)s;
+  const existing = doc.getElementById(id);
+  if (existing && existing.dataset.digest === digest) return;
+  if (existing) existing.remove();
+
+  function inline(text) {
+    const style = doc.createElement("style");
+    style.id = id;
+    style.dataset.digest = digest;
+    style.textContent = text;
+    return style;
+  }
+
+  let el;
+  if (url) {
+    el = doc.createElement("link");
+    el.id = id;
+    el.rel = "stylesheet";
+    el.href = url;
+    el.dataset.digest = digest;
+    // Older static handlers serve .css as text/plain, which browsers refuse as a stylesheet
+    el.onerror = () => fetch(el.href).then(r => r.text()).then(text => el.replaceWith(inline(text)));
+  } else {
+    el = inline(css);
+  }
+  // End of <body>: after Emotion's <head> styles, with no re-append on later mutations
+  doc.body.appendChild(el);
+})();
+</script>
+"""
+
+
+def _components_html():
+    from streamlit.components.v1 import html
+
+    return html
+
+
+def inject_css_once(bundle: CssBundle, element_id: str | None = None) -> None:
+    """Add a session-wide bundle to the page once per browser session."""
+    element_id = element_id or f"cca-css-{bundle.name}"
+    sentinel = f"_css_once.{element_id}"
+    if st.session_state.get(sentinel) == bundle.digest:
+        return
+
+    _components_html()(
+        _INJECT_ONCE_JS
+        % {
+            "id": json.dumps(element_id),
+            "digest": json.dumps(bundle.digest),
+            "url": json.dumps(bundle.url),
+            "css": json.dumps("" if bundle.url else bundle.css).replace("</", "<\\/"),
+        },
+        height=0,
+    )
+    st.session_state[sentinel] = bundle.digest
+
+
+__all__ = [
+    "BUNDLES",
+    "CssBundle",
+    "build_bundle",
+    "build_bundles",
+    "bundle_from_text",
+    "get_bundle",
+    "inject_css_bundle",
+    "inject_css_once",
+    "minify_css",
+]
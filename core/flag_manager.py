@@ -25,6 +25,7 @@ from pathlib import Path
 
 import streamlit as st
 
+from core.config_registry import get_json
 from core.events import log_event
 from core.flags import VALID_FLAGS
 
@@ -60,9 +61,6 @@ CONDITIONS_REGISTRY_PATH = (
     Path(__file__).parent.parent / "config" / "conditions" / "conditions.json"
 )
 
-# Lazy-loaded conditions registry
-_CONDITIONS_REGISTRY = None
-
 
 # ==============================================================================
 # INTERNAL HELPERS
@@ -188,17 +186,10 @@ def _normalize_legacy_flags(session: dict) -> dict[str, any]:
 
 
 def _load_conditions_registry() -> dict:
-    """Load conditions registry from JSON (cached)"""
-    global _CONDITIONS_REGISTRY
-
-    if _CONDITIONS_REGISTRY is not None:
-        return _CONDITIONS_REGISTRY
-
+    """Load conditions registry from JSON (shared, read-only; see core.config_registry)"""
     try:
-        with open(CONDITIONS_REGISTRY_PATH) as f:
-            _CONDITIONS_REGISTRY = json.load(f)
-        return _CONDITIONS_REGISTRY
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        return get_json(CONDITIONS_REGISTRY_PATH)
+    except (FileNotFoundError, ValueError) as e:
         print(f"⚠️  Error loading conditions registry: {e}")
         return {"conditions": []}
 
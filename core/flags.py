@@ -62,6 +62,60 @@ FEATURE_FLAGS = {
             "off": "Text-only FAQ responses",
             "on": "Optional 🔊 Listen toggle for FAQ audio playback (default)"
         }
+    },
+    "FEATURE_FAQ_STREAMING": {
+        "default": "on",
+        "values": ["off", "on"],
+        "description": "Stream FAQ / AI Advisor answers token by token as they are generated",
+        "details": {
+            "off": "Show answers only after the full LLM response arrives",
+            "on": "Render guarded answer text progressively (default)"
+        }
+    },
+    "FEATURE_NAV_WARMUP": {
+        "default": "on",
+        "values": ["off", "on"],
+        "description": "Import likely next pages' render modules in the background after first paint",
+        "details": {
+            "off": "Page modules are imported on first navigation",
+            "on": "Warm the hub's and current page's routes in a daemon thread (default)"
+        }
+    },
+    "FEATURE_CONFIG_WARMUP": {
+        "default": "on",
+        "values": ["off", "on"],
+        "description": "Parse config/*.json and product module JSON up front at app start",
+        "details": {
+            "off": "Each config is parsed on first use",
+            "on": "Warm core.config_registry in a background thread from app.py (default)"
+        }
+    },
+    "LLM_MAX_CONCURRENCY": {
+        "default": "4",
+        "values": ["1", "2", "4", "8", "16"],
+        "description": "Max simultaneous OpenAI requests from the shared async LLM client (ai/llm_async.py)",
+        "details": {
+            "1": "One request at a time (sequential)",
+            "4": "Up to four requests in flight per process (default)"
+        }
+    },
+    "FEATURE_TILE_RENDER_CACHE": {
+        "default": "on",
+        "values": ["off", "on"],
+        "description": "Reuse rendered product tile HTML while a tile's definition and state are unchanged",
+        "details": {
+            "off": "Every tile is rebuilt on every rerun",
+            "on": "Rendered tile HTML is kept in a process-wide LRU (default)"
+        }
+    },
+    "ADVISOR_SUMMARY_PARALLEL": {
+        "default": "on",
+        "values": ["off", "on"],
+        "description": "Generate the four advisor summary drawers concurrently (ai/advisor_summary_engine.py)",
+        "details": {
+            "off": "Drawers are generated one after another",
+            "on": "Drawers fan out together under one deadline (default)"
+        }
     }
 }
 
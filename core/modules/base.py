@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
+from core.config_registry import get_module_manifest
 from core.modules.inputs import render_input
 from core.modules.schema import validate_manifest
 
@@ -13,7 +13,7 @@ from core.modules.schema import validate_manifest
 def load_module_manifest(product: str, module: str) -> dict[str, Any]:
     manifest_path = Path("products") / product / "modules" / module / "module.json"
     try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = get_module_manifest(product, module)
         validate_manifest(manifest)
         return manifest
     except Exception as exc:  # pragma: no cover - defensive UI layer
@@ -0,0 +1,207 @@
+"""
+Dependency-tracked evaluation for ModuleConfig flows.
+
+Each step's required-field check, effects and the module outcome read a
+known set of state keys (field store keys plus visible_if keys). The graph
+records those sets once per ModuleConfig; results are memoized by a
+fingerprint of just their inputs, so a rerun recomputes only the step or
+outcome whose inputs an answer edit actually touched. Keys the engine
+writes itself (progress, status) are not inputs and never invalidate.
+
+Memos live in a plain dict (the engine keeps one per module under
+"<state_key>._memo" in session state, outside the persisted answers).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import weakref
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .schema import FieldDef, ModuleConfig, StepDef
+
+# State key the engine's step effects write flags into
+FLAGS_KEY = "flags"
+
+# State keys read by the outcome context (engine._compute_context)
+CONTEXT_KEYS = ("recipient_name",)
+
+
+def store_key(f: FieldDef) -> str:
+    return f.write_key or f.key
+
+
+def _condition_keys(condition: Any) -> set[str]:
+    """Keys read by a visible_if condition, including nested all/any clauses."""
+    if not isinstance(condition, dict):
+        return set()
+    keys = {condition["key"]} if condition.get("key") else set()
+    for clause in (*condition.get("all", ()), *condition.get("any", ())):
+        keys |= _condition_keys(clause)
+    return keys
+
+
+def _visibility_keys(f: FieldDef) -> set[str]:
+    return _condition_keys(f.visible_if)
+
+
+@dataclass(frozen=True)
+class StepDependencies:
+    """State keys one step reads."""
+
+    step_id: str
+    fields: tuple[str, ...]  # Store keys written by the step's fields
+    visibility: frozenset[str]  # Keys read by visible_if conditions
+    required: frozenset[str]  # Inputs of the required-field check
+    effects: frozenset[str]  # Store keys of fields with effects
+
+
+@dataclass
+class ModuleDependencyGraph:
+    """Per-config index of step/outcome inputs and their dependents."""
+
+    steps: dict[str, StepDependencies]
+    outcome: frozenset[str]
+    progress_steps: tuple[str, ...]  # Step ids counted by the progress bar
+    dependents: dict[str, set[str]] = field(default_factory=dict)  # key → step ids ("outcome" for the outcome)
+
+    @classmethod
+    def build(cls, config: ModuleConfig) -> ModuleDependencyGraph:
+        steps = {}
+        outcome: set[str] = {FLAGS_KEY, *CONTEXT_KEYS}
+        dependents: dict[str, set[str]] = {}
+        for step in config.steps:
+            fields = tuple(store_key(f) for f in step.fields)
+            visibility = frozenset().union(*(_visibility_keys(f) for f in step.fields))
+            required = frozenset(
+                k for f in step.fields if f.required for k in (store_key(f), *_visibility_keys(f))
+            )
+            effects = frozenset(store_key(f) for f in step.fields if f.effects)
+            steps[step.id] = StepDependencies(step.id, fields, visibility, required, effects)
+            for key in required | effects | visibility:
+                dependents.setdefault(key, set()).add(step.id)
+            outcome.update(fields)
+            outcome.update(visibility)
+        for key in outcome:
+            dependents.setdefault(key, set()).add("outcome")
+        return cls(
+            steps=steps,
+            outcome=frozenset(outcome),
+            progress_steps=tuple(s.id for s in config.steps if s.show_progress),
+            dependents=dependents,
+        )
+
+    def affected_by(self, keys: set[str] | list[str]) -> set[str]:
+        """Step ids (and "outcome") whose inputs include any of keys."""
+        affected: set[str] = set()
+        for key in keys:
+            affected |= self.dependents.get(key, set())
+        return affected
+
+
+# Graphs by config identity (ModuleConfig is an unhashable dataclass, so no
+# WeakKeyDictionary). Entries hold only a weak reference and are dropped when
+# their config is collected, so configs rebuilt per rerun don't accumulate.
+_GRAPHS: dict[int, tuple[weakref.ref[ModuleConfig], ModuleDependencyGraph]] = {}
+
+
+def dependency_graph(config: ModuleConfig) -> ModuleDependencyGraph:
+    """Dependency graph for a config, built once per config object."""
+    cached = _GRAPHS.get(id(config))
+    if cached is not None and cached[0]() is config:
+        return cached[1]
+    graph = ModuleDependencyGraph.build(config)
+    _GRAPHS[id(config)] = (weakref.ref(config), graph)
+    weakref.finalize(config, _GRAPHS.pop, id(config), None)
+    return graph
+
+
+def fingerprint(state: Mapping[str, Any], keys: frozenset[str] | set[str], extra: Any = None) -> str:
+    """Stable hash of the values of keys in state.
+
+    A missing key hashes differently from a key set to None (visible_if
+    treats an absent key as hidden). extra is hashed alongside, for inputs
+    that live outside the module state.
+    """
+    payload = [(key, key in state, state.get(key)) for key in sorted(keys)]
+    if extra is not None:
+        payload.append(("__extra__", True, extra))
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def memoized(memo: dict[str, Any], name: str, inputs: str, compute: Callable[[], Any]) -> Any:
+    """compute() unless memo[name] was computed from the same inputs fingerprint."""
+    entry = memo.get(name)
+    if entry is not None and entry[0] == inputs:
+        return entry[1]
+    value = compute()
+    memo[name] = (inputs, value)
+    return value
+
+
+# ====================================================================
+# STEP EVALUATION
+# ====================================================================
+
+
+def required_fields(
+    config: ModuleConfig,
+    step: StepDef,
+    state: Mapping[str, Any],
+    memo: dict[str, Any],
+    compute: Callable[[StepDef, Mapping[str, Any]], list[FieldDef]],
+) -> list[FieldDef]:
+    """compute(step, state), recomputed only when the step's required inputs change."""
+    deps = dependency_graph(config).steps[step.id]
+    return memoized(
+        memo, f"required:{step.id}", fingerprint(state, deps.required), lambda: compute(step, state)
+    )
+
+
+def effects_current(config: ModuleConfig, step: StepDef, state: Mapping[str, Any], memo: dict[str, Any]) -> bool:
+    """True if the step's effects were applied for its current inputs and their flags are still set."""
+    deps = dependency_graph(config).steps[step.id]
+    if not deps.effects:
+        return True
+    entry = memo.get(f"effects:{step.id}")
+    if entry is None or entry[0] != fingerprint(state, deps.effects):
+        return False
+    flags = state.get(FLAGS_KEY) or {}
+    return all(flags.get(key) == value for key, value in entry[1].items())
+
+
+def record_effects(
+    config: ModuleConfig,
+    step: StepDef,
+    state: Mapping[str, Any],
+    memo: dict[str, Any],
+    flags_before: Mapping[str, Any],
+) -> None:
+    """Remember the inputs the step's effects were applied for and the flags they set."""
+    deps = dependency_graph(config).steps[step.id]
+    flags = state.get(FLAGS_KEY) or {}
+    written = {key: value for key, value in flags.items() if flags_before.get(key) != value}
+    memo[f"effects:{step.id}"] = (fingerprint(state, deps.effects), written)
+
+
+def outcome_fingerprint(config: ModuleConfig, state: Mapping[str, Any], context: Mapping[str, Any] | None = None) -> str:
+    """Fingerprint of everything outcomes_compute reads: answers, flags and context."""
+    extra = {k: v for k, v in (context or {}).items() if k != "config"} or None
+    return fingerprint(state, dependency_graph(config).outcome, extra)
+
+
+__all__ = [
+    "ModuleDependencyGraph",
+    "StepDependencies",
+    "dependency_graph",
+    "effects_current",
+    "fingerprint",
+    "memoized",
+    "outcome_fingerprint",
+    "record_effects",
+    "required_fields",
+]
@@ -14,6 +14,7 @@ from core.nav import PRODUCTS
 from core.session_store import safe_rerun
 
 from . import components as components
+from . import dependencies
 from .layout import actions
 from .schema import FieldDef, ModuleConfig, OutcomeContract, StepDef
 
@@ -23,15 +24,18 @@ from typing import Any, Dict, Iterable
 
 def inject_module_css_once(css_text: str) -> None:
     """Inject module CSS once per session to avoid repeated injection.
-    
+
+    The CSS is minified into a content-hashed static file (core.css_bundle)
+    and added to the page once per browser session; distinct CSS texts get
+    distinct sentinels.
+
     Args:
         css_text: CSS string to inject
     """
-    ss = st.session_state
-    if ss.get("_module_css_loaded"):
-        return
-    st.markdown(f"<style>{css_text}</style>", unsafe_allow_html=True)
-    ss["_module_css_loaded"] = True
+    from core.css_bundle import bundle_from_text, inject_css_once
+
+    bundle = bundle_from_text("module", css_text)
+    inject_css_once(bundle, element_id=f"cca-css-module-{bundle.digest}")
 
 
 # Memory Care diagnosis flag constants
@@ -615,8 +619,7 @@ def run_module(config: ModuleConfig) -> dict[str, Any]:
     progress = _update_progress(config, state, step, step_index)
 
     # Calculate progress-eligible steps (exclude intro/results pages)
-    progress_steps = [s for s in config.steps if s.show_progress]
-    progress_total = len(progress_steps)
+    progress_total = len(dependencies.dependency_graph(config).progress_steps)
 
     # Check if current step should show progress indicators
     show_step_dots = step.show_progress
@@ -686,7 +689,7 @@ def run_module(config: ModuleConfig) -> dict[str, Any]:
 
     _render_summary(step, state)
 
-    required_fields = _required_fields(step, state)
+    required_fields = _step_required_fields(config, step, state)
     missing = _required_missing(required_fields, state)
 
     # Render actions - get save_exit button state
@@ -727,7 +730,11 @@ def run_module(config: ModuleConfig) -> dict[str, Any]:
         st.warning(f"Please complete the required fields: {', '.join(missing)}")
     allow_next = next_clicked and not missing
     if allow_next:
-        _apply_step_effects(step, state)
+        memo = _module_memo(config)
+        if not dependencies.effects_current(config, step, state, memo):
+            flags_before = dict(state.get("flags") or {})
+            _apply_step_effects(step, state)
+            dependencies.record_effects(config, step, state, memo, flags_before)
     _handle_nav(config, step, step_index, total_steps, allow_next, skip_clicked)
 
     if config.results_step_id and step.id == config.results_step_id:
@@ -876,7 +883,7 @@ def _update_progress(
     config: ModuleConfig, state: dict[str, Any], step: StepDef, step_index: int
 ) -> float:
     # Only count steps that have show_progress=True (exclude intro)
-    progress_steps = [s for s in config.steps if s.show_progress]
+    progress_steps = dependencies.dependency_graph(config).progress_steps
     total = len(progress_steps) or 1
 
     # Check if we're on results page FIRST - that's always 100%
@@ -885,13 +892,13 @@ def _update_progress(
     else:
         # Find the current step's index among progress-eligible steps
         try:
-            progress_index = next(i for i, s in enumerate(progress_steps) if s.id == step.id)
-        except StopIteration:
+            progress_index = progress_steps.index(step.id)
+        except ValueError:
             # Current step doesn't count toward progress (like intro page)
             progress = 0.0
         else:
             # Calculate fractional progress within current step
-            required = _required_fields(step, state)
+            required = _step_required_fields(config, step, state)
             if required:
                 completed = sum(1 for f in required if _has_value(state.get(f.write_key or f.key)))
                 fraction = completed / len(required)
@@ -1095,11 +1102,33 @@ def _handle_save_exit(
 def _ensure_outcomes(config: ModuleConfig, answers: dict[str, Any]) -> None:
     state_key = config.state_key
     outcome_key = f"{state_key}._outcomes"
+    fingerprint_key = f"{state_key}._outcomes_fp"
 
+    # Recompute only when an input of the outcome changed since it was computed
+    context = _compute_context(config)
+    current = dependencies.outcome_fingerprint(config, answers, context)
     if st.session_state.get(outcome_key):
-        return
+        stored = st.session_state.get(fingerprint_key)
+        if stored is None:
+            # Outcome restored without a fingerprint: adopt it for these answers
+            st.session_state[fingerprint_key] = current
+            return
+        if stored == current:
+            return
+
+    try:
+        _compute_outcomes(config, answers, context)
+    finally:
+        # Fingerprint after compute: outcomes_compute may write flags/answers
+        st.session_state[fingerprint_key] = dependencies.outcome_fingerprint(
+            config, answers, _compute_context(config)
+        )
+
+
+def _compute_outcomes(config: ModuleConfig, answers: dict[str, Any], context: dict[str, Any]) -> None:
+    state_key = config.state_key
+    outcome_key = f"{state_key}._outcomes"
 
-    context = _compute_context(config)
     outcome = OutcomeContract()
     if config.outcomes_compute:
         fn = _resolve_callable(config.outcomes_compute)
@@ -1416,6 +1445,20 @@ def _required_fields(step: StepDef, state: Mapping[str, Any]) -> list[FieldDef]:
     return fields
 
 
+def _module_memo(config: ModuleConfig) -> dict[str, Any]:
+    """Per-module memo for dependency-tracked step results (not persisted with answers)."""
+    memo = st.session_state.get(f"{config.state_key}._memo")
+    if memo is None or memo.get("config_id") != id(config):
+        # Entries hold FieldDefs of the config they were computed for
+        memo = st.session_state[f"{config.state_key}._memo"] = {"config_id": id(config)}
+    return memo
+
+
+def _step_required_fields(config: ModuleConfig, step: StepDef, state: Mapping[str, Any]) -> list[FieldDef]:
+    """_required_fields(), recomputed only when the step's visibility/required inputs change."""
+    return dependencies.required_fields(config, step, state, _module_memo(config), _required_fields)
+
+
 def _required_missing(required_fields: Sequence[FieldDef], state: Mapping[str, Any]) -> list[str]:
     missing: list[str] = []
     for field in required_fields:
@@ -1887,6 +1930,9 @@ def _render_results_view(mod: dict[str, Any], config: ModuleConfig) -> None:
     if st.session_state.get("dev_mode"):
         outcome_ids = _get_outcome_flags()
         st.caption(f"🔍 MC_ELIG pin: show={show_banner}, flags={sorted(outcome_ids)}")
+        if config.product == "gcp_v4":
+            from products.gcp_v4.ui_helpers import render_what_if_panel
+            render_what_if_panel(mod)
     
     if show_banner:
         logging.info("MC_ELIG: rendering eligibility advice banner")
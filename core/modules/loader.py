@@ -10,6 +10,7 @@ import importlib
 import json
 from pathlib import Path
 
+from core.config_registry import get_json
 from core.modules.schema import ModuleConfig
 
 
@@ -140,10 +141,9 @@ def load_product_module_manifest(product: str, module: str) -> dict:
             f"Expected file: products/{product}/modules/{module}/module.json"
         )
 
-    # Load and parse JSON
+    # Load and parse JSON (shared, read-only; see core.config_registry)
     try:
-        with manifest_path.open() as f:
-            return json.load(f)
+        return get_json(manifest_path)
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in {manifest_path}: {e.msg}", e.doc, e.pos)
 
@@ -1,8 +1,12 @@
+import functools
 import importlib
-import json
-from collections.abc import Callable
+import sys
+import threading
+from collections.abc import Callable, Iterable
 
 import streamlit as st
+from core.config_registry import get_config
+from core.flags import get_flag_value
 from core.url_helpers import route_to as url_route_to, current_route as url_current_route
 
 # Registry records
@@ -33,13 +37,50 @@ PRODUCTS = {
 
 
 def _import_callable(path: str) -> Callable:
+    # Not cached: import_module is a sys.modules lookup once imported, and
+    # Streamlit's reloader swaps modules out from under a cached function
     mod, fn = path.split(":")
     return getattr(importlib.import_module(mod), fn)
 
 
+class LazyRender:
+    """Page render callable imported on first call (or resolve()).
+
+    Keeps load_nav() from importing every product/hub/CRM module on startup;
+    only the route actually navigated to pays for its imports.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def resolve(self) -> Callable:
+        return _import_callable(self.path)
+
+    @property
+    def loaded(self) -> bool:
+        return self.path.split(":")[0] in sys.modules
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyRender({self.path!r})"
+
+
+@functools.cache
+def _lazy_render(path: str) -> LazyRender:
+    return LazyRender(path)
+
+
+def _nav_config() -> dict:
+    """Parsed config/nav.json (shared via the config registry; re-read when the file changes)."""
+    return get_config("nav.json")
+
+
 def load_nav(ctx: dict) -> dict[str, dict]:
-    with open("config/nav.json", encoding="utf-8") as f:
-        cfg = json.load(f)
+    cfg = _nav_config()
 
     role = ctx["auth"].get("role", "guest")
     is_auth = ctx["auth"].get("is_authenticated", False)
@@ -58,13 +99,72 @@ def load_nav(ctx: dict) -> dict[str, dict]:
                 continue
             pages[item["key"]] = {
                 "label": item["label"],
-                "render": _import_callable(item["module"]),
+                "render": _lazy_render(item["module"]),
+                "module": item["module"],
                 "group": group["label"],
                 "hidden": item.get("hidden", False),
             }
     return pages
 
 
+# ====================================================================
+# ROUTE WARM-UP
+# ====================================================================
+
+# Always worth having imported after the first page
+WARMUP_ROUTES = ("hub_lobby",)
+
+# Module paths already scheduled for warm-up
+_WARMED: set[str] = set()
+_WARMUP_LOCK = threading.Lock()
+
+
+def likely_next_routes(route: str, pages: dict[str, dict], limit: int = 3) -> list[str]:
+    """Routes a user is likely to open next: hub routes plus visible siblings in the route's nav group."""
+    group = pages.get(route, {}).get("group")
+    siblings = [
+        key
+        for key, page in pages.items()
+        if key != route and page["group"] == group and not page["hidden"]
+    ]
+    candidates = [key for key in WARMUP_ROUTES if key != route] + siblings[:limit]
+    return [key for key in dict.fromkeys(candidates) if key in pages]
+
+
+def warm_routes(pages: dict[str, dict], keys: Iterable[str]) -> threading.Thread | None:
+    """Import the render modules of keys in a background thread (after first paint).
+
+    Disabled with FEATURE_NAV_WARMUP=off. Each module path is warmed at most
+    once per process; import errors are left for navigation to surface.
+
+    Returns:
+        The started daemon thread, or None if there was nothing to warm
+    """
+    if get_flag_value("FEATURE_NAV_WARMUP").strip().lower() == "off":
+        return None
+    with _WARMUP_LOCK:
+        paths = [pages[key]["module"] for key in keys if key in pages]
+        paths = [
+            path
+            for path in dict.fromkeys(paths)
+            if path not in _WARMED and not _lazy_render(path).loaded
+        ]
+        _WARMED.update(paths)
+    if not paths:
+        return None
+
+    def _warm() -> None:
+        for path in paths:
+            try:
+                _import_callable(path)
+            except Exception as e:
+                print(f"[NAV_WARMUP] {path} failed: {type(e).__name__}: {e}")
+
+    thread = threading.Thread(target=_warm, name="nav-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
 def route_to(key: str, **context) -> None:
     """Navigate to a page by updating query params and triggering rerun.
 
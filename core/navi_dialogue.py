@@ -5,12 +5,12 @@ Loads and renders contextual messages from Navi throughout the user journey.
 Enhanced with LLM capabilities for dynamic, contextual advice generation.
 """
 
-import json
 import random
 from collections.abc import Callable
-from pathlib import Path
 from typing import Any, Optional
 
+from core.config_registry import get_config, thaw
+
 try:
     import streamlit as st
     HAS_STREAMLIT = True
@@ -29,16 +29,10 @@ except ImportError:
 class NaviDialogue:
     """Navi's dialogue system - loads contextual messages based on journey state."""
 
-    _dialogue_data: dict[str, Any] | None = None
-
     @classmethod
     def load_dialogue(cls) -> dict[str, Any]:
-        """Load Navi dialogue configuration from JSON."""
-        if cls._dialogue_data is None:
-            config_path = Path(__file__).parent.parent / "config" / "navi_dialogue.json"
-            with open(config_path) as f:
-                cls._dialogue_data = json.load(f)
-        return cls._dialogue_data
+        """Load Navi dialogue configuration from JSON (shared, read-only; see core.config_registry)."""
+        return get_config("navi_dialogue.json")
 
     @classmethod
     def get_journey_message(
@@ -84,6 +78,7 @@ class NaviDialogue:
         # Last resort: return empty dict
         if message is None:
             message = {}
+        message = thaw(message)  # Callers get their own copy of the shared config
 
         # Format with context
         if context:
@@ -180,7 +175,7 @@ class NaviDialogue:
         # Get static boost messages first
         dialogue = cls.load_dialogue()
         phase_data = dialogue["journey_phases"].get(phase, {})
-        boost = phase_data.get("messages", {}).get("context_boost", [])
+        boost = list(phase_data.get("messages", {}).get("context_boost", []))
 
         if context:
             boost = [cls._format_string(msg, context) for msg in boost]
@@ -250,7 +245,7 @@ class NaviDialogue:
             Dict with welcome, what_to_expect, navi_says
         """
         dialogue = cls.load_dialogue()
-        intro = dialogue["product_intros"].get(product_key, {})
+        intro = thaw(dialogue["product_intros"].get(product_key, {}))
 
         if context:
             intro = cls._format_message(intro, context)
@@ -268,7 +263,7 @@ class NaviDialogue:
             Dict with message, action, encouragement
         """
         dialogue = cls.load_dialogue()
-        return dialogue["product_gates"].get(product_key, {})
+        return thaw(dialogue["product_gates"].get(product_key, {}))
 
     @classmethod
     def get_micro_moment(cls, moment_type: str, context: dict[str, Any] | None = None) -> str:
@@ -337,7 +332,7 @@ class NaviDialogue:
         dialogue = cls.load_dialogue()
         module_guidance = dialogue.get("module_guidance", {})
         product_modules = module_guidance.get(product_key, {})
-        message = product_modules.get(module_key, {})
+        message = thaw(product_modules.get(module_key, {}))
 
         if context:
             message = cls._format_message(message, context)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import functools
 import html as _html
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
 from html import escape as H
 from typing import Any
 
 import streamlit as st
 
 from core.events import log_event
+from core.flags import get_flag_value
 
 try:  # pragma: no cover - optional import in tests
     from layout import static_url
@@ -18,6 +23,10 @@ except Exception:  # pragma: no cover
 
 SN_DEBUG_TILES = os.environ.get("SN_DEBUG_TILES", "0") == "1"
 
+# Rendered tile HTML is reused while a tile's definition and state are unchanged
+# (FEATURE_TILE_RENDER_CACHE, read on every render)
+TILE_RENDER_CACHE_MAX = 512
+
 
 def html_escape(s: str) -> str:
     return _html.escape(str(s), quote=True)
@@ -57,63 +66,53 @@ def _get_progress(state: Mapping[str, Any], key: str) -> float:
         return 0.0
 
 
-def _evaluate_requirement(req: str, state: Mapping[str, Any]) -> bool:
-    """
-    Supported patterns:
-      'gcp:complete'           -> MCIP.is_product_complete("gcp") OR progress == 100
-      'cost:>=50'              -> progress >= 50
-      'pfma:scheduled'         -> MCIP appointment OR state['pfma']['appointment']
-      'care_tier:in_home|al|mc|mc_ha'
-      'auth:required'          -> state['auth']['is_authenticated'] is True
+# ====================================================================
+# UNLOCK REQUIREMENTS
+# ====================================================================
 
-    NOTE: Checks MCIP first for modern products, falls back to legacy session state.
-    """
-    if ":" not in req:
-        return False
+# Requirement keys → MCIP product ids
+_PRODUCT_MAP = {
+    "gcp": "gcp",
+    "cost": "cost_planner",
+    "cost_planner": "cost_planner",
+    "cost_v2": "cost_planner",
+    "pfma": "pfma_v2",
+    "pfma_v2": "pfma_v2",
+}
 
-    key, spec = req.split(":", 1)
-    key = key.strip()
-    spec = spec.strip()
 
-    # Check product completion/progress
-    if key in ("gcp", "cost", "pfma", "cost_planner", "pfma_v2", "cost_v2"):
-        # Map keys to MCIP product IDs
-        product_map = {
-            "gcp": "gcp",
-            "cost": "cost_planner",
-            "cost_planner": "cost_planner",
-            "cost_v2": "cost_planner",
-            "pfma": "pfma_v2",
-            "pfma_v2": "pfma_v2",
-        }
+@dataclass(frozen=True)
+class CompiledRequirement:
+    """A parsed 'key:spec' unlock requirement; call it with state to evaluate."""
 
-        if spec == "complete":
+    source: str
+    kind: str  # complete|progress|scheduled|care_tier|auth|flag|never
+    key: str = ""
+    threshold: float = 0.0
+    options: tuple[str, ...] = ()
+
+    def __call__(self, state: Mapping[str, Any]) -> bool:
+        kind = self.kind
+        if kind == "complete":
             # FIRST: Check MCIP (authoritative source for modern products)
             try:
                 from core.mcip import MCIP
 
-                product_id = product_map.get(key, key)
-                if MCIP.is_product_complete(product_id):
+                if MCIP.is_product_complete(_PRODUCT_MAP.get(self.key, self.key)):
                     return True
             except Exception:
                 pass  # Fall back to legacy check
 
             # FALLBACK: Check legacy session state (for old products or during migration)
-            prog = _get_progress(state, key)
-            return prog >= 100
+            return _get_progress(state, self.key) >= 100
 
-        if spec.startswith(">="):
+        if kind == "progress":
             # Partial progress checks (MCIP doesn't track these, use legacy state)
-            prog = _get_progress(state, key)
-            try:
-                threshold = float(spec[2:].strip())
-                return prog >= threshold
-            except Exception:
-                return False
+            return _get_progress(state, self.key) >= self.threshold
 
-        if spec == "scheduled":
+        if kind == "scheduled":
             # FIRST: Check MCIP appointment
-            if key in ("pfma", "pfma_v2"):
+            if self.key in ("pfma", "pfma_v2"):
                 try:
                     from core.mcip import MCIP
 
@@ -124,37 +123,89 @@ def _evaluate_requirement(req: str, state: Mapping[str, Any]) -> bool:
                     pass
 
             # FALLBACK: Check legacy session state
-            return state.get(key, {}).get("appointment") == "scheduled"
+            return state.get(self.key, {}).get("appointment") == "scheduled"
+
+        if kind == "care_tier":
+            return str(state.get("gcp", {}).get("care_tier", "")).lower() == self.options[0]
+
+        if kind == "auth":
+            return bool(state.get("auth", {}).get("is_authenticated", False))
+
+        if kind == "flag":
+            gcp_flags = state.get("gcp", {}).get("flags", {}) or {}
+            return any(bool(gcp_flags.get(opt, False)) for opt in self.options)
 
         return False
 
+
+@functools.cache
+def compile_requirement(req: str) -> CompiledRequirement:
+    """
+    Parse a requirement string once; the result is cached per string.
+
+    Supported patterns:
+      'gcp:complete'           -> MCIP.is_product_complete("gcp") OR progress == 100
+      'cost:>=50'              -> progress >= 50
+      'pfma:scheduled'         -> MCIP appointment OR state['pfma']['appointment']
+      'care_tier:in_home|al|mc|mc_ha'
+      'auth:required'          -> state['auth']['is_authenticated'] is True
+      'flag:a|b'               -> any of the GCP flags is set
+
+    Unparseable or unknown requirements compile to a predicate that is never satisfied.
+    """
+    if ":" not in req:
+        return CompiledRequirement(req, "never")
+
+    key, spec = req.split(":", 1)
+    key = key.strip()
+    spec = spec.strip()
+
+    if key in _PRODUCT_MAP:
+        if spec == "complete":
+            return CompiledRequirement(req, "complete", key)
+        if spec.startswith(">="):
+            try:
+                return CompiledRequirement(req, "progress", key, threshold=float(spec[2:].strip()))
+            except ValueError:
+                return CompiledRequirement(req, "never", key)
+        if spec == "scheduled":
+            return CompiledRequirement(req, "scheduled", key)
+        return CompiledRequirement(req, "never", key)
+
     if key == "care_tier":
-        current = str(state.get("gcp", {}).get("care_tier", "")).lower()
-        return current == spec.lower()
+        return CompiledRequirement(req, "care_tier", key, options=(spec.lower(),))
 
     if key == "auth":
-        return spec == "required" and bool(state.get("auth", {}).get("is_authenticated", False))
+        return CompiledRequirement(req, "auth" if spec == "required" else "never", key)
 
     if key == "flag":
-        gcp_flags = state.get("gcp", {}).get("flags", {}) or {}
-        opts = [s.strip() for s in spec.split("|") if s.strip()]
-        if not opts:
-            return False
-        return any(bool(gcp_flags.get(opt, False)) for opt in opts)
+        opts = tuple(s.strip() for s in spec.split("|") if s.strip())
+        return CompiledRequirement(req, "flag" if opts else "never", key, options=opts)
+
+    return CompiledRequirement(req, "never", key)
+
+
+def compile_requirements(reqs: list[str] | tuple[str, ...] | None) -> tuple[CompiledRequirement, ...]:
+    return tuple(compile_requirement(r) for r in reqs or ())
+
 
-    return False
+def _evaluate_requirement(req: str, state: Mapping[str, Any]) -> bool:
+    """Evaluate one requirement string (see compile_requirement for patterns).
+
+    NOTE: Checks MCIP first for modern products, falls back to legacy session state.
+    """
+    return compile_requirement(req)(state)
 
 
 def tile_is_unlocked(tile: BaseTile, state: Mapping[str, Any]) -> bool:
     reqs = getattr(tile, "unlock_requires", []) or []
-    return all(_evaluate_requirement(r, state) for r in reqs)
+    return all(predicate(state) for predicate in compile_requirements(reqs))
 
 
 def tile_requirements_satisfied(
     unlock_requires: list[str] | None, state: Mapping[str, Any]
 ) -> bool:
-    reqs = unlock_requires or []
-    return all(_evaluate_requirement(r, state) for r in reqs)
+    return all(predicate(state) for predicate in compile_requirements(unlock_requires))
 
 
 def _render_badges(badges: list[Any]) -> str:
@@ -341,13 +392,7 @@ class BaseTile:
             return href
 
         # Get current UID from session_state
-        # PRIORITY: Authenticated user_id takes precedence over anonymous_uid
-        uid = None
-        if "auth" in st.session_state and st.session_state["auth"].get("user_id"):
-            uid = st.session_state["auth"]["user_id"]
-        elif "anonymous_uid" in st.session_state:
-            uid = st.session_state["anonymous_uid"]
-
+        uid = _session_uid()
         if not uid:
             return href
 
@@ -383,6 +428,14 @@ class BaseTile:
         badge_markup = _render_badges(pills)
         return f'<div class="dashboard-badges">{badge_markup}</div>' if badge_markup else ""
 
+    def render_html(self) -> str:
+        if not self.visible:
+            return ""
+        return _cached_render(self)
+
+    def _build_html(self) -> str:
+        raise NotImplementedError
+
     def _state_class(self) -> str:
         if self.locked:
             return "locked"
@@ -397,11 +450,64 @@ class BaseTile:
         return "new"
 
 
-class ProductTileHub(BaseTile):
-    def render_html(self) -> str:
-        if not self.visible:
-            return ""
+# ====================================================================
+# RENDER CACHE
+# ====================================================================
+
+# Process-wide LRU of tile HTML. Tiles are rebuilt on every rerun, but their
+# attributes already carry the state they render (progress, locked, phase,
+# is_next_step, recommended_*); together with the session uid written into
+# CTA hrefs they fully determine the HTML.
+_RENDER_CACHE: OrderedDict[str, str] = OrderedDict()
+_RENDER_CACHE_LOCK = threading.Lock()
+_RENDER_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _session_uid() -> str | None:
+    # PRIORITY: Authenticated user_id takes precedence over anonymous_uid
+    if "auth" in st.session_state and st.session_state["auth"].get("user_id"):
+        return st.session_state["auth"]["user_id"]
+    if "anonymous_uid" in st.session_state:
+        return st.session_state["anonymous_uid"]
+    return None
+
+
+def _render_key(tile: BaseTile) -> str:
+    return repr((type(tile).__name__, _session_uid(), vars(tile)))
+
 
+def _cached_render(tile: BaseTile) -> str:
+    if get_flag_value("FEATURE_TILE_RENDER_CACHE") == "off":
+        return tile._build_html()
+    key = _render_key(tile)
+    with _RENDER_CACHE_LOCK:
+        html = _RENDER_CACHE.get(key)
+        if html is not None:
+            _RENDER_CACHE.move_to_end(key)
+            _RENDER_CACHE_STATS["hits"] += 1
+            return html
+    html = tile._build_html()
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE[key] = html
+        _RENDER_CACHE_STATS["misses"] += 1
+        while len(_RENDER_CACHE) > TILE_RENDER_CACHE_MAX:
+            _RENDER_CACHE.popitem(last=False)
+    return html
+
+
+def clear_tile_cache() -> None:
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE.clear()
+        _RENDER_CACHE_STATS.update(hits=0, misses=0)
+
+
+def tile_cache_stats() -> dict[str, int]:
+    with _RENDER_CACHE_LOCK:
+        return {**_RENDER_CACHE_STATS, "size": len(_RENDER_CACHE)}
+
+
+class ProductTileHub(BaseTile):
+    def _build_html(self) -> str:
         out: list[str] = []
         classes = ["ptile", "dashboard-card", f"tile--{self._state_class()}"]
         if self.variant:
@@ -493,6 +599,7 @@ class ProductTileHub(BaseTile):
             out.append(lock_msg_html)
         out.append("</div>")  # /card
 
+        # Logged when the HTML is built; cache hits on later reruns are not re-logged
         try:
             log_event(
                 "tile.rendered",
@@ -515,9 +622,7 @@ class ProductTileHub(BaseTile):
 
 
 class ModuleTileCompact(BaseTile):
-    def render_html(self) -> str:
-        if not self.visible:
-            return ""
+    def _build_html(self) -> str:
         out: list[str] = []
         out.append(f'<div class="mtile dashboard-card"{self._variant()}{self._style()}>')
         out.append(
@@ -542,8 +647,12 @@ class ModuleTileCompact(BaseTile):
 
 
 __all__ = [
+    "CompiledRequirement",
     "ProductTileHub",
     "ModuleTileCompact",
+    "clear_tile_cache",
+    "compile_requirement",
+    "tile_cache_stats",
     "tile_is_unlocked",
     "tile_requirements_satisfied",
 ]
@@ -0,0 +1,32 @@
+"""
+Thread-safe rate limiting for batch tools.
+
+TokenBucket is shared by tools/sync_site.py (one bucket per crawled host)
+and tools/precompute_advisor_summaries.py (LLM calls across workers).
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Blocking token bucket: `rate` requests per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = max(float(rate), 1e-6)
+        self.capacity = max(float(capacity), 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,364 @@
+"""
+Compiled visibility rules for additional services.
+
+Partner unlock_requires strings ("gcp:complete", "flag:a|b") and REGISTRY
+visible_when rule dicts are compiled once into predicates over named
+inputs (a context path, one flag, a financial-profile figure). A RuleSet
+indexes input → services that read it, and RuleEvaluator keeps the last
+input values and results, so each call resolves the inputs once and
+re-tests only the services whose inputs changed.
+
+A service is visible when ALL its unlock requirements hold and ANY of its
+visible_when rules passes (or it has none). It is personalized ("Navi
+Recommended") when a passing rule is a care-flag includes or a cost rule,
+unless all its rules are min_progress (general utilities).
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+Context = Mapping[str, Any]
+
+
+def _get(ctx: Any, dotted: str, default: Any = None) -> Any:
+    cur: Any = ctx
+    for part in dotted.split("."):
+        if isinstance(cur, dict) and part in cur:
+            cur = cur[part]
+        else:
+            return default
+    return cur
+
+
+# ====================================================================
+# INPUTS
+# ====================================================================
+
+
+@dataclass(frozen=True)
+class Input:
+    """A named value extracted from the services context."""
+
+    name: str
+    extract: Callable[[Context], Any] = field(compare=False)
+
+
+@functools.cache
+def path_input(path: str, default: Any = None) -> Input:
+    return Input(f"{path}" if default is None else f"{path}|{default!r}", lambda ctx: _get(ctx, path, default))
+
+
+@functools.cache
+def member_input(path: str, value: Any) -> Input:
+    """Whether value is in the container at path (truthy key for dicts such as flags)."""
+
+    def extract(ctx: Context) -> Any:
+        container = _get(ctx, path, [])
+        if isinstance(container, dict):
+            return container.get(value, False)
+        if isinstance(container, (list, tuple, set)):
+            return value in container
+        return False
+
+    return Input(f"{path}[{value}]", extract)
+
+
+@functools.cache
+def financial_input(attr: str) -> Input:
+    """An attribute of the MCIP financial profile (None if there is no profile)."""
+
+    def extract(ctx: Context) -> Any:
+        financial = _get(ctx, "mcip.financial_profile")
+        if not financial:
+            return None
+        return getattr(financial, attr, None)
+
+    return Input(f"mcip.financial_profile.{attr}", extract)
+
+
+# ====================================================================
+# PREDICATES
+# ====================================================================
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """A compiled rule: test(values) reads only the named inputs."""
+
+    source: str
+    inputs: tuple[Input, ...]
+    test: Callable[[Mapping[str, Any]], bool] = field(compare=False)
+    personalizing: bool = False  # Counts towards "Navi Recommended" when it passes
+
+    def __call__(self, values: Mapping[str, Any]) -> bool:
+        return bool(self.test(values))
+
+
+def _never(source: str) -> Predicate:
+    return Predicate(source, (), lambda _values: False)
+
+
+def _at_least(value: Any, threshold: float) -> bool:
+    try:
+        return float(value) >= threshold
+    except (TypeError, ValueError):
+        return False
+
+
+def _compare(value: Any, threshold: float, op: Callable[[Any, float], bool]) -> bool:
+    try:
+        return op(value, threshold)
+    except Exception:
+        return False
+
+
+@functools.cache
+def compile_unlock(req: str) -> Predicate:
+    """Compile one partner unlock requirement.
+
+    Formats:
+    - "gcp:complete" - GCP must be 100% complete
+    - "gcp:>=50" - GCP must be at least 50% complete
+    - "flag:flag_name" - Single flag must be True
+    - "flag:flag1|flag2|flag3" - ANY of the flags must be True (OR logic)
+
+    Anything else never passes.
+    """
+    if req.startswith("gcp:"):
+        spec = req[len("gcp:") :]
+        progress = path_input("progress.gcp", 0)
+        if spec == "complete":
+            threshold = 100.0
+        elif spec.startswith(">="):
+            try:
+                threshold = float(int(spec[2:]))
+            except ValueError:
+                print(f"[SERVICES] Invalid unlock requirement {req!r}; never satisfied")
+                return _never(req)
+        else:
+            return _never(req)
+        return Predicate(req, (progress,), lambda values: values[progress.name] >= threshold)
+
+    if req.startswith("flag:"):
+        names = [name.strip() for name in req[len("flag:") :].split("|") if name.strip()]
+        flags = tuple(member_input("flags", name) for name in names)
+        return Predicate(req, flags, lambda values: any(values[f.name] for f in flags))
+
+    return _never(req)
+
+
+# CARE FLAGS (from GCP): includes-rules on these mark a service as personalized
+# ("Navi Recommended"). These match the actual flag IDs in core/flags.py FLAG_REGISTRY
+# Source: products/gcp_v4/modules/care_recommendation/module.json
+CARE_FLAGS = frozenset(
+    {
+        # Cognitive & Memory
+        "mild_cognitive_decline",
+        "moderate_cognitive_decline",
+        "severe_cognitive_risk",
+        # Fall & Safety
+        "moderate_safety_concern",
+        "high_safety_concern",
+        "falls_multiple",
+        # Mobility
+        "moderate_mobility",
+        "high_mobility_dependence",
+        # Dependence & ADL
+        "moderate_dependence",
+        "high_dependence",
+        "veteran_aanda_risk",
+        # Mental Health
+        "moderate_risk",
+        "high_risk",
+        "mental_health_concern",
+        # Health
+        "chronic_present",
+        # Support System
+        "no_support",
+        "limited_support",
+        # Geographic
+        "low_access",
+        "very_low_access",
+        "geo_isolated",
+    }
+)
+
+
+def compile_rule(rule: Mapping[str, Any]) -> Predicate:
+    """Compile one visible_when rule dict."""
+    source = repr(dict(rule))
+    if not rule:
+        return Predicate(source, (), lambda _values: True)
+
+    if "equals" in rule:
+        spec = rule["equals"]
+        target = path_input(spec["path"])
+        expected = spec.get("value")
+        return Predicate(source, (target,), lambda values: values[target.name] == expected)
+
+    if "includes" in rule:
+        spec = rule["includes"]
+        member = member_input(spec["path"], spec.get("value"))
+        return Predicate(
+            source,
+            (member,),
+            lambda values: values[member.name],
+            personalizing=spec.get("value") in CARE_FLAGS,
+        )
+
+    if "exists" in rule:
+        target = path_input(rule["exists"]["path"])
+        return Predicate(source, (target,), lambda values: values[target.name] is not None)
+
+    if "min_progress" in rule:
+        spec = rule["min_progress"]
+        target = path_input(spec["path"], 0)
+        try:
+            threshold = float(spec.get("value", 0))
+        except (TypeError, ValueError):
+            return _never(source)
+        return Predicate(source, (target,), lambda values: _at_least(values[target.name], threshold))
+
+    if "role_in" in rule:
+        roles = tuple(rule["role_in"] or ())
+        role = path_input("role")
+        return Predicate(source, (role,), lambda values: values[role.name] in roles)
+
+    for kind, attr, op in (
+        ("cost_gap", "gap_amount", lambda value, threshold: value >= threshold),
+        ("runway_low", "runway_months", lambda value, threshold: value <= threshold),
+    ):
+        if kind in rule:
+            target = financial_input(attr)
+            try:
+                threshold = float(rule[kind].get("value", 0))
+            except (TypeError, ValueError):
+                return _never(source)
+            return Predicate(
+                source,
+                (target,),
+                lambda values, t=target, th=threshold, o=op: _compare(values[t.name], th, o),
+                personalizing=True,
+            )
+
+    return _never(source)
+
+
+# ====================================================================
+# RULE SET
+# ====================================================================
+
+
+@dataclass(frozen=True)
+class CompiledService:
+    """A service's rules: all of unlock AND (no visible_when OR any visible_when)."""
+
+    key: str
+    unlock: tuple[Predicate, ...] = ()
+    visible_when: tuple[Predicate, ...] = ()
+    utility: bool = False  # No visible_when, or only min_progress rules: never personalized
+
+    @property
+    def inputs(self) -> set[Input]:
+        return {i for p in (*self.unlock, *self.visible_when) for i in p.inputs}
+
+    def evaluate(self, values: Mapping[str, Any]) -> tuple[bool, bool]:
+        """(visible, personalized) for resolved input values."""
+        if not all(p(values) for p in self.unlock):
+            return False, False
+        if not self.visible_when:
+            return True, False
+        passed = [p(values) for p in self.visible_when]
+        if not any(passed):
+            return False, False
+        personalized = not self.utility and any(
+            ok and p.personalizing for ok, p in zip(passed, self.visible_when, strict=True)
+        )
+        return True, personalized
+
+
+def compile_service(
+    key: str,
+    unlock_requires: Iterable[str] | None = None,
+    visible_when: Iterable[Mapping[str, Any]] | None = None,
+) -> CompiledService:
+    rules = list(visible_when or ())
+    return CompiledService(
+        key=key,
+        unlock=tuple(compile_unlock(req) for req in unlock_requires or ()),
+        visible_when=tuple(compile_rule(rule) for rule in rules),
+        utility=not rules or all("min_progress" in rule for rule in rules),
+    )
+
+
+@dataclass
+class RuleSet:
+    """Compiled services plus an inverted index from input name to service keys."""
+
+    services: dict[str, CompiledService]
+    inputs: dict[str, Input] = field(default_factory=dict)
+    dependents: dict[str, set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, services: Iterable[CompiledService]) -> RuleSet:
+        by_key = {service.key: service for service in services}
+        inputs: dict[str, Input] = {}
+        dependents: dict[str, set[str]] = {}
+        for service in by_key.values():
+            for item in service.inputs:
+                inputs[item.name] = item
+                dependents.setdefault(item.name, set()).add(service.key)
+        return cls(by_key, inputs, dependents)
+
+    def affected_by(self, names: Iterable[str]) -> set[str]:
+        affected: set[str] = set()
+        for name in names:
+            affected |= self.dependents.get(name, set())
+        return affected
+
+
+def _snapshot(value: Any) -> Any:
+    # Containers are copied so in-place edits to session state still register as changes
+    return copy.deepcopy(value) if isinstance(value, (dict, list, set)) else value
+
+
+class RuleEvaluator:
+    """Re-tests only the services whose inputs changed since the last call."""
+
+    def __init__(self, rules: RuleSet) -> None:
+        self.rules = rules
+        self.values: dict[str, Any] = {}
+        self.results: dict[str, tuple[bool, bool]] = {}
+        self.last_evaluated: set[str] = set()
+
+    def evaluate(self, ctx: Context) -> dict[str, tuple[bool, bool]]:
+        """(visible, personalized) by service key for ctx."""
+        current = {name: item.extract(ctx) for name, item in self.rules.inputs.items()}
+        if not self.results:
+            stale = set(self.rules.services)
+        else:
+            changed = [name for name, value in current.items() if self.values.get(name) != value]
+            stale = self.rules.affected_by(changed)
+        for key in stale:
+            self.results[key] = self.rules.services[key].evaluate(current)
+        self.values = {name: _snapshot(value) for name, value in current.items()}
+        self.last_evaluated = stale
+        return self.results
+
+
+__all__ = [
+    "CARE_FLAGS",
+    "CompiledService",
+    "Input",
+    "Predicate",
+    "RuleEvaluator",
+    "RuleSet",
+    "compile_rule",
+    "compile_service",
+    "compile_unlock",
+]
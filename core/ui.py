@@ -1,6 +1,9 @@
 import base64
 import functools
+import hashlib
+import json
 import mimetypes
+import os
 import pathlib
 import sys
 from typing import Optional
@@ -15,12 +18,59 @@ from .nav import PRODUCTS
 # Resolve repository root (…/cca_senior_navigator_v3)
 _REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
 
+# Built by tools/build_assets.py; served by Streamlit static serving
+# (server.enableStaticServing) from ./static at app/static/
+ASSET_MANIFEST = _REPO_ROOT / "static" / "img" / "manifest.json"
+ASSET_BASE_URL = os.getenv("ASSET_BASE_URL", "app/static").rstrip("/")
+
+
+@functools.cache
+def _asset_manifest() -> dict:
+    """Source path → resized variants, read once per process ({} if not built)."""
+    try:
+        return json.loads(ASSET_MANIFEST.read_text(encoding="utf-8")).get("assets", {})
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[WARN] Unreadable asset manifest {ASSET_MANIFEST}: {e}", file=sys.stderr)
+        return {}
+
+
+@functools.lru_cache(maxsize=256)
+def _source_sha1(path: str, mtime_ns: int, size: int) -> str:
+    """sha1 of a source image; keyed by its stat so an edit is re-hashed."""
+    return hashlib.sha1(pathlib.Path(path).read_bytes()).hexdigest()
+
+
+def _asset_variants(safe_rel: str, p: pathlib.Path) -> dict[int, str] | None:
+    """Static URLs by width for a built image, or None (not built / source changed since)."""
+    entry = _asset_manifest().get(safe_rel)
+    if not entry:
+        return None
+    try:
+        stat = p.stat()
+        if stat.st_size != entry["bytes"]:
+            return None
+        if _source_sha1(str(p), stat.st_mtime_ns, stat.st_size) != entry["sha1"]:
+            return None
+    except OSError:
+        return None
+    variants = entry["variants"].get("webp") or next(iter(entry["variants"].values()), None)
+    if not variants:
+        return None
+    # Filenames are content-hashed; ?v= also gets the far-future Cache-Control
+    # from Streamlit's Tornado static handler
+    version = entry["sha1"][:10]
+    return {int(w): f"{ASSET_BASE_URL}/{path}?v={version}" for w, path in variants.items()}
+
 
 @functools.lru_cache(maxsize=128)
 def img_src(rel_path: str) -> str:
     """
-    Return a base64 data URI for an image at repo-relative rel_path.
+    Return a URL for an image at repo-relative rel_path.
     Example: img_src("assets/images/hero.png")
+    Images built by tools/build_assets.py resolve to their widest WebP variant
+    (static URL); anything else (small icons, unbuilt images) to a base64 data URI.
     WARNING: Returns empty string for missing files. Use safe_img_src() for None returns.
     """
     safe_rel = rel_path.lstrip("/").replace("\\", "/")
@@ -28,6 +78,9 @@ def img_src(rel_path: str) -> str:
     if not p.exists():
         print(f"[WARN] Missing static image: {safe_rel} (resolved: {p})", file=sys.stderr)
         return ""
+    variants = _asset_variants(safe_rel, p)
+    if variants:
+        return variants[max(variants)]
     mime, _ = mimetypes.guess_type(p.name)
     try:
         data = p.read_bytes()
@@ -47,6 +100,19 @@ def safe_img_src(rel_path: str) -> Optional[str]:
     return uri if uri else None
 
 
+@functools.lru_cache(maxsize=128)
+def img_srcset(rel_path: str) -> str:
+    """
+    Return an <img srcset> value ("url 480w, url 800w, …") for a built image,
+    or empty string if it has no resized variants (use img_src alone then).
+    """
+    safe_rel = rel_path.lstrip("/").replace("\\", "/")
+    variants = _asset_variants(safe_rel, (_REPO_ROOT / safe_rel).resolve())
+    if not variants or len(variants) < 2:
+        return ""
+    return ", ".join(f"{url} {width}w" for width, url in sorted(variants.items()))
+
+
 def legacy_safe_img_src(filename: str) -> str:
     """
     Resolve a static image by delegating to layout.static_url while avoiding circular imports.
@@ -1,14 +1,12 @@
 """CSS injection helpers that survive Streamlit's Emotion re-injection.
 
 This module provides deterministic CSS injection that ensures our styles
-always remain last in the cascade, even after Streamlit's Emotion engine
+stay after Streamlit's Emotion styles in the cascade, even when Emotion
 re-injects styles on widget interactions.
 
 VERIFIED WORKING: GCP radio pills render correctly as of 2025-11-01.
 """
 
-from streamlit.components.v1 import html
-
 PILL_CSS = r"""
 :root{
   --pill-bg:#f3f4f6;
@@ -58,57 +56,17 @@ PILL_CSS = r"""
 
 def inject_pill_css():
     """
-    Ensures pill CSS always re-applies *after* Streamlit Emotion reinjects its styles.
-    Uses a targeted observer that tracks Emotion's mount events specifically.
-    
-    This works by:
-    1. Watching for Emotion's style[data-emotion] tag in <head>
-    2. Re-appending our style after any Emotion mutation
-    3. Running a heartbeat check every 1s to ensure recovery from full teardowns
-    
-    Call this once at the top of each page render that uses radio pills.
-    It's idempotent and lightweight.
-    """
-    html(f"""
-    <script>
-    (function() {{
-        const STYLE_ID = "cca-pill-css";
-        const CSS_TEXT = `{PILL_CSS}`;
-        let emotionObserver = null;
+    Ensures pill CSS is on the page, after Streamlit's Emotion styles.
 
-        function applyStyles() {{
-            let el = document.getElementById(STYLE_ID);
-            if (!el) {{
-                el = document.createElement("style");
-                el.id = STYLE_ID;
-                el.textContent = CSS_TEXT;
-                document.head.appendChild(el);
-            }} else {{
-                // re-append so it always stays last
-                el.remove();
-                document.head.appendChild(el);
-            }}
-        }}
+    The CSS is added once per browser session (core.css_bundle) as the last
+    element of <body>, which keeps it after every <head> style Emotion
+    (re)injects without observing mutations or re-applying on a timer.
+    The element id STYLE_ID = "cca-pill-css" is the sentinel.
 
-        function watchEmotion() {{
-            // watch for Emotion cache re-injection
-            const emotionHead = document.querySelector('style[data-emotion]');
-            if (!emotionHead) return;
-            if (emotionObserver) emotionObserver.disconnect();
-
-            emotionObserver = new MutationObserver(() => {{
-                applyStyles();
-            }});
-            emotionObserver.observe(document.head, {{ childList: true }});
-        }}
+    Call this at the top of each page render that uses radio pills.
+    It's idempotent and lightweight.
+    """
+    from core.css_bundle import get_bundle, inject_css_once
 
-        // run now and reapply every second in case of delayed emotion injection
-        applyStyles();
-        watchEmotion();
-        setInterval(() => {{
-            if (!document.getElementById(STYLE_ID)) applyStyles();
-        }}, 1000);
-    }})();
-    </script>
-    """, height=0)
+    inject_css_once(get_bundle("pills"), element_id="cca-pill-css")
 
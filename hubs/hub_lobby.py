@@ -29,6 +29,7 @@ import os
 import streamlit as st
 from core.product_tile import ProductTileHub
 from core.base_hub import render_dashboard_body
+from core.css_bundle import inject_css_bundle
 from core.ui import render_navi_panel_v2
 from core.mcip import MCIP
 from core.additional_services import get_additional_services
@@ -913,10 +914,7 @@ def render(ctx=None) -> None:
     visible_modules = get_visible_modules()
     
     # Load dashboard CSS
-    st.markdown(
-        f"<style>{open('core/styles/dashboard.css').read()}</style>",
-        unsafe_allow_html=True
-    )
+    inject_css_bundle("hubs")
     
     # Render header
     render_header_simple(active_route="hub_lobby")
@@ -4,6 +4,7 @@ import streamlit as st
 
 from core.additional_services import get_additional_services
 from core.base_hub import render_dashboard_body
+from core.css_bundle import inject_css_bundle
 from core.ui import render_navi_panel_v2
 from core.product_tile import ProductTileHub, tile_requirements_satisfied
 from ui.footer_simple import render_footer_simple
@@ -47,10 +48,7 @@ def _card_to_tile(card: dict[str, any], order: int) -> ProductTileHub:
 
 def render(ctx=None) -> None:
     # Load dashboard CSS for consistency
-    st.markdown(
-        f"<style>{open('core/styles/dashboard.css').read()}</style>",
-        unsafe_allow_html=True
-    )
+    inject_css_bundle("hubs")
     
     # Render header
     render_header_simple(active_route="learning")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
@@ -8,6 +7,8 @@ from typing import Any
 import streamlit as st
 
 from core.base_hub import render_dashboard_body
+from core.config_registry import get_json
+from core.css_bundle import inject_css_bundle
 from core.hub_guide import compute_hub_guide, partners_intel_from_state
 from core.ui import render_navi_panel_v2
 from core.product_tile import ProductTileHub, tile_requirements_satisfied
@@ -21,8 +22,7 @@ FILTER_KEY = "_partners_filters"
 
 
 def _load_json(path: Path) -> Any:
-    with open(path, encoding="utf-8") as handle:
-        return json.load(handle)
+    return get_json(path)
 
 
 def _get_filters(default_state: str, categories: Mapping[str, dict[str, Any]]) -> dict[str, str]:
@@ -130,10 +130,7 @@ def _partner_to_tile(
 
 def page_partners() -> None:
     # Load dashboard CSS for consistency
-    st.markdown(
-        f"<style>{open('core/styles/dashboard.css').read()}</style>",
-        unsafe_allow_html=True
-    )
+    inject_css_bundle("hubs")
     
     # Render header
     render_header_simple(active_route="partners")
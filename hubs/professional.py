@@ -5,6 +5,7 @@ from html import escape as html_escape
 import streamlit as st
 
 from core.base_hub import render_dashboard_body
+from core.css_bundle import inject_css_bundle
 from core.ui import render_navi_panel_v2
 from core.product_tile import ProductTileHub
 from ui.footer_simple import render_footer_simple
@@ -74,10 +75,7 @@ def _build_mcip_panel(
 
 def render(ctx=None) -> None:
     # Load dashboard CSS for consistency
-    st.markdown(
-        f"<style>{open('core/styles/dashboard.css').read()}</style>",
-        unsafe_allow_html=True
-    )
+    inject_css_bundle("hubs")
     
     # Render header
     render_header_simple(active_route="professional")
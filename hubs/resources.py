@@ -12,6 +12,7 @@ import streamlit as st
 
 from core.additional_services import get_additional_services
 from core.base_hub import render_dashboard_body
+from core.css_bundle import inject_css_bundle
 from core.mcip import MCIP
 from core.ui import render_navi_panel_v2
 from core.product_tile import ProductTileHub
@@ -25,10 +26,7 @@ def render(ctx=None) -> None:
     """Render the Resources Hub with Navi orchestration."""
     
     # Load dashboard CSS for consistency
-    st.markdown(
-        f"<style>{open('core/styles/dashboard.css').read()}</style>",
-        unsafe_allow_html=True
-    )
+    inject_css_bundle("hubs")
     
     # Render header
     render_header_simple(active_route="resources")
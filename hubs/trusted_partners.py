@@ -4,6 +4,7 @@ import streamlit as st
 
 from core.additional_services import get_additional_services
 from core.base_hub import BaseHub, status_label
+from core.css_bundle import inject_css_bundle
 from core.ui import render_navi_panel_v2
 
 
@@ -154,10 +155,7 @@ class TrustedPartnersHub(BaseHub):
 
 def render() -> None:
     # Load dashboard CSS for consistency
-    st.markdown(
-        f"<style>{open('core/styles/dashboard.css').read()}</style>",
-        unsafe_allow_html=True
-    )
+    inject_css_bundle("hubs")
     
     from ui.header_simple import render_header_simple
     from ui.footer_simple import render_footer_simple
@@ -6,7 +6,7 @@ import streamlit as st
 import html
 
 from core.nav import route_to
-from core.ui import img_src
+from core.ui import img_src, img_srcset
 from core.url_helpers import add_uid_to_href
 from ui.footer_simple import render_footer_simple
 from ui.header_simple import render_header_simple
@@ -219,6 +219,7 @@ def _page_content():
     
     # Load image
     photo_data = img_src(image_path)
+    photo_srcset = img_srcset(image_path)
     
     # Create two-column layout
     st.markdown('<div class="audience-layout">', unsafe_allow_html=True)
@@ -394,7 +395,9 @@ def _page_content():
     with right_col:
         if photo_data:
             st.markdown(
-                f'<div class="audience-image-panel"><img src="{photo_data}" alt="Family care moments" /></div>',
+                f'<div class="audience-image-panel"><img src="{photo_data}"'
+                + (f' srcset="{photo_srcset}" sizes="(max-width: 768px) 100vw, 50vw"' if photo_srcset else "")
+                + ' alt="Family care moments" /></div>',
                 unsafe_allow_html=True,
             )
     
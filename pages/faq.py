@@ -19,6 +19,7 @@ LLM-POWERED FAQ (Stage 3):
 from __future__ import annotations
 
 from typing import Any, Optional
+import hashlib
 import html
 import json
 import re
@@ -26,6 +27,7 @@ import re
 import streamlit as st
 import numpy as np
 
+from core.config_registry import get_config
 from core.flags import get_all_flags, get_flag_value
 from core.mcip import MCIP
 from core.nav import route_to
@@ -71,9 +73,8 @@ def _sanitize_to_md(text: str) -> str:
 # ==============================================================================
 # QUESTION DATABASE LOADER
 # ==============================================================================
-@st.cache_data
 def load_faq_items() -> list[dict[str, Any]]:
-    """Load FAQ questions from config/faq.json.
+    """Load FAQ questions from config/faq.json (shared, read-only; see core.config_registry).
     
     Returns:
         List of FAQ question dicts with schema:
@@ -89,13 +90,11 @@ def load_faq_items() -> list[dict[str, Any]]:
             "ctas": list[dict]
         }
     """
-    with open("config/faq.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_config("faq.json")
 
 
-@st.cache_data
 def load_faq_policy() -> dict[str, Any]:
-    """Load FAQ policy guardrails from config/faq_policy.json.
+    """Load FAQ policy guardrails from config/faq_policy.json (shared, read-only).
     
     Returns:
         Policy dict with schema:
@@ -107,11 +106,9 @@ def load_faq_policy() -> dict[str, Any]:
             "default_cta": dict
         }
     """
-    with open("config/faq_policy.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_config("faq_policy.json")
 
 
-@st.cache_data
 def load_faq_recommended() -> list[dict[str, Any]]:
     """Load canonical recommended FAQ questions from config/faq_recommended.json.
     
@@ -125,8 +122,7 @@ def load_faq_recommended() -> list[dict[str, Any]]:
             "label": str      # Display text for chip (from FAQ question)
         }
     """
-    with open("config/faq_recommended.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = get_config("faq_recommended.json")
     
     faqs = {f["id"]: f for f in load_faq_items()}
     recs = []
@@ -144,7 +140,6 @@ def load_faq_recommended() -> list[dict[str, Any]]:
     return recs
 
 
-@st.cache_data
 def load_easter_eggs() -> list[dict[str, Any]]:
     """Load easter egg patterns from config/easter_eggs.json.
     
@@ -159,8 +154,7 @@ def load_easter_eggs() -> list[dict[str, Any]]:
         }
     """
     try:
-        with open("config/easter_eggs.json", "r", encoding="utf-8") as f:
-            return json.load(f)
+        return get_config("easter_eggs.json")
     except FileNotFoundError:
         return []
 
@@ -343,7 +337,6 @@ def load_corp_chunks(_mtime: float | None = None) -> list[dict[str, Any]]:
         return []
 
 
-@st.cache_data
 def load_corp_mini_faq() -> list[dict[str, Any]]:
     """Load curated mini-FAQ for identity questions (Stage 3.6).
     
@@ -356,12 +349,10 @@ def load_corp_mini_faq() -> list[dict[str, Any]]:
             "ctas": list[dict]  # [{"label": str, "route": str}]
         }
     """
-    import os
-    p = "config/corp_mini_faq.json"
     try:
-        if os.path.exists(p):
-            with open(p, "r", encoding="utf-8") as f:
-                return json.load(f)
+        return get_config("corp_mini_faq.json")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"[MINI_FAQ_LOAD_ERROR] {e}")
     return []
@@ -1000,6 +991,35 @@ def _get_legacy_response(question: str) -> str:
 # ==============================================================================
 # UX ENHANCEMENT HELPERS
 # ==============================================================================
+def _mediated_answer(
+    kind: str,
+    query: str,
+    name: str | None,
+    hits: list[dict],
+    policy: dict[str, Any],
+    slot: Any = None,
+) -> dict[str, Any]:
+    """Get an LLM answer for the FAQ ("faq") or corp ("corp") path.
+    
+    With FEATURE_FAQ_STREAMING on, guarded tokens are rendered into `slot`
+    as they arrive; otherwise this blocks on answer_faq/answer_corp.
+    Both paths return the same result dict. Answer-cache metrics are
+    counted per user role ("member" / "professional").
+    """
+    from ai.llm_mediator import answer_corp, answer_faq, stream_answer_corp, stream_answer_faq
+
+    tenant = st.session_state.get("user_role")
+    if slot is None or get_flag_value("FEATURE_FAQ_STREAMING") != "on":
+        answer_fn = answer_faq if kind == "faq" else answer_corp
+        return answer_fn(query, name, hits, policy, tenant=tenant)
+
+    stream_fn = stream_answer_faq if kind == "faq" else stream_answer_corp
+    stream = stream_fn(query, name, hits, policy, tenant=tenant)
+    with slot.container():
+        st.write_stream(stream)
+    return stream.result or {"answer": "", "sources": []}
+
+
 def fmt_date(iso: str) -> str | None:
     """Format ISO date string to 'MMM YYYY' for display.
     
@@ -1259,10 +1279,6 @@ def render():
     if "faq_send_now" not in st.session_state:
         st.session_state["faq_send_now"] = False
     
-    # Initialize audio cache early to prevent KeyError
-    if "audio_cache" not in st.session_state:
-        st.session_state["audio_cache"] = {}
-    
     # Clear audio config validation cache when returning to page from elsewhere
     # Track current page to detect navigation
     current_page = "faq"
@@ -1452,6 +1468,9 @@ def render():
             # ─── Chat Transcript ───
             chat = st.session_state["faq_chat"]
 
+            # Newest-first slot for streaming the in-flight answer
+            stream_slot = st.empty()
+
             if not chat:
                 st.info("💡 Click a recommended question above or type your own to start chatting.")
             else:
@@ -1510,15 +1529,29 @@ def render():
                             # Only autoplay for the FIRST assistant message (newest)
                             if get_flag_value("FEATURE_FAQ_AUDIO") == "on" and st.session_state.get("faq_voice_enabled", False):
                                 try:
-                                    from shared.audio.tts_client import synthesize
+                                    from shared.audio.player import (
+                                        render_joined_audio,
+                                        render_streaming_audio,
+                                    )
+                                    from shared.audio.tts_client import synthesize_stream
                                     # Use clean text without sources for audio
                                     audio_text = _sanitize_to_md(text) if not is_html else text
-                                    audio_bytes = synthesize(audio_text)
                                     
-                                    if audio_bytes:
-                                        # Only autoplay the first (newest) message
-                                        should_autoplay = not first_assistant_seen
-                                        st.audio(audio_bytes, format="audio/mp3", autoplay=should_autoplay)
+                                    # Only autoplay the first (newest) message
+                                    should_autoplay = not first_assistant_seen
+                                    if should_autoplay:
+                                        # Sentence chunks play as they arrive (first sentence starts
+                                        # while the rest are synthesized)
+                                        player_key = f"faq-audio-{idx}-{hashlib.sha1(audio_text.encode()).hexdigest()[:12]}"
+                                        chunks_played = render_streaming_audio(
+                                            synthesize_stream(audio_text), key=player_key, autoplay=True
+                                        )
+                                    else:
+                                        # Older answers were streamed on an earlier run: their chunks
+                                        # are cached, so one st.audio clip is enough
+                                        chunks_played = render_joined_audio(synthesize_stream(audio_text))
+                                    
+                                    if chunks_played:
                                         first_assistant_seen = True
                                         
                                         # Log audio playback
@@ -1526,6 +1559,7 @@ def render():
                                         log_event("faq_audio_played", {
                                             "query": msg.get("user_query", ""),
                                             "text_length": len(audio_text),
+                                            "chunks": chunks_played,
                                             "autoplay": should_autoplay
                                         })
                                     else:
@@ -1753,12 +1787,10 @@ def render():
                     print(f"[CORP_HITS] {[(h.get('title', '')[:50], h.get('source', '')) for h in corp_hits[:3]]}")
                 
                 if corp_hits:
-                    from ai.llm_mediator import answer_corp
-                    
                     name = st.session_state.get("ctx", {}).get("auth", {}).get("name") or policy.get("fallback_name", "the person you're helping")
                     
                     try:
-                        result = answer_corp(q, name, corp_hits, policy)
+                        result = _mediated_answer("corp", q, name, corp_hits, policy, stream_slot)
                     except Exception as e:
                         # Error handling with retry (#8)
                         from core.events import log_event
@@ -1847,12 +1879,10 @@ def render():
                 retrieved = retrieve_faq(q, faqs, k=3)
                 
                 if retrieved:
-                    from ai.llm_mediator import answer_faq
-                    
                     name = st.session_state.get("ctx", {}).get("auth", {}).get("name") or policy.get("fallback_name", "the person you're helping")
                     
                     try:
-                        result = answer_faq(q, name, retrieved, policy)
+                        result = _mediated_answer("faq", q, name, retrieved, policy, stream_slot)
                     except Exception as e:
                         # Error handling with retry (#8)
                         from core.events import log_event
@@ -1934,12 +1964,10 @@ def render():
                     
                     if corp_hits:
                         # Found something in corp knowledge!
-                        from ai.llm_mediator import answer_corp
-                        
                         name = st.session_state.get("ctx", {}).get("auth", {}).get("name") or policy.get("fallback_name", "the person you're helping")
                         
                         try:
-                            result = answer_corp(q, name, corp_hits, policy)
+                            result = _mediated_answer("corp", q, name, corp_hits, policy, stream_slot)
                             
                             # Format sources with freshness
                             used_sources = result.get("sources", [])[:5]
@@ -9,7 +9,7 @@ import streamlit as st
 from core.mcip import MCIP
 from core.nav import route_to
 from core.state import is_authenticated
-from core.ui import img_src
+from core.ui import img_src, img_srcset
 from core.url_helpers import add_uid_to_href
 from layout import static_url  # Keep static_url for now
 from ui.footer_simple import render_footer_simple
@@ -462,6 +462,7 @@ def render_welcome_card(
     pill_keys = _PILL_SETS.get(safe_active, ("someone", "self"))
 
     photo_data = img_src(image_path)
+    photo_srcset = img_srcset(image_path)
     alt_text = {
         "someone": "Care team supporting family members",
         "self": "Senior smiling outdoors",
@@ -593,7 +594,7 @@ def render_welcome_card(
         if photo_data:
             st.markdown(
                 '<div class="context-image"><div class="context-collage">'
-                f'<figure class="context-collage__base"><img src="{photo_data}" alt="{html.escape(alt_text)}" /></figure>'
+                f'<figure class="context-collage__base"><img src="{photo_data}"{_srcset_attrs(photo_srcset)} alt="{html.escape(alt_text)}" /></figure>'
                 "</div></div>",
                 unsafe_allow_html=True,
             )
@@ -613,6 +614,11 @@ def render_welcome_card(
             )
 
 
+def _srcset_attrs(srcset: str) -> str:
+    """srcset/sizes attributes for a half-width photo (empty when the image has no variants)."""
+    return f' srcset="{srcset}" sizes="(max-width: 768px) 100vw, 50vw"' if srcset else ""
+
+
 def _welcome_body(
     primary_label: str = "Start Now",
     primary_route: str = "someone_else",
@@ -4,12 +4,10 @@ Advisor Prep - Medical & Care Section
 Data inventory view showing captured medical conditions and care needs for advisor review.
 """
 
-import json
-from pathlib import Path
-
 import streamlit as st
 
 import core.flag_manager as flag_manager
+from core.config_registry import get_config
 from core.events import log_event
 from core.mcip import MCIP
 from core.name_utils import section_header, personalize
@@ -217,13 +215,7 @@ def _load_conditions_registry() -> list:
     Returns:
         List of condition dicts from registry
     """
-    # Path is relative to workspace root
-    registry_path = (
-        Path(__file__).parent.parent.parent.parent / "config" / "conditions" / "conditions.json"
-    )
     try:
-        with open(registry_path) as f:
-            data = json.load(f)
-            return data.get("conditions", [])
+        return get_config("conditions/conditions.json").get("conditions", [])
     except FileNotFoundError:
         return []
@@ -78,7 +78,8 @@ def render():
             response = get_answer(
                 question=question,
                 name=st.session_state.get("person_name"),
-                source="auto"  # Try corp first, then FAQ
+                source="auto",  # Try corp first, then FAQ
+                tenant=st.session_state.get("user_role"),
             )
         
         # Extract response data
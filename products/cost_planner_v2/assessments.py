@@ -9,7 +9,6 @@ Configuration: Loads assessments from JSON files
 State Management: Tracks completion status and progress
 """
 
-import json
 import time
 from pathlib import Path
 from typing import Any
@@ -17,6 +16,7 @@ from typing import Any
 import streamlit as st
 
 from core.assessment_engine import run_assessment
+from core.config_registry import get_config, get_json
 from core.events import log_event
 from core.session_store import safe_rerun
 from products.cost_planner_v2.utils.financial_helpers import (
@@ -1476,9 +1476,7 @@ def _load_all_assessments(product_key: str) -> list[dict[str, Any]]:
     # Load each JSON file
     for json_file in sorted(assessments_dir.glob("*.json")):
         try:
-            with open(json_file) as f:
-                config = json.load(f)
-                assessments.append(config)
+            assessments.append(get_json(json_file))
         except Exception as e:
             st.error(f"Error loading {json_file.name}: {e}")
 
@@ -1498,8 +1496,7 @@ def _load_assessment_config(assessment_key: str, product_key: str) -> dict[str,
         return None
 
     try:
-        with open(config_path) as f:
-            return json.load(f)
+        return get_json(config_path)
     except Exception as e:
         st.error(f"Error loading assessment config: {e}")
         return None
@@ -1605,15 +1602,10 @@ def _render_page_navigation(
     """Render navigation buttons at bottom of assessment page."""
 
     # Load all assessments to determine next assessment based on sort_order
-    from core.paths import get_config_path
+    all_config = get_config("cost_planner_v2_modules.json")
     
-    config_path = get_config_path("cost_planner_v2_modules.json")
-    with open(config_path, "r") as f:
-        all_config = json.load(f)
-    
-    all_assessments = all_config.get("modules", [])
     # Sort by sort_order
-    all_assessments.sort(key=lambda a: a.get("sort_order", 999))
+    all_assessments = sorted(all_config.get("modules", []), key=lambda a: a.get("sort_order", 999))
     
     # Find current assessment index
     current_idx = next(
@@ -0,0 +1,348 @@
+"""
+Vectorized batch cost-scenario engine for Cost Planner v2.
+
+Prices many scenarios at once with NumPy, using exactly the same rules as
+comparison_calcs.calculate_facility_scenario / calculate_inhome_scenario:
+
+- Facility: base rate × regional multiplier, then care modifiers applied
+  cumulatively, then +25% for memory_care_high_acuity, then home carry when
+  keep_home is set
+- In-home: regionally adjusted hourly rate × hours/day × 30.4, then care
+  modifiers, then home carry (always)
+
+Inputs are parallel arrays (scalars broadcast) of care_type, zip, hours per
+day, home carry override, keep_home and active flags. Regional multipliers
+and home carry are resolved once per unique ZIP / (ZIP, override); every
+line item and total is then computed in one pass over the batch.
+
+Typical uses:
+- price_household_grid(): every tier × hours band × keep-home combination
+  for one household
+- compute_scenario_batch(): CRM-wide cost summaries in bulk
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from products.cost_planner_v2.comparison_calcs import (
+    CARE_TYPE_MODIFIERS,
+    FACILITY_BASE_RATES,
+    INHOME_HOURLY_BASE,
+    BreakdownLine,
+    ScenarioBreakdown,
+    get_home_carry_effective,
+    get_modifier_label,
+)
+from products.cost_planner_v2.utils.regional_data import RegionalDataProvider
+
+# Order matters: modifiers compound in this order (matches comparison_calcs)
+MODIFIER_FLAGS = [
+    "memory_support", "mobility_limited", "adl_support_high",
+    "medication_management", "behavioral_concerns", "falls_risk",
+    "chronic_conditions",
+]
+CARE_TYPES = ["assisted_living", "memory_care", "memory_care_high_acuity", "in_home_care"]
+HIGH_ACUITY_PCT = 0.25
+DAYS_PER_MONTH = 30.4
+DEFAULT_FACILITY_RATE = 4500
+
+_CARE_INDEX = {care: i for i, care in enumerate(CARE_TYPES)}
+_FLAG_INDEX = {flag: i for i, flag in enumerate(MODIFIER_FLAGS)}
+
+# (care type × flag) modifier percentages
+_PCT_TABLE = np.array(
+    [[CARE_TYPE_MODIFIERS.get(care, {}).get(flag, {}).get("pct", 0.0) for flag in MODIFIER_FLAGS]
+     for care in CARE_TYPES]
+)
+_FACILITY_RATE = np.array([FACILITY_BASE_RATES.get(care, DEFAULT_FACILITY_RATE) for care in CARE_TYPES], dtype=float)
+
+
+# ==============================================================================
+# RESULT
+# ==============================================================================
+
+@dataclass
+class ScenarioBatch:
+    """Column-oriented results for n scenarios.
+
+    Per-line arrays (length n unless noted):
+        base_cost, regional_adj, modifier_amounts (n × len(MODIFIER_FLAGS)),
+        high_acuity_amount, home_carry, home_carry_applied
+    Totals:
+        monthly_total, annual_total, three_year_total
+    """
+
+    care_types: list[str]
+    care_index: np.ndarray
+    hours_per_day: np.ndarray
+    multiplier: np.ndarray
+    location_labels: list[str]
+    base_cost: np.ndarray
+    regional_adj: np.ndarray
+    modifier_pct: np.ndarray
+    modifier_amounts: np.ndarray
+    high_acuity_amount: np.ndarray
+    home_carry: np.ndarray
+    home_carry_applied: np.ndarray
+    monthly_total: np.ndarray
+    annual_total: np.ndarray
+    three_year_total: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.care_types)
+
+    def breakdown(self, i: int) -> ScenarioBreakdown:
+        """ScenarioBreakdown for row i, with the same lines as the scalar calculators."""
+        care_type = self.care_types[i]
+        m = float(self.multiplier[i])
+        lines: list[BreakdownLine] = []
+
+        if care_type == "in_home_care":
+            hours = float(self.hours_per_day[i])
+            hourly_rate = INHOME_HOURLY_BASE * m
+            lines.append(BreakdownLine(
+                label=f"Base Cost ({hours}hrs/day × ${hourly_rate:.2f}/hr)",
+                value=float(self.base_cost[i]),
+                applied=True,
+            ))
+            show_regional = abs((m - 1.0) * 100) > 0.01
+        else:
+            lines.append(BreakdownLine(label="Base Cost", value=float(self.base_cost[i]), applied=True))
+            show_regional = abs(float(self.regional_adj[i])) > 0.01
+
+        if show_regional:
+            adj = float(self.regional_adj[i])
+            sign = "+" if adj > 0 else ""
+            lines.append(BreakdownLine(
+                label=f"Regional Adjustment ({sign}{(m - 1.0) * 100:.0f}%)",
+                value=adj,
+                pct=m - 1.0,
+                applied=True,
+            ))
+
+        for j, flag_id in enumerate(MODIFIER_FLAGS):
+            pct = float(self.modifier_pct[i, j])
+            if pct > 0:
+                label = get_modifier_label(care_type, flag_id)
+                lines.append(BreakdownLine(
+                    label=f"{label} (+{pct*100:.0f}%)",
+                    value=float(self.modifier_amounts[i, j]),
+                    pct=pct,
+                    applied=True,
+                ))
+
+        if care_type == "memory_care_high_acuity":
+            lines.append(BreakdownLine(
+                label=f"High-Acuity Intensive Care (+{HIGH_ACUITY_PCT*100:.0f}%)",
+                value=float(self.high_acuity_amount[i]),
+                pct=HIGH_ACUITY_PCT,
+                applied=True,
+            ))
+
+        lines.append(BreakdownLine(
+            label="Home Carry Cost",
+            value=float(self.home_carry[i]),
+            applied=bool(self.home_carry_applied[i]),
+        ))
+
+        return ScenarioBreakdown(
+            care_type=care_type,
+            location_label=self.location_labels[i],
+            monthly_total=float(self.monthly_total[i]),
+            annual_total=float(self.annual_total[i]),
+            three_year_total=float(self.three_year_total[i]),
+            lines=lines,
+        )
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Lightweight per-row totals (no line items) for bulk summaries."""
+        return [
+            {
+                "care_type": care,
+                "location_label": label,
+                "monthly_total": float(mt),
+                "annual_total": float(at),
+                "three_year_total": float(tt),
+            }
+            for care, label, mt, at, tt in zip(
+                self.care_types, self.location_labels,
+                self.monthly_total.tolist(), self.annual_total.tolist(), self.three_year_total.tolist(),
+                strict=True,
+            )
+        ]
+
+
+# ==============================================================================
+# ENGINE
+# ==============================================================================
+
+def _is_many(values: Any) -> bool:
+    return isinstance(values, Iterable) and not isinstance(values, (str, bytes))
+
+
+def _broadcast(values: Any, n: int, name: str) -> list:
+    if not _is_many(values):
+        return [values] * n
+    values = list(values)
+    if len(values) != n:
+        raise ValueError(f"{name}: expected {n} values, got {len(values)}")
+    return values
+
+
+def _flag_mask(flags: Any, n: int) -> np.ndarray:
+    """Bool matrix n × len(MODIFIER_FLAGS) from one flag list or one per row."""
+    mask = np.zeros((n, len(MODIFIER_FLAGS)), dtype=bool)
+    if flags is None:
+        return mask
+    flags = list(flags)
+    per_row = bool(flags) and all(not isinstance(f, str) for f in flags)
+    rows = flags if per_row else [flags] * n
+    if len(rows) != n:
+        raise ValueError(f"flags: expected {n} flag lists, got {len(rows)}")
+    for i, row_flags in enumerate(rows):
+        for flag in row_flags or ():
+            j = _FLAG_INDEX.get(flag)
+            if j is not None:
+                mask[i, j] = True
+    return mask
+
+
+def compute_scenario_batch(
+    care_types: str | Sequence[str],
+    zip_codes: str | None | Sequence[str | None] = None,
+    hours_per_day: float | Sequence[float] = 8.0,
+    home_carry_overrides: float | None | Sequence[float | None] = None,
+    keep_home: bool | Sequence[bool] = False,
+    flags: Sequence[str] | Sequence[Sequence[str]] | None = None,
+) -> ScenarioBatch:
+    """Price n scenarios in one vectorized pass.
+
+    Scalar arguments broadcast to the length of the longest sequence argument.
+
+    Args:
+        care_types: assisted_living | memory_care | memory_care_high_acuity | in_home_care
+        zip_codes: ZIP for regional pricing (None = national)
+        hours_per_day: Care hours per day (in-home rows only)
+        home_carry_overrides: Monthly home carry override (None/0 = ZIP default)
+        keep_home: Include home carry for facility rows (always on for in-home)
+        flags: Active flag ids, either one list for all rows or one list per row
+
+    Returns:
+        ScenarioBatch with per-line arrays and totals
+    """
+    lengths = [
+        len(v) for v in (care_types, zip_codes, hours_per_day, home_carry_overrides, keep_home)
+        if _is_many(v)
+    ]
+    n = max(lengths, default=1)
+
+    cares = _broadcast(care_types, n, "care_types")
+    zips = _broadcast(zip_codes, n, "zip_codes")
+    overrides = [o or None for o in _broadcast(home_carry_overrides, n, "home_carry_overrides")]
+
+    unknown = set(cares) - set(_CARE_INDEX)
+    if unknown:
+        raise ValueError(f"Unknown care types: {sorted(unknown)}")
+
+    care_idx = np.fromiter((_CARE_INDEX[c] for c in cares), dtype=np.int64, count=n)
+    hours = np.asarray(_broadcast(hours_per_day, n, "hours_per_day"), dtype=float)
+    keep = np.asarray(_broadcast(keep_home, n, "keep_home"), dtype=bool)
+
+    # Regional multipliers and home carry: resolved once per unique key
+    regional = {z: RegionalDataProvider.get_multiplier(zip_code=z) for z in set(zips)}
+    carry = {key: get_home_carry_effective(*key) for key in set(zip(zips, overrides, strict=True))}
+    multiplier = np.fromiter((regional[z].multiplier for z in zips), dtype=float, count=n)
+    labels = [regional[z].region_name for z in zips]
+    home_carry = np.fromiter((carry[key] for key in zip(zips, overrides, strict=True)), dtype=float, count=n)
+
+    in_home = care_idx == _CARE_INDEX["in_home_care"]
+    high_acuity = care_idx == _CARE_INDEX["memory_care_high_acuity"]
+
+    # Base + regional
+    hours_per_month = hours * DAYS_PER_MONTH
+    facility_base = _FACILITY_RATE[care_idx]
+    inhome_base = INHOME_HOURLY_BASE * multiplier * hours_per_month
+    base_cost = np.where(in_home, inhome_base, facility_base)
+    regional_adj = np.where(in_home, INHOME_HOURLY_BASE * hours_per_month, facility_base) * (multiplier - 1.0)
+    running = np.where(in_home, inhome_base, facility_base * multiplier)
+
+    # Care modifiers compound: line j = running before j × pct_j
+    pct = _PCT_TABLE[care_idx] * _flag_mask(flags, n)
+    growth = np.cumprod(1.0 + pct, axis=1)
+    before = np.hstack([np.ones((n, 1)), growth[:, :-1]])
+    modifier_amounts = running[:, None] * before * pct
+    running = running * growth[:, -1]
+
+    high_acuity_amount = np.where(high_acuity, running * HIGH_ACUITY_PCT, 0.0)
+    running = running + high_acuity_amount
+
+    carry_applied = keep | in_home
+    running = running + np.where(carry_applied, home_carry, 0.0)
+
+    monthly_total = np.round(running, 0)
+    annual_total = np.round(monthly_total * 12, 0)
+    three_year_total = np.round(annual_total * 3, 0)
+
+    return ScenarioBatch(
+        care_types=cares,
+        care_index=care_idx,
+        hours_per_day=hours,
+        multiplier=multiplier,
+        location_labels=labels,
+        base_cost=base_cost,
+        regional_adj=regional_adj,
+        modifier_pct=pct,
+        modifier_amounts=modifier_amounts,
+        high_acuity_amount=high_acuity_amount,
+        home_carry=home_carry,
+        home_carry_applied=carry_applied,
+        monthly_total=monthly_total,
+        annual_total=annual_total,
+        three_year_total=three_year_total,
+    )
+
+
+def price_household_grid(
+    zip_code: str | None,
+    flags: Sequence[str] | None = None,
+    care_types: Sequence[str] = tuple(CARE_TYPES),
+    hours_options: Sequence[float] = (4.0, 8.0, 12.0, 24.0),
+    keep_home_options: Sequence[bool] = (False, True),
+    home_carry_override: float | None = None,
+) -> tuple[list[dict[str, Any]], ScenarioBatch]:
+    """Price every care type × hours band × keep-home combination for one household.
+
+    Hours only vary in-home rows and keep_home only varies facility rows, so
+    each combination that actually changes the price appears once.
+
+    Returns:
+        (scenario keys, batch) — keys[i] = {"care_type", "hours_per_day", "keep_home"}
+    """
+    keys: list[dict[str, Any]] = []
+    for care in care_types:
+        if care == "in_home_care":
+            keys.extend({"care_type": care, "hours_per_day": h, "keep_home": True} for h in hours_options)
+        else:
+            keys.extend(
+                {"care_type": care, "hours_per_day": 0.0, "keep_home": k}
+                for k in keep_home_options
+            )
+    batch = compute_scenario_batch(
+        care_types=[k["care_type"] for k in keys],
+        zip_codes=zip_code,
+        hours_per_day=[k["hours_per_day"] for k in keys],
+        home_carry_overrides=home_carry_override,
+        keep_home=[k["keep_home"] for k in keys],
+        flags=flags,
+    )
+    return keys, batch
+
+
+def iter_breakdowns(batch: ScenarioBatch) -> Iterable[ScenarioBreakdown]:
+    return (batch.breakdown(i) for i in range(len(batch)))
+
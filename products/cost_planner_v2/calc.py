@@ -56,6 +56,68 @@ def compute_totals_cached(
     else:
         return {"total": 0.0, "segments": {}}
     
+    return {
+        "total": float(breakdown.monthly_total),
+        "segments": _segments_from_breakdown(assessment, breakdown),
+    }
+
+
+_ASSESSMENT_CARE_TYPES = {"home": "in_home_care", "al": "assisted_living", "mc": "memory_care"}
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def compute_all_totals_cached(
+    assessments: tuple[str, ...],
+    *,
+    zip_code: str,
+    hours_per_day: float = 8.0,
+    home_carry: float = 0.0,
+    keep_home: bool = False,
+    flags: tuple[str, ...] = (),
+) -> dict[str, dict]:
+    """Totals + segments for several assessments in one batch pass.
+    
+    Same result per assessment as compute_totals_cached, but all tabs are
+    priced together by the vectorized batch engine instead of one call (and
+    one worker thread) per tab. Active flags are part of the cache key.
+    
+    Args:
+        assessments: Assessment keys ("home", "al", "mc")
+        zip_code: ZIP code for regional pricing
+        hours_per_day: Hours of care per day (home only)
+        home_carry: Monthly home expense override
+        keep_home: Whether keeping home (facility only)
+        flags: Active GCP flag ids
+        
+    Returns:
+        Dict of assessment -> {"total": float, "segments": dict}
+    """
+    from products.cost_planner_v2.batch_calcs import compute_scenario_batch
+
+    priced = [a for a in assessments if a in _ASSESSMENT_CARE_TYPES]
+    results = {a: {"total": 0.0, "segments": {}} for a in assessments}
+    if not priced:
+        return results
+
+    batch = compute_scenario_batch(
+        care_types=[_ASSESSMENT_CARE_TYPES[a] for a in priced],
+        zip_codes=zip_code,
+        hours_per_day=hours_per_day,
+        home_carry_overrides=home_carry or None,
+        keep_home=keep_home,
+        flags=list(flags),
+    )
+    for i, assessment in enumerate(priced):
+        breakdown = batch.breakdown(i)
+        results[assessment] = {
+            "total": float(breakdown.monthly_total),
+            "segments": _segments_from_breakdown(assessment, breakdown),
+        }
+    return results
+
+
+def _segments_from_breakdown(assessment: str, breakdown) -> dict[str, float]:
+    """Group applied breakdown lines into Housing/Care/Home Carry segments."""
     # Extract segments from breakdown
     segments = {}
     housing_amt = 0.0
@@ -93,7 +155,4 @@ def compute_totals_cached(
         if home_carry_amt > 0:
             segments["Home Carry"] = float(home_carry_amt)
     
-    return {
-        "total": float(breakdown.monthly_total),
-        "segments": segments,
-    }
+    return segments
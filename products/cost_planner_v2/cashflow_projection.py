@@ -0,0 +1,437 @@
+"""
+Cash-Flow Projection Engine for Cost Planner v2
+
+Month-by-month runway simulation that replaces the straight-line
+`total_selected / monthly_gap` estimate with:
+- Care-cost inflation and optional tier progression (e.g. AL → MC step-up)
+- Income cost-of-living adjustments and scheduled income changes
+- Per-category asset returns and liquidation delays
+- Draw-down in the recommended funding order (calculate_recommended_funding_order)
+- Monte Carlo bands for care-cost growth and asset returns
+
+Sleeves and paths are stacked into one (sleeves, paths) array that is
+advanced with a few whole-array operations per month; the month loop is the
+only Python-level loop. Results are cached per input hash, so re-rendering
+the Expert Review page with unchanged selections is free.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from core.mcip import CareRecommendation
+from products.cost_planner_v2.expert_formulas import (
+    AssetCategory,
+    calculate_asset_breakdown,
+    calculate_recommended_funding_order,
+)
+from products.cost_planner_v2.financial_profile import FinancialProfile
+
+MAX_HORIZON_MONTHS = 360  # 30 years
+
+# Months before a category's cash is actually available to spend
+LIQUIDATION_DELAY_MONTHS = {
+    "immediate": 0,
+    "1-3_months": 2,
+    "3-6_months": 5,
+    "6-12_months": 9,
+}
+
+# (expected annual return, annual volatility) by asset category.
+# Home equity / real estate track housing appreciation; liquid assets are a
+# cash-heavy mix.
+CATEGORY_RETURNS = {
+    "liquid_assets": (0.02, 0.03),
+    "retirement_accounts": (0.05, 0.12),
+    "life_insurance": (0.03, 0.0),
+    "annuities": (0.03, 0.0),
+    "home_equity": (0.03, 0.05),
+    "other_real_estate": (0.03, 0.06),
+    "other_resources": (0.02, 0.04),
+}
+DEFAULT_RETURN = (0.02, 0.0)
+
+
+# ==== INPUTS ====
+
+
+@dataclass(frozen=True)
+class ProjectionAssumptions:
+    """
+    Economic assumptions for a runway projection.
+
+    Rates are annual. With n_paths == 1 (or both volatilities at 0) the
+    projection is deterministic.
+    """
+
+    care_inflation: float = 0.04
+    care_inflation_volatility: float = 0.0
+    income_cola: float = 0.02
+    return_volatility_scale: float = 1.0  # 0 disables return shocks
+    horizon_months: int = MAX_HORIZON_MONTHS
+    n_paths: int = 1
+    seed: int = 0
+    # ((start_month, cost_multiplier), ...) — e.g. ((36, 1.25),) for a move to memory care
+    tier_progression: tuple[tuple[int, float], ...] = ()
+    # ((start_month, monthly_income_delta), ...) — e.g. ((24, -1800.0),) when partner income ends
+    income_changes: tuple[tuple[int, float], ...] = ()
+    # Overrides for CATEGORY_RETURNS: ((category, annual_return, annual_volatility), ...)
+    category_returns: tuple[tuple[str, float, float], ...] = ()
+
+
+@dataclass(frozen=True)
+class AssetSleeve:
+    """One asset category in draw-down order."""
+
+    name: str
+    balance: float
+    delay_months: int
+    annual_return: float
+    annual_volatility: float
+
+
+# ==== RESULTS ====
+
+
+@dataclass
+class RunwayProjection:
+    """
+    Projection results across all simulated paths.
+
+    runway_months is fractional (months funded before the first unfunded
+    dollar); paths that never run out are reported as horizon_months with
+    sustained=True.
+    """
+
+    horizon_months: int
+    runway_months: np.ndarray  # (n_paths,)
+    sustained: np.ndarray  # (n_paths,) bool
+    year_end_balances: np.ndarray  # (n_paths, years) total assets at each year end
+    sleeve_names: list[str] = field(default_factory=list)
+    # (n_paths, n_sleeves) month by which each sleeve was empty (checked at year end), inf if never
+    depletion_months: np.ndarray | None = None
+
+    @property
+    def n_paths(self) -> int:
+        return int(self.runway_months.shape[0])
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.runway_months, q))
+
+    @property
+    def median_months(self) -> float:
+        return self.percentile(50)
+
+    def bands(self, low: float = 10, high: float = 90) -> dict[str, float]:
+        """Runway bands in months: {"low", "median", "high"}."""
+        p_low, p_med, p_high = np.percentile(self.runway_months, [low, 50, high])
+        return {"low": float(p_low), "median": float(p_med), "high": float(p_high)}
+
+    def probability_sustained(self, months: float) -> float:
+        """Share of paths still funded after `months`."""
+        return float(np.mean(self.runway_months >= months))
+
+    def balance_bands(self, low: float = 10, high: float = 90) -> np.ndarray:
+        """(3, years) array of low / median / high year-end asset balances."""
+        return np.percentile(self.year_end_balances, [low, 50, high], axis=0)
+
+
+# ==== SLEEVE CONSTRUCTION ====
+
+
+def build_sleeves(
+    asset_categories: dict[str, AssetCategory],
+    selected_assets: dict[str, bool] | None = None,
+    funding_order: list[str] | None = None,
+    assumptions: ProjectionAssumptions | None = None,
+) -> tuple[AssetSleeve, ...]:
+    """
+    Order selected asset categories into draw-down sleeves.
+
+    Args:
+        asset_categories: Output of calculate_asset_breakdown
+        selected_assets: asset_name -> bool; None uses each category's `recommended`
+        funding_order: Output of calculate_recommended_funding_order; selected
+            categories missing from it are drawn last
+        assumptions: Optional category return overrides
+
+    Returns:
+        Tuple of AssetSleeve in draw-down order (zero balances dropped)
+    """
+    if selected_assets is None:
+        chosen = [name for name, cat in asset_categories.items() if cat.recommended]
+    else:
+        chosen = [name for name, sel in selected_assets.items() if sel and name in asset_categories]
+
+    order = [name for name in (funding_order or []) if name in chosen]
+    order += [name for name in chosen if name not in order]
+
+    returns = dict(CATEGORY_RETURNS)
+    if assumptions is not None:
+        returns.update({name: (mu, vol) for name, mu, vol in assumptions.category_returns})
+
+    sleeves = []
+    for name in order:
+        category = asset_categories[name]
+        if category.accessible_value <= 0:
+            continue
+        mu, vol = returns.get(name, DEFAULT_RETURN)
+        sleeves.append(
+            AssetSleeve(
+                name=name,
+                balance=float(category.accessible_value),
+                delay_months=LIQUIDATION_DELAY_MONTHS.get(category.liquidation_timeframe, 0),
+                annual_return=float(mu),
+                annual_volatility=float(vol),
+            )
+        )
+    return tuple(sleeves)
+
+
+# ==== SIMULATION ====
+
+
+def _income_schedule(monthly_income: float, a: ProjectionAssumptions, months: int) -> np.ndarray:
+    """Deterministic monthly income: COLA applied each January-equivalent (every 12 months)."""
+    years = np.arange(months) // 12
+    income = np.full(months, float(monthly_income)) * (1.0 + a.income_cola) ** years
+    for start, delta in a.income_changes:
+        if start < months:
+            income[start:] += float(delta) * (1.0 + a.income_cola) ** years[start:]
+    return np.maximum(income, 0.0)
+
+
+def _tier_steps(a: ProjectionAssumptions, months: int) -> dict[int, float]:
+    """Care-cost multiplier applied at each tier change month."""
+    steps: dict[int, float] = {}
+    for start, multiplier in a.tier_progression:
+        if start < months:
+            month = max(int(start), 0)
+            steps[month] = steps.get(month, 1.0) * float(multiplier)
+    return steps
+
+
+def _simulate(
+    monthly_cost: float,
+    monthly_income: float,
+    sleeves: tuple[AssetSleeve, ...],
+    a: ProjectionAssumptions,
+) -> RunwayProjection:
+    months = int(min(max(a.horizon_months, 1), MAX_HORIZON_MONTHS))
+    years = (months + 11) // 12
+    n = max(int(a.n_paths), 1)
+    k = len(sleeves)
+    rng = np.random.default_rng(a.seed)
+    stochastic = n > 1
+
+    # Annual care-cost growth per (year, path), applied as a constant monthly rate within the year
+    cost_growth = np.full((years, n), a.care_inflation)
+    if stochastic and a.care_inflation_volatility > 0:
+        cost_growth += a.care_inflation_volatility * rng.standard_normal((years, n))
+    cost_monthly = np.power(np.maximum(1.0 + cost_growth, 0.0), 1.0 / 12.0)
+
+    # One market shock per (year, path), scaled by each sleeve's volatility
+    market = rng.standard_normal((years, n)) if stochastic and a.return_volatility_scale > 0 else None
+    base = 1.0 + np.array([s.annual_return for s in sleeves], dtype=float)[:, None]
+    shock = a.return_volatility_scale * np.array([s.annual_volatility for s in sleeves], dtype=float)[:, None]
+
+    def yearly_growth(rows: slice, year: int) -> np.ndarray:
+        """(rows, paths) growth factor of each sleeve over `year`."""
+        if market is None:
+            return np.maximum(base[rows], 0.0)
+        factor = shock[rows] * market[year]
+        factor += base[rows]
+        return np.maximum(factor, 0.0, out=factor)
+
+    income = _income_schedule(monthly_income, a, months)
+    tier_steps = _tier_steps(a, months)
+    delays = [s.delay_months for s in sleeves]
+    max_delay = max(delays, default=0)
+
+    # Row j holds sleeve j for every path. Sleeves before `front` are empty
+    # on every path; rows [front, live) have been drawn and are grown with
+    # one array step per month; rows from `live` on are untouched, so they
+    # are grown once at year end (or caught up when first drawn).
+    balances = np.repeat(np.array([s.balance for s in sleeves], dtype=float)[:, None], n, axis=1)
+    growth = np.ones((k, n))
+    depletion = np.full((k, n), np.inf)
+    runway = np.full(n, float(months))
+    sustained = np.ones(n, dtype=bool)
+    year_end = np.zeros((years, n))
+
+    cost = np.full(n, float(monthly_cost))
+    need = np.empty(n)
+    gap = np.empty(n)
+    take = np.empty(n)
+    front = live = 0
+
+    for m in range(months):
+        year, month_of_year = divmod(m, 12)
+        if month_of_year == 0:
+            growth[front:live] = np.power(yearly_growth(slice(front, live), year), 1.0 / 12.0)
+        if m:
+            np.multiply(cost, cost_monthly[year], out=cost)
+        if m in tier_steps:
+            cost *= tier_steps[m]
+
+        # Gap this month (surplus months are not banked)
+        np.subtract(cost, income[m], out=need)
+        np.maximum(need, 0.0, out=need)
+
+        # Draw in funding order; sleeves still liquidating keep growing
+        balances[front:live] *= growth[front:live]
+        for j in range(front, k):
+            if j >= live:
+                if not need.any():
+                    break
+                growth[j] = np.power(yearly_growth(slice(j, j + 1), year), 1.0 / 12.0)
+                balances[j] *= np.power(growth[j], month_of_year + 1)
+                live = j + 1
+            if m < delays[j]:
+                continue
+            bal = balances[j]
+            np.fmin(bal, need, out=take)
+            bal -= take
+            need -= take
+
+        while front < live and m >= delays[front] and balances[front].max() <= 1e-9:
+            depletion[front][np.isinf(depletion[front])] = m + 1
+            front += 1
+
+        # First month with an unfunded balance ends the runway for that path.
+        # Once every sleeve is liquid such a path has nothing left, so its
+        # cost is zeroed and it stops showing up as short.
+        if need.max() > 1e-9:
+            newly_short = (need > 1e-9) & sustained
+            if newly_short.any():
+                np.subtract(cost, income[m], out=gap, where=newly_short)
+                np.divide(need, gap, out=take, where=newly_short)
+                np.subtract(m + 1.0, take, out=runway, where=newly_short)
+                sustained &= ~newly_short
+                if m >= max_delay:
+                    np.copyto(cost, 0.0, where=newly_short)
+
+        if month_of_year == 11 or m == months - 1:
+            if live < k:
+                if month_of_year == 11:
+                    balances[live:] *= yearly_growth(slice(live, k), year)
+                else:
+                    balances[live:] *= np.power(yearly_growth(slice(live, k), year), (month_of_year + 1) / 12.0)
+            for j in range(front, live):
+                np.copyto(depletion[j], m + 1, where=(balances[j] <= 1e-9) & np.isinf(depletion[j]))
+            balances[front:].sum(axis=0, out=year_end[year])
+
+        if front == k and m >= max_delay and not sustained.any():
+            break
+
+    return RunwayProjection(
+        horizon_months=months,
+        runway_months=runway,
+        sustained=sustained,
+        year_end_balances=np.ascontiguousarray(year_end.T),
+        sleeve_names=[s.name for s in sleeves],
+        depletion_months=np.ascontiguousarray(depletion.T),
+    )
+
+
+# ==== CACHE ====
+
+_CACHE_SIZE = 128
+_CACHE: OrderedDict[str, RunwayProjection] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def projection_key(
+    monthly_cost: float,
+    monthly_income: float,
+    sleeves: tuple[AssetSleeve, ...],
+    assumptions: ProjectionAssumptions,
+) -> str:
+    """Stable hash of all projection inputs."""
+    payload = {
+        "cost": round(float(monthly_cost), 4),
+        "income": round(float(monthly_income), 4),
+        "sleeves": [asdict(s) for s in sleeves],
+        "assumptions": asdict(assumptions),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def clear_projection_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def project_runway(
+    monthly_cost: float,
+    monthly_income: float,
+    sleeves: tuple[AssetSleeve, ...],
+    assumptions: ProjectionAssumptions | None = None,
+) -> RunwayProjection:
+    """
+    Simulate care funding month by month.
+
+    Each month the care cost (inflated, tier-adjusted) net of income is drawn
+    from the sleeves in order; sleeves still in their liquidation window are
+    skipped but keep growing.
+
+    Args:
+        monthly_cost: Current monthly care cost
+        monthly_income: Current monthly income + benefits
+        sleeves: Output of build_sleeves
+        assumptions: ProjectionAssumptions (defaults: 4% care inflation, 2% COLA)
+
+    Returns:
+        RunwayProjection (cached per input hash; arrays are read-only)
+    """
+    assumptions = assumptions or ProjectionAssumptions()
+    key = projection_key(monthly_cost, monthly_income, sleeves, assumptions)
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            _CACHE.move_to_end(key)
+            return cached
+
+    result = _simulate(monthly_cost, monthly_income, sleeves, assumptions)
+    for arr in (result.runway_months, result.sustained, result.year_end_balances, result.depletion_months):
+        arr.setflags(write=False)
+
+    with _CACHE_LOCK:
+        _CACHE[key] = result
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return result
+
+
+def project_profile_runway(
+    profile: FinancialProfile,
+    monthly_cost: float,
+    care_recommendation: CareRecommendation | None = None,
+    selected_assets: dict[str, bool] | None = None,
+    assumptions: ProjectionAssumptions | None = None,
+) -> RunwayProjection:
+    """
+    Project runway straight from a FinancialProfile.
+
+    Uses calculate_asset_breakdown for the categories and
+    calculate_recommended_funding_order for the draw-down sequence.
+    """
+    categories = calculate_asset_breakdown(profile, care_recommendation)
+    order, _notes = calculate_recommended_funding_order(categories, care_recommendation, profile)
+    sleeves = build_sleeves(categories, selected_assets, order, assumptions)
+    # Same monthly resources as calculate_expert_review (STEP 3)
+    income = (
+        profile.total_monthly_income
+        + profile.total_va_benefits_monthly
+        + profile.annuity_monthly_income
+        - (profile.ltc_monthly_premium if profile.has_ltc_insurance else 0.0)
+    )
+    return project_runway(monthly_cost, income, sleeves, assumptions)
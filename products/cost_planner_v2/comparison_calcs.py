@@ -21,6 +21,7 @@ from typing import Any
 
 from core.mcip import MCIP
 from products.cost_planner_v2.utils.regional_data import RegionalDataProvider
+from products.cost_planner_v2.utils.zip_index import get_zip_index
 
 # ==============================================================================
 # BASE RATES
@@ -127,6 +128,10 @@ class ScenarioBreakdown:
 def get_home_carry_effective(zip_code: str | None, user_override: float | None = None) -> float:
     """Calculate effective home carry cost with regional scaling.
     
+    Without a user override, the ZIP's median monthly cost (exact match or
+    ZIP3 median from the shared ZIP index) is used as-is, since it is already
+    local. Otherwise the override/national base is regionally scaled.
+    
     Args:
         zip_code: ZIP code for regional adjustment
         user_override: User-specified home carry amount (overrides base if provided)
@@ -134,6 +139,11 @@ def get_home_carry_effective(zip_code: str | None, user_override: float | None =
     Returns:
         Monthly home carry cost (regionally adjusted)
     """
+    if user_override is None and zip_code:
+        found = get_zip_index().lookup(zip_code, "owner")
+        if found is not None:
+            return round(found[0], 2)
+
     # Start with user override or base
     base_amount = user_override if user_override is not None else HOME_CARRY_BASE
 
@@ -747,6 +747,9 @@ def calculate_extended_runway(
 ) -> float | None:
     """
     Calculate how long care can be funded with selected assets.
+
+    Straight-line estimate (today's gap, no inflation or returns). See
+    cashflow_projection.project_runway for the month-by-month simulation.
     
     Args:
         monthly_gap: Monthly shortfall (positive number)
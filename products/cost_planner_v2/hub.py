@@ -9,11 +9,11 @@ the universal product interface.
 Uses Navi as the single intelligence layer for guidance and progress.
 """
 
-import json
 import os
 
 import streamlit as st
 
+from core.config_registry import get_config
 from core.mcip import MCIP, CareRecommendation
 from core.name_utils import section_header, personalize, pname
 from products.cost_planner_v2.utils.financial_helpers import (
@@ -29,13 +29,11 @@ def _load_module_config() -> dict:
     """Load module configuration from JSON."""
     config_path = os.path.join("config", "cost_planner_v2_modules.json")
     try:
-        with open(config_path) as f:
-            config = json.load(f)
-        return config
+        return get_config("cost_planner_v2_modules.json")
     except FileNotFoundError:
         st.error(f"❌ Configuration file not found: {config_path}")
         return {"modules": []}
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # JSONDecodeError or ConfigError
         st.error(f"❌ Error parsing configuration file: {e}")
         return {"modules": []}
 
@@ -5,25 +5,20 @@ Renders financial assessment modules from JSON configuration.
 Similar to GCP's data-driven approach but for financial forms.
 """
 
-import json
-from functools import lru_cache
-from pathlib import Path
 from typing import Any
 
 import streamlit as st
+from core.config_registry import get_config
 from core.name_utils import personalize
 
 
-@lru_cache(maxsize=1)
 def load_module_config() -> dict[str, Any]:
     """Load module configuration from JSON file.
 
     Returns:
-        Dict with complete module configuration
+        Dict with complete module configuration (shared, read-only; see core.config_registry)
     """
-    config_path = Path(__file__).parent.parent.parent / "config" / "cost_planner_v2_modules.json"
-    with open(config_path) as f:
-        return json.load(f)
+    return get_config("cost_planner_v2_modules.json")
 
 
 def get_module_definition(module_key: str) -> dict[str, Any] | None:
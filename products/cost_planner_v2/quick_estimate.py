@@ -12,7 +12,6 @@ Clean tabbed comparison view with:
 
 import hashlib
 import json
-import threading
 import time
 
 import streamlit as st
@@ -523,12 +522,10 @@ def render():
         st.warning("⚠️ **ZIP code required:** Return to the previous page to enter your ZIP code.")
         st.markdown("")
 
-    # Pre-warm ALL visible tabs BEFORE rendering strip (concurrent + cached)
+    # Pre-warm ALL visible tabs BEFORE rendering strip (one batch pass + cached)
     # Uses persistent cache keyed by inputs - no recompute on reruns if unchanged
-    from concurrent.futures import ThreadPoolExecutor
-    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
-    
-    from products.cost_planner_v2.calc import compute_totals_cached
+    from products.cost_planner_v2.calc import compute_all_totals_cached
+    from products.cost_planner_v2.comparison_calcs import get_active_flags
     from products.cost_planner_v2.ui_helpers import totals_set
     
     ss = st.session_state
@@ -547,29 +544,18 @@ def render():
     home_carry = float(ss.get("comparison_home_carry_cost", 0) or 0)
     keep_home = ss.get("comparison_keep_home", False)
     
-    # Get script context for worker threads (eliminates warnings)
-    ctx = get_script_run_ctx()
-    
-    def _warm_one(key: str) -> tuple[str, dict]:
-        """Warm one tab's totals (cached by inputs)."""
-        # Attach script context to avoid "missing ScriptRunContext" warnings
-        if ctx:
-            add_script_run_ctx(threading.current_thread(), ctx)
-        
-        result = compute_totals_cached(
-            key,
-            zip_code=zip_for_compute,
-            hours_per_day=hours_per_day,
-            home_carry=home_carry,
-            keep_home=keep_home,
-        )
+    # Price all visible tabs together (vectorized batch engine)
+    warmed = compute_all_totals_cached(
+        tuple(visible_tabs),
+        zip_code=zip_for_compute,
+        hours_per_day=hours_per_day,
+        home_carry=home_carry,
+        keep_home=keep_home,
+        flags=tuple(sorted(get_active_flags())),
+    )
+    for key in visible_tabs:
         # Also populate legacy totals_cache for backward compat
-        totals_set(key, result["total"])
-        return key, result
-    
-    # Warm all visible tabs concurrently (max 4 threads)
-    with ThreadPoolExecutor(max_workers=min(4, len(visible_tabs))) as ex:
-        warmed = dict(ex.map(_warm_one, visible_tabs))
+        totals_set(key, warmed[key]["total"])
     
     # Build totals dict for tab strip (now fully populated)
     totals = {k: warmed[k]["total"] for k in visible_tabs}
@@ -6,14 +6,27 @@ ZIP → ZIP3 → State → Default
 
 Data sources:
 - config/regional_cost_config.json (existing regional multipliers)
+- Bundled ZIP3 → state map (zip3_states.py), so state multipliers apply
+  when only a ZIP is known
 - Fallback to national averages
+
+The config is compiled once into flat tables (see CompiledRegionalResolver):
+an exact-ZIP override dict plus a 1000-slot ZIP3 table with precedence
+already resolved, so a lookup is one dict probe and one list index. The
+tables are rebuilt when the config file's mtime changes.
 """
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from typing import Any
 
+from .zip3_states import build_zip3_state_table
+
+# Confidence per match precision (exact ZIP is most specific)
+PRECISION_CONFIDENCE = {"zip": 1.0, "zip3": 0.85, "state": 0.7, "national": 0.5}
+
 
 @dataclass
 class RegionalMultiplier:
@@ -22,6 +35,69 @@ class RegionalMultiplier:
     multiplier: float
     region_name: str
     precision: str  # "zip", "zip3", "state", or "national"
+    confidence: float = 1.0
+
+
+def _entry(multiplier: float, name: str, precision: str) -> RegionalMultiplier:
+    return RegionalMultiplier(
+        multiplier=multiplier,
+        region_name=name,
+        precision=precision,
+        confidence=PRECISION_CONFIDENCE[precision],
+    )
+
+
+class CompiledRegionalResolver:
+    """Flat lookup tables compiled from the normalized regional config.
+
+    - zip_overrides: {zip5: RegionalMultiplier} exact-ZIP matches
+    - zip3_table: 1000 RegionalMultipliers (configured ZIP3, else the state
+      of that prefix, else national default)
+    - states: {state: RegionalMultiplier} for explicit state lookups
+    """
+
+    def __init__(self, config: dict[str, Any]):
+        self.national = _entry(config.get("default_multiplier", 1.0), "National Average", "national")
+        self.states = {
+            code: _entry(data["multiplier"], data.get("name", code), "state")
+            for code, data in config.get("state_multipliers", {}).items()
+        }
+        self.zip_overrides = {
+            zip5: _entry(data["multiplier"], data.get("name", zip5), "zip")
+            for zip5, data in config.get("zip_multipliers", {}).items()
+        }
+
+        zip3_config = config.get("zip3_multipliers", {})
+        zip3_states = build_zip3_state_table()
+        self.zip3_table: list[RegionalMultiplier] = []
+        for i in range(1000):
+            zip3 = f"{i:03d}"
+            if zip3 in zip3_config:
+                data = zip3_config[zip3]
+                self.zip3_table.append(_entry(data["multiplier"], data.get("name", f"Region {zip3}"), "zip3"))
+            else:
+                self.zip3_table.append(self.states.get(zip3_states[i], self.national))
+
+    def resolve(self, zip_code: str | None = None, state: str | None = None) -> RegionalMultiplier:
+        """Resolve a multiplier: exact ZIP → ZIP3 → state → national.
+
+        An explicit state wins over the state inferred from the ZIP prefix,
+        but not over a configured ZIP or ZIP3 match.
+        """
+        result = self.national
+        if zip_code:
+            zip_code = str(zip_code).strip()
+            if len(zip_code) >= 5:
+                hit = self.zip_overrides.get(zip_code[:5])
+                if hit is not None:
+                    return hit
+            if len(zip_code) >= 3 and zip_code[:3].isdigit():
+                result = self.zip3_table[int(zip_code[:3])]
+                if result.precision == "zip3":
+                    return result
+        if state:
+            return self.states.get(state.upper(), result)
+        return result
 
 
 class RegionalDataProvider:
@@ -29,12 +105,43 @@ class RegionalDataProvider:
 
     _config: dict[str, Any] | None = None
     _config_path = "config/regional_cost_config.json"
+    _config_mtime: int | None = None
+    _resolver: CompiledRegionalResolver | None = None
+    _next_reload_check: float = 0.0
+    _reload_check_interval = 2.0  # seconds between config mtime checks
+
+    @classmethod
+    def _current_mtime(cls) -> int | None:
+        try:
+            return os.stat(os.path.join(os.getcwd(), cls._config_path)).st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def get_resolver(cls) -> CompiledRegionalResolver:
+        """Compiled resolver, rebuilt when the config file changes on disk.
+
+        The mtime is checked at most every _reload_check_interval seconds so
+        the hot path stays a dict probe plus a list index.
+        """
+        now = time.monotonic()
+        if cls._resolver is not None and now < cls._next_reload_check:
+            return cls._resolver
+        cls._next_reload_check = now + cls._reload_check_interval
+
+        mtime = cls._current_mtime()
+        if cls._resolver is None or mtime != cls._config_mtime:
+            cls._config = None
+            cls._resolver = CompiledRegionalResolver(cls._load_config())
+            cls._config_mtime = mtime
+        return cls._resolver
 
     @classmethod
     def _load_config(cls) -> dict[str, Any]:
         """Load regional config once and cache.
 
-        Transforms array-based config into lookup dicts for fast access.
+        Transforms array-based config into lookup dicts (compiled further by
+        CompiledRegionalResolver).
         """
         if cls._config is None:
             config_path = os.path.join(os.getcwd(), cls._config_path)
@@ -122,7 +229,7 @@ class RegionalDataProvider:
         Precedence (most specific to least specific):
         1. ZIP code (exact match)
         2. ZIP3 (first 3 digits)
-        3. State
+        3. State (explicit, else inferred from the ZIP prefix)
         4. National default (1.0)
 
         Args:
@@ -132,44 +239,7 @@ class RegionalDataProvider:
         Returns:
             RegionalMultiplier with multiplier value and metadata
         """
-        config = cls._load_config()
-
-        # Try ZIP code exact match
-        if zip_code and len(zip_code) >= 5:
-            zip5 = zip_code[:5]
-            if zip5 in config.get("zip_multipliers", {}):
-                return RegionalMultiplier(
-                    multiplier=config["zip_multipliers"][zip5]["multiplier"],
-                    region_name=config["zip_multipliers"][zip5].get("name", zip5),
-                    precision="zip",
-                )
-
-        # Try ZIP3 (first 3 digits)
-        if zip_code and len(zip_code) >= 3:
-            zip3 = zip_code[:3]
-            if zip3 in config.get("zip3_multipliers", {}):
-                return RegionalMultiplier(
-                    multiplier=config["zip3_multipliers"][zip3]["multiplier"],
-                    region_name=config["zip3_multipliers"][zip3].get("name", f"Region {zip3}"),
-                    precision="zip3",
-                )
-
-        # Try state
-        if state:
-            state_upper = state.upper()
-            if state_upper in config.get("state_multipliers", {}):
-                return RegionalMultiplier(
-                    multiplier=config["state_multipliers"][state_upper]["multiplier"],
-                    region_name=config["state_multipliers"][state_upper].get("name", state_upper),
-                    precision="state",
-                )
-
-        # Fallback to national default
-        return RegionalMultiplier(
-            multiplier=config.get("default_multiplier", 1.0),
-            region_name="National Average",
-            precision="national",
-        )
+        return cls.get_resolver().resolve(zip_code, state)
 
     @classmethod
     def get_all_states(cls) -> dict[str, str]:
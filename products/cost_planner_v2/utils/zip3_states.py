@@ -0,0 +1,83 @@
+"""
+ZIP3 prefix → state mapping (USPS sectional center ranges).
+
+Bundled so regional pricing can fall back to a state multiplier when only a
+ZIP code is known. Military (AA/AE/AP) and unassigned prefixes map to None.
+"""
+
+# (first_zip3, last_zip3, state) — inclusive ranges; later rows override
+# earlier ones for the few prefixes carved out of a larger range.
+ZIP3_STATE_RANGES: list[tuple[int, int, str]] = [
+    (5, 5, "NY"),
+    (6, 7, "PR"),
+    (8, 8, "VI"),
+    (9, 9, "PR"),
+    (10, 27, "MA"),
+    (28, 29, "RI"),
+    (30, 38, "NH"),
+    (39, 49, "ME"),
+    (50, 59, "VT"),
+    (55, 55, "MA"),
+    (60, 69, "CT"),
+    (70, 89, "NJ"),
+    (100, 149, "NY"),
+    (150, 196, "PA"),
+    (197, 199, "DE"),
+    (200, 205, "DC"),
+    (201, 201, "VA"),
+    (206, 219, "MD"),
+    (220, 246, "VA"),
+    (247, 268, "WV"),
+    (270, 289, "NC"),
+    (290, 299, "SC"),
+    (300, 319, "GA"),
+    (320, 339, "FL"),
+    (341, 349, "FL"),
+    (350, 369, "AL"),
+    (370, 385, "TN"),
+    (386, 397, "MS"),
+    (398, 399, "GA"),
+    (400, 427, "KY"),
+    (430, 459, "OH"),
+    (460, 479, "IN"),
+    (480, 499, "MI"),
+    (500, 528, "IA"),
+    (530, 549, "WI"),
+    (550, 567, "MN"),
+    (569, 569, "DC"),
+    (570, 577, "SD"),
+    (580, 588, "ND"),
+    (590, 599, "MT"),
+    (600, 629, "IL"),
+    (630, 658, "MO"),
+    (660, 679, "KS"),
+    (680, 693, "NE"),
+    (700, 714, "LA"),
+    (716, 729, "AR"),
+    (730, 749, "OK"),
+    (733, 733, "TX"),
+    (750, 799, "TX"),
+    (800, 816, "CO"),
+    (820, 831, "WY"),
+    (832, 838, "ID"),
+    (840, 847, "UT"),
+    (850, 865, "AZ"),
+    (870, 884, "NM"),
+    (885, 885, "TX"),
+    (889, 898, "NV"),
+    (900, 961, "CA"),
+    (967, 968, "HI"),
+    (969, 969, "GU"),
+    (970, 979, "OR"),
+    (980, 994, "WA"),
+    (995, 999, "AK"),
+]
+
+
+def build_zip3_state_table() -> list[str | None]:
+    """List of length 1000: index = ZIP3 as int, value = state code or None."""
+    table: list[str | None] = [None] * 1000
+    for first, last, state in ZIP3_STATE_RANGES:
+        for zip3 in range(first, last + 1):
+            table[zip3] = state
+    return table
@@ -0,0 +1,294 @@
+"""
+Array-backed ZIP cost index for Cost Planner v2.
+
+Single loader for data/app_data/monthly_median_cost.csv shared by every
+home-cost lookup (data.lookup_home_cost, home_costs.lookup_zip and
+comparison_calcs.get_home_carry_effective).
+
+Layout per kind ("owner", "renter"):
+- zips: sorted int32 array of 5-digit ZIPs
+- amounts: float64 array aligned with zips
+- zip3_median: float64 array of length 1000 (NaN where no data)
+
+Lookups:
+- Exact ZIP: binary search (np.searchsorted), O(log n)
+- ZIP3 bucket median: direct index, O(1)
+
+The parsed arrays are persisted to a .npz sidecar in .cache/, stamped with
+the CSV's size and mtime, so later processes skip CSV parsing entirely.
+Non-numeric ('-') and non-positive amounts are dropped.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+KINDS = ("owner", "renter")
+SIDECAR_VERSION = 1
+SIDECAR_PATH = Path(".cache/zip_cost_index.npz")
+
+# Column detection (case-insensitive, spaces -> underscores)
+ZIP_VARIANTS = ["zipcode", "zip", "postal", "zip_code", "postalcode"]
+OWNER_VARIANTS = [
+    "owner_monthly", "owner_carry", "owner_cost", "owner_avg", "median_owner",
+    "medianmonthlycost", "median_monthly_cost",
+]
+RENTER_VARIANTS = ["renter_monthly", "renter_carry", "renter_cost", "renter_avg", "median_renter"]
+
+
+def _project_root(start: Path) -> Path:
+    """Walk up from `start` until we find a marker of the repo root."""
+    cur = start.resolve()
+    for _ in range(8):
+        if (cur / "config" / "nav.json").exists() or (cur / "app.py").exists():
+            return cur
+        cur = cur.parent
+    return start.resolve().parents[4]
+
+
+@cache
+def default_csv_path() -> Path:
+    return _project_root(Path(__file__)) / "data" / "app_data" / "monthly_median_cost.csv"
+
+
+def normalize_zip(zip_code: str | int | None) -> int | None:
+    """5-digit ZIP as int, or None if not a ZIP."""
+    if zip_code is None:
+        return None
+    text = str(zip_code).strip()[:5]
+    if not text.isdigit():
+        return None
+    return int(text.zfill(5))
+
+
+# ====================================================================
+# INDEX
+# ====================================================================
+
+
+class ZipCostIndex:
+    """Sorted ZIP/amount arrays per kind with precomputed ZIP3 medians."""
+
+    def __init__(self, arrays: dict[str, tuple[np.ndarray, np.ndarray]]):
+        self._zips: dict[str, np.ndarray] = {}
+        self._amounts: dict[str, np.ndarray] = {}
+        self._zip3: dict[str, np.ndarray] = {}
+        for kind, (zips, amounts) in arrays.items():
+            order = np.argsort(zips, kind="stable")
+            zips = np.asarray(zips, dtype=np.int32)[order]
+            amounts = np.asarray(amounts, dtype=np.float64)[order]
+            self._zips[kind] = zips
+            self._amounts[kind] = amounts
+            self._zip3[kind] = _zip3_medians(zips, amounts)
+
+    @property
+    def kinds(self) -> list[str]:
+        return list(self._zips)
+
+    def __len__(self) -> int:
+        return sum(len(z) for z in self._zips.values())
+
+    def count(self, kind: str) -> int:
+        zips = self._zips.get(kind)
+        return 0 if zips is None else len(zips)
+
+    def exact(self, zip_code: str | int | None, kind: str = "owner") -> float | None:
+        """Amount for an exact ZIP match (binary search)."""
+        z = normalize_zip(zip_code)
+        zips = self._zips.get(kind)
+        if z is None or zips is None or len(zips) == 0:
+            return None
+        # Scalar must match the array dtype or numpy casts the whole array
+        i = int(zips.searchsorted(np.int32(z)))
+        if i < len(zips) and zips[i] == z:
+            return float(self._amounts[kind][i])
+        return None
+
+    def zip3_median(self, zip_code: str | int | None, kind: str = "owner") -> float | None:
+        """Median amount of all ZIPs sharing the first three digits."""
+        z = normalize_zip(zip_code)
+        table = self._zip3.get(kind)
+        if z is None or table is None:
+            return None
+        value = table[z // 100]
+        return None if np.isnan(value) else float(value)
+
+    def lookup(self, zip_code: str | int | None, kind: str = "owner") -> tuple[float, str] | None:
+        """Exact match, then ZIP3 median.
+
+        Returns:
+            (amount, "exact" | "zip3") or None
+        """
+        amount = self.exact(zip_code, kind)
+        if amount is not None:
+            return amount, "exact"
+        amount = self.zip3_median(zip_code, kind)
+        if amount is not None:
+            return amount, "zip3"
+        return None
+
+    def as_dict(self, kind: str = "owner") -> dict[str, float]:
+        """{zip5: amount} view (for legacy callers)."""
+        zips = self._zips.get(kind, np.empty(0, dtype=np.int32))
+        amounts = self._amounts.get(kind, np.empty(0))
+        return {f"{z:05d}": float(a) for z, a in zip(zips.tolist(), amounts.tolist(), strict=True)}
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long DataFrame with columns zip (str), amount (float), kind (str)."""
+        frames = [
+            pd.DataFrame({
+                "zip": pd.Series(self._zips[k]).map("{:05d}".format),
+                "amount": self._amounts[k],
+                "kind": k,
+            })
+            for k in self._zips
+        ]
+        if not frames:
+            return pd.DataFrame(columns=["zip", "amount", "kind"])
+        return pd.concat(frames, ignore_index=True)
+
+    # ----------------------------------------------------------------
+    # Sidecar
+    # ----------------------------------------------------------------
+
+    def save(self, path: Path, stamp: tuple[int, int]) -> None:
+        """Persist arrays atomically (tmp file + os.replace)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload: dict[str, np.ndarray] = {
+            "version": np.array(SIDECAR_VERSION),
+            "stamp": np.array(stamp, dtype=np.int64),
+        }
+        for kind in self._zips:
+            payload[f"{kind}_zips"] = self._zips[kind]
+            payload[f"{kind}_amounts"] = self._amounts[kind]
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as fh:
+            np.savez(fh, **payload)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, stamp: tuple[int, int]) -> ZipCostIndex | None:
+        """Load a sidecar if it matches the CSV stamp, else None."""
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != SIDECAR_VERSION:
+                    return None
+                if tuple(int(x) for x in data["stamp"]) != tuple(stamp):
+                    return None
+                arrays = {
+                    kind: (data[f"{kind}_zips"], data[f"{kind}_amounts"])
+                    for kind in KINDS
+                    if f"{kind}_zips" in data.files
+                }
+            return cls(arrays)
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+def _zip3_medians(zips: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+    """Median amount per ZIP3 prefix (NaN where no ZIPs), length 1000."""
+    table = np.full(1000, np.nan)
+    if len(zips) == 0:
+        return table
+    prefixes = zips // 100
+    # zips are sorted, so prefixes are sorted: split into contiguous groups
+    bounds = np.flatnonzero(np.diff(prefixes)) + 1
+    for group_prefixes, group_amounts in zip(np.split(prefixes, bounds), np.split(amounts, bounds), strict=True):
+        table[group_prefixes[0]] = np.median(group_amounts)
+    return table
+
+
+def build_from_csv(csv_path: Path) -> ZipCostIndex:
+    """Parse the CSV (vectorized) into a ZipCostIndex."""
+    df = pd.read_csv(csv_path, dtype=str)
+
+    def _find(variants: list[str]) -> str | None:
+        for col in df.columns:
+            if col.strip().lower().replace(" ", "_") in variants:
+                return col
+        return None
+
+    zip_col = _find(ZIP_VARIANTS)
+    if zip_col is None:
+        print(f"[HOME_COST_WARN] No ZIP column detected; columns={list(df.columns)}")
+        return ZipCostIndex({})
+
+    zip_text = df[zip_col].str.strip().str.zfill(5).str[:5]
+    zip_ints = pd.to_numeric(zip_text, errors="coerce")
+
+    arrays: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    for kind, variants in (("owner", OWNER_VARIANTS), ("renter", RENTER_VARIANTS)):
+        col = _find(variants)
+        if col is None:
+            continue
+        amounts = pd.to_numeric(df[col], errors="coerce")
+        valid = zip_ints.notna() & amounts.notna() & (amounts > 0)
+        frame = pd.DataFrame({"zip": zip_ints[valid], "amount": amounts[valid]})
+        # First occurrence wins for duplicate ZIPs
+        frame = frame.drop_duplicates("zip", keep="first")
+        arrays[kind] = (frame["zip"].to_numpy(dtype=np.int32), frame["amount"].to_numpy(dtype=np.float64))
+
+    if not arrays:
+        print(f"[HOME_COST_WARN] No owner/renter columns; columns={list(df.columns)}")
+    return ZipCostIndex(arrays)
+
+
+# ====================================================================
+# SHARED INSTANCE
+# ====================================================================
+
+_INDEX_LOCK = threading.Lock()
+_INDEX: tuple[tuple, ZipCostIndex] | None = None
+
+
+def _csv_stamp(csv_path: Path) -> tuple[int, int]:
+    stat = csv_path.stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def get_zip_index(csv_path: Path | None = None, sidecar_path: Path | None = None) -> ZipCostIndex:
+    """Process-wide ZIP index, rebuilt only when the CSV changes.
+
+    Order: in-memory instance -> .npz sidecar -> CSV parse (then sidecar
+    written). A missing CSV yields an empty index.
+    """
+    global _INDEX
+
+    csv_path = Path(csv_path) if csv_path else default_csv_path()
+    sidecar_path = Path(sidecar_path) if sidecar_path else SIDECAR_PATH
+
+    try:
+        stamp = _csv_stamp(csv_path)
+    except OSError:
+        print(f"[HOME_COST_WARN] CSV not found at: {csv_path}")
+        return ZipCostIndex({})
+    ident = (str(csv_path), str(sidecar_path), stamp)
+    cached = _INDEX
+    if cached is not None and cached[0] == ident:
+        return cached[1]
+
+    with _INDEX_LOCK:
+        if _INDEX is not None and _INDEX[0] == ident:
+            return _INDEX[1]
+
+        index = ZipCostIndex.load(sidecar_path, stamp)
+        if index is None:
+            try:
+                index = build_from_csv(csv_path)
+            except Exception as e:
+                print(f"[HOME_COST_ERR] Failed to read CSV at {csv_path}: {e}")
+                return ZipCostIndex({})
+            try:
+                index.save(sidecar_path, stamp)
+            except OSError as e:
+                print(f"[HOME_COST_WARN] Could not write ZIP index sidecar: {e}")
+            print(f"[HOME_COST_OK] Built ZIP index from CSV: owner={index.count('owner')} renter={index.count('renter')}")
+
+        _INDEX = (ident, index)
+        return index
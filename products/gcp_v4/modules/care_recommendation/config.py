@@ -5,14 +5,14 @@ Loads module.json and converts to ModuleConfig for the module engine.
 Converts sections-based schema to steps-based schema with content contract system.
 """
 
-import json
 from functools import cache
-from pathlib import Path
 from typing import Any
 
     # Remove legacy imports that are no longer used
 from core.modules.schema import FieldDef, ModuleConfig, StepDef
 
+from .scoring_tables import load_module_spec
+
 
 @cache
 def get_config() -> ModuleConfig:
@@ -24,13 +24,10 @@ def get_config() -> ModuleConfig:
     Returns:
         ModuleConfig object for module engine
     """
-    # Load raw JSON without content contract resolution
+    # Raw spec without content contract resolution, shared with the compiled
+    # scoring model so module.json is parsed once per process.
     # Resolution will happen at render time when session state is available
-    module_dir = Path(__file__).parent
-    spec_file = module_dir / "module.json"
-    
-    with spec_file.open('r', encoding='utf-8') as f:
-        raw_spec = json.load(f)
+    raw_spec = load_module_spec()
     
     # Extract raw data
     module_meta = raw_spec.get("module", {})
@@ -243,14 +240,12 @@ def _build_effects_from_options(options: list[dict[str, Any]]) -> list[dict[str,
 
 
 def _load_module_json() -> dict[str, Any]:
-    """Load module.json from disk.
+    """Parsed module.json, shared with the compiled scoring model.
 
     Returns:
         Module configuration dict
     """
-    path = Path(__file__).with_name("module.json")
-    with path.open() as fh:
-        return json.load(fh)
+    return load_module_spec()
 
 
 __all__ = ["get_config"]
@@ -0,0 +1,500 @@
+"""
+Headless GCP evaluation core.
+
+Pure, side-effect-free versions of the deterministic pieces of
+logic.derive_outcome: score → tier, cognitive gate, cognition/support bands,
+tier-map lookup, behavior gate and tier selection, plus the answers →
+HoursContext mapping used for the weighted hours baseline.
+
+Nothing here imports Streamlit, touches session state, prints or calls an
+LLM, so it can be used from batch replays and process pools
+(tools/batch_eval.py). logic.py wraps these functions with its logging and
+session-state side effects.
+"""
+
+import json
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from ai.gcp_schemas import CANONICAL_TIERS
+
+from .scoring_tables import CompiledScoringModel, flags_for_answers, score_answers
+
+# Tier thresholds based on total score
+# CRITICAL: These are the ONLY 5 allowed tier values
+TIER_THRESHOLDS = {
+    "no_care_needed": (0, 8),  # 0-8 points: no formal care needed
+    "in_home": (9, 16),  # 9-16 points: needs regular in-home support
+    "assisted_living": (17, 24),  # 17-24 points: needs assisted living environment
+    "memory_care": (25, 39),  # 25-39 points: needs memory care
+    "memory_care_high_acuity": (40, 100),  # 40+ points: needs intensive memory care
+}
+
+# Valid tier values - used for validation
+VALID_TIERS = set(TIER_THRESHOLDS.keys())
+
+# Cognitive high-risk flags/behaviors that gate memory care access
+COGNITIVE_HIGH_RISK = {
+    "wandering",
+    "elopement",
+    "aggression",
+    "severe_sundowning",
+    "severe_cognitive_risk",
+    "memory_support",
+}
+
+MEMORY_CARE_TIERS = {"memory_care", "memory_care_high_acuity"}
+
+# Fallback order when neither the tier map nor the score tier is allowed
+FALLBACK_TIER_ORDER = ("assisted_living", "in_home", "none", "memory_care", "memory_care_high_acuity")
+
+HOURS_BANDS = ("<1h", "1-3h", "4-8h", "12-16h", "24h")
+
+# Canonical BADL mapping to deduplicate UI variations
+CANON_BADLS = {
+    "Bathing/Showering": "bathing",
+    "Bathing": "bathing",
+    "Showering": "bathing",
+    "Dressing": "dressing",
+    "Toileting": "toileting",
+    "Transferring": "transferring",
+    "Eating": "feeding",
+    "Feeding": "feeding",
+    "Mobility": "mobility",
+    "Personal Hygiene": "hygiene",
+    "Hygiene": "hygiene",
+}
+
+
+@cache
+def load_tier_map() -> dict:
+    """(cognition_band, support_band) → tier from tier_map.json; {} if unreadable."""
+    try:
+        with (Path(__file__).parent / "tier_map.json").open() as fh:
+            return json.load(fh)
+    except Exception:
+        return {}
+
+
+# ====================================================================
+# SCORE / GATES / BANDS
+# ====================================================================
+
+
+def determine_tier(total_score: float) -> str:
+    """Determine care tier from total score.
+
+    Raises:
+        ValueError: If determined tier is not in VALID_TIERS
+    """
+    tier = None
+
+    for tier_name, (min_score, max_score) in TIER_THRESHOLDS.items():
+        if min_score <= total_score <= max_score:
+            tier = tier_name
+            break
+
+    # Default to highest tier if score exceeds all thresholds
+    if tier is None:
+        tier = "memory_care_high_acuity"
+
+    # CRITICAL VALIDATION: Ensure only allowed tiers can be returned
+    if tier not in VALID_TIERS:
+        raise ValueError(f"Invalid tier '{tier}' - must be one of {VALID_TIERS}")
+
+    return tier
+
+
+def cognitive_gate_decision(answers: dict[str, Any], flags: list[str]) -> tuple[bool, str]:
+    """Memory care gate with the reason it passed or failed.
+
+    Memory care requires a formal diagnosis (cognitive_dx_confirm == "dx_yes")
+    AND moderate/severe memory changes, risky behaviors or cognitive risk flags.
+
+    Returns:
+        (passed, reason) where reason is one of "no_diagnosis", "memory",
+        "behaviors", "flags", "no_symptoms"
+    """
+    dx_confirm = (answers.get("cognitive_dx_confirm") or "").lower()
+    if dx_confirm != "dx_yes":
+        return False, "no_diagnosis"
+
+    mem = (answers.get("memory_changes") or "").lower()
+    if mem in ("moderate", "severe"):
+        return True, "memory"
+
+    behaviors = answers.get("behaviors") or []
+    if {b.lower() for b in behaviors} & COGNITIVE_HIGH_RISK:
+        return True, "behaviors"
+
+    if {f.lower() for f in (flags or [])} & COGNITIVE_HIGH_RISK:
+        return True, "flags"
+
+    return False, "no_symptoms"
+
+
+def cognition_band(answers: dict[str, Any], flags: list[str]) -> str:
+    """Derive cognition band from memory changes and behaviors.
+
+    Returns:
+        One of: "none", "mild", "moderate", "high"
+    """
+    mem = (answers.get("memory_changes") or "").lower()
+    behaviors = answers.get("behaviors") or []
+    risky_behav = {b.lower() for b in behaviors}
+
+    # Count risky behaviors
+    risky_count = len(risky_behav & COGNITIVE_HIGH_RISK)
+
+    # High: severe memory OR multiple risky behaviors
+    if mem == "severe" or risky_count >= 2:
+        return "high"
+
+    # Moderate: moderate memory OR single risky behavior
+    if mem == "moderate" or risky_count >= 1:
+        return "moderate"
+
+    # Mild: mild memory changes
+    if mem == "mild":
+        return "mild"
+
+    # None: no significant cognitive issues
+    return "none"
+
+
+def support_band(answers: dict[str, Any], flags: list[str]) -> str:
+    """Derive support band from ADLs, mobility, falls, meds.
+
+    Returns:
+        One of: "low", "moderate", "high", "24h"
+    """
+    # Count BADL challenges
+    badls = answers.get("badls") or []
+    badl_count = len(badls) if isinstance(badls, list) else 0
+
+    # Count IADL challenges
+    iadls = answers.get("iadls") or []
+    iadl_count = len(iadls) if isinstance(iadls, list) else 0
+
+    # Check mobility
+    mobility = (answers.get("mobility") or "").lower()
+
+    # Check falls
+    falls = (answers.get("falls") or "").lower()
+
+    # Check meds complexity
+    meds = (answers.get("meds_complexity") or "").lower()
+
+    # 24h: wheelchair/bedbound OR multiple BADLs + high falls
+    if mobility in ("wheelchair", "bedbound") or (badl_count >= 3 and falls == "multiple"):
+        return "24h"
+
+    # High: multiple BADLs OR significant mobility + falls
+    if badl_count >= 2 or (mobility in ("walker", "cane") and falls in ("once", "multiple")):
+        return "high"
+
+    # Moderate: some IADLs OR single BADL OR meds complexity
+    if iadl_count >= 2 or badl_count >= 1 or meds in ("moderate", "complex"):
+        return "moderate"
+
+    # Low: minimal support needs
+    return "low"
+
+
+def cognitive_gate_behaviors_only(answers: dict[str, Any], flags: list[str]) -> bool:
+    """Check if risky behaviors are present (for disagreement logging).
+
+    Used to identify cases where MC recommendation might be driven by
+    behaviors rather than pure cognition band.
+
+    Args:
+        answers: User responses from GCP module
+        flags: Flags set by assessment
+
+    Returns:
+        True if risky cognitive behaviors present
+    """
+    behaviors = set(answers.get("behaviors") or [])
+    flags_set = set(flags or [])
+
+    return bool(behaviors & COGNITIVE_HIGH_RISK) or bool(flags_set & COGNITIVE_HIGH_RISK)
+
+
+def calculate_confidence(scoring_details: dict[str, Any], total_score: float) -> float:
+    """Confidence from completeness (60%) and distance from tier boundaries (40%), min 0.5."""
+    required_answered = scoring_details.get("required_answered", 0)
+    required_total = scoring_details.get("required_total", 0)
+    completeness = required_answered / required_total if required_total > 0 else 1.0
+
+    min_score, max_score = TIER_THRESHOLDS[determine_tier(total_score)]
+    distance_from_boundary = min(total_score - min_score, max_score - total_score)
+
+    # Normalize distance (3+ points from boundary = full confidence)
+    boundary_confidence = min(distance_from_boundary / 3.0, 1.0)
+
+    confidence = (completeness * 0.6) + (boundary_confidence * 0.4)
+    return max(0.5, confidence)
+
+
+def select_tier(
+    tier_from_mapping: str | None, tier_from_score: str | None, allowed_tiers: set[str]
+) -> tuple[str, str]:
+    """Choose the deterministic tier.
+
+    Priority: mapping (if allowed) > score-based (if allowed) > best permitted
+    fallback; MC/MC-HA is forced down to assisted_living when not allowed.
+
+    Returns:
+        (tier, source) where source is "mapping", "score", "fallback" or "forced_downgrade"
+    """
+    chosen = None
+    source = "fallback"
+
+    if tier_from_mapping and tier_from_mapping in allowed_tiers:
+        chosen, source = tier_from_mapping, "mapping"
+    elif tier_from_score and tier_from_score in allowed_tiers:
+        chosen, source = tier_from_score, "score"
+    else:
+        for cand in FALLBACK_TIER_ORDER:
+            if cand in allowed_tiers:
+                chosen = cand
+                break
+
+    tier = chosen or (tier_from_mapping or tier_from_score or "none")
+
+    # Ensure MC/MC-HA is downgraded if not allowed (safety check)
+    if tier in MEMORY_CARE_TIERS and "memory_care" not in allowed_tiers:
+        tier, source = "assisted_living", "forced_downgrade"
+
+    return tier, source
+
+
+# ====================================================================
+# FULL EVALUATION
+# ====================================================================
+
+
+@dataclass
+class GcpEvaluation:
+    """Deterministic GCP outcome for one answer set."""
+
+    tier: str
+    tier_source: str  # mapping | score | fallback | forced_downgrade
+    total_score: float
+    tier_from_score: str
+    tier_from_mapping: str | None
+    cognition_band: str
+    support_band: str  # routing band (24h folded into high)
+    support_band_legacy: str  # diagnostic band, may be "24h"
+    passes_cognitive_gate: bool
+    cognitive_gate_reason: str
+    risky_behaviors: bool
+    behavior_gate_applied: bool
+    allowed_tiers: list[str]
+    flags: list[str]
+    confidence: float
+    # Tier map wanted MC/MC-HA but the cognitive gate blocked it (interim AL advice)
+    mc_blocked_by_gate: bool = False
+    scoring_details: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tier": self.tier,
+            "tier_source": self.tier_source,
+            "total_score": self.total_score,
+            "tier_from_score": self.tier_from_score,
+            "tier_from_mapping": self.tier_from_mapping,
+            "bands": {"cog": self.cognition_band, "sup": self.support_band},
+            "support_band_legacy": self.support_band_legacy,
+            "passes_cognitive_gate": self.passes_cognitive_gate,
+            "cognitive_gate_reason": self.cognitive_gate_reason,
+            "risky_behaviors": self.risky_behaviors,
+            "behavior_gate_applied": self.behavior_gate_applied,
+            "allowed_tiers": self.allowed_tiers,
+            "flags": self.flags,
+            "confidence": self.confidence,
+            "mc_blocked_by_gate": self.mc_blocked_by_gate,
+        }
+
+
+def resolve_flags(answers: dict[str, Any], model: CompiledScoringModel | None = None) -> list[str]:
+    """Flag IDs from the module state flags map, else from selected options."""
+    flag_ids: list[str] = []
+    flags_map = answers.get("flags")
+    if isinstance(flags_map, dict):
+        flag_ids.extend(str(k) for k, v in flags_map.items() if not k.endswith("_message") and v)
+    raw_flags = answers.get("_flags")
+    if isinstance(raw_flags, (list, tuple, set)):
+        flag_ids.extend(str(flag) for flag in raw_flags if flag)
+    if flag_ids:
+        return list(dict.fromkeys(flag_ids))
+    return flags_for_answers(answers, model)
+
+
+def evaluate_gcp(
+    answers: dict[str, Any],
+    flags: list[str] | None = None,
+    *,
+    behavior_gate: bool = False,
+    scoring_model: CompiledScoringModel | None = None,
+    tier_map: dict | None = None,
+) -> GcpEvaluation:
+    """Deterministic tier for an answer set, without side effects.
+
+    Args:
+        answers: GCP module answers
+        flags: Flag IDs; None resolves them from answers like derive_outcome
+        behavior_gate: FEATURE_GCP_MC_BEHAVIOR_GATE (moderate×high needs risky behaviors for MC)
+        scoring_model: Compiled module.json (default: process-wide model)
+        tier_map: cognition×support → tier map (default: tier_map.json)
+    """
+    total_score, scoring_details = score_answers(answers, scoring_model)
+
+    if flags is None:
+        flags = resolve_flags(answers, scoring_model)
+
+    decision = decide_tier(answers, flags, total_score, behavior_gate=behavior_gate, tier_map=tier_map)
+
+    return GcpEvaluation(
+        total_score=total_score,
+        flags=list(flags),
+        confidence=calculate_confidence(scoring_details, total_score),
+        scoring_details=scoring_details,
+        **decision,
+    )
+
+
+def decide_tier(
+    answers: dict[str, Any],
+    flags: list[str],
+    total_score: float,
+    *,
+    behavior_gate: bool = False,
+    tier_map: dict | None = None,
+) -> dict[str, Any]:
+    """Gate, band and tier decision for an already-scored answer set.
+
+    Split from evaluate_gcp() so callers that maintain the score
+    incrementally (what_if) skip re-scoring.
+
+    Returns:
+        GcpEvaluation fields other than total_score, flags, confidence
+        and scoring_details
+    """
+    tier_from_score = determine_tier(total_score)
+
+    passes_gate, gate_reason = cognitive_gate_decision(answers, flags)
+    cog_band = cognition_band(answers, flags)
+    sup_legacy = support_band(answers, flags)
+    # 24h is diagnostic only; route it as high
+    sup_band = "high" if sup_legacy == "24h" else sup_legacy
+
+    tier_map = load_tier_map() if tier_map is None else tier_map
+    tier_from_mapping = tier_map.get(cog_band, {}).get(sup_band)
+
+    allowed_tiers = set(CANONICAL_TIERS)
+    mc_blocked = False
+    if not passes_gate:
+        allowed_tiers -= MEMORY_CARE_TIERS
+        mc_blocked = tier_from_mapping in MEMORY_CARE_TIERS
+
+    risky = cognitive_gate_behaviors_only(answers, flags)
+    behavior_gate_applied = False
+    if behavior_gate and cog_band == "moderate" and sup_band == "high" and not risky:
+        behavior_gate_applied = bool(allowed_tiers & MEMORY_CARE_TIERS)
+        allowed_tiers -= MEMORY_CARE_TIERS
+
+    tier, source = select_tier(tier_from_mapping, tier_from_score, allowed_tiers)
+
+    return {
+        "tier": tier,
+        "tier_source": source,
+        "tier_from_score": tier_from_score,
+        "tier_from_mapping": tier_from_mapping,
+        "cognition_band": cog_band,
+        "support_band": sup_band,
+        "support_band_legacy": sup_legacy,
+        "passes_cognitive_gate": passes_gate,
+        "cognitive_gate_reason": gate_reason,
+        "risky_behaviors": risky,
+        "behavior_gate_applied": behavior_gate_applied,
+        "allowed_tiers": sorted(allowed_tiers),
+        "mc_blocked_by_gate": mc_blocked,
+    }
+
+
+# ====================================================================
+# HOURS
+# ====================================================================
+
+
+def hours_fields_from_answers(
+    answers: dict[str, Any], flags: list[str], current_hours: str | None = None
+) -> dict[str, Any]:
+    """HoursContext fields for the weighted hours baseline (unvalidated dict).
+
+    Args:
+        answers: GCP module answers
+        flags: Flag IDs
+        current_hours: User's current band when not in answers (session fallback)
+    """
+    badls = answers.get("badls", [])
+    if not isinstance(badls, list):
+        badls = []
+    badls_unique = {CANON_BADLS.get(x, x.lower()) for x in badls}
+
+    iadls = answers.get("iadls", [])
+    if not isinstance(iadls, list):
+        iadls = []
+
+    help_overall = answers.get("help_overall", "independent")
+    raw_hours = answers.get("hours_per_day")
+    current = raw_hours or current_hours
+
+    memory_changes = answers.get("memory_changes", "none")
+    cognitive_level = memory_changes if memory_changes in ["none", "mild", "moderate", "severe"] else "none"
+
+    return {
+        "badls_count": len(badls_unique),
+        "badls_list": [x for x in badls_unique if x is not None],
+        "iadls_count": len(iadls),
+        "iadls_list": [x.lower().replace(" ", "_") for x in iadls],
+        "falls": answers.get("falls", "none"),
+        "mobility": answers.get("mobility", "independent"),
+        "risky_behaviors": bool(set(flags) & COGNITIVE_HIGH_RISK),
+        "wandering": "wandering" in flags or "elopement" in flags,
+        "aggression": "aggression" in flags or "violent" in flags,
+        "sundowning": "sundowning" in flags,
+        "repetitive_questions": "repetitive_questions" in flags or "repetitive_behaviors" in flags,
+        "meds_complexity": answers.get("meds_complexity", "none"),
+        "primary_support": answers.get("primary_support", "none"),
+        # Heuristic: full support or a current 24h arrangement
+        "overnight_needed": (help_overall == "full_support" or raw_hours == "24h"),
+        "current_hours": current if current in HOURS_BANDS else None,
+        "cognitive_level": cognitive_level,
+    }
+
+
+def hours_context_from_answers(
+    answers: dict[str, Any], flags: list[str], current_hours: str | None = None
+) -> Any:
+    """Build the HoursContext for the weighted hours baseline.
+
+    Returns:
+        HoursContext instance (from ai.hours_schemas)
+    """
+    from ai.hours_schemas import HoursContext
+
+    return HoursContext(**hours_fields_from_answers(answers, flags, current_hours))
+
+
+def evaluate_hours(answers: dict[str, Any], flags: list[str] | None = None) -> tuple[str, float]:
+    """Weighted hours baseline (band, hours) for an answer set, without side effects."""
+    from ai.hours_engine import compute_weighted_hours
+
+    if flags is None:
+        flags = resolve_flags(answers)
+    result = compute_weighted_hours(hours_context_from_answers(answers, flags))
+    return result.band, result.hours
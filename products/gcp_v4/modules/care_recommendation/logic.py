@@ -13,7 +13,20 @@ import os
 from pathlib import Path
 from typing import Any
 
+# Pure evaluation core; band helpers are re-exported for existing importers
+from .evaluation import (
+    TIER_THRESHOLDS,
+    calculate_confidence,
+    cognition_band,
+    cognitive_gate_behaviors_only,
+    cognitive_gate_decision,
+    evaluate_gcp,
+    hours_context_from_answers,
+    support_band,
+)
+from .evaluation import determine_tier as _determine_tier
 from .flags import build_flags
+from .scoring_tables import flags_for_answers, get_scoring_model, load_module_spec, score_answers
 
 # Import flag manager for persisting flags
 try:
@@ -506,29 +519,6 @@ def ensure_summary_ready(answers: dict, flags: list[str], tier: str) -> None:
         pass
 
 
-# Tier thresholds based on total score
-# CRITICAL: These are the ONLY 5 allowed tier values
-TIER_THRESHOLDS = {
-    "no_care_needed": (0, 8),  # 0-8 points: no formal care needed
-    "in_home": (9, 16),  # 9-16 points: needs regular in-home support
-    "assisted_living": (17, 24),  # 17-24 points: needs assisted living environment
-    "memory_care": (25, 39),  # 25-39 points: needs memory care
-    "memory_care_high_acuity": (40, 100),  # 40+ points: needs intensive memory care
-}
-
-# Valid tier values - used for validation
-VALID_TIERS = set(TIER_THRESHOLDS.keys())
-
-# Cognitive high-risk flags/behaviors that gate memory care access
-COGNITIVE_HIGH_RISK = {
-    "wandering",
-    "elopement",
-    "aggression",
-    "severe_sundowning",
-    "severe_cognitive_risk",
-    "memory_support",
-}
-
 # Tier map cache (loaded from tier_map.json)
 _TIER_MAP_CACHE = None
 
@@ -572,128 +562,23 @@ def cognitive_gate(answers: dict[str, Any], flags: list[str]) -> bool:
     Returns:
         True if memory care access should be allowed
     """
-    # CRITICAL: Check for formal diagnosis FIRST
-    dx_confirm = (answers.get("cognitive_dx_confirm") or "").lower()
-    
+    passed, reason = cognitive_gate_decision(answers, flags)
+
     # Diagnostic logging
+    dx_confirm = (answers.get("cognitive_dx_confirm") or "").lower()
     mem = (answers.get("memory_changes") or "").lower()
     behaviors = answers.get("behaviors") or []
     print(f"[COGNITIVE_GATE] dx_confirm='{dx_confirm}' memory={mem} behaviors={len(behaviors)}")
-    
-    if dx_confirm != "dx_yes":
-        # No formal diagnosis = MC not allowed
-        print(f"[COGNITIVE_GATE] FAILED - no formal diagnosis (dx_confirm={dx_confirm})")
-        return False
-    
-    # Check memory_changes level
-    if mem in ("moderate", "severe"):
-        print(f"[COGNITIVE_GATE] PASSED - {mem} memory changes + diagnosis")
-        return True
-
-    # Check for risky behaviors
-    risky_behav = set(b.lower() for b in behaviors)
-    if len(risky_behav & COGNITIVE_HIGH_RISK) > 0:
-        print(f"[COGNITIVE_GATE] PASSED - risky behaviors + diagnosis")
-        return True
-
-    # Check for cognitive risk flags
-    flags_lower = set(f.lower() for f in (flags or []))
-    if len(flags_lower & COGNITIVE_HIGH_RISK) > 0:
-        print(f"[COGNITIVE_GATE] PASSED - cognitive risk flags + diagnosis")
-        return True
-
-    print(f"[COGNITIVE_GATE] FAILED - no cognitive symptoms despite diagnosis")
-    return False
-
-
-def cognition_band(answers: dict[str, Any], flags: list[str]) -> str:
-    """Derive cognition band from memory changes and behaviors.
-    
-    Returns:
-        One of: "none", "mild", "moderate", "high"
-    """
-    mem = (answers.get("memory_changes") or "").lower()
-    behaviors = answers.get("behaviors") or []
-    risky_behav = set(b.lower() for b in behaviors)
-
-    # Count risky behaviors
-    risky_count = len(risky_behav & COGNITIVE_HIGH_RISK)
-
-    # High: severe memory OR multiple risky behaviors
-    if mem == "severe" or risky_count >= 2:
-        return "high"
-
-    # Moderate: moderate memory OR single risky behavior
-    if mem == "moderate" or risky_count >= 1:
-        return "moderate"
-
-    # Mild: mild memory changes
-    if mem == "mild":
-        return "mild"
-
-    # None: no significant cognitive issues
-    return "none"
-
-
-def support_band(answers: dict[str, Any], flags: list[str]) -> str:
-    """Derive support band from ADLs, mobility, falls, meds.
-    
-    Returns:
-        One of: "low", "moderate", "high", "24h"
-    """
-    # Count BADL challenges
-    badls = answers.get("badls") or []
-    badl_count = len(badls) if isinstance(badls, list) else 0
-
-    # Count IADL challenges
-    iadls = answers.get("iadls") or []
-    iadl_count = len(iadls) if isinstance(iadls, list) else 0
-
-    # Check mobility
-    mobility = (answers.get("mobility") or "").lower()
-
-    # Check falls
-    falls = (answers.get("falls") or "").lower()
-
-    # Check meds complexity
-    meds = (answers.get("meds_complexity") or "").lower()
-
-    # 24h: wheelchair/bedbound OR multiple BADLs + high falls
-    if mobility in ("wheelchair", "bedbound") or (badl_count >= 3 and falls == "multiple"):
-        return "24h"
-
-    # High: multiple BADLs OR significant mobility + falls
-    if badl_count >= 2 or (mobility in ("walker", "cane") and falls in ("once", "multiple")):
-        return "high"
-
-    # Moderate: some IADLs OR single BADL OR meds complexity
-    if iadl_count >= 2 or badl_count >= 1 or meds in ("moderate", "complex"):
-        return "moderate"
-
-    # Low: minimal support needs
-    return "low"
-
 
-def cognitive_gate_behaviors_only(answers: dict[str, Any], flags: list[str]) -> bool:
-    """Check if risky behaviors are present (for disagreement logging).
-    
-    Used to identify cases where MC recommendation might be driven by
-    behaviors rather than pure cognition band.
-    
-    Args:
-        answers: User responses from GCP module
-        flags: Flags set by assessment
-    
-    Returns:
-        True if risky cognitive behaviors present
-    """
-    risky_flags = {"wandering", "elopement", "aggression", "severe_sundowning",
-                   "severe_cognitive_risk", "memory_support"}
-
-    behaviors = set(answers.get("behaviors") or [])
-    flags_set = set(flags or [])
-
-    return bool(behaviors & risky_flags) or bool(flags_set & risky_flags)
+    messages = {
+        "no_diagnosis": f"FAILED - no formal diagnosis (dx_confirm={dx_confirm})",
+        "memory": f"PASSED - {mem} memory changes + diagnosis",
+        "behaviors": "PASSED - risky behaviors + diagnosis",
+        "flags": "PASSED - cognitive risk flags + diagnosis",
+        "no_symptoms": "FAILED - no cognitive symptoms despite diagnosis",
+    }
+    print(f"[COGNITIVE_GATE] {messages[reason]}")
+    return passed
 
 
 def _derive_move_preference(answers: dict[str, Any]) -> int | None:
@@ -756,8 +641,7 @@ def compute_recommendation_category(answers: dict[str, Any], persist_to_state: b
     Returns:
         Tier string (no_care_needed | in_home | assisted_living | memory_care | memory_care_high_acuity)
     """
-    module_data = _load_module_json()
-    total_score, _ = _calculate_score(answers, module_data)
+    total_score, _ = score_answers(answers)
     tier = _determine_tier(total_score)
 
     # Persist to session state for conditional show_if logic
@@ -767,38 +651,92 @@ def compute_recommendation_category(answers: dict[str, Any], persist_to_state: b
     return tier
 
 
+def _section_advice_inputs(section_id: str, answers: dict[str, Any]) -> tuple[Any, list[str]]:
+    """Partial GCPContext and cognitive-gate tier scope for section advice."""
+    from ai.gcp_schemas import CANONICAL_TIERS
+
+    flags = _extract_flags_from_state(answers) or flags_for_answers(answers)
+    allowed_tiers = set(CANONICAL_TIERS)
+    if not cognitive_gate(answers, flags):
+        allowed_tiers -= {"memory_care", "memory_care_high_acuity"}
+    return build_partial_gcp_context(section_id, answers, flags), sorted(allowed_tiers)
+
+
+def prefetch_section_feedback(answers: dict[str, Any], section_name: str) -> bool:
+    """Speculatively start section advice while the user is still on the section.
+
+    Submits the LLM request to a background executor as soon as the section's
+    required answers are present. Unchanged answers reuse the pending future;
+    changed answers cancel it and submit a new one.
+
+    Args:
+        answers: Current user responses (partial)
+        section_name: Section the user is currently answering
+
+    Returns:
+        True if a prefetch is pending for the current answers
+    """
+    try:
+        from ai.llm_client import get_feature_gcp_mode
+        llm_mode = get_feature_gcp_mode()
+
+        if llm_mode not in ("shadow", "assist"):
+            return False
+
+        from .section_prefetch import get_section_prefetcher, required_answers_present
+
+        if not required_answers_present(section_name, answers):
+            return False
+
+        gcp_context, allowed_tiers = _section_advice_inputs(section_name, answers)
+        get_section_prefetcher().prefetch(section_name, gcp_context, llm_mode, allowed_tiers)
+        return True
+
+    except Exception as e:
+        print(f"[GCP_LLM_PREFETCH] Exception (silent) - section={section_name}: {e}")
+        return False
+
+
 def compute_section_feedback(
     answers: dict[str, Any],
     section_name: str,
     context: dict[str, Any] = None,
-) -> None:
+) -> Any:
     """Generate LLM feedback after a section completes (shadow/assist mode only).
-    
-    Builds a partial GCPContext from answers so far and calls the LLM to
-    generate contextual Navi advice and a running tier estimate.
-    
+
+    Builds a partial GCPContext from answers so far and picks up the advice
+    prefetched by prefetch_section_feedback(). If the answers changed since
+    the prefetch (or none was started), the stale request is cancelled and
+    advice is generated synchronously.
+
     Stores result in session state for potential UI use (assist mode).
     In shadow mode, only logs results without affecting UI.
-    
+
     Args:
         answers: Current user responses (partial)
         section_name: Section identifier (about_you, health_safety, daily_living, etc.)
-        context: Context dict from module engine
+        context: Context dict from module engine (unused; the partial context
+            is built from answers)
+
+    Returns:
+        GCPAdvice, or None when off or generation failed
     """
     try:
         from ai.llm_client import get_feature_gcp_mode
         llm_mode = get_feature_gcp_mode()
 
         if llm_mode not in ("shadow", "assist"):
-            return  # Off mode, skip LLM
+            return None  # Off mode, skip LLM
 
-        # Build partial GCP context from answers so far
-        from ai.gcp_navi_engine import generate_section_advice
+        from .section_prefetch import get_section_prefetcher
 
-        gcp_context = _build_gcp_context(answers, context or {})
+        # Build partial GCP context from answers so far
+        gcp_context, allowed_tiers = _section_advice_inputs(section_name, answers)
 
-        # Generate section advice
-        ok, advice = generate_section_advice(gcp_context, section_name, mode=llm_mode)
+        # Prefetched result if answers are unchanged, else synchronous call
+        ok, advice = get_section_prefetcher().collect(
+            section_name, gcp_context, llm_mode, allowed_tiers
+        )
 
         if ok and advice:
             # Store in session state for potential UI use
@@ -812,10 +750,12 @@ def compute_section_feedback(
                 "questions_next": advice.questions_next,
                 "confidence": advice.confidence,
             }
+            return advice
 
     except Exception as e:
         # Silent failure - LLM must not affect flow
         print(f"[GCP_LLM_SECTION] Exception (silent) - section={section_name}: {e}")
+    return None
 
 
 def build_partial_gcp_context(section_id: str, answers: dict[str, Any], flags: list[str]) -> Any:
@@ -948,7 +888,7 @@ def _build_gcp_context(answers: dict[str, Any], context: dict[str, Any]) -> Any:
     # Extract flags
     flag_ids = _extract_flags_from_state(answers)
     if not flag_ids:
-        flag_ids = _extract_flags_from_answers(answers, _load_module_json())
+        flag_ids = flags_for_answers(answers)
 
     return GCPContext(
         age_range=age_range,
@@ -979,103 +919,20 @@ def _build_hours_context(answers: dict[str, Any], flags: list[str]) -> Any:
     Returns:
         HoursContext instance (from ai.hours_schemas)
     """
-    from ai.hours_schemas import HoursContext
-
-    # Canonical BADL mapping to deduplicate UI variations
-    CANON_BADLS = {
-        "Bathing/Showering": "bathing",
-        "Bathing": "bathing",
-        "Showering": "bathing",
-        "Dressing": "dressing",
-        "Toileting": "toileting",
-        "Transferring": "transferring",
-        "Eating": "feeding",
-        "Feeding": "feeding",
-        "Mobility": "mobility",
-        "Personal Hygiene": "hygiene",
-        "Hygiene": "hygiene",
-    }
-
-    # Count BADLs (deduplicated)
-    badls = answers.get("badls", [])
-    if not isinstance(badls, list):
-        badls = []
-
-    # Deduplicate using canonical mapping
-    badls_unique = {CANON_BADLS.get(x, x.lower()) for x in badls}
-    badls_count = len(badls_unique)
-
-    print(f"[GUARD_INPUT] badls_raw={badls} badls_unique={badls_unique} badls_count={badls_count}")
-
-    # NEW: Store actual list for weighted scoring
-    badls_list = [x for x in badls_unique if x is not None]
-
-    # Count IADLs
-    iadls = answers.get("iadls", [])
-    if not isinstance(iadls, list):
-        iadls = []
-    iadls_count = len(iadls)
-
-    print(f"[GUARD_INPUT] iadls_count={iadls_count}")
-    
-    # NEW: Store actual IADL list for weighted scoring
-    iadls_list = [x.lower().replace(" ", "_") for x in iadls]
-
-    # Falls
-    falls = answers.get("falls", "none")
-
-    # Mobility
-    mobility = answers.get("mobility", "independent")
-
-    # Risky behaviors (check flags)
-    risky_behaviors = bool(set(flags) & COGNITIVE_HIGH_RISK)
-    
-    # NEW: Individual behavior flags for multipliers
-    wandering = "wandering" in flags or "elopement" in flags
-    aggression = "aggression" in flags or "violent" in flags
-    sundowning = "sundowning" in flags
-    repetitive_questions = "repetitive_questions" in flags or "repetitive_behaviors" in flags
-
-    # Meds complexity
-    meds_complexity = answers.get("meds_complexity", "none")
-
-    # Primary support
-    primary_support = answers.get("primary_support", "none")
-
-    # Overnight needed (heuristic: help_overall == "full_support" or 24h current)
-    help_overall = answers.get("help_overall", "independent")
-    raw_hours = answers.get("hours_per_day")
-    overnight_needed = (help_overall == "full_support" or raw_hours == "24h")
+    # Session fallback for the user's current hours selection
+    current_hours = None
+    if not answers.get("hours_per_day"):
+        import streamlit as st
+        current_hours = st.session_state.get("gcp_hours_user_choice")
 
-    # Get user's current hours selection (validate it's a valid band)
-    import streamlit as st
-    current = raw_hours or st.session_state.get("gcp_hours_user_choice")
-    valid_bands = {"<1h", "1-3h", "4-8h", "12-16h", "24h"}
-    current_hours = current if current in valid_bands else None
-    
-    # NEW: Get cognitive level from answers (stored as memory_changes in GCP module)
-    memory_changes = answers.get("memory_changes", "none")
-    cognitive_level = memory_changes if memory_changes in ["none", "mild", "moderate", "severe"] else "none"
-    print(f"[HOURS_CONTEXT] cognitive_level={cognitive_level} from memory_changes={memory_changes}")
-
-    return HoursContext(
-        badls_count=badls_count,
-        badls_list=badls_list,
-        iadls_count=iadls_count,
-        iadls_list=iadls_list,
-        falls=falls,
-        mobility=mobility,
-        risky_behaviors=risky_behaviors,
-        wandering=wandering,
-        aggression=aggression,
-        sundowning=sundowning,
-        repetitive_questions=repetitive_questions,
-        meds_complexity=meds_complexity,
-        primary_support=primary_support,
-        overnight_needed=overnight_needed,
-        current_hours=current_hours,
-        cognitive_level=cognitive_level,
+    context = hours_context_from_answers(answers, flags, current_hours)
+    print(
+        f"[GUARD_INPUT] badls_raw={answers.get('badls', [])} badls_unique={set(context.badls_list)} "
+        f"badls_count={context.badls_count}"
     )
+    print(f"[GUARD_INPUT] iadls_count={context.iadls_count}")
+    print(f"[HOURS_CONTEXT] cognitive_level={context.cognitive_level} from memory_changes={answers.get('memory_changes', 'none')}")
+    return context
 
 
 def derive_outcome(
@@ -1084,8 +941,8 @@ def derive_outcome(
     """Compute care recommendation from answers and module.json scoring.
 
     This function:
-    1. Loads module.json to get scoring rules
-    2. Calculates total score from user answers
+    1. Gets the compiled module.json scoring tables (parsed once per file hash)
+    2. Calculates total score from user answers by direct option lookups
     3. Determines tier based on score thresholds
     4. Builds rationale from high-scoring areas
     5. Reads flags already set by module engine
@@ -1112,101 +969,54 @@ def derive_outcome(
     for key in legacy_keys:
         st.session_state.pop(key, None)
 
-    # Load module.json to get scoring rules
-    module_data = _load_module_json()
-
-    # Calculate total score from answers
-    total_score, scoring_details = _calculate_score(answers, module_data)
+    # Compiled scoring tables (module.json is only re-read when it changes)
+    scoring_model = get_scoring_model()
 
-    # Determine tier from score (traditional point-sum approach)
-    tier_from_score = _determine_tier(total_score)
+    # Flags set by the module engine, else derived from selected options
+    flags = _extract_flags_from_state(answers) or flags_for_answers(answers, scoring_model)
 
     # ====================================================================
-    # COGNITIVE GATES + 2-AXIS MAPPING
+    # DETERMINISTIC TIER: score + cognitive gates + 2-axis mapping
     # ====================================================================
-    # Compute allowed tiers based on cognitive assessment
-    # Memory care requires moderate/severe memory changes OR risky behaviors
-    flags = _extract_flags_from_state(answers) or _extract_flags_from_answers(answers, module_data)
-
-    # Determine if cognitive gate passes
-    passes_cognitive_gate = cognitive_gate(answers, flags)
-
-    # Derive cognition band for tier mapping
-    cog_band = cognition_band(answers, flags)
-
-    # Derive supervision bucket (LEGACY DIAGNOSTIC - not used for routing)
-    # This 24h bucket is diagnostic only and should NOT influence tier selection
-    supervision_bucket_legacy = support_band(answers, flags)
-    print(f"[LEGACY_SUP] bucket={supervision_bucket_legacy} cog={cog_band} (diagnostic only, not used for routing)")
-
-    # For tier_map lookup, we use a routing-safe support band (without 24h)
-    # Map 24h → high for routing purposes only
-    sup_band_for_routing = "high" if supervision_bucket_legacy == "24h" else supervision_bucket_legacy
-
-    # Load tier map and compute base recommendation using routing-safe band
-    tier_map = _load_tier_map()
-    tier_from_mapping = None
+    # Pure evaluation (see evaluation.py); logging and session state below
+    gate_on = mc_behavior_gate_enabled()
+    evaluation = evaluate_gcp(
+        answers, flags, behavior_gate=gate_on, scoring_model=scoring_model, tier_map=_load_tier_map()
+    )
+    total_score = evaluation.total_score
+    scoring_details = evaluation.scoring_details
+    allowed_tiers = set(evaluation.allowed_tiers)
+    cog_band = evaluation.cognition_band
+    sup_band_for_routing = evaluation.support_band
 
-    if tier_map and cog_band in tier_map and sup_band_for_routing in tier_map.get(cog_band, {}):
-        tier_from_mapping = tier_map[cog_band][sup_band_for_routing]
+    # Diagnostic gate logging (cognitive_gate prints the gate decision)
+    cognitive_gate(answers, flags)
 
-    # Build allowed tiers set
-    from ai.gcp_schemas import CANONICAL_TIERS
-    allowed_tiers = set(CANONICAL_TIERS)
+    # Supervision bucket is LEGACY DIAGNOSTIC - 24h is routed as high, never used for tier selection
+    print(f"[LEGACY_SUP] bucket={evaluation.support_band_legacy} cog={cog_band} (diagnostic only, not used for routing)")
 
-    if not passes_cognitive_gate:
-        # Block memory care tiers
-        allowed_tiers -= {"memory_care", "memory_care_high_acuity"}
+    if not evaluation.passes_cognitive_gate:
         print(f"[GCP_GUARD] Cognitive gate FAILED (cog={cog_band} sup={sup_band_for_routing}) - MC/MC-HA blocked")
-        
+
         # CRITICAL: Set interim advice flag if tier mapping would have selected MC
         # This ensures the interim banner shows even though MC is blocked
-        if tier_from_mapping in ("memory_care", "memory_care_high_acuity"):
+        if evaluation.mc_blocked_by_gate:
             import streamlit as st
             st.session_state["_show_mc_interim_advice"] = True
-            print(f"[GCP_INTERIM] Would-be tier={tier_from_mapping} blocked by no DX → setting interim AL flag")
+            print(f"[GCP_INTERIM] Would-be tier={evaluation.tier_from_mapping} blocked by no DX → setting interim AL flag")
     else:
         print(f"[GCP_GUARD] Cognitive gate PASSED (cog={cog_band} sup={sup_band_for_routing}) - all tiers allowed")
 
-    # --- Behavior gate for moderate × high without risky behaviors ---
-    gate_on = mc_behavior_gate_enabled()
-    risky = cognitive_gate_behaviors_only(answers, flags)  # True iff any of COGNITIVE_HIGH_RISK present
-    print(f"[GCP_FLAG] MC_BEHAVIOR_GATE={gate_on} cog={cog_band} sup={sup_band_for_routing} risky={risky} allowed_pre={sorted(list(allowed_tiers))}")
-
-    if gate_on and cog_band == "moderate" and sup_band_for_routing == "high" and not risky:
-        # remove MC and MC-HA from allowed before selecting det tier
-        if "memory_care" in allowed_tiers or "memory_care_high_acuity" in allowed_tiers:
-            allowed_tiers.discard("memory_care")
-            allowed_tiers.discard("memory_care_high_acuity")
-            print(f"[GCP_GUARD] moderate×high without risky behaviors → remove {{'memory_care','memory_care_high_acuity'}} from allowed: {sorted(list(allowed_tiers))}")
-    # --- end behavior gate ---
-
-    # Choose final deterministic tier
-    # Priority: mapping (if available and in allowed) > score-based (if in allowed) > fallback to best permitted
-    chosen = None
-
-    if tier_from_mapping and tier_from_mapping in allowed_tiers:
-        chosen = tier_from_mapping
-        print(f"[GCP_GUARD] Using tier_map result: {chosen} (mapping: {cog_band}×{sup_band_for_routing})")
-    elif tier_from_score and tier_from_score in allowed_tiers:
-        chosen = tier_from_score
-        print(f"[GCP_GUARD] Using score-based tier: {chosen} (score={total_score})")
-    else:
-        # Fallback to best permitted tier given the map order: prefer assisted_living, else in_home, else none
-        for cand in ("assisted_living", "in_home", "none", "memory_care", "memory_care_high_acuity"):
-            if cand in allowed_tiers:
-                chosen = cand
-                print(f"[GCP_GUARD] fallback chosen tier={cand} due to constraints; mapping={tier_from_mapping} score={tier_from_score} allowed={sorted(list(allowed_tiers))}")
-                break
-
-    det_tier = chosen or (tier_from_mapping or tier_from_score or "none")
+    print(f"[GCP_FLAG] MC_BEHAVIOR_GATE={gate_on} cog={cog_band} sup={sup_band_for_routing} risky={evaluation.risky_behaviors}")
+    if evaluation.behavior_gate_applied:
+        print(f"[GCP_GUARD] moderate×high without risky behaviors → remove {{'memory_care','memory_care_high_acuity'}} from allowed: {sorted(allowed_tiers)}")
 
-    # Ensure MC/MC-HA is downgraded if not allowed (safety check)
-    if det_tier in {"memory_care", "memory_care_high_acuity"} and "memory_care" not in allowed_tiers:
-        print("[GCP_GUARD] forced downgrade: MC/MC-HA not allowed → det=assisted_living")
-        det_tier = "assisted_living"
-
-    tier = det_tier
+    tier = evaluation.tier
+    print(
+        f"[GCP_GUARD] det tier={tier} source={evaluation.tier_source} "
+        f"mapping={evaluation.tier_from_mapping} ({cog_band}×{sup_band_for_routing}) "
+        f"score={evaluation.tier_from_score} ({total_score}) allowed={sorted(allowed_tiers)}"
+    )
 
     # ====================================================================
     # HOURS/DAY SUGGESTION: Baseline + LLM refinement + Nudge
@@ -1508,7 +1318,7 @@ def derive_outcome(
     # The flags are stored in the answers dict under a "flags" key if present
     flag_ids = _extract_flags_from_state(answers)
     if not flag_ids:
-        flag_ids = _extract_flags_from_answers(answers, module_data)
+        flag_ids = flags_for_answers(answers, scoring_model)
 
     # Add derived flag for move flexibility
     if move_preference_value is not None and move_preference_value >= 3:
@@ -1568,14 +1378,12 @@ def derive_outcome(
 
 
 def _load_module_json() -> dict[str, Any]:
-    """Load module.json from disk.
+    """Parsed module.json, shared with the compiled scoring model.
 
     Returns:
-        Module configuration dict
+        Module configuration dict (do not mutate)
     """
-    path = Path(__file__).with_name("module.json")
-    with path.open() as fh:
-        return json.load(fh)
+    return load_module_spec()
 
 
 def _calculate_score(
@@ -1583,6 +1391,9 @@ def _calculate_score(
 ) -> tuple[float, dict[str, Any]]:
     """Calculate total score from user answers using module.json scoring.
 
+    Linear walk over an arbitrary module spec. derive_outcome uses the
+    compiled equivalent, scoring_tables.score_answers.
+
     Args:
         answers: User responses
         module_data: Loaded module.json
@@ -1684,36 +1495,6 @@ def _has_answer(value: Any) -> bool:
     return True
 
 
-def _determine_tier(total_score: float) -> str:
-    """Determine care tier from total score.
-
-    Args:
-        total_score: Total points from all questions
-
-    Returns:
-        Tier name (no_care_needed | in_home | assisted_living | memory_care | memory_care_high_acuity)
-
-    Raises:
-        ValueError: If determined tier is not in VALID_TIERS
-    """
-    tier = None
-
-    for tier_name, (min_score, max_score) in TIER_THRESHOLDS.items():
-        if min_score <= total_score <= max_score:
-            tier = tier_name
-            break
-
-    # Default to highest tier if score exceeds all thresholds
-    if tier is None:
-        tier = "memory_care_high_acuity"
-
-    # CRITICAL VALIDATION: Ensure only allowed tiers can be returned
-    if tier not in VALID_TIERS:
-        raise ValueError(f"Invalid tier '{tier}' - must be one of {VALID_TIERS}")
-
-    return tier
-
-
 def _build_tier_rankings(total_score: float, winning_tier: str) -> list[tuple[str, float]]:
     """Build tier rankings showing all tiers with their distance from user's score.
 
@@ -1758,27 +1539,7 @@ def _calculate_confidence(
     Returns:
         Confidence score between 0 and 1
     """
-    # Base confidence from completeness
-    required_answered = scoring_details.get("required_answered", 0)
-    required_total = scoring_details.get("required_total", 0)
-    completeness = required_answered / required_total if required_total > 0 else 1.0
-
-    # Adjust for score clarity (distance from boundaries)
-    tier = _determine_tier(total_score)
-    min_score, max_score = TIER_THRESHOLDS[tier]
-
-    # Distance from nearest boundary
-    distance_from_min = total_score - min_score
-    distance_from_max = max_score - total_score
-    distance_from_boundary = min(distance_from_min, distance_from_max)
-
-    # Normalize distance (3+ points from boundary = full confidence)
-    boundary_confidence = min(distance_from_boundary / 3.0, 1.0)
-
-    # Combined confidence (weighted average)
-    confidence = (completeness * 0.6) + (boundary_confidence * 0.4)
-
-    return max(0.5, confidence)  # Minimum 50% confidence
+    return calculate_confidence(scoring_details, total_score)
 
 
 def _build_rationale(scoring_details: dict[str, Any], tier: str, total_score: float) -> list[str]:
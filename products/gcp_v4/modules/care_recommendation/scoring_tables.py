@@ -0,0 +1,284 @@
+"""
+Compiled scoring tables for the GCP v4 care_recommendation module.
+
+module.json is parsed once per process into per-question value → option
+lookup tables, so scoring an answer set is a handful of dict lookups instead
+of a walk over every section, question and option. The compiled model is
+keyed by the file's content hash and rebuilt when module.json changes on disk.
+
+Both the scoring path (logic.derive_outcome) and the module engine config
+(config.get_config) read module.json through get_scoring_model().
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+MODULE_JSON = Path(__file__).with_name("module.json")
+
+# Section types whose questions contribute to the score
+SCORED_SECTION_TYPES = ("questions", None)
+
+
+@dataclass(frozen=True)
+class CompiledOption:
+    """One answer option: score, display label and flags raised."""
+
+    value: Any
+    score: float
+    label: str | None
+    flags: tuple[str, ...]
+    position: int  # Index within the question's options (detail ordering)
+
+
+@dataclass(frozen=True)
+class CompiledQuestion:
+    """A scored question with its value → options lookup table.
+
+    Values map to every option carrying them (module.json order); a
+    single-select answer takes the first, a multi-select answer takes all.
+    """
+
+    id: str
+    section_id: str
+    label: str
+    required: bool
+    position: int  # Global question order across scored sections
+    options: dict[Any, tuple[CompiledOption, ...]] = field(default_factory=dict)
+
+    def match(self, answer: Any) -> list[CompiledOption]:
+        """Options selected by an answer, in module.json option order.
+
+        Single-select answers match at most one option; list answers match
+        every option whose value appears in the list (once each).
+        """
+        if isinstance(answer, list):
+            matched = {}
+            for value in answer:
+                try:
+                    options = self.options.get(value, ())
+                except TypeError:  # unhashable answer value
+                    continue
+                for option in options:
+                    matched[option.position] = option
+            return [matched[pos] for pos in sorted(matched)]
+        try:
+            options = self.options.get(answer)
+        except TypeError:
+            return []
+        return [options[0]] if options else []
+
+
+@dataclass(frozen=True)
+class CompiledScoringModel:
+    """module.json compiled for direct-lookup scoring."""
+
+    file_hash: str
+    spec: dict[str, Any]  # Raw parsed module.json (shared; do not mutate)
+    questions: dict[str, tuple[CompiledQuestion, ...]]
+    section_ids: tuple[str, ...]  # Scored sections in module.json order
+    question_ids: tuple[str, ...]
+    required_total: int
+
+
+def _compile_question(question: dict[str, Any], section_id: str, position: int) -> CompiledQuestion:
+    options: dict[Any, list[CompiledOption]] = {}
+    for index, option in enumerate(question.get("options", [])):
+        value = option.get("value")
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        options.setdefault(value, []).append(
+            CompiledOption(
+                value=value,
+                score=option.get("score", 0),
+                label=option.get("label"),
+                flags=tuple(option.get("flags", [])),
+                position=index,
+            )
+        )
+    return CompiledQuestion(
+        id=question["id"],
+        section_id=section_id,
+        label=question.get("label", question["id"]),
+        required=bool(question.get("required", False)),
+        position=position,
+        options={value: tuple(opts) for value, opts in options.items()},
+    )
+
+
+def compile_spec(spec: dict[str, Any], file_hash: str = "") -> CompiledScoringModel:
+    """Compile a parsed module.json into lookup tables."""
+    questions: dict[str, list[CompiledQuestion]] = {}
+    section_ids = []
+    question_ids = []
+    required_total = 0
+    position = 0
+
+    for section in spec.get("sections", []):
+        if section.get("type", "questions") not in SCORED_SECTION_TYPES:
+            continue
+        section_ids.append(section["id"])
+        for question in section.get("questions", []):
+            compiled = _compile_question(question, section["id"], position)
+            position += 1
+            questions.setdefault(compiled.id, []).append(compiled)
+            question_ids.append(compiled.id)
+            required_total += compiled.required
+
+    return CompiledScoringModel(
+        file_hash=file_hash,
+        spec=spec,
+        questions={qid: tuple(qs) for qid, qs in questions.items()},
+        section_ids=tuple(section_ids),
+        question_ids=tuple(question_ids),
+        required_total=required_total,
+    )
+
+
+# ====================================================================
+# PROCESS-WIDE MODEL
+# ====================================================================
+
+_LOCK = threading.Lock()
+_MODEL: CompiledScoringModel | None = None
+_STAMP: tuple[int, int] | None = None  # (mtime_ns, size) of the file _MODEL was built from
+
+
+def get_scoring_model(path: Path | None = None) -> CompiledScoringModel:
+    """Compiled model for module.json, rebuilt only when the file changes.
+
+    A stat() per call detects edits; the file is re-read and re-hashed only
+    when its mtime/size changes, and recompiled only if the hash differs.
+    """
+    global _MODEL, _STAMP
+
+    path = Path(path) if path else MODULE_JSON
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    model = _MODEL
+    if model is not None and stamp == _STAMP and path == MODULE_JSON:
+        return model
+
+    with _LOCK:
+        if _MODEL is not None and stamp == _STAMP and path == MODULE_JSON:
+            return _MODEL
+        raw = path.read_bytes()
+        file_hash = hashlib.sha256(raw).hexdigest()
+        if _MODEL is not None and _MODEL.file_hash == file_hash:
+            compiled = _MODEL
+        else:
+            compiled = compile_spec(json.loads(raw.decode("utf-8")), file_hash)
+            print(f"[GCP_SCORING] compiled module.json sha={file_hash[:12]} questions={len(compiled.question_ids)}")
+        if path == MODULE_JSON:
+            _MODEL, _STAMP = compiled, stamp
+        return compiled
+
+
+def load_module_spec() -> dict[str, Any]:
+    """Parsed module.json, shared with the compiled scoring model."""
+    return get_scoring_model().spec
+
+
+# ====================================================================
+# SCORING
+# ====================================================================
+
+
+def has_answer(value: Any) -> bool:
+    """Whether an answer value counts as answered (non-blank)."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value.strip() != ""
+    if isinstance(value, (list, tuple, set)):
+        return any(str(v).strip() != "" for v in value)
+    return True
+
+
+def score_answers(
+    answers: dict[str, Any], model: CompiledScoringModel | None = None
+) -> tuple[float, dict[str, Any]]:
+    """Total score and breakdown, visiting only the answered questions.
+
+    Output matches the section-by-section walk in logic._calculate_score:
+    by_question lists every scored question (0.0 if unanswered), by_section
+    lists every scored section in module.json order, and details keep
+    question/option order.
+    """
+    model = model or get_scoring_model()
+
+    by_question = dict.fromkeys(model.question_ids, 0.0)
+    section_scores = dict.fromkeys(model.section_ids, 0.0)
+    section_details: dict[str, list[tuple[int, int, dict[str, Any]]]] = {}
+    required_answered = 0
+    optional_answered = 0
+
+    for question_id, answer in answers.items():
+        compiled = model.questions.get(question_id)
+        if compiled is None or not has_answer(answer):
+            continue
+        for question in compiled:
+            if question.required:
+                required_answered += 1
+            else:
+                optional_answered += 1
+
+            options = question.match(answer)
+            question_score = 0.0
+            for option in options:
+                question_score += option.score
+                section_details.setdefault(question.section_id, []).append(
+                    (
+                        question.position,
+                        option.position,
+                        {"question": question.label, "answer": option.label, "score": option.score},
+                    )
+                )
+            by_question[question_id] = question_score
+            section_scores[question.section_id] += question_score
+
+    by_section = {}
+    for section_id, score in section_scores.items():
+        entries = section_details.get(section_id, [])
+        entries.sort(key=lambda e: (e[0], e[1]))
+        by_section[section_id] = {"score": score, "details": [e[2] for e in entries]}
+
+    scoring_details = {
+        "by_section": by_section,
+        "by_question": by_question,
+        "required_answered": required_answered,
+        "required_total": model.required_total,
+        "optional_answered": optional_answered,
+        "answer_count": required_answered,
+        "total_questions": model.required_total,
+    }
+    return sum(section_scores.values()), scoring_details
+
+
+def flags_for_answers(answers: dict[str, Any], model: CompiledScoringModel | None = None) -> list[str]:
+    """Flag IDs raised by the selected options of answered questions."""
+    model = model or get_scoring_model()
+    flag_ids: set[str] = set()
+    for question_id, answer in answers.items():
+        if answer is None:
+            continue
+        for question in model.questions.get(question_id, ()):
+            for option in question.match(answer):
+                flag_ids.update(option.flags)
+    return list(flag_ids)
+
+
+__all__ = [
+    "CompiledScoringModel",
+    "compile_spec",
+    "flags_for_answers",
+    "get_scoring_model",
+    "has_answer",
+    "load_module_spec",
+    "score_answers",
+]
@@ -0,0 +1,244 @@
+"""
+Speculative per-section LLM advice for GCP v4.
+
+Section advice used to be generated synchronously when a section finished,
+so the user waited on the LLM at every section transition. Instead, as soon
+as a section's required answers are present, the advice request is submitted
+to a background executor and its future is stored under a hash of the
+answers that feed the prompt. When the user advances, the finished (or
+nearly finished) result is picked up; if the answers changed in the
+meantime the stale future is cancelled and a fresh one submitted.
+
+Flow:
+- prefetch(): called on every rerun of a question step; no-op until the
+  section's required (visible) questions are answered, and a no-op while
+  the answers hash is unchanged
+- collect(): called once the section is completed; returns the prefetched
+  advice when the hash still matches, otherwise generates synchronously
+
+Futures whose work already started cannot be interrupted; they finish in the
+background and their response still lands in the prompt cache.
+
+Environment:
+- GCP_SECTION_PREFETCH_WORKERS: executor size (default 4)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from functools import cache
+from typing import Any
+
+from ai.llm_cache import canonical_json
+
+# ====================================================================
+# REQUIRED ANSWERS
+# ====================================================================
+
+
+def _section_questions() -> dict[str, list[dict[str, Any]]]:
+    """Questions per section id from the shared module.json spec."""
+    from .scoring_tables import load_module_spec
+
+    return {s["id"]: s.get("questions", []) for s in load_module_spec().get("sections", [])}
+
+
+def _is_visible(question: dict[str, Any], answers: dict[str, Any]) -> bool:
+    """Mirror of the module engine's visible_if evaluation."""
+    cond = question.get("visible_if")
+    if not cond:
+        return True
+    key = cond.get("key")
+    if key is None or key not in answers:
+        return False
+    if "eq" in cond:
+        return answers.get(key) == cond["eq"]
+    if "in" in cond:
+        values = cond.get("in")
+        return answers.get(key) in values if isinstance(values, (list, tuple, set)) else False
+    return True
+
+
+def required_answers_present(section_id: str, answers: dict[str, Any]) -> bool:
+    """True when every required, visible question of a section is answered.
+
+    Args:
+        section_id: Section identifier from module.json
+        answers: Current module answers
+
+    Returns:
+        False for unknown sections or sections without questions
+    """
+    questions = _section_questions().get(section_id)
+    if not questions:
+        return False
+    for q in questions:
+        if not q.get("required") or not _is_visible(q, answers):
+            continue
+        value = answers.get(q["id"])
+        if value is None or value == "" or value == []:
+            return False
+    return True
+
+
+def answers_hash(section_id: str, context: Any, allowed_tiers: list[str] | None = None) -> str:
+    """Hash of everything that feeds the section advice prompt."""
+    material = canonical_json({
+        "section": section_id,
+        "context": context,
+        "allowed_tiers": sorted(allowed_tiers or []),
+    })
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+
+# ====================================================================
+# PREFETCHER
+# ====================================================================
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    workers = int(os.getenv("GCP_SECTION_PREFETCH_WORKERS", "4"))
+    return ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="gcp-prefetch")
+
+
+def _generate(context: Any, section_id: str, mode: str, allowed_tiers: list[str] | None):
+    # Resolved at call time so the engine can be swapped (tests, feature flags)
+    from ai.gcp_navi_engine import generate_section_advice
+
+    return generate_section_advice(context, section=section_id, mode=mode, allowed_tiers=allowed_tiers)
+
+
+class SectionAdvicePrefetcher:
+    """Per-session registry of in-flight section advice futures.
+
+    One entry per section: (answers hash, future). A new hash for the same
+    section cancels the previous future.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor | None = None):
+        self._executor = executor
+        self._entries: dict[str, tuple[str, Future]] = {}
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.cancelled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _submit(self, section_id, context, mode, allowed_tiers) -> Future:
+        executor = self._executor or _executor()
+        self.submitted += 1
+        return executor.submit(_generate, context, section_id, mode, allowed_tiers)
+
+    def prefetch(
+        self,
+        section_id: str,
+        context: Any,
+        mode: str,
+        allowed_tiers: list[str] | None = None,
+    ) -> str:
+        """Start (or keep) background generation for the current answers.
+
+        Args:
+            section_id: Section identifier
+            context: Partial GCPContext for the section
+            mode: LLM mode ("shadow" | "assist")
+            allowed_tiers: Optional cognitive-gate tier restriction
+
+        Returns:
+            Answers hash the future is stored under
+        """
+        key = answers_hash(section_id, context, allowed_tiers)
+        with self._lock:
+            entry = self._entries.get(section_id)
+            if entry and entry[0] == key and not entry[1].cancelled():
+                return key
+            if entry:
+                self._cancel(section_id, entry)
+            self._entries[section_id] = (key, self._submit(section_id, context, mode, allowed_tiers))
+        print(f"[GCP_LLM_PREFETCH] submitted section={section_id} hash={key}")
+        return key
+
+    def collect(
+        self,
+        section_id: str,
+        context: Any,
+        mode: str,
+        allowed_tiers: list[str] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[bool, Any]:
+        """Return section advice, using the prefetched result when still valid.
+
+        Args:
+            section_id: Section identifier
+            context: Partial GCPContext for the section as completed
+            mode: LLM mode
+            allowed_tiers: Optional cognitive-gate tier restriction
+            timeout: Max seconds to wait on a running prefetch (None = wait)
+
+        Returns:
+            Tuple of (success, GCPAdvice | None), as generate_section_advice
+        """
+        key = answers_hash(section_id, context, allowed_tiers)
+        with self._lock:
+            entry = self._entries.pop(section_id, None)
+        if entry and entry[0] == key and not entry[1].cancelled():
+            try:
+                result = entry[1].result(timeout=timeout)
+                self.hits += 1
+                print(f"[GCP_LLM_PREFETCH] hit section={section_id} hash={key}")
+                return result
+            except FutureTimeout:
+                print(f"[GCP_LLM_PREFETCH] timeout section={section_id} hash={key}")
+                return (False, None)
+            except Exception as e:
+                print(f"[GCP_LLM_PREFETCH] prefetch failed section={section_id}: {e}")
+        elif entry:
+            self._cancel(section_id, entry)
+
+        self.misses += 1
+        return _generate(context, section_id, mode, allowed_tiers)
+
+    def _cancel(self, section_id: str, entry: tuple[str, Future]) -> None:
+        if entry[1].cancel():
+            self.cancelled += 1
+            print(f"[GCP_LLM_PREFETCH] cancelled stale section={section_id} hash={entry[0]}")
+
+    def cancel_all(self) -> None:
+        """Cancel every pending future (restart, leaving the module)."""
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        for section_id, entry in entries.items():
+            self._cancel(section_id, entry)
+
+    def pending(self) -> dict[str, str]:
+        """Section id -> answers hash of futures not yet collected."""
+        with self._lock:
+            return {sid: key for sid, (key, _) in self._entries.items()}
+
+
+def get_section_prefetcher() -> SectionAdvicePrefetcher:
+    """Prefetcher for the current Streamlit session.
+
+    Stored in session_state so futures never leak between sessions; falls
+    back to a process-wide instance outside a Streamlit run.
+    """
+    try:
+        import streamlit as st
+
+        prefetcher = st.session_state.get("_gcp_llm_prefetcher")
+        if prefetcher is None:
+            prefetcher = SectionAdvicePrefetcher()
+            st.session_state["_gcp_llm_prefetcher"] = prefetcher
+        return prefetcher
+    except Exception:
+        return _process_prefetcher()
+
+
+@cache
+def _process_prefetcher() -> SectionAdvicePrefetcher:
+    return SectionAdvicePrefetcher()
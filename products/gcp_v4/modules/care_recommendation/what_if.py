@@ -0,0 +1,350 @@
+"""
+What-if sensitivity explorer for the GCP recommendation.
+
+Given a completed answer set, evaluates every single-answer change (and
+optionally pairs of changes) through the deterministic tier, cognitive gate
+and weighted hours logic, and returns the minimal changes that flip the
+tier or the hours band.
+
+Each candidate is evaluated incrementally: the score moves by the compiled
+option-score delta of the changed question and flags by the changed
+question's option flags, so only the gate/band/tier decision runs per
+candidate. Hours are evaluated for all hours-relevant candidates in one
+columnar batch (ai.hours_batch).
+
+Flags are derived from the selected options (as flags_for_answers does), not
+from the module state's flags map, so a changed answer changes its flags.
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from .evaluation import decide_tier, hours_fields_from_answers, load_tier_map
+from .scoring_tables import CompiledScoringModel, get_scoring_model, has_answer
+
+# Answers read by hours_fields_from_answers()
+HOURS_QUESTIONS = {
+    "badls",
+    "iadls",
+    "help_overall",
+    "hours_per_day",
+    "memory_changes",
+    "falls",
+    "mobility",
+    "meds_complexity",
+    "primary_support",
+}
+
+# Single edits kept as pair candidates (ranked by how much they move the case)
+DEFAULT_PAIR_POOL = 20
+
+
+@dataclass(frozen=True)
+class AnswerEdit:
+    """One answer change."""
+
+    question_id: str
+    question_label: str
+    before: Any
+    after: Any
+    description: str  # e.g. "Walker → Wheelchair" or "Add: Wandering"
+
+
+@dataclass(frozen=True)
+class WhatIfOutcome:
+    """Result of applying one or more edits."""
+
+    edits: tuple[AnswerEdit, ...]
+    tier: str
+    hours_band: str | None
+    total_score: float
+    score_delta: float
+    flips_tier: bool
+    flips_hours: bool
+
+
+@dataclass
+class WhatIfReport:
+    """Minimal answer changes that flip the tier or the hours band."""
+
+    baseline_tier: str
+    baseline_hours_band: str | None
+    baseline_score: float
+    outcomes: list[WhatIfOutcome] = field(default_factory=list)
+    evaluated: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def tier_flips(self) -> list[WhatIfOutcome]:
+        return [o for o in self.outcomes if o.flips_tier]
+
+    @property
+    def hours_flips(self) -> list[WhatIfOutcome]:
+        return [o for o in self.outcomes if o.flips_hours]
+
+
+@dataclass
+class _Candidate:
+    edit: AnswerEdit
+    position: int
+    score_delta: float
+    flag_delta: Counter
+    decision: dict[str, Any] | None = None
+    hours_band: str | None = None
+
+
+def _is_visible(question: dict[str, Any], answers: dict[str, Any]) -> bool:
+    condition = question.get("visible_if")
+    if not condition:
+        return True
+    value = answers.get(condition.get("key"))
+    if "eq" in condition:
+        return value == condition["eq"]
+    if "in" in condition:
+        return value in condition["in"]
+    return True
+
+
+def _question_effect(model: CompiledScoringModel, question_id: str, answer: Any) -> tuple[float, Counter]:
+    """Score contribution and flag counts of one answer (as score_answers/flags_for_answers)."""
+    score = 0.0
+    flags: Counter = Counter()
+    if answer is None:
+        return score, flags
+    scored = has_answer(answer)
+    for question in model.questions.get(question_id, ()):
+        for option in question.match(answer):
+            if scored:
+                score += option.score
+            flags.update(option.flags)
+    return score, flags
+
+
+def _option_label(spec_question: dict[str, Any], value: Any) -> str:
+    for option in spec_question.get("options", []):
+        if option.get("value") == value:
+            return option.get("label") or str(value)
+    return str(value)
+
+
+def _candidate_edits(model: CompiledScoringModel, answers: dict[str, Any]) -> list[tuple[AnswerEdit, int]]:
+    edits = []
+    position = 0
+    seen = set()
+    for section in model.spec.get("sections", []):
+        if section["id"] not in model.section_ids:
+            continue
+        for question in section.get("questions", []):
+            position += 1
+            qid = question["id"]
+            if qid in seen or not _is_visible(question, answers):
+                continue
+            seen.add(qid)
+            label = question.get("label", qid)
+            current = answers.get(qid)
+            values = list(dict.fromkeys(o.get("value") for o in question.get("options", [])))
+
+            if question.get("select") == "multi":
+                selected = list(current) if isinstance(current, list) else []
+                for value in values:
+                    if value in selected:
+                        after = [v for v in selected if v != value]
+                        description = f"Remove: {_option_label(question, value)}"
+                    else:
+                        after = selected + [value]
+                        description = f"Add: {_option_label(question, value)}"
+                    edits.append((AnswerEdit(qid, label, current, after, description), position))
+            else:
+                before_label = _option_label(question, current) if current is not None else "(unanswered)"
+                for value in values:
+                    if value == current:
+                        continue
+                    description = f"{before_label} → {_option_label(question, value)}"
+                    edits.append((AnswerEdit(qid, label, current, value, description), position))
+    return edits
+
+
+def _apply(answers: dict[str, Any], edits: tuple[AnswerEdit, ...]) -> dict[str, Any]:
+    changed = dict(answers)
+    for edit in edits:
+        changed[edit.question_id] = edit.after
+    return changed
+
+
+def _flags_with(base: Counter, *deltas: Counter) -> list[str]:
+    counts = base.copy()
+    for delta in deltas:
+        counts.update(delta)
+    return [flag for flag, count in counts.items() if count > 0]
+
+
+def _hours_bands(rows: list[dict[str, Any]]) -> list[str]:
+    from ai.hours_batch import weighted_hours_batch
+
+    return weighted_hours_batch(rows).bands if rows else []
+
+
+def explore_what_if(
+    answers: dict[str, Any],
+    *,
+    pairs: bool = False,
+    pair_pool: int = DEFAULT_PAIR_POOL,
+    behavior_gate: bool = False,
+    include_hours: bool = True,
+    scoring_model: CompiledScoringModel | None = None,
+    tier_map: dict | None = None,
+) -> WhatIfReport:
+    """Minimal answer changes that flip the tier or the hours band.
+
+    Args:
+        answers: Completed GCP answers
+        pairs: Also try pairs of changes to different questions. Only the
+            pair_pool edits that move the case most (band, gate or score
+            changes) are combined, and a pair is reported only if neither
+            edit flips the same outcome on its own.
+        pair_pool: Number of single edits considered for pairs
+        behavior_gate: FEATURE_GCP_MC_BEHAVIOR_GATE
+        include_hours: Evaluate the weighted hours band as well
+        scoring_model: Compiled module.json (default: process-wide model)
+        tier_map: cognition×support → tier map (default: tier_map.json)
+
+    Returns:
+        WhatIfReport with single-edit flips first, then pairs
+    """
+    start = time.perf_counter()
+    model = scoring_model or get_scoring_model()
+    tier_map = load_tier_map() if tier_map is None else tier_map
+
+    base_score = 0.0
+    base_flags: Counter = Counter()
+    effects = {}
+    for qid, answer in answers.items():
+        if qid in model.questions:
+            effects[qid] = _question_effect(model, qid, answer)
+            base_score += effects[qid][0]
+            base_flags.update(effects[qid][1])
+
+    base_flag_list = _flags_with(base_flags)
+    baseline = decide_tier(answers, base_flag_list, base_score, behavior_gate=behavior_gate, tier_map=tier_map)
+
+    candidates = []
+    for edit, position in _candidate_edits(model, answers):
+        old_score, old_flags = effects.get(edit.question_id, (0.0, Counter()))
+        new_score, new_flags = _question_effect(model, edit.question_id, edit.after)
+        flag_delta = Counter(new_flags)
+        flag_delta.subtract(old_flags)
+        candidates.append(_Candidate(edit, position, new_score - old_score, flag_delta))
+
+    def evaluate(group: tuple[_Candidate, ...]) -> tuple[dict[str, Any], dict[str, Any], list[str], float]:
+        changed = _apply(answers, tuple(c.edit for c in group))
+        flags = _flags_with(base_flags, *(c.flag_delta for c in group))
+        score = base_score + sum(c.score_delta for c in group)
+        decision = decide_tier(changed, flags, score, behavior_gate=behavior_gate, tier_map=tier_map)
+        return changed, decision, flags, score
+
+    def touches_hours(group: tuple[_Candidate, ...]) -> bool:
+        return any(c.edit.question_id in HOURS_QUESTIONS or +c.flag_delta or -c.flag_delta for c in group)
+
+    # Singles
+    hours_rows, hours_targets = [], []
+    if include_hours:
+        hours_rows.append(hours_fields_from_answers(answers, base_flag_list))
+    scores = {}
+    for candidate in candidates:
+        changed, candidate.decision, flags, scores[id(candidate)] = evaluate((candidate,))
+        if include_hours and touches_hours((candidate,)):
+            hours_rows.append(hours_fields_from_answers(changed, flags))
+            hours_targets.append(candidate)
+
+    baseline_hours = None
+    if include_hours:
+        bands = _hours_bands(hours_rows)
+        baseline_hours = bands[0]
+        for candidate in candidates:
+            candidate.hours_band = baseline_hours
+        for candidate, band in zip(hours_targets, bands[1:], strict=True):
+            candidate.hours_band = band
+
+    report = WhatIfReport(baseline["tier"], baseline_hours, base_score, evaluated=len(candidates))
+
+    def outcome(group, decision, hours_band, score) -> WhatIfOutcome:
+        return WhatIfOutcome(
+            edits=tuple(c.edit for c in group),
+            tier=decision["tier"],
+            hours_band=hours_band,
+            total_score=score,
+            score_delta=score - base_score,
+            flips_tier=decision["tier"] != baseline["tier"],
+            flips_hours=include_hours and hours_band != baseline_hours,
+        )
+
+    for candidate in sorted(candidates, key=lambda c: c.position):
+        result = outcome((candidate,), candidate.decision, candidate.hours_band, scores[id(candidate)])
+        if result.flips_tier or result.flips_hours:
+            report.outcomes.append(result)
+
+    if pairs:
+        report.evaluated += _explore_pairs(
+            report, candidates, baseline, evaluate, touches_hours, outcome, pair_pool, include_hours
+        )
+
+    report.elapsed_ms = (time.perf_counter() - start) * 1000
+    return report
+
+
+def _movement(candidate: _Candidate, baseline: dict[str, Any]) -> tuple:
+    decision = candidate.decision
+    moved = sum(
+        decision[key] != baseline[key]
+        for key in ("cognition_band", "support_band", "passes_cognitive_gate", "tier_from_score", "tier_from_mapping")
+    )
+    return (moved, abs(candidate.score_delta))
+
+
+def _explore_pairs(report, candidates, baseline, evaluate, touches_hours, outcome, pair_pool, include_hours) -> int:
+    flips_tier = {id(c) for c in candidates if c.decision["tier"] != baseline["tier"]}
+    flips_hours = {id(c) for c in candidates if include_hours and c.hours_band != report.baseline_hours_band}
+    # Edits that flip both outcomes alone cannot be part of a minimal pair
+    pool = [c for c in candidates if not (id(c) in flips_tier and id(c) in flips_hours)]
+    pool.sort(key=lambda c: _movement(c, baseline), reverse=True)
+    pool = sorted(pool[:pair_pool], key=lambda c: c.position)
+
+    evaluated = []
+    hours_rows, hours_index = [], []
+    for i, first in enumerate(pool):
+        for second in pool[i + 1:]:
+            if first.edit.question_id == second.edit.question_id:
+                continue
+            group = (first, second)
+            changed, decision, flags, score = evaluate(group)
+            evaluated.append((group, decision, score))
+            if include_hours and touches_hours(group):
+                hours_index.append(len(evaluated) - 1)
+                hours_rows.append(hours_fields_from_answers(changed, flags))
+
+    hours_by_pair = dict(zip(hours_index, _hours_bands(hours_rows), strict=True))
+    for index, (group, decision, score) in enumerate(evaluated):
+        hours_band = hours_by_pair.get(index, report.baseline_hours_band) if include_hours else None
+        result = outcome(group, decision, hours_band, score)
+        ids = {id(c) for c in group}
+        # Minimal only: neither edit flips the same outcome on its own
+        new_tier = result.flips_tier and not (ids & flips_tier)
+        new_hours = result.flips_hours and not (ids & flips_hours)
+        if new_tier or new_hours:
+            report.outcomes.append(
+                WhatIfOutcome(
+                    edits=result.edits,
+                    tier=result.tier,
+                    hours_band=result.hours_band,
+                    total_score=result.total_score,
+                    score_delta=result.score_delta,
+                    flips_tier=new_tier,
+                    flips_hours=new_hours,
+                )
+            )
+    return len(evaluated)
+
+
+__all__ = ["AnswerEdit", "WhatIfOutcome", "WhatIfReport", "explore_what_if"]
@@ -233,8 +233,10 @@ def render():
         # PER-SECTION LLM SHADOW FEEDBACK
         # Track section completion and trigger LLM feedback for each section
         current_step_index = module_state.get("_step", 0)
-        if current_step_index > 0:  # Past the intro
-            _trigger_section_llm_feedback(config, module_state, current_step_index)
+        # The engine keeps the live step index under "<state_key>._step"
+        llm_step_index = int(st.session_state.get(f"{state_key}._step", current_step_index) or 0)
+        if llm_step_index > 0:  # Past the intro
+            _trigger_section_llm_feedback(config, module_state, llm_step_index)
 
         # MID-FLOW COMPUTATION: After Daily Living section, compute recommendation
         # This enables conditional rendering of Move Preferences section
@@ -767,7 +769,14 @@ def _render_hours_suggestion_if_needed(config: ModuleConfig, current_step_index:
 def _trigger_section_llm_feedback(config: ModuleConfig, module_state: dict, current_step_index: int) -> None:
     """Trigger per-section LLM shadow feedback.
     
-    Calls LLM after each section completes to generate partial recommendation.
+    Two phases per section, so the user never waits on the LLM at a section
+    transition:
+    - While a section is on screen, its advice is prefetched in the
+      background once the required answers are present (re-submitted if the
+      answers change).
+    - Once the user advances, the prefetched advice for the section just
+      completed is picked up (or generated if the answers changed).
+    
     Only runs in shadow or assist mode. Never blocks navigation on errors.
     
     Args:
@@ -788,8 +797,21 @@ def _trigger_section_llm_feedback(config: ModuleConfig, module_state: dict, curr
         if current_step_index < 0 or current_step_index >= len(config.steps):
             return
 
-        current_step = config.steps[current_step_index]
-        section_id = current_step.id
+        from products.gcp_v4.modules.care_recommendation.logic import (
+            compute_section_feedback,
+            prefetch_section_feedback,
+        )
+
+        # Speculative: start advice for the section being answered
+        current_section_id = config.steps[current_step_index].id
+        if current_section_id not in ("intro", "results"):
+            prefetch_section_feedback(module_state, current_section_id)
+
+        # Completed: pick up advice for the section the user just left
+        completed_index = current_step_index - 1
+        if completed_index < 0:
+            return
+        section_id = config.steps[completed_index].id
 
         # Skip intro and results
         if section_id in ("intro", "results"):
@@ -800,7 +822,7 @@ def _trigger_section_llm_feedback(config: ModuleConfig, module_state: dict, curr
         processed = st.session_state.setdefault(processed_key, set())
 
         # Build a unique key for this section at this step
-        section_key = f"{section_id}_{current_step_index}"
+        section_key = f"{section_id}_{completed_index}"
 
         if section_key in processed:
             return  # Already processed this section
@@ -808,44 +830,16 @@ def _trigger_section_llm_feedback(config: ModuleConfig, module_state: dict, curr
         # Mark as processed
         processed.add(section_key)
 
-        # Build partial context
-        from ai.gcp_schemas import CANONICAL_TIERS
-        from products.gcp_v4.modules.care_recommendation.flags import build_flags
-        from products.gcp_v4.modules.care_recommendation.logic import (
-            build_partial_gcp_context,
-            cognitive_gate,
-        )
-
-        answers = module_state
-        flags = build_flags(answers)
-
-        partial_context = build_partial_gcp_context(section_id, answers, flags)
-
-        # Compute allowed tiers based on cognitive gate (even for partial context)
-        passes_gate = cognitive_gate(answers, flags)
-        allowed_tiers = set(CANONICAL_TIERS)
-
-        if not passes_gate:
-            allowed_tiers -= {"memory_care", "memory_care_high_acuity"}
-
-        # Generate LLM advice with allowed_tiers scoping
-        from ai.gcp_navi_engine import generate_section_advice
-
-        ok, advice = generate_section_advice(
-            partial_context,
-            section=section_id,
-            mode=llm_mode,
-            allowed_tiers=sorted(list(allowed_tiers))
-        )
+        advice = compute_section_feedback(module_state, section_id)
 
         # Log result
-        if ok and advice:
+        if advice:
             print(
-                f"[GCP_LLM_SECTION] section={section_id} ok={ok} tier_llm={advice.tier} "
+                f"[GCP_LLM_SECTION] section={section_id} ok=True tier_llm={advice.tier} "
                 f"msgs={len(advice.navi_messages)} reasons={len(advice.reasons)} conf={advice.confidence:.2f}"
             )
         else:
-            print(f"[GCP_LLM_SECTION] section={section_id} ok={ok} tier_llm=None msgs=0 reasons=0 conf=0.00")
+            print(f"[GCP_LLM_SECTION] section={section_id} ok=False tier_llm=None msgs=0 reasons=0 conf=0.00")
 
     except Exception as e:
         # Never fail the flow - just log
@@ -914,6 +908,10 @@ def _handle_restart_if_needed(config: ModuleConfig) -> None:
         del st.session_state["_summary_ready"]
     if "_summary_advice" in st.session_state:
         del st.session_state["_summary_advice"]
+    prefetcher = st.session_state.pop("_gcp_llm_prefetcher", None)
+    if prefetcher is not None:
+        prefetcher.cancel_all()
+    st.session_state.pop("_gcp_llm_sections_processed", None)
 
     # 6. Reset MCIP GCP completion (but preserve Cost Planner!)
     try:
@@ -813,3 +813,39 @@ def vrhythm(section: str):
     Use instead of st.write("") or st.markdown("") for consistency.
     """
     st.markdown(f'<div class="vr vr--{section}"></div>', unsafe_allow_html=True)
+
+
+def render_what_if_panel(answers: dict) -> None:
+    """
+    Render the "what would change the recommendation?" panel (dev mode).
+
+    Lists the single answer changes (and pairs) that flip the deterministic
+    tier or the hours band, from care_recommendation.what_if.
+    """
+    from products.gcp_v4.modules.care_recommendation.logic import mc_behavior_gate_enabled
+    from products.gcp_v4.modules.care_recommendation.what_if import explore_what_if
+
+    try:
+        report = explore_what_if(answers, pairs=True, behavior_gate=mc_behavior_gate_enabled())
+    except Exception as e:
+        print(f"[WHAT_IF] failed: {e}")
+        return
+
+    with st.expander("🔀 What would change the recommendation?", expanded=False):
+        st.caption(
+            f"Baseline: {report.baseline_tier} · {report.baseline_hours_band or '—'} · "
+            f"{report.evaluated} changes checked in {report.elapsed_ms:.0f} ms"
+        )
+        if not report.outcomes:
+            st.markdown("No single or paired answer change flips the tier or hours band.")
+            return
+        for title, outcomes, target in (
+            ("**Tier**", report.tier_flips, "tier"),
+            ("**Hours band**", report.hours_flips, "hours_band"),
+        ):
+            if not outcomes:
+                continue
+            st.markdown(title)
+            for outcome in outcomes:
+                changes = " + ".join(f"{e.question_label}: {e.description}" for e in outcome.edits)
+                st.markdown(f"- {changes} → `{getattr(outcome, target)}`")
@@ -14,7 +14,8 @@ def get_answer(
     question: str,
     name: Optional[str] = None,
     tags: Optional[List[str]] = None,
-    source: str = "auto"
+    source: str = "auto",
+    tenant: str | None = None
 ) -> Dict[str, Any]:
     """
     Global AI advisor service - RAG-FIRST architecture.
@@ -29,6 +30,7 @@ def get_answer(
         name: Optional user name for personalization
         tags: Optional tags for filtering (future use)
         source: "auto" (try corp then FAQ), "corp" (corp only), or "faq" (FAQ only)
+        tenant: Optional tenant label for answer-cache hit-rate metrics
     
     Returns:
         {
@@ -83,7 +85,7 @@ def get_answer(
                 good_chunks = [c for c in top_chunks if isinstance(c, dict)]
                 if good_chunks:
                     used_urls = list({c.get("url", "") for c in good_chunks})
-                    result = answer_corp(question, name, good_chunks, policy)
+                    result = answer_corp(question, name, good_chunks, policy, tenant=tenant)
                     if result:
                         mode = "rag"
                         print(f"[ADVISOR_RAG] question='{question[:50]}...' chunks={len(good_chunks)} urls={len(used_urls)}")
@@ -93,7 +95,7 @@ def get_answer(
             top_faqs = retrieve_faq(question, faqs, k=3)
             if top_faqs:
                 used_faq_ids = [x.get("id") for x in top_faqs if isinstance(x, dict)]
-                result = answer_faq(question, name, top_faqs, policy)
+                result = answer_faq(question, name, top_faqs, policy, tenant=tenant)
                 if result:
                     mode = "faq"
         
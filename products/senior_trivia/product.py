@@ -12,6 +12,8 @@ Features:
 - Fun, accessible, educational content
 """
 
+from functools import cache
+
 import streamlit as st
 
 from core.modules.engine import run_module
@@ -371,6 +373,8 @@ def _clear_module_state(module_key: str):
         state_key,
         f"{state_key}._step",
         f"{state_key}._outcomes",
+        f"{state_key}._outcomes_fp",
+        f"{state_key}._memo",
         f"{state_key}._timestamp",
     ]
 
@@ -504,10 +508,13 @@ def _render_module_hub():
             st.markdown("---")
 
 
+@cache
 def _load_module_config(module_key: str) -> ModuleConfig:
     """Load module configuration for the specified trivia game.
 
-    Converts trivia JSON format to ModuleConfig for module engine.
+    Converts trivia JSON format to ModuleConfig for module engine. Cached so
+    every rerun gets the same object (the engine's per-module memo and the
+    dependency graph are keyed by config identity).
 
     Args:
         module_key: Key of the trivia module (e.g., "truths_myths")
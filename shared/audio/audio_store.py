@@ -0,0 +1,263 @@
+"""
+Content-addressed audio cache for synthesized speech.
+
+Most clips the FAQ voice feature plays are canned answers from
+config/faq.json, so the same bytes are requested by every session. Clips
+are stored once per process in memory and once per machine on disk, keyed
+by everything that changes the audio (see audio_cache_key):
+
+- cleaned text (after Markdown stripping and truncation)
+- voice ID, model ID and voice settings
+- output format + AUDIO_FORMAT_VERSION
+
+Storage:
+- Memory: OrderedDict LRU of the most recent clips (bounded by entry count)
+- Disk: .cache/tts_audio/<key[:2]>/<key>.<ext>, atomic writes (tmp file +
+  os.replace). A hit bumps the file's mtime, so mtime order is LRU order
+  across processes; when the total exceeds max_bytes the least recently
+  used files are deleted.
+
+Environment:
+- TTS_AUDIO_CACHE: "on" (default) | "memory" | "off"
+- TTS_AUDIO_CACHE_DIR: disk location (default .cache/tts_audio)
+- TTS_AUDIO_CACHE_MB: disk budget in MB (default 200)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+# ====================================================================
+# CONFIGURATION
+# ====================================================================
+
+AUDIO_FORMAT_VERSION = 1
+DEFAULT_AUDIO_DIR = Path(".cache/tts_audio")
+DEFAULT_MAX_MB = 200
+DEFAULT_MEMORY_ENTRIES = 64
+
+
+def audio_cache_key(
+    text: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: dict[str, Any],
+    output_format: str,
+) -> str:
+    """sha256 of everything that determines the synthesized audio."""
+    material = json.dumps(
+        {
+            "v": AUDIO_FORMAT_VERSION,
+            "text": text,
+            "voice": voice_id,
+            "model": model_id,
+            "settings": voice_settings,
+            "format": output_format,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# ====================================================================
+# STORE
+# ====================================================================
+
+
+class AudioStore:
+    """Two-tier (memory LRU + size-bounded disk) cache of audio clips.
+
+    Thread-safe within a process; safe to share a directory between
+    processes since every file is written atomically under its content key.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = DEFAULT_AUDIO_DIR,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        suffix: str = ".mp3",
+    ) -> None:
+        self.root = Path(root) if root is not None else None
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.suffix = suffix
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._index: dict[str, tuple[float, int]] | None = None  # key -> (mtime, size)
+        self._lock = threading.RLock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    # ----------------------------------------------------------------
+    # Disk index
+    # ----------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        assert self.root is not None
+        return self.root / key[:2] / f"{key}{self.suffix}"
+
+    def _disk_index(self) -> dict[str, tuple[float, int]]:
+        """Scan the cache directory once; kept up to date by get/put after that."""
+        if self._index is None:
+            index: dict[str, tuple[float, int]] = {}
+            if self.root is not None and self.root.exists():
+                for path in self.root.glob(f"*/*{self.suffix}"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    index[path.stem] = (stat.st_mtime, stat.st_size)
+            self._index = index
+        return self._index
+
+    def disk_bytes(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._disk_index().values())
+
+    def _evict(self) -> None:
+        index = self._disk_index()
+        total = sum(size for _, size in index.values())
+        if total <= self.max_bytes:
+            return
+        for key, (_, size) in sorted(index.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"[TTS_CACHE] Could not evict {key[:12]}: {e}")
+                continue
+            del index[key]
+            total -= size
+            self._stats["evictions"] += 1
+
+    # ----------------------------------------------------------------
+    # Memory tier
+    # ----------------------------------------------------------------
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ----------------------------------------------------------------
+    # Public API
+    # ----------------------------------------------------------------
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return data
+            if self.root is None:
+                self._stats["misses"] += 1
+                return None
+
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+            except OSError:
+                self._disk_index().pop(key, None)
+                self._stats["misses"] += 1
+                return None
+
+            now = time.time()
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            self._disk_index()[key] = (now, len(data))
+            self._remember(key, data)
+            self._stats["disk_hits"] += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if not data:
+            return
+        with self._lock:
+            self._remember(key, data)
+            if self.root is None:
+                return
+            path = self._path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp, path)
+                except BaseException:
+                    Path(tmp).unlink(missing_ok=True)
+                    raise
+            except OSError as e:
+                print(f"[TTS_CACHE] Could not write {path}: {e}")
+                return
+            self._disk_index()[key] = (time.time(), len(data))
+            self._stats["writes"] += 1
+            self._evict()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+            return self.root is not None and self._path(key).exists()
+
+    def clear(self, disk: bool = False) -> int:
+        """Drop the memory tier (and the disk tier if disk=True); returns clips removed."""
+        with self._lock:
+            removed = len(self._memory)
+            self._memory.clear()
+            if disk and self.root is not None:
+                for key in list(self._disk_index()):
+                    self._path(key).unlink(missing_ok=True)
+                    removed += 1
+                self._index = {}
+            return removed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._disk_index()) if self.root is not None else 0,
+                "disk_bytes": self.disk_bytes() if self.root is not None else 0,
+                "max_bytes": self.max_bytes,
+            }
+
+
+@cache
+def get_audio_store() -> AudioStore | None:
+    """Process-wide store configured from the environment (None when TTS_AUDIO_CACHE=off)."""
+    mode = os.getenv("TTS_AUDIO_CACHE", "on").strip().lower()
+    if mode == "off":
+        return None
+    root = None if mode == "memory" else Path(os.getenv("TTS_AUDIO_CACHE_DIR", str(DEFAULT_AUDIO_DIR)))
+    try:
+        max_mb = float(os.getenv("TTS_AUDIO_CACHE_MB", str(DEFAULT_MAX_MB)))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    return AudioStore(root=root, max_bytes=int(max_mb * 1024 * 1024))
+
+
+__all__ = [
+    "AUDIO_FORMAT_VERSION",
+    "AudioStore",
+    "audio_cache_key",
+    "get_audio_store",
+]
@@ -0,0 +1,147 @@
+"""
+Progressive audio player for chunked TTS.
+
+render_streaming_audio() takes the chunks yielded by
+tts_client.synthesize_stream() and hands each one to the browser as soon as
+it is ready. The player is a plain <audio> element with a queue: chunk i
+starts when chunk i-1 ends, so the first sentence plays while later ones
+are still being synthesized.
+
+Delivery: the player and every chunk are separate components.html iframes
+(same origin as the app). They meet in a queue on the parent window,
+window.__ccaAudioStreams[key], so chunks may arrive before the player has
+loaded. A failed chunk is delivered as "" and skipped. The chunk iframes
+carry only a URL: the audio itself is registered with Streamlit's media
+file manager, the same way st.audio serves its data.
+
+Only the newest answer needs the queue player. Older answers are rendered
+with render_joined_audio(), a single st.audio element, so reruns do not
+re-send a player per message.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Iterable
+
+_QUEUE_JS = """
+  const root = window.parent;
+  const streams = root.__ccaAudioStreams = root.__ccaAudioStreams || {};
+  const q = streams[%(key)s] = streams[%(key)s] || {chunks: {}};
+"""
+
+_PLAYER_HTML = """
+<audio id="cca-stream" controls preload="auto" style="width:100%%;height:40px"></audio>
+<script>
+(function() {
+""" + _QUEUE_JS + """
+  const audio = document.getElementById("cca-stream");
+  let next = 0, loaded = -1, started = %(autoplay)s;
+
+  function advance() {
+    while (q.chunks[next] === "") next++;  // Failed chunks are skipped
+    const src = q.chunks[next];
+    if (src === undefined || loaded === next) return;  // Not delivered yet: notify() retries
+    loaded = next;
+    audio.src = src;
+    if (started) audio.play().catch(() => {});
+  }
+
+  audio.addEventListener("play", () => { started = true; });
+  audio.addEventListener("ended", () => { next++; advance(); });
+  q.notify = advance;
+  advance();
+})();
+</script>
+"""
+
+_CHUNK_HTML = """
+<script>
+(function() {
+""" + _QUEUE_JS + """
+  q.chunks[%(index)d] = %(src)s;
+  if (q.notify) q.notify();
+})();
+</script>
+"""
+
+
+def _components_html():
+    from streamlit.components.v1 import html
+
+    return html
+
+
+def _media_file_mgr():
+    """Streamlit's media file manager, or None in bare mode (scripts, tests)."""
+    from streamlit import runtime
+
+    return runtime.get_instance().media_file_mgr if runtime.exists() else None
+
+
+def _base_url_path() -> str:
+    from streamlit import config
+
+    return config.get_option("server.baseUrlPath").strip("/")
+
+
+def _media_url(audio: bytes | None, coordinates: str) -> str:
+    """URL the browser can fetch the chunk from ("" for a failed chunk)."""
+    if not audio:
+        return ""
+    media_files = _media_file_mgr()
+    if media_files is None:
+        # No media endpoint to serve from
+        return "data:audio/mpeg;base64," + base64.b64encode(audio).decode("ascii")
+    url = media_files.add(audio, "audio/mpeg", coordinates)
+    base = _base_url_path()
+    return f"/{base}{url}" if base else url
+
+
+def render_streaming_audio(chunks: Iterable[bytes | None], key: str, autoplay: bool = False) -> int:
+    """
+    Play audio chunks in order as they arrive.
+
+    The player is rendered with the first chunk that has audio, so nothing
+    is shown if every chunk fails.
+
+    Args:
+        chunks: Audio per chunk in playback order (None = failed chunk)
+        key: Unique per player on the page
+        autoplay: Start playing as soon as the first chunk arrives
+
+    Returns:
+        Number of chunks delivered with audio
+    """
+    html = _components_html()
+    key_js = json.dumps(f"{key}")
+    delivered = 0
+    for index, audio in enumerate(chunks):
+        if audio and not delivered:
+            html(_PLAYER_HTML % {"key": key_js, "autoplay": "true" if autoplay else "false"}, height=54)
+        src = _media_url(audio, f"cca-audio.{key}.{index}")
+        html(_CHUNK_HTML % {"key": key_js, "index": index, "src": json.dumps(src)}, height=0)
+        if audio:
+            delivered += 1
+    return delivered
+
+
+def render_joined_audio(chunks: Iterable[bytes | None]) -> int:
+    """
+    Play audio chunks as one st.audio clip (for answers older than the newest).
+
+    MP3 chunks concatenate into a playable stream; failed chunks are left out.
+
+    Returns:
+        Number of chunks with audio (0 = nothing rendered)
+    """
+    clips = [audio for audio in chunks if audio]
+    if clips:
+        import streamlit as st
+
+        st.audio(b"".join(clips), format="audio/mp3")
+    return len(clips)
+
+
+__all__ = ["render_joined_audio", "render_streaming_audio"]
@@ -4,42 +4,62 @@ Provides simple wrapper for synthesizing FAQ answers to speech.
 
 Uses centralized configuration from core.config to ensure API keys
 persist across Streamlit reruns and page navigations.
+
+Synthesized clips are cached in a shared, content-addressed store
+(memory + disk, see shared/audio/audio_store.py) rather than per session.
+Canned FAQ answers can be rendered ahead of time with
+tools/prerender_faq_audio.py.
 """
 
-import time
-import hashlib
+import os
 import re
-from typing import Optional
-import streamlit as st
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 # Check if requests is available
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+# Import centralized configuration
+from core.config import get_elevenlabs_config, validate_elevenlabs_config
+
 # Import logging
 from core.logging import get_logger
-logger = get_logger("audio")
+from shared.audio.audio_store import audio_cache_key, get_audio_store
 
-# Import centralized configuration
-from core.config import get_elevenlabs_config, validate_elevenlabs_config
+logger = get_logger("audio")
 
 # Constants
 MAX_TEXT_LENGTH = 2000  # Character limit for synthesis
 TIMEOUT_SECONDS = 15
 MAX_RETRIES = 1
+MODEL_ID = "eleven_monolingual_v1"
+DEFAULT_VOICE_ID = "h8fE15wgH3MZaYwKHXyg"
 
-# Session cache for audio to avoid re-generating same content
-if "audio_cache" not in st.session_state:
-    st.session_state["audio_cache"] = {}
+# Overridable so tests (and the pre-render CLI) can point at a local stub server
+API_BASE = os.getenv("ELEVENLABS_API_BASE", "https://api.elevenlabs.io")
 
 
-def _get_cache_key(text: str, voice_id: str) -> str:
-    """Generate cache key from text and voice ID"""
-    combined = f"{text}|{voice_id}"
-    return hashlib.md5(combined.encode()).hexdigest()
+@cache
+def get_tts_session():
+    """Pooled HTTP session for ElevenLabs (keep-alive across synthesize calls).
+
+    Retries are handled by synthesize() itself, so the adapter does none.
+    """
+    if not REQUESTS_AVAILABLE:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept": "audio/mpeg", "User-Agent": "cca-senior-navigator/1.0"})
+    return session
 
 
 def _strip_markdown(text: str) -> str:
@@ -97,31 +117,52 @@ def _strip_markdown(text: str) -> str:
     return text
 
 
-def synthesize(text: str, voice_id: Optional[str] = None, format: str = "mp3_44100_128") -> Optional[bytes]:
-    """
-    Synthesize text to speech using ElevenLabs API
-    
-    Args:
-        text: Text to synthesize (max 2000 chars)
-        voice_id: ElevenLabs voice ID (defaults to configured voice)
-        format: Audio format (default: mp3_44100_128)
-    
-    Returns:
-        MP3 audio bytes or None on failure
-    """
-    if not REQUESTS_AVAILABLE:
-        logger.warning("requests library not available for audio synthesis")
-        return None
-    
-    # Get configuration from centralized config with retry
+def _prepare_text(text: str) -> str:
+    """Text as sent to the API: Markdown stripped, truncated to MAX_TEXT_LENGTH."""
+    clean_text = _strip_markdown(text)
+    if len(clean_text) > MAX_TEXT_LENGTH:
+        logger.warning(f"Text truncated from {len(clean_text)} to {MAX_TEXT_LENGTH} chars")
+        clean_text = clean_text[:MAX_TEXT_LENGTH] + "..."
+    return clean_text
+
+
+def _voice_settings(config: dict) -> dict:
+    return {
+        "stability": float(config.get("stability", 0.5)),
+        "similarity_boost": float(config.get("similarity", 0.93)),
+        "style": float(config.get("style", 0.15)),
+        "use_speaker_boost": True,
+    }
+
+
+def _request_spec(clean_text: str, voice_id: str | None, format: str, config: dict) -> tuple[str, dict, str]:
+    """(voice_id, payload, cache_key) for synthesizing already-cleaned text."""
+    voice_id = voice_id or config.get("voice_id") or DEFAULT_VOICE_ID
+    payload = {
+        "text": clean_text,
+        "model_id": MODEL_ID,
+        "voice_settings": _voice_settings(config),
+    }
+    key = audio_cache_key(clean_text, voice_id, MODEL_ID, payload["voice_settings"], format)
+    return voice_id, payload, key
+
+
+def _load_config() -> dict | None:
     try:
-        config = get_elevenlabs_config()
-        api_key = config.get("api_key")
+        return get_elevenlabs_config()
     except Exception as e:
         logger.error(f"[FAQ_AUDIO] ❌ Failed to load configuration: {e}")
         return None
+
+
+def _api_key(config: dict) -> str | None:
+    """Configured API key, or None (logged) when synthesis is not possible."""
+    if not REQUESTS_AVAILABLE:
+        logger.warning("requests library not available for audio synthesis")
+        return None
     
     # Validate configuration
+    api_key = config.get("api_key")
     if not api_key:
         logger.error("[FAQ_AUDIO] ❌ ElevenLabs API key not loaded from configuration")
         try:
@@ -138,49 +179,18 @@ def synthesize(text: str, voice_id: Optional[str] = None, format: str = "mp3_441
     
     # Log successful key load for debugging
     logger.info(f"[FAQ_AUDIO] ✓ API key loaded (length: {len(api_key)})")
-    
-    # Use configured voice if not specified
-    if not voice_id:
-        voice_id = config.get("voice_id") or "h8fE15wgH3MZaYwKHXyg"
-    
-    # Strip Markdown formatting before synthesis
-    clean_text = _strip_markdown(text)
-    logger.info(f"[FAQ_AUDIO] Stripped Markdown: {len(text)} -> {len(clean_text)} chars")
-    
-    # Truncate if too long
-    if len(clean_text) > MAX_TEXT_LENGTH:
-        logger.warning(f"Text truncated from {len(clean_text)} to {MAX_TEXT_LENGTH} chars")
-        clean_text = clean_text[:MAX_TEXT_LENGTH] + "..."
-    
-    # Check cache first (using cleaned text)
-    # Ensure cache exists (defensive programming)
-    if "audio_cache" not in st.session_state:
-        st.session_state["audio_cache"] = {}
-    
-    cache_key = _get_cache_key(clean_text, voice_id)
-    if cache_key in st.session_state["audio_cache"]:
-        logger.info(f"[FAQ_AUDIO] Cache hit for {len(clean_text)} chars")
-        return st.session_state["audio_cache"][cache_key]
-    
-    # Prepare API request
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+    return api_key
+
+
+def _fetch(voice_id: str, payload: dict, format: str, api_key: str) -> bytes | None:
+    """POST one synthesis request (with retry on server errors)."""
+    clean_text = payload["text"]
+    url = f"{API_BASE}/v1/text-to-speech/{voice_id}"
     headers = {
-        "Accept": "audio/mpeg",
         "Content-Type": "application/json",
         "xi-api-key": api_key
     }
-    
-    # Get voice settings from config
-    payload = {
-        "text": clean_text,
-        "model_id": "eleven_monolingual_v1",
-        "voice_settings": {
-            "stability": float(config.get("stability", 0.5)),
-            "similarity_boost": float(config.get("similarity", 0.93)),
-            "style": float(config.get("style", 0.15)),
-            "use_speaker_boost": True
-        }
-    }
+    session = get_tts_session()
     
     # Attempt synthesis with retry
     start_time = time.time()
@@ -189,8 +199,9 @@ def synthesize(text: str, voice_id: Optional[str] = None, format: str = "mp3_441
         try:
             logger.info(f"[FAQ_AUDIO] Synthesizing {len(clean_text)} chars (attempt {attempt + 1}/{MAX_RETRIES + 1})")
             
-            response = requests.post(
+            response = session.post(
                 url,
+                params={"output_format": format},
                 json=payload,
                 headers=headers,
                 timeout=TIMEOUT_SECONDS
@@ -208,12 +219,6 @@ def synthesize(text: str, voice_id: Optional[str] = None, format: str = "mp3_441
                     f"voice_id={voice_id} | "
                     f"duration={duration:.2f}s"
                 )
-                
-                # Cache result (ensure cache exists)
-                if "audio_cache" not in st.session_state:
-                    st.session_state["audio_cache"] = {}
-                st.session_state["audio_cache"][cache_key] = audio_bytes
-                
                 return audio_bytes
             
             elif response.status_code >= 500 and attempt < MAX_RETRIES:
@@ -242,9 +247,197 @@ def synthesize(text: str, voice_id: Optional[str] = None, format: str = "mp3_441
     return None
 
 
-def clear_audio_cache():
-    """Clear the audio cache (useful for memory management)"""
-    if "audio_cache" in st.session_state:
-        cache_size = len(st.session_state["audio_cache"])
-        st.session_state["audio_cache"].clear()
+def cached_audio(text: str, voice_id: str | None = None, format: str = "mp3_44100_128") -> bytes | None:
+    """Cached audio for text, or None (never calls the API)."""
+    store = get_audio_store()
+    config = _load_config()
+    if store is None or config is None:
+        return None
+    _, _, key = _request_spec(_prepare_text(text), voice_id, format, config)
+    return store.get(key)
+
+
+def synthesize(text: str, voice_id: str | None = None, format: str = "mp3_44100_128") -> bytes | None:
+    """
+    Synthesize text to speech using ElevenLabs API
+    
+    Audio is cached on disk and shared across sessions (see
+    shared/audio/audio_store.py), so cached clips are served even when no
+    API key is configured.
+    
+    Args:
+        text: Text to synthesize (max 2000 chars)
+        voice_id: ElevenLabs voice ID (defaults to configured voice)
+        format: Audio format (default: mp3_44100_128)
+    
+    Returns:
+        MP3 audio bytes or None on failure
+    """
+    config = _load_config()
+    if config is None:
+        return None
+    
+    # Strip Markdown formatting before synthesis; the key covers text, voice and settings
+    clean_text = _prepare_text(text)
+    logger.info(f"[FAQ_AUDIO] Stripped Markdown: {len(text)} -> {len(clean_text)} chars")
+    voice_id, payload, cache_key = _request_spec(clean_text, voice_id, format, config)
+    
+    store = get_audio_store()
+    if store is not None:
+        cached = store.get(cache_key)
+        if cached is not None:
+            logger.info(f"[FAQ_AUDIO] Cache hit for {len(clean_text)} chars")
+            return cached
+    
+    api_key = _api_key(config)
+    if not api_key:
+        return None
+    
+    audio_bytes = _fetch(voice_id, payload, format, api_key)
+    if audio_bytes and store is not None:
+        store.put(cache_key, audio_bytes)
+    return audio_bytes
+
+
+# ==============================================================================
+# CHUNKED STREAMING SYNTHESIS
+# ==============================================================================
+
+CHUNK_MAX_CHARS = 400  # Longer sentences are split at clause boundaries
+CHUNK_MIN_CHARS = 40  # Shorter sentences ("Yes.") are merged into the next one
+STREAM_WORKERS = 3  # Concurrent chunk requests per answer
+
+_SENTENCE_END = re.compile(r'(?:(?<=[.!?…])|(?<=[.!?…]["\')\]]))\s+')
+_CLAUSE_BREAK = re.compile(r'(?<=[,;:—])\s+')
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    """Split one sentence at clause breaks, then at spaces, into <= max_chars pieces."""
+    if len(sentence) <= max_chars:
+        return [sentence]
+    pieces: list[str] = []
+    current = ""
+    for part in _CLAUSE_BREAK.split(sentence):
+        while len(part) > max_chars:
+            cut = part.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(part[:cut].strip())
+            part = part[cut:].strip()
+        if current and len(current) + 1 + len(part) > max_chars:
+            pieces.append(current)
+            current = part
+        else:
+            current = f"{current} {part}" if current else part
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_for_speech(
+    clean_text: str,
+    max_chars: int = CHUNK_MAX_CHARS,
+    min_chars: int = CHUNK_MIN_CHARS,
+) -> list[str]:
+    """
+    Split cleaned text into sentence-level chunks for streaming synthesis
+    
+    Chunking is deterministic, so a sentence that appears in several answers
+    produces the same chunk (and the same cache key) each time.
+    """
+    sentences = [s.strip() for s in _SENTENCE_END.split(clean_text) if s.strip()]
+    chunks: list[str] = []
+    pending = ""
+    for sentence in sentences:
+        sentence = f"{pending} {sentence}" if pending else sentence
+        pending = ""
+        if len(sentence) < min_chars:
+            pending = sentence
+            continue
+        chunks.extend(_split_long(sentence, max_chars))
+    if pending:
+        if chunks and len(chunks[-1]) + 1 + len(pending) <= max_chars:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+def stream_is_cached(text: str, voice_id: str | None = None, format: str = "mp3_44100_128") -> bool:
+    """Whether every chunk synthesize_stream() would produce is already cached."""
+    store = get_audio_store()
+    config = _load_config()
+    if store is None or config is None:
+        return False
+    chunks = split_for_speech(_strip_markdown(text))
+    return all(_request_spec(chunk, voice_id, format, config)[2] in store for chunk in chunks)
+
+
+def synthesize_stream(
+    text: str,
+    voice_id: str | None = None,
+    format: str = "mp3_44100_128",
+    max_workers: int = STREAM_WORKERS,
+) -> Iterator[bytes | None]:
+    """
+    Synthesize text chunk by chunk, yielding audio in order as it is ready
+    
+    Chunks (see split_for_speech) are synthesized concurrently and each one
+    goes through the shared audio cache. The first chunk is yielded as soon
+    as it is ready, while later chunks are still being produced. Unlike
+    synthesize(), long text is not truncated.
+    
+    Yields:
+        MP3 bytes per chunk, or None for a chunk that failed
+    """
+    config = _load_config()
+    if config is None:
+        return
+    
+    chunks = split_for_speech(_strip_markdown(text))
+    if not chunks:
+        return
+    specs = [_request_spec(chunk, voice_id, format, config) for chunk in chunks]
+    store = get_audio_store()
+    
+    # Only resolve (and log about) the API key if something actually needs synthesizing
+    api_key = None
+    if store is None or any(key not in store for _, _, key in specs):
+        api_key = _api_key(config)
+    
+    def produce(spec: tuple[str, dict, str]) -> bytes | None:
+        chunk_voice, payload, key = spec
+        if store is not None:
+            cached = store.get(key)
+            if cached is not None:
+                return cached
+        if not api_key:
+            return None
+        audio_bytes = _fetch(chunk_voice, payload, format, api_key)
+        if audio_bytes and store is not None:
+            store.put(key, audio_bytes)
+        return audio_bytes
+    
+    logger.info(f"[FAQ_AUDIO] Streaming {len(chunks)} chunks ({len(text)} chars)")
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="tts-chunk")
+    try:
+        # A sentence repeated within the answer is synthesized once
+        by_key = {}
+        for spec in specs:
+            if spec[2] not in by_key:
+                by_key[spec[2]] = pool.submit(produce, spec)
+        for future in (by_key[spec[2]] for spec in specs):
+            yield future.result()
+    finally:
+        # Stop queued chunks if the consumer stops early
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def clear_audio_cache(disk: bool = False):
+    """Clear the in-memory audio cache (and the shared disk cache if disk=True)"""
+    store = get_audio_store()
+    if store is not None:
+        cache_size = store.clear(disk=disk)
         logger.info(f"[FAQ_AUDIO] Cleared {cache_size} cached audio clips")
@@ -0,0 +1,90 @@
+"""
+Precomputed advisor summaries for the CRM.
+
+tools/precompute_advisor_summaries.py generates, per customer, the four
+advisor summary drawers (ai.advisor_summary_engine) and the Smart Timeline
+insights and events, and stores them here so Customer 360 and Smart Timeline
+read finished text instead of generating it while the advisor waits.
+
+Each record carries the assessment hash of the user document it was built
+from. A record is current while the document's hash still matches; the
+batch job only regenerates customers whose hash changed. Insights and
+timeline events also carry an "as_of" key (date and days since last
+activity, see apps.crm.pages.smart_timeline.timeline_as_of) and are only
+used while it matches.
+
+Layout: data/crm/advisor_summaries/<user_id>.json (atomic writes).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from ai.llm_cache import canonical_json
+
+# Bump to invalidate every stored record (e.g. new drawer templates)
+SUMMARY_FORMAT_VERSION = 1
+
+# Bookkeeping keys that change on every save without changing the assessment
+VOLATILE_KEYS = {"uid", "session_id", "created_at", "last_updated", "last_accessed"}
+
+
+def assessment_hash(user_doc: Mapping[str, Any]) -> str:
+    """Hash of everything in a user document that summaries are built from."""
+    material = {key: value for key, value in user_doc.items() if key not in VOLATILE_KEYS}
+    payload = canonical_json({"v": SUMMARY_FORMAT_VERSION, "doc": material})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AdvisorSummaryStore:
+    """One JSON record per customer with drawers, insights and timeline."""
+
+    def __init__(self, data_root: str = "data"):
+        self.data_root = Path(data_root)
+        self.summary_dir = self.data_root / "crm" / "advisor_summaries"
+
+    def _path(self, user_id: str) -> Path:
+        return self.summary_dir / f"{user_id}.json"
+
+    def get(self, user_id: str) -> dict[str, Any] | None:
+        """Stored record for a customer, current or not."""
+        path = self._path(user_id)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[ADVISOR_SUMMARY_STORE] Unreadable record {path.name}: {e}")
+            return None
+
+    def get_current(self, user_id: str, user_doc: Mapping[str, Any] | None) -> dict[str, Any] | None:
+        """Stored record, only if it was built from this version of the user document."""
+        if not user_doc:
+            return None
+        record = self.get(user_id)
+        if record and record.get("assessment_hash") == assessment_hash(user_doc):
+            return record
+        return None
+
+    def is_current(self, user_id: str, digest: str) -> bool:
+        """Whether a complete record exists for this assessment hash."""
+        record = self.get(user_id)
+        return bool(record and record.get("assessment_hash") == digest and record.get("complete"))
+
+    def put(self, user_id: str, record: dict[str, Any]) -> None:
+        """Write a record atomically (readers never see a partial file)."""
+        self.summary_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(user_id)
+        fd, tmp = tempfile.mkstemp(dir=self.summary_dir, prefix=f".{user_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f, indent=2, default=str)
+            os.replace(tmp, path)
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,74 @@
+"""
+Shared pytest fixtures.
+"""
+
+import threading
+import time
+
+import pytest
+
+
+class FakeAdvisorLLM:
+    """LLMClient stand-in for the advisor summary engine.
+
+    Recognises the drawer from the template's opening words and records
+    each call. Per-drawer latency and failures can be injected; active and
+    max_active count overlapping calls, and an optional barrier makes calls
+    wait for each other (only concurrent calls can pass it).
+    """
+
+    MARKERS = {
+        "about_person": "what demographic and social information",
+        "housing_preferences": "what housing and care setting information",
+        "medical_care": "what medical and care information",
+        "financial_overview": "comprehensive financial assessment report",
+    }
+
+    def __init__(self):
+        self.latency = dict.fromkeys(self.MARKERS, 0.0)
+        self.fail = set()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.barrier = None
+        self._lock = threading.Lock()
+        fake = self
+
+        class Client:
+            def generate_completion(self, system_prompt=None, user_prompt=""):
+                return fake.complete(user_prompt)
+
+        self.Client = Client
+
+    def drawer_for(self, user_prompt):
+        return next(d for d, marker in self.MARKERS.items() if marker in user_prompt)
+
+    def complete(self, user_prompt):
+        drawer = self.drawer_for(user_prompt)
+        with self._lock:
+            self.calls.append(drawer)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait()
+            time.sleep(self.latency[drawer])
+        finally:
+            with self._lock:
+                self.active -= 1
+        if drawer in self.fail:
+            raise RuntimeError("boom")
+        return f"  {drawer} narrative  "
+
+
+@pytest.fixture
+def advisor_llm(monkeypatch):
+    """Fake LLM and an empty in-memory prompt cache for ai.advisor_summary_engine."""
+    from ai import advisor_summary_engine as engine
+    from ai.llm_cache import MemoryLRUBackend, PromptCache
+
+    fake = FakeAdvisorLLM()
+    cache = PromptCache(MemoryLRUBackend())
+    monkeypatch.setattr(engine, "LLMClient", fake.Client)
+    monkeypatch.setattr(engine, "get_prompt_cache", lambda: cache)
+    return fake
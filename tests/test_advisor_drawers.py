@@ -0,0 +1,78 @@
+"""
+Tests for parallel advisor summary drawer generation and the drawer cache
+(ai/advisor_summary_engine.generate_all_drawers) against the fake LLM
+(tests/conftest.py) with injected latency and failures.
+"""
+
+import dataclasses
+import threading
+import time
+
+from ai import advisor_summary_engine as engine
+from ai.advisor_summary_engine import DRAWER_TYPES, AdvisorSummaryEngine
+from ai.advisor_summary_templates import EXAMPLE_CONTEXT
+from ai.llm_cache import PromptCache
+
+
+def test_fake_llm_recognises_every_drawer(advisor_llm):
+    AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT, parallel=False)
+    assert advisor_llm.calls == DRAWER_TYPES
+
+
+def test_parallel_matches_sequential_and_overlaps(advisor_llm, monkeypatch):
+    sequential = AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT, parallel=False)
+    assert advisor_llm.max_active == 1
+
+    monkeypatch.setattr(engine, "get_prompt_cache", lambda: PromptCache(None))
+    # Each call waits at the barrier until all four are in flight
+    advisor_llm.barrier = threading.Barrier(len(DRAWER_TYPES), timeout=5)
+    parallel = AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT, parallel=True)
+
+    assert parallel == sequential == {d: f"{d} narrative" for d in DRAWER_TYPES}
+    assert list(parallel) == DRAWER_TYPES
+    assert advisor_llm.max_active == len(DRAWER_TYPES)
+
+
+def test_deadline_and_failures_fall_back_per_drawer(advisor_llm):
+    advisor_llm.latency["medical_care"] = 1.0
+    advisor_llm.fail.add("financial_overview")
+
+    start = time.perf_counter()
+    drawers = AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT, parallel=True, deadline=0.4)
+    assert time.perf_counter() - start < 0.8
+
+    assert drawers["about_person"] == "about_person narrative"
+    assert drawers["housing_preferences"] == "housing_preferences narrative"
+    for drawer in ("medical_care", "financial_overview"):
+        assert drawers[drawer] == AdvisorSummaryEngine.fallback_narrative(drawer, EXAMPLE_CONTEXT)
+
+
+def test_unchanged_context_is_served_from_cache(advisor_llm):
+    AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT)
+    assert len(advisor_llm.calls) == 4
+
+    # The advisor prep page asks for one drawer of the same context
+    assert AdvisorSummaryEngine.generate_drawer_narrative("about_person", EXAMPLE_CONTEXT) == "about_person narrative"
+    AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT)
+    assert len(advisor_llm.calls) == 4
+
+    changed = dataclasses.replace(EXAMPLE_CONTEXT, monthly_cost=EXAMPLE_CONTEXT.monthly_cost + 500)
+    AdvisorSummaryEngine.generate_all_drawers(changed)
+    assert len(advisor_llm.calls) == 8
+
+
+def test_fallbacks_are_not_cached(advisor_llm):
+    advisor_llm.fail.add("about_person")
+    first = AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT)
+    assert first["about_person"] == AdvisorSummaryEngine.fallback_narrative("about_person", EXAMPLE_CONTEXT)
+
+    advisor_llm.fail.clear()
+    assert AdvisorSummaryEngine.generate_all_drawers(EXAMPLE_CONTEXT)["about_person"] == "about_person narrative"
+    assert advisor_llm.calls.count("about_person") == 2 and len(advisor_llm.calls) == 5
+
+
+def test_parallel_toggle(monkeypatch):
+    monkeypatch.setenv("ADVISOR_SUMMARY_PARALLEL", "off")
+    assert not engine.parallel_drawers_enabled()
+    monkeypatch.delenv("ADVISOR_SUMMARY_PARALLEL")
+    assert engine.parallel_drawers_enabled()
@@ -0,0 +1,161 @@
+"""
+Tests for CRM advisor summary precomputation: context from persisted user
+documents, the summary store, and the incremental batch job
+(tools/precompute_advisor_summaries.py) against the fake LLM
+(tests/conftest.py).
+"""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from ai.advisor_summary_engine import DRAWER_TYPES, AdvisorSummaryEngine
+from shared.data_access.advisor_summary_store import AdvisorSummaryStore, assessment_hash
+from shared.data_access.navigator_reader import NavigatorDataReader
+from tools import precompute_advisor_summaries
+
+
+def _user_doc(name, tier="assisted_living", monthly_cost=6500.0):
+    return {
+        "uid": f"demo_{name.lower()}",
+        "last_updated": 1762394559.4,
+        "profile": {"person_name": name, "qualifiers": {"is_veteran": True}},
+        "flags": {"is_veteran": True, "medicaid_planning_interest": False},
+        "mcip_contracts": {
+            "care_recommendation": {
+                "tier": tier,
+                "flags": ["falls_risk"],
+                "status": "complete",
+                "allowed_tiers": [tier, "in_home"],
+            },
+            "financial_profile": {"estimated_monthly_cost": monthly_cost, "status": "complete"},
+        },
+        "tiles": {
+            "cost_planner_v2": {
+                "assessments": {
+                    "income": {"ss_monthly": 2600.0, "total_monthly_income": 2600.0},
+                    "assets": {"checking_balance": 34000.0, "total_asset_value": 234000.0},
+                }
+            }
+        },
+    }
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    demo = tmp_path / "users" / "demo"
+    demo.mkdir(parents=True)
+    for name in ("Mary", "John"):
+        (demo / f"demo_{name.lower()}.json").write_text(json.dumps(_user_doc(name)))
+    return tmp_path
+
+
+def _run(data_root, **kwargs):
+    return precompute_advisor_summaries.precompute(data_root=str(data_root), rate=1000, **kwargs)
+
+
+def test_context_from_user_document():
+    context = AdvisorSummaryEngine.build_advisor_context_from_user(_user_doc("Mary"))
+    assert context.person_a_name == "Mary"
+    assert context.recommended_tier == "assisted_living"
+    assert context.allowed_tiers == ["assisted_living", "in_home"]
+    assert "falls_risk" in context.care_flags
+    assert context.monthly_cost == 6500.0 and context.total_assets == 234000.0
+    assert context.va_benefits_eligible is True
+    assert context.years_funded == pytest.approx(234000.0 / (6500.0 * 12))
+
+
+def test_assessment_hash_ignores_bookkeeping_keys():
+    doc = _user_doc("Mary")
+    touched = {**doc, "last_updated": doc["last_updated"] + 60, "last_accessed": 1.0}
+    assert assessment_hash(touched) == assessment_hash(doc)
+    assert assessment_hash(_user_doc("Mary", monthly_cost=7000.0)) != assessment_hash(doc)
+
+
+def test_batch_only_regenerates_changed_assessments(advisor_llm, data_root):
+    first = _run(data_root)
+    assert (first["customers"], first["generated"]) == (2, 2)
+    assert len(advisor_llm.calls) == 2 * len(DRAWER_TYPES)
+
+    store = AdvisorSummaryStore(str(data_root))
+    record = store.get("demo_mary")
+    assert record["complete"] and set(record["drawers"]) == set(DRAWER_TYPES)
+    assert record["insights"]["readiness_score"] in (50, 90)
+    assert record["timeline"] and record["timeline"][-1]["title"] == "Navigator Registration"
+
+    again = _run(data_root)
+    assert again["current"] == 2 and len(advisor_llm.calls) == 8
+
+    path = data_root / "users" / "demo" / "demo_john.json"
+    path.write_text(json.dumps(_user_doc("John", tier="memory_care")))
+    third = _run(data_root)
+    assert (third["generated"], third["current"]) == (1, 1)
+    assert len(advisor_llm.calls) == 12
+
+    # CRM pages only accept a record built from the current document
+    assert store.get_current("demo_john", _user_doc("John", tier="memory_care"))
+    assert store.get_current("demo_john", _user_doc("John")) is None
+
+
+def test_partial_records_are_retried(advisor_llm, data_root):
+    advisor_llm.fail.update(DRAWER_TYPES)
+    result = _run(data_root, user_ids=["demo_mary"])
+    assert result["partial"] == 1
+    record = AdvisorSummaryStore(str(data_root)).get("demo_mary")
+    assert not record["complete"] and record["fallback_drawers"] == DRAWER_TYPES
+
+    advisor_llm.fail.clear()
+    assert _run(data_root, user_ids=["demo_mary"])["generated"] == 1
+    assert _run(data_root, user_ids=["demo_mary"])["current"] == 1
+
+
+def test_unknown_customers_are_reported(advisor_llm, data_root):
+    result = _run(data_root, user_ids=["demo_nobody"])
+    assert result["missing"] == 1 and not advisor_llm.calls
+
+
+def test_llm_calls_are_rate_limited(advisor_llm, data_root):
+    start = time.perf_counter()
+    precompute_advisor_summaries.precompute(data_root=str(data_root), rate=20, workers=2)
+    # 8 drawer calls at 20/s with a burst of 1
+    assert time.perf_counter() - start >= 0.3
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.tokens = 0
+
+    def acquire(self):
+        self.tokens += 1
+
+
+def test_prompt_cache_hits_take_no_rate_limit_tokens(advisor_llm, data_root):
+    reader = NavigatorDataReader(str(data_root))
+    store = AdvisorSummaryStore(str(data_root))
+
+    limiter = _CountingLimiter()
+    precompute_advisor_summaries.precompute_customer("demo_mary", reader, store, limiter)
+    assert limiter.tokens == len(DRAWER_TYPES)
+
+    limiter = _CountingLimiter()
+    result = precompute_advisor_summaries.precompute_customer("demo_mary", reader, store, limiter, force=True)
+    assert result["status"] == "generated"
+    assert limiter.tokens == 0 and len(advisor_llm.calls) == len(DRAWER_TYPES)
+
+
+def test_date_relative_insights_are_refreshed_without_llm(advisor_llm, data_root):
+    _run(data_root, user_ids=["demo_mary"])
+    store = AdvisorSummaryStore(str(data_root))
+    record = store.get("demo_mary")
+    assert record["as_of"]["date"] == datetime.now().strftime("%Y-%m-%d")
+
+    store.put("demo_mary", {**record, "as_of": {**record["as_of"], "date": "2000-01-01"}})
+    assert _run(data_root, user_ids=["demo_mary"])["refreshed"] == 1
+    assert len(advisor_llm.calls) == len(DRAWER_TYPES)
+
+    refreshed = store.get("demo_mary")
+    assert refreshed["as_of"] == record["as_of"] and refreshed["drawers"] == record["drawers"]
+    assert _run(data_root, user_ids=["demo_mary"])["current"] == 1
+
@@ -0,0 +1,128 @@
+"""
+Tests for the FAQ/corp answer cache (ai/answer_cache.py).
+
+Covers exact and near-duplicate hits, scope isolation (sources, policy,
+name), TTL expiry, LRU eviction, debounced disk persistence and per-tenant
+hit-rate metrics.
+"""
+
+import time
+
+import pytest
+
+from ai.answer_cache import AnswerCache, jaccard, normalize_query, policy_version, query_tokens
+
+POLICY = {"version": "2025-10-25", "answer": {"max_words": 120}}
+PV = policy_version(POLICY)
+ANSWER = {"answer": "Assisted living typically costs...", "sources": ["faq_1"], "cta": None}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AnswerCache(path=tmp_path / "answer_cache.json")
+
+
+class TestKeyHelpers:
+    def test_normalize_query(self):
+        assert normalize_query("  How much does Assisted-Living COST?? ") == (
+            "how much does assisted living cost"
+        )
+
+    def test_query_tokens_drop_stopwords(self):
+        assert query_tokens("What is the cost of memory care?") == {"cost", "memory", "care"}
+
+    def test_jaccard(self):
+        assert jaccard(frozenset({"a", "b"}), frozenset({"a", "b"})) == 1.0
+        assert jaccard(frozenset({"a"}), frozenset()) == 0.0
+
+    def test_policy_version_changes_with_content(self):
+        edited = {**POLICY, "answer": {"max_words": 100}}
+        assert policy_version(POLICY) != policy_version(edited)
+        assert policy_version(POLICY).startswith("2025-10-25:")
+
+
+class TestAnswerCache:
+    def test_exact_hit_after_put(self, cache):
+        cache.put("faq", "How much is assisted living?", ["faq_1"], PV, ANSWER)
+        assert cache.get("faq", "how much is assisted living", ["faq_1"], PV) == ANSWER
+
+    def test_returned_answer_is_a_copy(self, cache):
+        cache.put("faq", "q", ["faq_1"], PV, ANSWER)
+        cache.get("faq", "q", ["faq_1"], PV)["answer"] = "mutated"
+        assert cache.get("faq", "q", ["faq_1"], PV) == ANSWER
+
+    def test_source_order_does_not_matter(self, cache):
+        cache.put("faq", "q", ["faq_1", "faq_2"], PV, ANSWER)
+        assert cache.get("faq", "q", ["faq_2", "faq_1"], PV) == ANSWER
+
+    def test_scope_isolation(self, cache):
+        cache.put("faq", "q", ["faq_1"], PV, ANSWER, name="Mary")
+        assert cache.get("faq", "q", ["faq_9"], PV, name="Mary") is None
+        assert cache.get("faq", "q", ["faq_1"], "other", name="Mary") is None
+        assert cache.get("corp", "q", ["faq_1"], PV, name="Mary") is None
+        assert cache.get("faq", "q", ["faq_1"], PV, name="John") is None
+
+    def test_near_duplicate_hit(self, cache):
+        cache.put("faq", "What does memory care cost per month?", ["faq_1"], PV, ANSWER)
+        assert cache.get("faq", "memory care cost per month", ["faq_1"], PV) == ANSWER
+
+    def test_near_duplicate_disabled(self, tmp_path):
+        cache = AnswerCache(path=tmp_path / "c.json", near_dup_threshold=0)
+        cache.put("faq", "What does memory care cost per month?", ["faq_1"], PV, ANSWER)
+        assert cache.get("faq", "memory care cost per month", ["faq_1"], PV) is None
+
+    def test_unrelated_question_misses(self, cache):
+        cache.put("faq", "What does memory care cost?", ["faq_1"], PV, ANSWER)
+        assert cache.get("faq", "Is memory care covered by Medicaid?", ["faq_1"], PV) is None
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = AnswerCache(path=tmp_path / "c.json", ttl_seconds=0.01)
+        cache.put("faq", "q", ["faq_1"], PV, ANSWER)
+        time.sleep(0.02)
+        assert cache.get("faq", "q", ["faq_1"], PV) is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = AnswerCache(path=tmp_path / "c.json", max_entries=2, near_dup_threshold=0)
+        cache.put("faq", "first", ["a"], PV, ANSWER)
+        cache.put("faq", "second", ["a"], PV, ANSWER)
+        cache.get("faq", "first", ["a"], PV)  # touch -> most recent
+        cache.put("faq", "third", ["a"], PV, ANSWER)
+        assert len(cache) == 2
+        assert cache.get("faq", "first", ["a"], PV) == ANSWER
+        assert cache.get("faq", "second", ["a"], PV) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "c.json"
+        AnswerCache(path=path).put("corp", "who is cca", ["doc_1"], PV, ANSWER)
+        assert AnswerCache(path=path).get("corp", "Who is CCA?", ["doc_1"], PV) == ANSWER
+
+    def test_writes_are_debounced_until_flush(self, tmp_path):
+        path = tmp_path / "c.json"
+        cache = AnswerCache(path=path, flush_interval=60)
+        cache.put("faq", "first", ["a"], PV, ANSWER)
+        cache.put("faq", "second", ["a"], PV, ANSWER)
+        assert AnswerCache(path=path).get("faq", "second", ["a"], PV) is None
+
+        cache.flush()
+        assert AnswerCache(path=path).get("faq", "second", ["a"], PV) == ANSWER
+
+    def test_hit_rate_metrics(self, cache):
+        assert cache.get_metrics("default")["lookups"] == 0
+        cache.put("faq", "q", ["faq_1"], PV, ANSWER)
+        cache.get("faq", "q", ["faq_1"], PV)
+        cache.get("faq", "missing", ["faq_1"], PV)
+
+        metrics = cache.get_metrics("default")
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["hit_rate"] == 0.5
+
+    def test_per_tenant_metrics(self, cache):
+        cache.put("faq", "q", ["faq_1"], PV, ANSWER)
+        cache.get("faq", "q", ["faq_1"], PV, tenant="acme")
+        cache.get("faq", "missing", ["faq_1"], PV, tenant="acme")
+        cache.get("faq", "q", ["faq_1"], PV, tenant="globex")
+
+        assert cache.get_metrics("acme")["hit_rate"] == 0.5
+        assert cache.get_metrics("globex")["hit_rate"] == 1.0
+        assert set(cache.get_metrics()) == {"acme", "globex"}
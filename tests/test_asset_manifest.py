@@ -0,0 +1,58 @@
+"""Tests for manifest-backed image URLs in core.ui (tools/build_assets.py output)."""
+
+import hashlib
+
+import pytest
+
+from core import ui
+
+HERO = "assets/images/hero.png"
+
+
+@pytest.fixture
+def manifest(monkeypatch):
+    entries = {}
+    monkeypatch.setattr(ui, "_asset_manifest", lambda: entries)
+    ui.img_src.cache_clear()
+    ui.img_srcset.cache_clear()
+    yield entries
+    ui.img_src.cache_clear()
+    ui.img_srcset.cache_clear()
+
+
+def _entry(size=None, sha1=None):
+    path = ui._REPO_ROOT / HERO
+    return {
+        "sha1": sha1 or hashlib.sha1(path.read_bytes()).hexdigest(),
+        "bytes": path.stat().st_size if size is None else size,
+        "variants": {"webp": {"480": "img/hero.480.aa.webp", "1200": "img/hero.1200.bb.webp", "800": "img/hero.800.cc.webp"}},
+    }
+
+
+def test_built_image_resolves_to_static_url(manifest):
+    manifest[HERO] = _entry()
+    version = manifest[HERO]["sha1"][:10]
+    assert ui.img_src(HERO) == f"{ui.ASSET_BASE_URL}/img/hero.1200.bb.webp?v={version}"
+    assert ui.img_srcset(HERO).split(", ") == [
+        f"{ui.ASSET_BASE_URL}/img/hero.480.aa.webp?v={version} 480w",
+        f"{ui.ASSET_BASE_URL}/img/hero.800.cc.webp?v={version} 800w",
+        f"{ui.ASSET_BASE_URL}/img/hero.1200.bb.webp?v={version} 1200w",
+    ]
+
+
+def test_unbuilt_or_changed_image_falls_back_to_base64(manifest):
+    assert ui.img_src(HERO).startswith("data:image/png;base64,")
+    assert ui.img_srcset(HERO) == ""
+
+    ui.img_src.cache_clear()
+    manifest[HERO] = _entry(size=1)  # Source edited since the last build
+    assert ui.img_src(HERO).startswith("data:image/png;base64,")
+
+    ui.img_src.cache_clear()
+    manifest[HERO] = _entry(sha1="0" * 40)  # Same size, different content
+    assert ui.img_src(HERO).startswith("data:image/png;base64,")
+
+
+def test_missing_image(manifest):
+    assert ui.img_src("assets/images/does_not_exist.png") == ""
+    assert ui.safe_img_src("assets/images/does_not_exist.png") is None
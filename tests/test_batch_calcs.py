@@ -0,0 +1,86 @@
+"""
+Tests for the vectorized batch cost-scenario engine
+(products/cost_planner_v2/batch_calcs.py).
+
+The batch engine must reproduce the scalar calculators in comparison_calcs
+line for line, so each test prices the same scenario both ways.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from products.cost_planner_v2 import comparison_calcs
+from products.cost_planner_v2.batch_calcs import (
+    CARE_TYPES,
+    compute_scenario_batch,
+    price_household_grid,
+)
+
+FLAG_SETS = [
+    [],
+    ["memory_support"],
+    ["mobility_limited", "falls_risk", "chronic_conditions"],
+    ["memory_support", "mobility_limited", "adl_support_high", "medication_management",
+     "behavioral_concerns", "falls_risk", "chronic_conditions", "unrelated_flag"],
+]
+ZIPS = [None, "98101", "10001", "14620", "55555"]
+
+
+def _scalar(care_type, zip_code, hours, override, keep_home, flags, monkeypatch):
+    monkeypatch.setattr(comparison_calcs, "get_active_flags", lambda: list(flags))
+    if care_type == "in_home_care":
+        return comparison_calcs.calculate_inhome_scenario(zip_code, hours, override)
+    return comparison_calcs.calculate_facility_scenario(care_type, zip_code, keep_home, override)
+
+
+def _assert_same(batch_bd, scalar_bd):
+    assert batch_bd.care_type == scalar_bd.care_type
+    assert batch_bd.location_label == scalar_bd.location_label
+    assert batch_bd.monthly_total == scalar_bd.monthly_total
+    assert batch_bd.annual_total == scalar_bd.annual_total
+    assert batch_bd.three_year_total == scalar_bd.three_year_total
+    assert [line.label for line in batch_bd.lines] == [line.label for line in scalar_bd.lines]
+    assert [line.applied for line in batch_bd.lines] == [line.applied for line in scalar_bd.lines]
+    np.testing.assert_allclose(
+        [line.value for line in batch_bd.lines], [line.value for line in scalar_bd.lines], rtol=1e-12
+    )
+
+
+def test_batch_matches_scalar_calculators(monkeypatch):
+    rows = list(itertools.product(CARE_TYPES, ZIPS, [4.0, 8.0], [None, 3200.0], [False, True], range(len(FLAG_SETS))))
+    batch = compute_scenario_batch(
+        care_types=[r[0] for r in rows],
+        zip_codes=[r[1] for r in rows],
+        hours_per_day=[r[2] for r in rows],
+        home_carry_overrides=[r[3] for r in rows],
+        keep_home=[r[4] for r in rows],
+        flags=[FLAG_SETS[r[5]] for r in rows],
+    )
+    assert len(batch) == len(rows)
+    for i, (care, zip_code, hours, override, keep, f) in enumerate(rows):
+        _assert_same(batch.breakdown(i), _scalar(care, zip_code, hours, override, keep, FLAG_SETS[f], monkeypatch))
+
+
+def test_scalars_broadcast_and_shared_flags():
+    batch = compute_scenario_batch(["assisted_living", "memory_care"], "98101", flags=["falls_risk"])
+    assert batch.modifier_pct[:, 5].tolist() == [0.08, 0.06]
+    assert batch.location_labels == [batch.location_labels[0]] * 2
+
+
+def test_unknown_care_type_and_length_mismatch():
+    with pytest.raises(ValueError):
+        compute_scenario_batch(["spa"])
+    with pytest.raises(ValueError):
+        compute_scenario_batch(["assisted_living", "memory_care"], zip_codes=["98101"])
+
+
+def test_household_grid():
+    keys, batch = price_household_grid("98101", hours_options=(4.0, 8.0))
+    # 3 facility types × keep-home on/off + 2 in-home hour bands
+    assert len(keys) == len(batch) == 8
+    records = batch.to_records()
+    by_key = {(k["care_type"], k["keep_home"], k["hours_per_day"]): r["monthly_total"] for k, r in zip(keys, records, strict=True)}
+    assert by_key[("assisted_living", True, 0.0)] > by_key[("assisted_living", False, 0.0)]
+    assert by_key[("in_home_care", True, 8.0)] > by_key[("in_home_care", True, 4.0)]
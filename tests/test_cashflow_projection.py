@@ -0,0 +1,150 @@
+"""
+Tests for the month-by-month cash-flow projection engine
+(products/cost_planner_v2/cashflow_projection.py).
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from products.cost_planner_v2 import cashflow_projection
+from products.cost_planner_v2.cashflow_projection import (
+    AssetSleeve,
+    ProjectionAssumptions,
+    build_sleeves,
+    project_profile_runway,
+    project_runway,
+)
+from products.cost_planner_v2.expert_formulas import (
+    calculate_asset_breakdown,
+    calculate_extended_runway,
+)
+from products.cost_planner_v2.financial_profile import FinancialProfile
+
+FLAT = ProjectionAssumptions(care_inflation=0.0, income_cola=0.0)
+
+
+def _sleeve(name, balance, delay=0, mu=0.0, vol=0.0):
+    return AssetSleeve(name, float(balance), delay, mu, vol)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cashflow_projection.clear_projection_cache()
+    yield
+    cashflow_projection.clear_projection_cache()
+
+
+class TestDeterministic:
+    def test_flat_matches_straight_line(self):
+        profile = FinancialProfile(checking_savings=60000, investment_accounts=40000)
+        categories = calculate_asset_breakdown(profile)
+        selected = {"liquid_assets": True}
+        sleeves = build_sleeves(categories, selected, ["liquid_assets"], FLAT)
+        # Zero out the default liquid return so only the draw-down remains
+        sleeves = tuple(_sleeve(s.name, s.balance) for s in sleeves)
+
+        result = project_runway(5000, 2000, sleeves, FLAT)
+        expected = calculate_extended_runway(3000, selected, categories)
+        assert result.runway_months[0] == pytest.approx(expected)
+        assert not result.sustained[0]
+
+    def test_inflation_shortens_runway(self):
+        sleeves = (_sleeve("liquid_assets", 300000),)
+        flat = project_runway(6000, 2000, sleeves, FLAT).runway_months[0]
+        inflated = project_runway(6000, 2000, sleeves, ProjectionAssumptions(income_cola=0.0)).runway_months[0]
+        assert flat == pytest.approx(75.0)
+        assert inflated < flat
+
+    def test_tier_progression_and_income_change(self):
+        sleeves = (_sleeve("liquid_assets", 120000),)
+        base = project_runway(5000, 3000, sleeves, FLAT).runway_months[0]
+        stepped = ProjectionAssumptions(care_inflation=0.0, income_cola=0.0, tier_progression=((12, 1.5),))
+        income_drop = ProjectionAssumptions(care_inflation=0.0, income_cola=0.0, income_changes=((12, -1000.0),))
+        assert base == pytest.approx(60.0)
+        # 12 months at 2000/month, then 4500/month
+        assert project_runway(5000, 3000, sleeves, stepped).runway_months[0] == pytest.approx(12 + 96000 / 4500)
+        assert project_runway(5000, 3000, sleeves, income_drop).runway_months[0] == pytest.approx(12 + 96000 / 3000)
+
+    def test_funding_order_and_liquidation_delay(self):
+        # The delayed sleeve is not available for the first 5 months, so the
+        # small liquid sleeve runs dry and the runway ends early.
+        sleeves = (_sleeve("liquid_assets", 5000), _sleeve("home_equity", 500000, delay=5))
+        result = project_runway(4000, 1000, sleeves, FLAT)
+        assert result.runway_months[0] == pytest.approx(5000 / 3000)
+        assert result.depletion_months[0, 0] <= 2
+
+        ordered = (_sleeve("liquid_assets", 30000), _sleeve("home_equity", 500000, delay=5))
+        result = project_runway(4000, 1000, ordered, FLAT)
+        assert result.runway_months[0] == pytest.approx(530000 / 3000)
+        assert list(result.sleeve_names) == ["liquid_assets", "home_equity"]
+
+    def test_surplus_is_sustained_to_horizon(self):
+        result = project_runway(3000, 4000, (_sleeve("liquid_assets", 10000),), FLAT)
+        assert result.sustained[0]
+        assert result.runway_months[0] == 360
+        assert result.year_end_balances[0, -1] == pytest.approx(10000)
+
+    def test_untouched_sleeve_keeps_growing(self):
+        sleeves = (_sleeve("liquid_assets", 100000), _sleeve("home_equity", 100000, mu=0.05))
+        result = project_runway(2000, 1000, sleeves, ProjectionAssumptions(
+            care_inflation=0.0, income_cola=0.0, horizon_months=18
+        ))
+        assert result.year_end_balances[0, 0] == pytest.approx(88000 + 105000)
+        assert result.year_end_balances[0, 1] == pytest.approx(82000 + 100000 * 1.05 ** 1.5)
+
+    def test_build_sleeves_follows_funding_order(self):
+        profile = FinancialProfile(
+            checking_savings=50000, retirement_accounts_total=200000, other_real_estate=150000
+        )
+        categories = calculate_asset_breakdown(profile)
+        selected = dict.fromkeys(categories, True)
+        sleeves = build_sleeves(categories, selected, ["retirement_accounts", "liquid_assets"])
+        names = [s.name for s in sleeves]
+        assert names[:2] == ["retirement_accounts", "liquid_assets"]
+        assert set(names) == set(categories)
+        assert {s.name: s.delay_months for s in sleeves}["other_real_estate"] == 5
+
+
+class TestMonteCarlo:
+    ASSUMPTIONS = ProjectionAssumptions(n_paths=10_000, care_inflation_volatility=0.02, seed=7)
+    SLEEVES = (
+        _sleeve("liquid_assets", 150000, mu=0.02, vol=0.03),
+        _sleeve("retirement_accounts", 250000, delay=2, mu=0.05, vol=0.12),
+        _sleeve("home_equity", 350000, delay=5, mu=0.03, vol=0.05),
+    )
+
+    def test_bands_are_ordered_and_reproducible(self):
+        result = project_runway(7000, 2500, self.SLEEVES, self.ASSUMPTIONS)
+        bands = result.bands()
+        assert result.n_paths == 10_000
+        assert bands["low"] < bands["median"] < bands["high"]
+        assert result.balance_bands().shape == (3, 30)
+
+        cashflow_projection.clear_projection_cache()
+        again = project_runway(7000, 2500, self.SLEEVES, self.ASSUMPTIONS)
+        np.testing.assert_array_equal(result.runway_months, again.runway_months)
+
+    def test_cached_per_input_hash(self):
+        first = project_runway(7000, 2500, self.SLEEVES, self.ASSUMPTIONS)
+        assert project_runway(7000, 2500, self.SLEEVES, self.ASSUMPTIONS) is first
+        assert project_runway(7000, 2600, self.SLEEVES, self.ASSUMPTIONS) is not first
+        with pytest.raises(ValueError):
+            first.runway_months[0] = 0.0
+
+    def test_ten_thousand_paths_fast(self):
+        project_runway(7000, 2500, self.SLEEVES, ProjectionAssumptions(n_paths=10, seed=1))
+        start = time.perf_counter()
+        project_runway(7000, 2500, self.SLEEVES, self.ASSUMPTIONS)
+        # Generous bound for shared CI runners
+        assert time.perf_counter() - start < 0.5
+
+
+def test_project_profile_runway():
+    profile = FinancialProfile(
+        total_monthly_income=3000, checking_savings=80000, retirement_accounts_total=120000
+    )
+    result = project_profile_runway(profile, 6000, assumptions=FLAT)
+    assert 0 < result.runway_months[0] < 360
+    assert result.sleeve_names[0] == "liquid_assets"
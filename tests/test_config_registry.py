@@ -0,0 +1,126 @@
+"""
+Tests for the shared JSON config registry (core/config_registry.py).
+"""
+
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from core import config_registry
+from core.config_registry import ConfigError, ConfigRegistry, FrozenDict, get_config, thaw
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+    # Bump mtime explicitly: two writes can land in the same timestamp tick
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ConfigRegistry(root=tmp_path, reload_interval=0)
+
+
+def test_file_is_parsed_once(registry, tmp_path):
+    _write(tmp_path / "a.json", {"x": [1, 2]})
+    first = registry.get("a.json")
+    assert registry.get(tmp_path / "a.json") is first
+    assert registry.report()[0]["loads"] == 1
+
+
+def test_configs_are_read_only(registry, tmp_path):
+    _write(tmp_path / "a.json", {"x": [1, 2], "y": {"z": 1}})
+    data = registry.get("a.json")
+    assert isinstance(data, dict) and isinstance(data["x"], list)
+    with pytest.raises(TypeError):
+        data["new"] = 1
+    with pytest.raises(TypeError):
+        data["x"].append(3)
+    with pytest.raises(TypeError):
+        data["y"].update(z=2)
+
+    mutable = copy.deepcopy(data)
+    mutable["x"].append(3)
+    assert type(mutable) is dict and data["x"] == [1, 2]
+    assert thaw(data) == {"x": [1, 2], "y": {"z": 1}}
+    assert type(pickle.loads(pickle.dumps(data))) is dict
+    assert json.loads(json.dumps(data)) == data
+
+
+def test_changed_file_is_reloaded(registry, tmp_path):
+    path = tmp_path / "a.json"
+    _write(path, {"v": 1})
+    assert registry.get("a.json")["v"] == 1
+    _write(path, {"v": 2, "extra": True})
+    assert registry.get("a.json")["v"] == 2
+    assert registry.report()[0]["loads"] == 2
+
+
+def test_reload_interval_throttles_stat(tmp_path):
+    registry = ConfigRegistry(root=tmp_path, reload_interval=3600)
+    path = tmp_path / "a.json"
+    _write(path, {"v": 1})
+    registry.get("a.json")
+    _write(path, {"v": 2})
+    assert registry.get("a.json")["v"] == 1
+
+
+def test_invalid_reload_keeps_previous_version(registry, tmp_path):
+    path = tmp_path / "a.json"
+    _write(path, {"v": 1})
+    first = registry.get("a.json")
+    path.write_text("{not json")
+    assert registry.get("a.json") is first
+    path.unlink()
+    assert registry.get("a.json") is first
+
+
+def test_missing_or_invalid_first_load_raises(registry, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        registry.get("missing.json")
+    (tmp_path / "bad.json").write_text("{not json")
+    with pytest.raises(json.JSONDecodeError):
+        registry.get("bad.json")
+
+
+def test_schema_validation(registry, tmp_path):
+    (tmp_path / "config").mkdir()
+    _write(tmp_path / "config" / "nav.json", {"groups": [{"label": "Main", "items": [{"key": "home"}]}]})
+    with pytest.raises(ConfigError, match="items\\[0\\] is missing label, module"):
+        registry.get("config/nav.json")
+
+    _write(tmp_path / "config" / "partners.json", [{"id": "p1", "unlock_requires": "gcp:complete"}])
+    with pytest.raises(ConfigError, match="unlock_requires must be list"):
+        registry.get("config/partners.json")
+
+
+def test_report_and_warm(registry, tmp_path):
+    (tmp_path / "config" / "sub").mkdir(parents=True)
+    (tmp_path / "products" / "p" / "modules" / "m").mkdir(parents=True)
+    _write(tmp_path / "config" / "a.json", {"x": 1})
+    _write(tmp_path / "config" / "sub" / "b.json", [1, 2, 3])
+    _write(tmp_path / "products" / "p" / "modules" / "m" / "module.json", {"module": {"id": "m"}})
+    (tmp_path / "config" / "broken.json").write_text("{")
+
+    assert registry.warm() == 3
+    rows = registry.report()
+    assert {r["path"] for r in rows} == {"config/a.json", "config/sub/b.json", "products/p/modules/m/module.json"}
+    for row in rows:
+        assert row["load_ms"] >= 0 and row["file_bytes"] > 0 and row["memory_bytes"] > 0
+
+
+def test_warmup_flag_off(monkeypatch):
+    monkeypatch.setenv("FEATURE_CONFIG_WARMUP", "off")
+    monkeypatch.setattr(config_registry.REGISTRY, "warm", lambda: pytest.fail("warmed with the flag off"))
+    assert config_registry.warm_configs(background=False) is None
+
+
+def test_repo_configs_validate():
+    nav = get_config("nav.json")
+    assert isinstance(nav, FrozenDict)
+    assert get_config("nav.json") is nav
+    assert ConfigRegistry(reload_interval=0).warm() == len(ConfigRegistry().discover())
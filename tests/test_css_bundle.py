@@ -0,0 +1,64 @@
+"""Tests for the CSS bundle manager (core/css_bundle.py)."""
+
+import pytest
+
+from core import css_bundle
+from core.css_bundle import build_bundle, minify_css
+
+
+def test_minify_keeps_strings_combinators_and_calc():
+    css = """/* header */
+    a :hover , b > c {
+        width: calc(1px + 2px) ;
+        content: "x ; /* kept */ }";
+    }
+    @media (max-width: 600px) { .x { color: red; } }
+    """
+    assert minify_css(css) == (
+        'a :hover,b>c{width:calc(1px + 2px);content:"x ; /* kept */ }"}'
+        "@media (max-width:600px){.x{color:red}}"
+    )
+
+
+def test_bundle_file_is_content_hashed(tmp_path, monkeypatch):
+    monkeypatch.setattr(css_bundle, "OUTPUT_DIR", tmp_path)
+    first = build_bundle("hubs", ".a{color:red}", prune=True)
+    assert first.url.endswith(f"css/hubs.{first.digest}.css")
+    assert (tmp_path / f"hubs.{first.digest}.css").read_text() == ".a{color:red}"
+    assert build_bundle("hubs", ".a{color:red}").digest == first.digest
+
+    second = build_bundle("hubs", ".a{color:blue}", prune=True)
+    assert second.digest != first.digest
+    assert [p.name for p in tmp_path.iterdir()] == [f"hubs.{second.digest}.css"]
+
+
+def test_named_bundles_build(tmp_path, monkeypatch):
+    monkeypatch.setattr(css_bundle, "OUTPUT_DIR", tmp_path)
+    css_bundle.get_bundle.cache_clear()
+    try:
+        hubs, pills = css_bundle.build_bundles()
+    finally:
+        css_bundle.get_bundle.cache_clear()
+    assert ".dashboard-card{" in hubs.css and "/*" not in hubs.css
+    assert 'div[role="radiogroup"]' in pills.css
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"hubs.{hubs.digest}.css", f"pills.{pills.digest}.css"]
+    with pytest.raises(KeyError):
+        css_bundle.get_bundle("nope")
+
+
+def test_inject_once_per_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(css_bundle, "OUTPUT_DIR", tmp_path)
+    session = {}
+    injected = []
+    monkeypatch.setattr(css_bundle.st, "session_state", session)
+    monkeypatch.setattr(css_bundle, "_components_html", lambda: lambda body, **_kwargs: injected.append(body))
+
+    bundle = build_bundle("pills", ".p{color:red}")
+    css_bundle.inject_css_once(bundle, element_id="cca-pill-css")
+    css_bundle.inject_css_once(bundle, element_id="cca-pill-css")
+    assert len(injected) == 1
+    assert '"cca-pill-css"' in injected[0] and bundle.url in injected[0]
+
+    changed = build_bundle("pills", ".p{color:blue}")
+    css_bundle.inject_css_once(changed, element_id="cca-pill-css")
+    assert len(injected) == 2
@@ -0,0 +1,98 @@
+"""
+Tests for the headless GCP/hours evaluation core
+(products/gcp_v4/modules/care_recommendation/evaluation.py,
+ai.hours_engine.compute_weighted_hours) and tools/batch_eval.py.
+"""
+
+import contextlib
+import io
+import json
+import random
+import subprocess
+import sys
+
+from ai.hours_engine import calculate_baseline_hours_with_value, compute_weighted_hours
+from ai.hours_schemas import HoursContext
+from ai.hours_weights import BADL_TIME_WEIGHTS, IADL_TIME_WEIGHTS
+from products.gcp_v4.modules.care_recommendation.evaluation import evaluate_gcp
+from products.gcp_v4.modules.care_recommendation.scoring_tables import get_scoring_model
+from tools import batch_eval
+
+
+def _quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def test_evaluate_gcp_matches_derive_outcome():
+    import streamlit as st
+
+    from products.gcp_v4.modules.care_recommendation import logic
+
+    spec = get_scoring_model().spec
+    rng = random.Random(36)
+    for _ in range(25):
+        answers = batch_eval.synthetic_answers(spec, rng)
+        st.session_state.clear()
+        outcome = _quiet(logic.derive_outcome, dict(answers))
+        assert evaluate_gcp(answers).tier == outcome["tier"]
+
+
+def test_evaluation_core_does_not_import_streamlit():
+    code = (
+        "import sys\n"
+        "from products.gcp_v4.modules.care_recommendation.evaluation import evaluate_gcp, evaluate_hours\n"
+        "evaluate_hours({'badls': ['bathing']})\n"
+        "print('streamlit' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_weighted_hours_parity_and_silent(capsys):
+    rng = random.Random(37)
+    badls, iadls = list(BADL_TIME_WEIGHTS), list(IADL_TIME_WEIGHTS)
+    for _ in range(200):
+        b = rng.sample(badls, rng.randint(0, 12))
+        i = rng.sample(iadls, rng.randint(0, len(iadls)))
+        context = HoursContext(
+            badls_count=len(b),
+            iadls_count=len(i),
+            badls_list=b,
+            iadls_list=i,
+            cognitive_level=rng.choice(["none", "mild", "moderate", "severe"]),
+            falls=rng.choice(["none", "once", "multiple"]),
+            mobility=rng.choice(["independent", "walker", "wheelchair"]),
+            overnight_needed=rng.random() < 0.2,
+            wandering=rng.random() < 0.3,
+        )
+        capsys.readouterr()
+        result = compute_weighted_hours(context)
+        assert capsys.readouterr().out == ""
+        assert _quiet(calculate_baseline_hours_with_value, context) == (result.band, result.hours)
+
+
+def test_batch_replay_reports_regressions(tmp_path):
+    answers = batch_eval.synthetic_answers(get_scoring_model().spec, random.Random(1))
+    tier = evaluate_gcp(answers).tier
+    gcp = tmp_path / "gcp.jsonl"
+    gcp.write_text(
+        json.dumps({"id": "a", "det_tier": tier, "answers": answers}) + "\n"
+        + json.dumps({"id": "b", "det_tier": "not_a_tier", "gcp_context": {"answers": answers}}) + "\n"
+        + "{broken\n"
+    )
+    hours = tmp_path / "hours.jsonl"
+    hours.write_text(
+        json.dumps({"badls_count": 1, "iadls_count": 0, "base_band": "1-3h"}) + "\n"
+        + json.dumps({"badls_list": ["toileting"], "iadls_list": [], "base_band": "4-8h"}) + "\n"
+    )
+
+    gcp_report = _quiet(batch_eval.replay_gcp, gcp, workers=1, chunk_size=1, behavior_gate=False)
+    assert (gcp_report["cases"], gcp_report["matches"], gcp_report["malformed"]) == (2, 1, 1)
+    assert gcp_report["regression_examples"][0]["id"] == "b"
+
+    hours_report = _quiet(batch_eval.replay_hours, hours, workers=1, chunk_size=10)
+    assert (hours_report["cases"], hours_report["not_replayable"], hours_report["regressions"]) == (1, 1, 0)
+
+    assert _quiet(batch_eval.main, ["--gcp-cases", str(gcp), "--hours-cases", str(hours),
+                                    "--workers", "1", "--json", "--fail-on-regression"]) == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the compiled GCP scoring tables
+(products/gcp_v4/modules/care_recommendation/scoring_tables.py).
+
+The compiled lookups must reproduce the linear module.json walk in
+logic._calculate_score / logic._extract_flags_from_answers exactly.
+"""
+
+import json
+import os
+import random
+
+import pytest
+
+from products.gcp_v4.modules.care_recommendation import logic, scoring_tables
+from products.gcp_v4.modules.care_recommendation.scoring_tables import (
+    compile_spec,
+    flags_for_answers,
+    get_scoring_model,
+    score_answers,
+)
+
+
+def _random_answers(spec, rng):
+    answers = {}
+    for section in spec["sections"]:
+        for question in section.get("questions", []):
+            values = [o["value"] for o in question.get("options", [])]
+            roll = rng.random()
+            if roll < 0.15 or not values:
+                continue
+            if roll < 0.2:
+                answers[question["id"]] = ""
+            elif question.get("select") == "multi":
+                answers[question["id"]] = rng.sample(values, rng.randint(0, len(values)))
+            else:
+                answers[question["id"]] = rng.choice(values + ["not_an_option"])
+    answers["unrelated_key"] = "x"
+    return answers
+
+
+class TestParity:
+    def test_score_matches_linear_walk(self):
+        model = get_scoring_model()
+        rng = random.Random(35)
+        for _ in range(200):
+            answers = _random_answers(model.spec, rng)
+            assert score_answers(answers, model) == logic._calculate_score(answers, model.spec)
+
+    def test_flags_match_linear_walk(self):
+        model = get_scoring_model()
+        rng = random.Random(36)
+        for _ in range(200):
+            answers = _random_answers(model.spec, rng)
+            expected = logic._extract_flags_from_answers(answers, model.spec)
+            assert sorted(flags_for_answers(answers, model)) == sorted(expected)
+
+    def test_duplicate_values_and_multi_select_order(self):
+        spec = {
+            "sections": [
+                {"id": "intro", "type": "info"},
+                {
+                    "id": "s1",
+                    "questions": [
+                        {
+                            "id": "q",
+                            "required": True,
+                            "options": [
+                                {"value": "a", "score": 1, "label": "A"},
+                                {"value": "b", "score": 2, "label": "B"},
+                                {"value": "a", "score": 9, "label": "A again"},
+                            ],
+                        }
+                    ],
+                },
+            ]
+        }
+        model = compile_spec(spec)
+        for answers in ({"q": "a"}, {"q": ["b", "a", "a"]}, {"q": None}, {}):
+            assert score_answers(answers, model) == logic._calculate_score(answers, spec)
+        assert model.section_ids == ("s1",)
+
+
+class TestReload:
+    def test_shared_with_module_config(self):
+        from products.gcp_v4.modules.care_recommendation.config import _load_module_json
+
+        assert _load_module_json() is get_scoring_model().spec
+        assert logic._load_module_json() is get_scoring_model().spec
+
+    def test_recompiles_only_on_content_change(self, tmp_path, monkeypatch):
+        path = tmp_path / "module.json"
+        spec = {"sections": [{"id": "s", "questions": [
+            {"id": "q", "required": True, "options": [{"value": "a", "score": 1}]}
+        ]}]}
+        path.write_text(json.dumps(spec))
+        monkeypatch.setattr(scoring_tables, "MODULE_JSON", path)
+        monkeypatch.setattr(scoring_tables, "_MODEL", None)
+        monkeypatch.setattr(scoring_tables, "_STAMP", None)
+
+        first = get_scoring_model()
+        assert get_scoring_model() is first
+
+        # Touch without changing content: same compiled model
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert get_scoring_model() is first
+
+        spec["sections"][0]["questions"][0]["options"][0]["score"] = 4
+        path.write_text(json.dumps(spec))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        reloaded = get_scoring_model()
+        assert reloaded is not first
+        assert score_answers({"q": "a"})[0] == pytest.approx(4.0)
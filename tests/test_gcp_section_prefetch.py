@@ -0,0 +1,137 @@
+"""
+Tests for speculative GCP section advice
+(products/gcp_v4/modules/care_recommendation/section_prefetch.py).
+
+The LLM call is replaced by a fake generator so the tests exercise the
+future bookkeeping (reuse, stale cancellation, pickup) without network.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from products.gcp_v4.modules.care_recommendation import section_prefetch
+from products.gcp_v4.modules.care_recommendation.section_prefetch import (
+    SectionAdvicePrefetcher,
+    answers_hash,
+    required_answers_present,
+)
+
+
+class _FakeGenerator:
+    def __init__(self, gate: threading.Event | None = None):
+        self.gate = gate
+        self.calls = []
+
+    def __call__(self, context, section_id, mode, allowed_tiers):
+        data = context if isinstance(context, dict) else context.model_dump()
+        self.calls.append((section_id, data))
+        if self.gate is not None:
+            self.gate.wait(5)
+        return (True, {"section": section_id, **data})
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    gen = _FakeGenerator()
+    monkeypatch.setattr(section_prefetch, "_generate", gen)
+    return gen
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class TestRequiredAnswers:
+    def test_about_you_requires_all_required_fields(self):
+        answers = {"age_range": "75_84", "living_situation": "alone"}
+        assert not required_answers_present("about_you", answers)
+        answers["isolation"] = "somewhat"
+        assert required_answers_present("about_you", answers)
+
+    def test_unknown_or_info_section(self):
+        assert not required_answers_present("intro", {})
+        assert not required_answers_present("nope", {})
+
+    def test_hash_ignores_tier_order(self):
+        ctx = {"mobility": "walker"}
+        assert answers_hash("s", ctx, ["b", "a"]) == answers_hash("s", ctx, ["a", "b"])
+        assert answers_hash("s", ctx) != answers_hash("s", {"mobility": "cane"})
+
+
+class TestPrefetcher:
+    def test_unchanged_answers_reuse_future(self, fake, executor):
+        pf = SectionAdvicePrefetcher(executor)
+        pf.prefetch("about_you", {"age": 1}, "shadow")
+        pf.prefetch("about_you", {"age": 1}, "shadow")
+        assert pf.submitted == 1
+
+    def test_collect_picks_up_prefetched_result(self, fake, executor):
+        pf = SectionAdvicePrefetcher(executor)
+        pf.prefetch("about_you", {"age": 1}, "shadow")
+        ok, advice = pf.collect("about_you", {"age": 1}, "shadow")
+        assert ok and advice["age"] == 1
+        assert len(fake.calls) == 1
+        assert pf.hits == 1
+        assert pf.pending() == {}
+
+    def test_changed_answers_cancel_stale_future(self, monkeypatch, executor):
+        gate = threading.Event()
+        gen = _FakeGenerator(gate)
+        monkeypatch.setattr(section_prefetch, "_generate", gen)
+        pf = SectionAdvicePrefetcher(executor)
+
+        pf.prefetch("about_you", {"age": 1}, "shadow")  # occupies the only worker
+        pf.prefetch("daily_living", {"help": "some"}, "shadow")  # queued
+        pf.prefetch("daily_living", {"help": "lots"}, "shadow")  # replaces queued one
+        assert pf.cancelled == 1
+
+        gate.set()
+        ok, advice = pf.collect("daily_living", {"help": "lots"}, "shadow")
+        assert ok and advice["help"] == "lots"
+        assert [c[0] for c in gen.calls] == ["about_you", "daily_living"]
+
+    def test_collect_with_changed_answers_generates_fresh(self, fake, executor):
+        pf = SectionAdvicePrefetcher(executor)
+        pf.prefetch("about_you", {"age": 1}, "shadow")
+        ok, advice = pf.collect("about_you", {"age": 2}, "shadow")
+        assert ok and advice["age"] == 2
+        assert pf.misses == 1
+
+    def test_collect_without_prefetch_is_synchronous(self, fake):
+        pf = SectionAdvicePrefetcher()
+        assert pf.collect("about_you", {"age": 3}, "shadow")[1]["age"] == 3
+        assert pf.submitted == 0
+
+    def test_cancel_all(self, monkeypatch, executor):
+        gate = threading.Event()
+        monkeypatch.setattr(section_prefetch, "_generate", _FakeGenerator(gate))
+        pf = SectionAdvicePrefetcher(executor)
+        pf.prefetch("about_you", {"age": 1}, "shadow")
+        pf.prefetch("daily_living", {"help": "some"}, "shadow")
+        pf.cancel_all()
+        gate.set()
+        assert pf.pending() == {}
+        assert pf.cancelled == 1  # the running one cannot be interrupted
+
+
+def test_logic_prefetch_then_compute_uses_one_call(monkeypatch, fake):
+    import ai.llm_client
+    from products.gcp_v4.modules.care_recommendation import logic
+
+    pf = SectionAdvicePrefetcher()
+    monkeypatch.setattr(ai.llm_client, "get_feature_gcp_mode", lambda: "shadow")
+    monkeypatch.setattr(section_prefetch, "get_section_prefetcher", lambda: pf)
+
+    answers = {"age_range": "75_84", "living_situation": "alone"}
+    assert not logic.prefetch_section_feedback(answers, "about_you")  # isolation missing
+    answers["isolation"] = "somewhat"
+    assert logic.prefetch_section_feedback(answers, "about_you")
+
+    logic.compute_section_feedback(answers, "about_you")
+    assert len(fake.calls) == 1
+    assert pf.hits == 1
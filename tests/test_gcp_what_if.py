@@ -0,0 +1,89 @@
+"""
+Tests for the GCP what-if explorer
+(products/gcp_v4/modules/care_recommendation/what_if.py).
+
+Every reported change must reproduce a full evaluate_gcp()/evaluate_hours()
+run on the edited answers.
+"""
+
+import random
+import time
+
+from products.gcp_v4.modules.care_recommendation.evaluation import evaluate_gcp, evaluate_hours
+from products.gcp_v4.modules.care_recommendation.scoring_tables import get_scoring_model
+from products.gcp_v4.modules.care_recommendation.what_if import _apply, explore_what_if
+from tools.batch_eval import synthetic_answers
+
+ANSWERS = {
+    "age_range": "85_plus",
+    "living_situation": "alone",
+    "isolation": "accessible",
+    "meds_complexity": "simple",
+    "mobility": "walker",
+    "falls": "one",
+    "chronic_conditions": ["diabetes"],
+    "memory_changes": "moderate",
+    "mood": "good",
+    "behaviors": [],
+    "help_overall": "some_help",
+    "badls": ["bathing"],
+    "iadls": ["meal_prep", "housekeeping"],
+    "hours_per_day": "1-3h",
+    "primary_support": "family",
+}
+
+
+def _check_outcomes(answers, report):
+    for outcome in report.outcomes:
+        changed = _apply(answers, outcome.edits)
+        assert evaluate_gcp(changed).tier == outcome.tier
+        assert evaluate_hours(changed)[0] == outcome.hours_band
+        assert outcome.flips_tier or outcome.flips_hours
+
+
+def test_baseline_matches_full_evaluation():
+    report = explore_what_if(ANSWERS)
+    assert report.baseline_tier == evaluate_gcp(ANSWERS).tier
+    assert report.baseline_hours_band == evaluate_hours(ANSWERS)[0]
+    assert report.evaluated > 20
+
+
+def test_reported_changes_reproduce_full_evaluation():
+    spec = get_scoring_model().spec
+    rng = random.Random(38)
+    for _ in range(10):
+        answers = synthetic_answers(spec, rng)
+        _check_outcomes(answers, explore_what_if(answers, pairs=True))
+
+
+def _keys(edits):
+    return {(e.question_id, e.description) for e in edits}
+
+
+def test_pairs_are_minimal():
+    report = explore_what_if(ANSWERS, pairs=True)
+    single_tier = {k for o in report.outcomes if len(o.edits) == 1 and o.flips_tier for k in _keys(o.edits)}
+    single_hours = {k for o in report.outcomes if len(o.edits) == 1 and o.flips_hours for k in _keys(o.edits)}
+    assert any(len(o.edits) == 2 for o in report.outcomes)
+    for outcome in report.outcomes:
+        if len(outcome.edits) == 2:
+            assert outcome.edits[0].question_id != outcome.edits[1].question_id
+            if outcome.flips_tier:
+                assert not _keys(outcome.edits) & single_tier
+            if outcome.flips_hours:
+                assert not _keys(outcome.edits) & single_hours
+
+
+def test_hidden_questions_are_not_edited():
+    answers = dict(ANSWERS, memory_changes="none")
+    edited = {e.question_id for o in explore_what_if(answers).outcomes for e in o.edits}
+    assert "behaviors" not in edited
+    assert "cognitive_dx_confirm" not in edited
+
+
+def test_single_changes_fast():
+    explore_what_if(ANSWERS)
+    start = time.perf_counter()
+    explore_what_if(ANSWERS)
+    # Generous bound for shared CI runners (target is well under 50 ms)
+    assert time.perf_counter() - start < 0.25
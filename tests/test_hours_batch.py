@@ -0,0 +1,86 @@
+"""
+Tests for the columnar weighted-hours calculator (ai/hours_batch.py).
+
+The batch path must reproduce hours_engine.compute_weighted_hours() exactly,
+hours and bands, including after the weight tables are tuned.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ai import hours_weights
+from ai.hours_batch import (
+    BANDS,
+    HoursBatch,
+    bands_for_hours,
+    compute_weighted_hours_batch,
+    weighted_hours_batch,
+)
+from ai.hours_engine import compute_weighted_hours, hours_to_band
+from ai.hours_schemas import HoursContext
+
+BEHAVIORS = ["wandering", "aggression", "sundowning", "repetitive_questions", "elopement",
+             "confusion", "judgment", "hoarding", "sleep"]
+
+
+def _random_contexts(n, seed):
+    rng = random.Random(seed)
+    badls = list(hours_weights.BADL_TIME_WEIGHTS) + ["stairs", "Bath"]
+    iadls = list(hours_weights.IADL_TIME_WEIGHTS) + ["pet_care"]
+    contexts = []
+    for _ in range(n):
+        b = [rng.choice(badls) for _ in range(rng.randint(0, 8))]
+        i = [rng.choice(iadls) for _ in range(rng.randint(0, 8))]
+        fields = {name: rng.random() < 0.25 for name in BEHAVIORS}
+        contexts.append(HoursContext(
+            badls_count=len(b),
+            iadls_count=len(i),
+            badls_list=b,
+            iadls_list=i,
+            cognitive_level=rng.choice(["none", "mild", "moderate", "severe", "advanced", None]),
+            falls=rng.choice(["none", "once", "multiple", "frequent", None]),
+            mobility=rng.choice(["independent", "cane", "walker", "wheelchair", "bedbound", None]),
+            overnight_needed=rng.random() < 0.15,
+            meds_complexity=rng.choice(["none", "simple", "moderate", "complex", None]),
+            primary_support=rng.choice(["none", "family", None]),
+            **fields,
+        ))
+    return contexts
+
+
+def _assert_parity(contexts, result):
+    expected = [compute_weighted_hours(c) for c in contexts]
+    assert result.hours.tolist() == [r.hours for r in expected]
+    assert result.bands == [r.band for r in expected]
+    assert [BANDS[i] for i in result.calculated_band_index] == [r.calculated_band for r in expected]
+
+
+def test_matches_scalar_path():
+    contexts = _random_contexts(3000, seed=37)
+    _assert_parity(contexts, weighted_hours_batch(contexts))
+
+
+def test_rebands_existing_batch_after_weight_tuning(monkeypatch):
+    contexts = _random_contexts(500, seed=38)
+    batch = HoursBatch.from_contexts(contexts)
+    before = compute_weighted_hours_batch(batch)
+
+    monkeypatch.setitem(hours_weights.BADL_TIME_WEIGHTS, "toileting", 3.0)
+    monkeypatch.setitem(hours_weights.FALL_RISK_MULTIPLIERS, "once", 1.2)
+    after = compute_weighted_hours_batch(batch)
+    assert not np.array_equal(before.hours, after.hours)
+    _assert_parity(contexts, after)
+
+
+def test_dict_rows_and_empty_batch():
+    row = {"badls_count": 1, "iadls_count": 0, "badls_list": ["toileting"], "iadls_list": []}
+    result = weighted_hours_batch([row])
+    assert result.bands == [compute_weighted_hours(HoursContext(**row)).band]
+    assert weighted_hours_batch([]).bands == []
+
+
+@pytest.mark.parametrize("hours", [0.0, 0.99, 1.0, 3.99, 4.0, 9.99, 10.0, 19.99, 20.0, 30.0])
+def test_band_edges(hours):
+    assert BANDS[int(bands_for_hours(np.array([hours]))[0])] == hours_to_band(hours)
@@ -0,0 +1,175 @@
+"""
+Tests for the async LLM client (ai/llm_async.py).
+
+Runs the real OpenAI async SDK against a local fake chat-completions server
+with injected latency, so coalescing, the concurrency limit, deadlines and
+the sync facade / fan_out are exercised without network access.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ai.llm_async import (
+    AsyncLLMClient,
+    SyncLLMFacade,
+    fan_out,
+    llm_deadline,
+    remaining_time,
+)
+
+
+class _FakeOpenAIServer:
+    """Minimal /v1/chat/completions server that echoes the user prompt."""
+
+    def __init__(self, latency: float = 0.2):
+        self.latency = latency
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server._lock:
+                    server.requests += 1
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                time.sleep(server.latency)
+                with server._lock:
+                    server.active -= 1
+                payload = json.dumps({
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": body["model"],
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "echo:" + body["messages"][-1]["content"]},
+                    }],
+                }).encode()
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+@pytest.fixture
+def server():
+    srv = _FakeOpenAIServer(latency=0.2)
+    yield srv
+    srv.close()
+
+
+def _client(server, **kwargs) -> AsyncLLMClient:
+    return AsyncLLMClient(api_key="test-key", base_url=server.base_url, max_retries=0, **kwargs)
+
+
+class TestAsyncLLMClient:
+    def test_completion_round_trip(self, server):
+        result = asyncio.run(_client(server).generate_completion("sys", "hello"))
+        assert result == "echo:hello"
+
+    def test_identical_inflight_requests_are_coalesced(self, server):
+        client = _client(server)
+
+        async def run():
+            return await asyncio.gather(*[client.generate_completion("sys", "same") for _ in range(5)])
+
+        assert asyncio.run(run()) == ["echo:same"] * 5
+        assert server.requests == 1
+
+    def test_concurrency_limit(self, server):
+        client = _client(server, max_concurrency=2)
+
+        async def run():
+            return await asyncio.gather(*[client.generate_completion("sys", f"q{i}") for i in range(6)])
+
+        asyncio.run(run())
+        assert server.requests == 6
+        assert server.max_active <= 2
+
+    def test_concurrency_limit_from_flag(self, server, monkeypatch):
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "3")
+        assert _client(server).max_concurrency == 3
+        monkeypatch.delenv("LLM_MAX_CONCURRENCY")
+        assert _client(server).max_concurrency == 4
+
+    def test_deadline_returns_none(self, server):
+        client = _client(server)
+
+        async def run():
+            with llm_deadline(0.05):
+                return await client.generate_completion("sys", "slow")
+
+        assert asyncio.run(run()) is None
+
+    def test_expired_deadline_skips_request(self, server):
+        client = _client(server)
+
+        async def run():
+            with llm_deadline(-1):
+                return await client.generate_completion("sys", "never")
+
+        assert asyncio.run(run()) is None
+        assert server.requests == 0
+
+
+class TestDeadlines:
+    def test_nested_deadline_only_tightens(self):
+        with llm_deadline(10):
+            with llm_deadline(60):
+                assert remaining_time() <= 10
+        assert remaining_time(default=None) is None
+
+
+class TestSyncFacade:
+    def test_fan_out_runs_call_sites_in_parallel(self, server):
+        facade = SyncLLMFacade(_client(server))
+        start = time.perf_counter()
+        results = fan_out({f"call{i}": (lambda i=i: facade.generate_completion("sys", f"p{i}")) for i in range(3)})
+        elapsed = time.perf_counter() - start
+
+        assert results == {f"call{i}": f"echo:p{i}" for i in range(3)}
+        assert elapsed < 3 * server.latency
+
+    def test_fan_out_coalesces_across_threads(self, server):
+        facade = SyncLLMFacade(_client(server))
+        results = fan_out({f"c{i}": (lambda: facade.generate_json("sys", "dup")) for i in range(4)})
+        assert set(results.values()) == {"echo:dup"}
+        assert server.requests == 1
+
+    def test_fan_out_deadline_marks_stragglers_none(self):
+        results = fan_out({"fast": lambda: "ok", "slow": lambda: time.sleep(0.5) or "late"}, timeout=0.1)
+        assert results == {"fast": "ok", "slow": None}
+
+    def test_fan_out_propagates_deadline(self):
+        seen = fan_out({"a": lambda: remaining_time()}, timeout=5)
+        assert 0 < seen["a"] <= 5
+
+    def test_fan_out_failure_is_none(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        assert fan_out({"x": boom}) == {"x": None}
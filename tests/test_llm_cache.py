@@ -0,0 +1,121 @@
+"""
+Tests for the prompt/response cache (ai/llm_cache.py) and its use by the
+GCP section advice engine.
+"""
+
+import json
+
+import pytest
+
+from ai import gcp_navi_engine
+from ai.gcp_schemas import GCPAdvice, GCPContext
+from ai.llm_cache import (
+    MemoryLRUBackend,
+    PromptCache,
+    SQLiteBackend,
+    TieredBackend,
+    canonical_json,
+    prompt_cache_key,
+    schema_fingerprint,
+)
+from ai.llm_client import FakeLLMClient
+
+
+class TestKeys:
+    def test_canonical_json_is_order_independent(self):
+        assert canonical_json({"b": 1, "a": {"y", "x"}}) == canonical_json({"a": {"x", "y"}, "b": 1})
+
+    def test_key_changes_with_each_component(self):
+        base = ("ns", "gpt-4o-mini", 0.2, "system", {"a": 1}, "s1")
+        key = prompt_cache_key(*base)
+        for i, changed in [(0, "other"), (1, "gpt-4o"), (2, 0.1), (3, "system2"), (4, {"a": 2}), (5, "s2")]:
+            variant = list(base)
+            variant[i] = changed
+            assert prompt_cache_key(*variant) != key
+
+    def test_high_temperature_not_cacheable(self):
+        assert prompt_cache_key("ns", "m", 0.7, "s", {}) is None
+
+    def test_schema_fingerprint_stable(self):
+        assert schema_fingerprint(GCPAdvice) == schema_fingerprint(GCPAdvice)
+
+
+class TestBackends:
+    def test_memory_lru_evicts_oldest(self):
+        mem = MemoryLRUBackend(max_entries=2)
+        mem.set("a", "1")
+        mem.set("b", "2")
+        mem.get("a")
+        mem.set("c", "3")
+        assert mem.get("b") is None
+        assert mem.get("a") == "1"
+
+    def test_sqlite_persists_and_evicts(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        db = SQLiteBackend(path, max_entries=2)
+        db.set("ns:s1:a", "1")
+        db.set("ns:s1:b", "2")
+        db.set("ns:s1:c", "3")
+        assert len(db) == 2
+        assert SQLiteBackend(path).get("ns:s1:c") == "3"
+
+    def test_sqlite_schema_change_drops_old_rows(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        SQLiteBackend(path).set("ns:old:a", "1")
+        fresh = SQLiteBackend(path)
+        fresh.set("ns:new:b", "2")
+        fresh.set("other:old:c", "3")
+        assert fresh.get("ns:old:a") is None
+        assert fresh.get("other:old:c") == "3"
+
+    def test_tiered_promotes_disk_hits(self, tmp_path):
+        disk = SQLiteBackend(tmp_path / "cache.sqlite3")
+        disk.set("ns:s:k", "v")
+        mem = MemoryLRUBackend()
+        assert TieredBackend(mem, disk).get("ns:s:k") == "v"
+        assert mem.get("ns:s:k") == "v"
+
+    def test_prompt_cache_ignores_none_key(self):
+        cache = PromptCache(MemoryLRUBackend())
+        cache.put(None, "x")
+        assert cache.get(None) is None
+
+
+@pytest.fixture
+def gcp_context():
+    return GCPContext(
+        age_range="75-84", living_situation="alone", has_partner=False,
+        meds_complexity="moderate", mobility="walker", falls="multiple",
+        badls=["bathing"], iadls=["meals"], memory_changes="mild", isolation="some",
+    )
+
+
+def test_section_advice_rerun_hits_cache(monkeypatch, gcp_context):
+    response = json.dumps({"tier": "in_home", "reasons": ["Walker use"], "confidence": 0.8})
+    fake = FakeLLMClient(response)
+    cache = PromptCache(MemoryLRUBackend())
+    monkeypatch.setattr(gcp_navi_engine, "get_sync_client", lambda: fake)
+    monkeypatch.setattr(gcp_navi_engine, "get_prompt_cache", lambda: cache)
+
+    first = gcp_navi_engine.generate_section_advice(gcp_context, "daily_living", mode="shadow")
+    second = gcp_navi_engine.generate_section_advice(gcp_context, "daily_living", mode="shadow")
+
+    assert first[0] and second[0]
+    assert second[1].tier == "in_home"
+    assert len(fake.calls) == 1
+    assert cache.hits == 1
+
+    # Different section -> different key -> new call
+    gcp_navi_engine.generate_section_advice(gcp_context, "health_safety", mode="shadow")
+    assert len(fake.calls) == 2
+
+
+def test_invalid_response_not_cached(monkeypatch, gcp_context):
+    fake = FakeLLMClient("not json")
+    cache = PromptCache(MemoryLRUBackend())
+    monkeypatch.setattr(gcp_navi_engine, "get_sync_client", lambda: fake)
+    monkeypatch.setattr(gcp_navi_engine, "get_prompt_cache", lambda: cache)
+
+    assert gcp_navi_engine.generate_section_advice(gcp_context, "daily_living", mode="shadow") == (False, None)
+    gcp_navi_engine.generate_section_advice(gcp_context, "daily_living", mode="shadow")
+    assert len(fake.calls) == 2
@@ -0,0 +1,160 @@
+"""
+Tests for streaming FAQ / corp answers (ai/llm_mediator.py).
+
+Uses FakeLLMClient so no network or API key is needed. Verifies that the
+incremental guardrails (banned phrases, word cap, HTML stripping, SOURCES
+trailer) give the same answer regardless of how the stream is chunked.
+"""
+
+import pytest
+
+from ai.llm_client import FakeLLMClient, LLMStreamError
+from ai.llm_mediator import StreamingAnswerGuard, stream_answer_corp, stream_answer_faq
+
+FAQS = [
+    {"id": "faq_al", "question": "What is assisted living?", "answer": "Assisted living is...",
+     "ctas": [{"label": "Compare costs", "route": "cost_planner"}]},
+    {"id": "faq_mc", "question": "What is memory care?", "answer": "Memory care is..."},
+]
+POLICY = {"banned_phrases": ["loved one"], "fallback_name": "your parent"}
+
+
+class _BrokenStreamClient(FakeLLMClient):
+    """Streams a few deltas, then fails like LLMClient does on a dropped connection."""
+
+    def stream_completion(self, system_prompt, user_prompt, max_tokens=None):
+        for i, delta in enumerate(super().stream_completion(system_prompt, user_prompt, max_tokens)):
+            if i == 3:
+                raise LLMStreamError("connection reset")
+            yield delta
+
+
+@pytest.fixture(autouse=True)
+def _no_answer_cache(monkeypatch):
+    monkeypatch.setenv("FAQ_ANSWER_CACHE", "off")
+
+
+def _guard_text(raw: str, chunk_size: int, **kwargs) -> tuple[str, str]:
+    guard = StreamingAnswerGuard(**kwargs)
+    out = "".join(guard.feed(raw[i:i + chunk_size]) for i in range(0, len(raw), chunk_size))
+    out += guard.finish()
+    return out.strip(), guard.trailer
+
+
+class TestStreamingAnswerGuard:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 13, 500])
+    def test_banned_phrase_replaced_across_chunk_boundaries(self, chunk_size):
+        raw = "We help your Loved One find care."
+        text, _ = _guard_text(raw, chunk_size, banned_phrases=["loved one"], fallback_name="your parent")
+        assert text == "We help your your parent find care."
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 500])
+    def test_html_stripped(self, chunk_size):
+        raw = '<div class="chat-bubble__content"><p>Costs <strong>vary</strong> &amp; change.</p>' \
+              '<a href="https://example.com/c">See costs</a></div>'
+        text, _ = _guard_text(raw, chunk_size)
+        assert "<" not in text
+        assert "Costs vary & change." in text
+        assert "[See costs](https://example.com/c)" in text
+
+    def test_word_cap(self):
+        raw = " ".join(f"w{i}" for i in range(200))
+        text, _ = _guard_text(raw, 7, max_words=120)
+        assert text.endswith("...")
+        assert len(text.removesuffix("...").split()) == 120
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 500])
+    def test_sources_trailer_hidden(self, chunk_size):
+        raw = "Memory care is specialized.\nSOURCES: faq_mc"
+        text, trailer = _guard_text(raw, chunk_size)
+        assert text == "Memory care is specialized."
+        assert trailer.strip() == "faq_mc"
+
+    def test_trailer_still_parsed_after_cap(self):
+        raw = " ".join(["word"] * 50) + "\nSOURCES: faq_al"
+        text, trailer = _guard_text(raw, 4, max_words=10)
+        assert text.endswith("...")
+        assert trailer.strip() == "faq_al"
+
+
+class TestStreamAnswerFaq:
+    def test_streams_incrementally_and_sets_result(self):
+        client = FakeLLMClient(
+            "Assisted living helps your loved one with daily tasks.\nSOURCES: faq_al, faq_xx",
+            chunk_size=3,
+        )
+        stream = stream_answer_faq("what is assisted living", None, FAQS, POLICY, client=client)
+        parts = list(stream)
+
+        assert len(parts) > 1
+        assert "".join(parts).strip() == stream.result["answer"]
+        assert stream.result["answer"] == "Assisted living helps your your parent with daily tasks."
+        assert stream.result["sources"] == ["faq_al"]  # unknown IDs dropped
+        assert stream.result["cta"]["route"] == "cost_planner"
+
+    def test_empty_stream_falls_back(self):
+        stream = stream_answer_faq("q", None, FAQS, POLICY, client=FakeLLMClient(""))
+        parts = list(stream)
+        assert parts == [stream.result["answer"]]
+        assert stream.result["sources"] == []
+
+    def test_cache_hit_yields_cached_answer(self, monkeypatch, tmp_path):
+        from ai import answer_cache
+
+        monkeypatch.setenv("FAQ_ANSWER_CACHE", "on")
+        cache = answer_cache.AnswerCache(path=tmp_path / "c.json")
+        monkeypatch.setattr(answer_cache, "get_answer_cache", lambda: cache)
+
+        client = FakeLLMClient("Assisted living helps.\nSOURCES: faq_al")
+        first = stream_answer_faq("What is assisted living?", None, FAQS, POLICY, client=client)
+        list(first)
+        second = stream_answer_faq("what is assisted living", None, FAQS, POLICY, client=client)
+        assert list(second) == ["Assisted living helps."]
+        assert len(client.calls) == 1
+
+    def test_truncated_stream_is_not_cached(self, monkeypatch, tmp_path):
+        from ai import answer_cache
+
+        monkeypatch.setenv("FAQ_ANSWER_CACHE", "on")
+        cache = answer_cache.AnswerCache(path=tmp_path / "c.json")
+        monkeypatch.setattr(answer_cache, "get_answer_cache", lambda: cache)
+
+        text = "Assisted living helps with daily tasks.\nSOURCES: faq_al"
+        broken = _BrokenStreamClient(text)
+        first = stream_answer_faq("What is assisted living?", None, FAQS, POLICY, client=broken)
+        list(first)
+        assert first.result["answer"] == "Assisted liv"  # Shown as far as it got
+        assert len(cache) == 0
+
+        client = FakeLLMClient(text)
+        second = stream_answer_faq("What is assisted living?", None, FAQS, POLICY, client=client)
+        list(second)
+        assert second.result["answer"] == "Assisted living helps with daily tasks."
+        assert len(client.calls) == 1 and len(cache) == 1
+
+    def test_stream_and_blocking_answers_cached_separately(self, monkeypatch, tmp_path):
+        from ai import answer_cache, llm_mediator
+
+        monkeypatch.setenv("FAQ_ANSWER_CACHE", "on")
+        cache = answer_cache.AnswerCache(path=tmp_path / "c.json")
+        monkeypatch.setattr(answer_cache, "get_answer_cache", lambda: cache)
+        monkeypatch.setattr(llm_mediator, "get_client", lambda: None)
+
+        client = FakeLLMClient("Assisted living helps.\nSOURCES: faq_al")
+        list(stream_answer_faq("What is assisted living?", None, FAQS, POLICY, client=client))
+        blocking = llm_mediator.answer_faq("What is assisted living?", None, FAQS, POLICY)
+        assert blocking["answer"] != "Assisted living helps."
+        assert len(cache) == 1
+
+
+class TestStreamAnswerCorp:
+    def test_chunk_numbers_map_to_sources(self):
+        chunks = [
+            {"doc_id": "d1", "title": "About CCA", "url": "https://cca.example/about"},
+            {"doc_id": "d2", "title": "Leadership", "url": "https://cca.example/team"},
+        ]
+        client = FakeLLMClient("CCA was founded in 2004.\nSOURCES: 2, 2, 7", chunk_size=5)
+        stream = stream_answer_corp("who is cca", None, chunks, POLICY, client=client)
+        list(stream)
+        assert stream.result["answer"] == "CCA was founded in 2004."
+        assert stream.result["sources"] == [{"title": "Leadership", "url": "https://cca.example/team"}]
@@ -0,0 +1,142 @@
+"""
+Tests for dependency-tracked module evaluation (core/modules/dependencies.py).
+
+Memoized step results must match a fresh computation and be invalidated by
+exactly the answer edits that touch their inputs.
+"""
+
+import gc
+
+from core.modules import dependencies
+from core.modules.dependencies import (
+    dependency_graph,
+    effects_current,
+    fingerprint,
+    outcome_fingerprint,
+    record_effects,
+    required_fields,
+)
+from core.modules.schema import FieldDef, ModuleConfig, StepDef
+
+
+def _config():
+    return ModuleConfig(
+        product="demo",
+        version="v1",
+        state_key="demo_module",
+        steps=[
+            StepDef(id="intro", title="Intro", show_progress=False),
+            StepDef(
+                id="daily",
+                title="Daily living",
+                fields=[
+                    FieldDef(key="help", label="Help", type="string", required=True),
+                    FieldDef(
+                        key="adls",
+                        label="ADLs",
+                        type="string",
+                        required=True,
+                        visible_if={"key": "help", "in": ["some", "lots"]},
+                    ),
+                    FieldDef(key="notes", label="Notes", type="string"),
+                ],
+            ),
+            StepDef(
+                id="safety",
+                title="Safety",
+                fields=[
+                    FieldDef(
+                        key="falls",
+                        label="Falls",
+                        type="string",
+                        write_key="fall_history",
+                        required=True,
+                        effects=[{"when_value_in": ["multiple"], "set_flag": "fall_risk"}],
+                    ),
+                ],
+            ),
+            StepDef(id="results", title="Results", show_progress=False),
+        ],
+        results_step_id="results",
+    )
+
+
+def _required(step, state):
+    calls.append(step.id)
+    return [f for f in step.fields if f.required and (f.visible_if is None or state.get("help") in ("some", "lots"))]
+
+
+calls: list[str] = []
+
+
+def test_graph_records_step_and_outcome_inputs():
+    config = _config()
+    graph = dependency_graph(config)
+    assert graph is dependency_graph(config)
+    assert graph.progress_steps == ("daily", "safety")
+    assert graph.steps["daily"].required == {"help", "adls"}
+    assert graph.steps["safety"].effects == {"fall_history"}
+    assert {"help", "adls", "notes", "fall_history", "flags"} <= graph.outcome
+    assert "progress" not in graph.outcome and "status" not in graph.outcome
+    assert graph.affected_by(["help"]) == {"daily", "outcome"}
+    assert graph.affected_by(["notes"]) == {"outcome"}
+
+
+def test_graphs_do_not_outlive_their_config():
+    before = len(dependencies._GRAPHS)
+    for _ in range(50):
+        dependency_graph(_config())
+    gc.collect()
+    assert len(dependencies._GRAPHS) == before
+
+
+def test_trivia_config_is_reused_across_reruns():
+    from products.senior_trivia.product import _load_module_config
+
+    assert _load_module_config("truths_myths") is _load_module_config("truths_myths")
+
+
+def test_fingerprint_distinguishes_missing_from_none():
+    assert fingerprint({}, {"a"}) != fingerprint({"a": None}, {"a"})
+    assert fingerprint({"a": [1, 2], "b": 1}, {"a"}) == fingerprint({"a": [1, 2], "b": 2}, {"a"})
+
+
+def test_required_fields_recomputed_only_for_relevant_edits():
+    config = _config()
+    step = config.steps[1]
+    memo: dict = {}
+    calls.clear()
+    state = {"help": "none"}
+    assert [f.key for f in required_fields(config, step, state, memo, _required)] == ["help"]
+    state["notes"] = "edited"
+    state["progress"] = 50.0
+    required_fields(config, step, state, memo, _required)
+    assert calls == ["daily"]
+    state["help"] = "some"
+    assert [f.key for f in required_fields(config, step, state, memo, _required)] == ["help", "adls"]
+    assert calls == ["daily", "daily"]
+
+
+def test_effects_skip_until_inputs_or_flags_change():
+    config = _config()
+    step = config.steps[2]
+    memo: dict = {}
+    state = {"fall_history": "multiple", "flags": {}}
+    assert not effects_current(config, step, state, memo)
+    state["flags"]["fall_risk"] = True
+    record_effects(config, step, state, memo, {})
+    assert effects_current(config, step, state, memo)
+    state["flags"].clear()
+    assert not effects_current(config, step, state, memo)
+    state["flags"]["fall_risk"] = True
+    state["fall_history"] = "none"
+    assert not effects_current(config, step, state, memo)
+
+
+def test_outcome_fingerprint_tracks_answers_and_context():
+    config = _config()
+    state = {"help": "some", "adls": ["bathing"], "progress": 10.0}
+    base = outcome_fingerprint(config, state, {"config": config, "geo": "WA"})
+    assert outcome_fingerprint(config, dict(state, progress=90.0, status="done"), {"config": config, "geo": "WA"}) == base
+    assert outcome_fingerprint(config, dict(state, adls=[]), {"config": config, "geo": "WA"}) != base
+    assert outcome_fingerprint(config, state, {"config": config, "geo": "OR"}) != base
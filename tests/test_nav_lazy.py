@@ -0,0 +1,46 @@
+"""Tests for lazy route loading in core.nav.load_nav."""
+
+import sys
+
+from core import nav
+
+GUEST = {"auth": {"role": "guest", "is_authenticated": False}, "flags": {}}
+
+
+def test_load_nav_does_not_import_routes(monkeypatch):
+    imported = []
+    monkeypatch.setattr(nav, "_import_callable", lambda path: imported.append(path) or (lambda: path))
+    pages = nav.load_nav(GUEST)
+    assert pages and imported == []
+    assert pages["welcome"]["module"] == "pages.welcome:render"
+    assert pages["welcome"]["render"]() == "pages.welcome:render"
+    assert imported == ["pages.welcome:render"]
+
+
+def test_nav_config_parsed_once():
+    assert nav._nav_config() is nav._nav_config()
+    assert nav.load_nav(GUEST)["welcome"]["render"] is nav.load_nav(GUEST)["welcome"]["render"]
+
+
+def test_likely_next_routes_are_visible_pages():
+    pages = nav.load_nav(GUEST)
+    routes = nav.likely_next_routes("welcome", pages)
+    assert routes[0] == "hub_lobby"
+    assert "welcome" not in routes
+    assert all(key in pages and not pages[key]["hidden"] for key in routes[1:])
+
+
+def test_warm_routes_imports_in_background(monkeypatch):
+    monkeypatch.setattr(nav, "_WARMED", set())
+    pages = {"stub": {"module": "tests._nav_warm_stub:render"}}
+    sys.modules.pop("tests._nav_warm_stub", None)
+    imported = []
+    monkeypatch.setattr(nav, "_import_callable", imported.append)
+    thread = nav.warm_routes(pages, ["stub", "missing"])
+    thread.join(timeout=5)
+    assert imported == ["tests._nav_warm_stub:render"]
+    assert nav.warm_routes(pages, ["stub"]) is None
+
+    monkeypatch.setattr(nav, "_WARMED", set())
+    monkeypatch.setenv("FEATURE_NAV_WARMUP", "off")
+    assert nav.warm_routes(pages, ["stub"]) is None
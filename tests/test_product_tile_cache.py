@@ -0,0 +1,116 @@
+"""
+Tests for compiled unlock requirements and the tile render cache
+(core/product_tile.py).
+"""
+
+import pytest
+
+from core import product_tile
+from core.product_tile import (
+    ProductTileHub,
+    compile_requirement,
+    tile_cache_stats,
+    tile_requirements_satisfied,
+)
+
+STATE = {
+    "gcp": {"progress": 100, "care_tier": "Assisted_Living", "flags": {"fall_risk": True}},
+    "cost": {"progress": 40},
+    "pfma": {"appointment": "scheduled"},
+    "auth": {"is_authenticated": True},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    product_tile.clear_tile_cache()
+    monkeypatch.setenv("FEATURE_TILE_RENDER_CACHE", "on")
+    monkeypatch.setattr(product_tile, "_session_uid", lambda: "uid-1")
+    yield
+    product_tile.clear_tile_cache()
+
+
+@pytest.mark.parametrize(
+    ("req", "expected"),
+    [
+        ("cost:>=40", True),
+        ("cost: >= 50", False),
+        ("cost:>=abc", False),
+        ("pfma:scheduled", True),
+        ("care_tier:assisted_living", True),
+        ("care_tier:memory_care", False),
+        ("flag:memory_support|fall_risk", True),
+        ("flag:memory_support", False),
+        ("flag:|", False),
+        ("auth:required", True),
+        ("auth:optional", False),
+        ("unknown:thing", False),
+        ("no-colon", False),
+    ],
+)
+def test_compiled_requirements(req, expected):
+    assert compile_requirement(req)(STATE) is expected
+    assert product_tile._evaluate_requirement(req, STATE) is expected
+
+
+def test_requirements_compiled_once():
+    assert compile_requirement("cost:>=40") is compile_requirement("cost:>=40")
+    assert tile_requirements_satisfied(["cost:>=40", "auth:required"], STATE)
+    assert not tile_requirements_satisfied(["cost:>=40", "cost:>=90"], STATE)
+    assert tile_requirements_satisfied(None, STATE)
+
+
+def _tile(**overrides):
+    kwargs = {
+        "key": "cost",
+        "title": "Cost Planner",
+        "primary_route": "?page=cost",
+        "progress": 40,
+        "phase": "planning",
+    }
+    return ProductTileHub(**{**kwargs, **overrides})
+
+
+def test_unchanged_tile_reuses_html(monkeypatch):
+    events = []
+    monkeypatch.setattr(product_tile, "log_event", lambda name, _data=None: events.append(name))
+
+    first = _tile().render_html()
+    again = _tile().render_html()
+    assert again == first
+    assert "uid=uid-1" in first
+    assert tile_cache_stats()["hits"] == 1
+    assert events == ["tile.rendered"]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [{"progress": 100}, {"locked": True}, {"phase": "engagement"}, {"is_next_step": True}],
+)
+def test_state_change_rebuilds_html(change):
+    before = _tile().render_html()
+    after = _tile(**change).render_html()
+    assert after != before
+    assert tile_cache_stats()["misses"] == 2
+
+
+def test_uid_is_part_of_the_key(monkeypatch):
+    first = _tile().render_html()
+    monkeypatch.setattr(product_tile, "_session_uid", lambda: "uid-2")
+    second = _tile().render_html()
+    assert "uid=uid-2" in second and second != first
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(product_tile, "TILE_RENDER_CACHE_MAX", 3)
+    for i in range(5):
+        _tile(progress=i).render_html()
+    assert tile_cache_stats()["size"] == 3
+
+
+def test_flag_off_bypasses_cache(monkeypatch):
+    monkeypatch.setenv("FEATURE_TILE_RENDER_CACHE", "off")
+    _tile().render_html()
+    _tile().render_html()
+    stats = tile_cache_stats()
+    assert stats["hits"] == stats["misses"] == 0
@@ -0,0 +1,87 @@
+"""
+Tests for the compiled regional multiplier resolver
+(products/cost_planner_v2/utils/regional_data.py).
+"""
+
+import json
+import os
+
+import pytest
+
+from products.cost_planner_v2.utils.regional_data import RegionalDataProvider
+from products.cost_planner_v2.utils.zip3_states import build_zip3_state_table
+
+CONFIG = {
+    "zip_multipliers": {
+        "default": 1.0,
+        "by_zip_wa": [{"zip": "98101", "multiplier": 1.15, "notes": "Seattle"}],
+        "by_zip3_wa": [{"zip3": "981", "multiplier": 1.12, "notes": "Seattle Core"}],
+        "by_state_wa": [{"state": "WA", "multiplier": 1.1}],
+        "by_zip": [
+            {"zip": "98101", "multiplier": 9.9, "notes": "ignored (WA wins)"},
+            {"zip": "10001", "multiplier": 1.4, "notes": "Manhattan"},
+        ],
+        "by_zip3": [{"zip3": "100", "multiplier": 1.35, "notes": "NYC core"}],
+        "by_state": [{"state": "NY", "multiplier": 1.2}, {"state": "TX", "multiplier": 0.95}],
+    }
+}
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    path = tmp_path / "regional_cost_config.json"
+    path.write_text(json.dumps(CONFIG))
+    monkeypatch.setattr(RegionalDataProvider, "_config_path", str(path))
+    monkeypatch.setattr(RegionalDataProvider, "_config", None)
+    monkeypatch.setattr(RegionalDataProvider, "_resolver", None)
+    monkeypatch.setattr(RegionalDataProvider, "_next_reload_check", 0.0)
+    return path
+
+
+class TestResolution:
+    def test_exact_zip_wa_precedence(self, provider):
+        result = RegionalDataProvider.get_multiplier("98101")
+        assert (result.multiplier, result.precision, result.confidence) == (1.15, "zip", 1.0)
+
+    def test_zip3(self, provider):
+        result = RegionalDataProvider.get_multiplier("98199")
+        assert (result.multiplier, result.precision) == (1.12, "zip3")
+
+    def test_state_inferred_from_zip(self, provider):
+        # 146xx is upstate NY: no ZIP/ZIP3 entry, NY state multiplier applies
+        result = RegionalDataProvider.get_multiplier("14620")
+        assert (result.multiplier, result.precision) == (1.2, "state")
+        # WA prefix without a ZIP3 entry
+        assert RegionalDataProvider.get_multiplier("99201").multiplier == 1.1
+
+    def test_explicit_state_beats_inferred_state(self, provider):
+        assert RegionalDataProvider.get_multiplier("14620", state="tx").multiplier == 0.95
+        # ...but not a configured ZIP3 match
+        assert RegionalDataProvider.get_multiplier("10010", state="TX").multiplier == 1.35
+
+    def test_national_fallback(self, provider):
+        for zip_code in (None, "", "ab", "09012"):  # 090 = military
+            result = RegionalDataProvider.get_multiplier(zip_code)
+            assert (result.multiplier, result.precision) == (1.0, "national")
+
+    def test_hot_reload_on_mtime_change(self, provider):
+        assert RegionalDataProvider.get_multiplier("10001").multiplier == 1.4
+
+        config = json.loads(json.dumps(CONFIG))
+        config["zip_multipliers"]["by_zip"][1]["multiplier"] = 1.5
+        provider.write_text(json.dumps(config))
+        stat = provider.stat()
+        os.utime(provider, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        RegionalDataProvider._next_reload_check = 0.0
+
+        assert RegionalDataProvider.get_multiplier("10001").multiplier == 1.5
+
+
+def test_zip3_state_table():
+    table = build_zip3_state_table()
+    assert len(table) == 1000
+    assert table[981] == "WA"
+    assert table[100] == "NY"
+    assert table[55] == "MA"  # carved out of VT range
+    assert table[733] == "TX"  # carved out of OK range
+    assert table[90] is None
@@ -0,0 +1,153 @@
+"""
+Tests for compiled additional-services rules (core/service_rules.py).
+
+Compiled unlock requirements and visible_when rules must give the
+documented results, and the evaluator must only re-test services whose
+inputs changed.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core import additional_services as services
+from core import config_registry
+from core.service_rules import RuleEvaluator, RuleSet, compile_rule, compile_service, compile_unlock
+
+
+def _check(predicate, ctx):
+    return predicate({i.name: i.extract(ctx) for i in predicate.inputs})
+
+
+@pytest.mark.parametrize(
+    ("req", "ctx", "expected"),
+    [
+        ("gcp:complete", {"progress": {"gcp": 100}}, True),
+        ("gcp:complete", {"progress": {"gcp": 99}}, False),
+        ("gcp:complete", {}, False),
+        ("gcp:>=50", {"progress": {"gcp": 50}}, True),
+        ("gcp:>=50", {"progress": {"gcp": 40}}, False),
+        ("gcp:>=half", {"progress": {"gcp": 100}}, False),
+        ("flag:fall_risk", {"flags": {"fall_risk": True}}, True),
+        ("flag:fall_risk", {"flags": {"fall_risk": False}}, False),
+        ("flag:no_support | geo_isolated", {"flags": {"geo_isolated": True}}, True),
+        ("flag:no_support | geo_isolated", {"flags": {}}, False),
+        ("cost:complete", {"progress": {"cost": 100}}, False),
+    ],
+)
+def test_unlock_requirements(req, ctx, expected):
+    assert _check(compile_unlock(req), ctx) is expected
+
+
+PROFILE = SimpleNamespace(gap_amount=800, runway_months=30)
+
+
+@pytest.mark.parametrize(
+    ("rule", "ctx", "expected"),
+    [
+        ({}, {}, True),
+        ({"equals": {"path": "role", "value": "advisor"}}, {"role": "advisor"}, True),
+        ({"equals": {"path": "role", "value": "advisor"}}, {"role": "family"}, False),
+        ({"exists": {"path": "gcp.care_tier"}}, {"gcp": {"care_tier": "assisted_living"}}, True),
+        ({"exists": {"path": "gcp.care_tier"}}, {"gcp": {}}, False),
+        ({"includes": {"path": "flags", "value": "falls_multiple"}}, {"flags": {"falls_multiple": True}}, True),
+        ({"includes": {"path": "flags", "value": "falls_multiple"}}, {"flags": {}}, False),
+        ({"includes": {"path": "gcp.tags", "value": "memory"}}, {"gcp": {"tags": ["memory"]}}, True),
+        ({"includes": {"path": "gcp.tags", "value": "memory"}}, {"gcp": {"tags": "memory"}}, False),
+        ({"min_progress": {"path": "cost.progress", "value": 50}}, {"cost": {"progress": 50}}, True),
+        ({"min_progress": {"path": "cost.progress", "value": 50}}, {"cost": {"progress": "n/a"}}, False),
+        ({"role_in": ["consumer", "family"]}, {"role": "family"}, True),
+        ({"role_in": ["consumer", "family"]}, {"role": "advisor"}, False),
+        ({"cost_gap": {"value": 500}}, {"mcip": {"financial_profile": PROFILE}}, True),
+        ({"cost_gap": {"value": 1000}}, {"mcip": {"financial_profile": PROFILE}}, False),
+        ({"cost_gap": {"value": 500}}, {"mcip": {"financial_profile": None}}, False),
+        ({"runway_low": {"value": 36}}, {"mcip": {"financial_profile": PROFILE}}, True),
+        ({"runway_low": {"value": 24}}, {"mcip": {"financial_profile": PROFILE}}, False),
+        ({"unknown_rule": {}}, {}, False),
+    ],
+)
+def test_visible_when_rules(rule, ctx, expected):
+    assert _check(compile_rule(rule), ctx) is expected
+
+
+def test_every_registry_rule_is_understood():
+    for tile in services.REGISTRY:
+        for rule in tile.get("visible_when", []):
+            assert compile_rule(rule).inputs, (tile["key"], rule)
+
+
+def test_visibility_and_personalization():
+    care = {"includes": {"path": "flags", "value": "falls_multiple"}}
+    other = {"includes": {"path": "flags", "value": "medicaid_likely"}}
+    rules = RuleSet.build(
+        [
+            compile_service("care", visible_when=[care, other]),
+            compile_service("cost", visible_when=[{"cost_gap": {"value": 500}}]),
+            compile_service("utility", visible_when=[{"min_progress": {"path": "progress.gcp", "value": 0}}]),
+            compile_service("locked", unlock_requires=["gcp:complete"], visible_when=[care]),
+            compile_service("always"),
+        ]
+    )
+    ctx = {
+        "flags": {"medicaid_likely": True},
+        "progress": {"gcp": 50},
+        "mcip": {"financial_profile": PROFILE},
+    }
+    assert RuleEvaluator(rules).evaluate(ctx) == {
+        "care": (True, False),  # Visible through a non-care flag only
+        "cost": (True, True),
+        "utility": (True, False),
+        "locked": (False, False),
+        "always": (True, False),
+    }
+
+    ctx["flags"]["falls_multiple"] = True
+    ctx["progress"]["gcp"] = 100
+    results = RuleEvaluator(rules).evaluate(ctx)
+    assert results["care"] == (True, True)
+    assert results["locked"] == (True, True)
+
+
+def test_only_affected_services_are_retested():
+    rules = RuleSet.build(
+        [
+            compile_service("a", visible_when=[{"includes": {"path": "flags", "value": "x"}}]),
+            compile_service("b", visible_when=[{"includes": {"path": "flags", "value": "y"}}]),
+            compile_service("c", unlock_requires=["gcp:complete"]),
+            compile_service("d"),
+        ]
+    )
+    evaluator = RuleEvaluator(rules)
+    ctx = {"flags": {"x": True}, "progress": {"gcp": 0}}
+    assert evaluator.evaluate(ctx) == {
+        "a": (True, False),
+        "b": (False, False),
+        "c": (False, False),
+        "d": (True, False),
+    }
+
+    evaluator.evaluate(ctx)
+    assert evaluator.last_evaluated == set()
+
+    ctx["flags"]["y"] = True  # In-place edit, as session state is usually mutated
+    assert evaluator.evaluate(ctx)["b"] == (True, False)
+    assert evaluator.last_evaluated == {"b"}
+
+    ctx["progress"]["gcp"] = 100
+    assert evaluator.evaluate(ctx)["c"] == (True, False)
+    assert evaluator.last_evaluated == {"c"}
+
+
+def test_partners_file_parsed_once(tmp_path, monkeypatch):
+    path = tmp_path / "partners.json"
+    path.write_text(json.dumps([{"id": "one", "unlock_requires": ["gcp:complete"]}]))
+    monkeypatch.setattr(services, "PARTNERS_FILE", path)
+    monkeypatch.setattr(config_registry.REGISTRY, "reload_interval", 0)
+
+    first = services._load_partners()
+    assert services._load_partners() is first
+    assert services._rule_set(first) is services._rule_set(first)
+
+    path.write_text(json.dumps([{"id": "one"}, {"id": "two"}]))
+    assert [p["id"] for p in services._load_partners()] == ["one", "two"]
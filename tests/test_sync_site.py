@@ -0,0 +1,250 @@
+"""
+Tests for the concurrent, incremental site crawler (tools/sync_site.py) and
+the incremental corp index build (tools/build_corp_index.py), against a
+local HTTP fixture site.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tools import build_corp_index, sync_site
+
+PARAGRAPH = (
+    "Our advisors help families compare assisted living, memory care and in-home care options "
+    "with a clear view of costs, availability and quality so that every decision feels informed. "
+)
+
+
+def _page(title, body_words):
+    paragraphs = "".join(f"<p>{PARAGRAPH}{body_words} {i}.</p>" for i in range(3))
+    return f"<html><head><title>{title}</title></head><body><h2>{title}</h2>{paragraphs}</body></html>"
+
+
+class _FixtureSite:
+    """Sitemap, robots.txt and HTML pages with ETag / Last-Modified support."""
+
+    def __init__(self, latency=0.0):
+        self.pages = {}
+        self.latency = latency
+        self.etags = True
+        self.log = []  # (path, status, time)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", headers=None):
+                with site._lock:
+                    site.log.append((self.path, status, time.monotonic()))
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/robots.txt":
+                    return self._send(200, b"User-agent: *\nDisallow: /private\n")
+                if self.path == "/sitemap.xml":
+                    locs = "".join(f"<url><loc>{site.url(p)}</loc></url>" for p in [*site.pages, "/private"])
+                    xml = f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locs}</urlset>'
+                    return self._send(200, xml.encode())
+                if self.path not in site.pages:
+                    return self._send(404)
+
+                with site._lock:
+                    site.active += 1
+                    site.max_active = max(site.max_active, site.active)
+                time.sleep(site.latency)
+                with site._lock:
+                    site.active -= 1
+
+                body = site.pages[self.path].encode()
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                headers = {"Content-Type": "text/html", "Last-Modified": formatdate(0, usegmt=True)}
+                if site.etags:
+                    headers["ETag"] = etag
+                    if self.headers.get("If-None-Match") == etag:
+                        return self._send(304, headers=headers)
+                self._send(200, body, headers)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.root = f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return self.root.rstrip("/") + path
+
+    def page_requests(self):
+        return [(path, status) for path, status, _ in self.log if path in self.pages]
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+@pytest.fixture
+def site():
+    srv = _FixtureSite()
+    srv.pages = {f"/page-{i}": _page(f"Page {i}", f"topic {i}") for i in range(6)}
+    yield srv
+    srv.close()
+
+
+def _policy(site, rate=1000):
+    return {
+        "root": site.root,
+        "use_sitemap": True,
+        "allow": [r"^http://127\.0\.0\.1:\d+/.*$"],
+        "exclude": [],
+        "max_pages": 50,
+        "rate_limit_per_sec": rate,
+        "max_bytes_per_page": 300000,
+        "min_text_chars": 200,
+        "respect_robots": True,
+    }
+
+
+def _run(site, existing, state, workers=4):
+    results, stats = sync_site.crawl(_policy(site), sync_site.usable_state(state, existing), workers=workers)
+    chunks = sync_site.merge_chunks(existing, results, site.root)
+    counts = {}
+    for chunk in chunks:
+        counts[chunk["url"]] = counts.get(chunk["url"], 0) + 1
+    new_state = {r.url: r.state(counts.get(r.url, 0)) for r in results if r.content_hash}
+    return chunks, stats, new_state
+
+
+def test_crawl_extracts_pages_and_honours_robots(site):
+    chunks, stats, _ = _run(site, [], {})
+    assert stats["total_urls"] == 6 and stats["new"] == 6 and stats["failed"] == 0
+    assert {c["url"] for c in chunks} == {site.url(p) for p in site.pages}
+    assert all(c["doc_id"].startswith("page-") and c["type"] == "blog" for c in chunks)
+    assert not any("/private" in path for path, _, _ in site.log)
+
+
+def test_incremental_run_only_re_extracts_changed_pages(site):
+    other = {"id": "va_1", "url": "https://www.va.gov/x", "source": "va.gov", "text": "VA benefits"}
+    chunks, _, state = _run(site, [other], {})
+    assert chunks[-1] == other
+
+    site.pages["/page-2"] = _page("Page 2", "updated wording")
+    site.pages["/page-6"] = _page("Page 6", "brand new")
+    del site.pages["/page-5"]
+    site.log.clear()
+
+    updated, stats, state = _run(site, chunks, state)
+    assert (stats["new"], stats["changed"], stats["unchanged"]) == (1, 1, 4)
+    # Conditional GETs: unchanged pages answered 304 and kept their previous chunks
+    assert sorted(status for _, status in site.page_requests()) == [200, 200, 304, 304, 304, 304]
+    unchanged = [c for c in chunks if c["url"] == site.url("/page-0")]
+    assert [c for c in updated if c["url"] == site.url("/page-0")] == unchanged
+    assert any("updated wording" in c["text"] for c in updated)
+    assert not any(c["url"] == site.url("/page-5") for c in updated)
+    assert updated[-1] == other
+
+
+def test_same_content_without_etag_is_not_re_extracted(site, monkeypatch):
+    site.etags = False
+    chunks, _, state = _run(site, [], {})
+    calls = []
+    monkeypatch.setattr(sync_site, "extract_text_sections", lambda *a: calls.append(a) or [])
+    again, stats, _ = _run(site, chunks, state)
+    assert stats["unchanged"] == 6 and calls == []
+    assert again == chunks
+
+
+def test_state_for_missing_chunks_is_ignored(site):
+    chunks, _, state = _run(site, [], {})
+    kept = [c for c in chunks if c["url"] != site.url("/page-1")]
+    assert site.url("/page-1") not in sync_site.usable_state(state, kept)
+    refreshed, stats, _ = _run(site, kept, state)
+    assert (stats["new"], stats["unchanged"]) == (1, 5)
+    assert sorted(c["doc_id"] for c in refreshed) == sorted(c["doc_id"] for c in chunks)
+
+
+def test_fetches_run_concurrently():
+    site = _FixtureSite(latency=0.2)
+    site.pages = {f"/page-{i}": _page(f"Page {i}", f"topic {i}") for i in range(8)}
+    try:
+        start = time.perf_counter()
+        _run(site, [], {}, workers=8)
+        assert time.perf_counter() - start < 1.2  # Sequential would take 1.6s+
+        assert site.max_active > 1
+    finally:
+        site.close()
+
+
+def test_token_bucket_limits_rate_per_host():
+    limiter = sync_site.HostRateLimiter(20)
+    stamps = []
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire("http://a.example/x")
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stamps.sort()
+    # 20 requests at 20/s with a burst of 1: ~0.95s regardless of thread count
+    assert stamps[-1] - stamps[0] >= 0.85
+
+    start = time.monotonic()
+    limiter.acquire("http://b.example/")  # Another host has its own bucket
+    assert time.monotonic() - start < 0.05
+
+
+def test_save_output_only_rewrites_on_change(tmp_path):
+    out, meta = tmp_path / "corp.jsonl", tmp_path / "meta.json"
+    chunks = [{"doc_id": "a", "url": "u", "text": "t"}]
+    assert sync_site.save_output(chunks, {}, out, meta)
+    version = json.loads(meta.read_text())["version"]
+    mtime = out.stat().st_mtime_ns
+    assert not sync_site.save_output(list(chunks), {}, out, meta)
+    assert out.stat().st_mtime_ns == mtime
+    assert json.loads(meta.read_text())["version"] == version
+
+
+def _chunk(i, text):
+    return {"doc_id": f"d{i}", "title": f"T{i}", "heading": "H", "text": text}
+
+
+CORPUS = [
+    _chunk(i, f"assisted living memory care costs planning family advisor topic{i} " * 3) for i in range(20)
+]
+
+
+def test_index_reuses_unchanged_rows():
+    full = build_corp_index.build_index(CORPUS)
+    assert full["build"]["mode"] == "full"
+
+    changed = list(CORPUS)
+    changed[3] = _chunk(3, "veterans benefits aid and attendance pension planning " * 3)
+    del changed[7]
+    changed.append(_chunk(99, "home care hours per day caregiver support " * 3))
+
+    inc = build_corp_index.build_index(changed, previous=full)
+    assert inc["build"] == {"mode": "incremental", "rows_transformed": 2, "rows_reused": 18, "rows_removed": 2}
+    assert inc["vectorizer"] is full["vectorizer"]
+    assert inc["matrix"].shape == (20, full["matrix"].shape[1])
+    expected = full["vectorizer"].transform([build_corp_index.index_text(c) for c in changed])
+    assert abs(inc["matrix"] - expected).max() < 1e-12
+    assert inc["chunks"] == changed
+
+    # Too much churn refits the vocabulary
+    rewritten = [_chunk(i, f"completely different corpus words {i} " * 3) for i in range(20)]
+    assert build_corp_index.build_index(rewritten, previous=inc)["build"]["mode"] == "full"
@@ -0,0 +1,290 @@
+"""
+Tests for the shared TTS audio cache (shared/audio/audio_store.py),
+shared/audio/tts_client.synthesize / synthesize_stream against a local stub
+ElevenLabs server, and the progressive player (shared/audio/player.py).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from shared.audio import audio_store, player, tts_client
+from shared.audio.audio_store import AudioStore, audio_cache_key
+
+
+class _StubTTSServer:
+    """Minimal /v1/text-to-speech/<voice> server returning deterministic bytes."""
+
+    def __init__(self):
+        self.requests = []
+        self.status = 200
+        self.delays = {}  # text -> seconds
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server._lock:
+                    server.requests.append({"path": self.path, "key": self.headers.get("xi-api-key"), "body": body})
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                time.sleep(server.delays.get(body["text"], 0))
+                with server._lock:
+                    server.active -= 1
+                if server.status != 200:
+                    payload = b'{"detail": "error"}'
+                else:
+                    digest = hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()
+                    payload = b"ID3" + digest.encode()
+                self.send_response(server.status)
+                self.send_header("Content-Type", "audio/mpeg")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+
+
+CONFIG = {"api_key": "test-key", "voice_id": "voice-1", "stability": 0.5, "similarity": 0.93, "style": 0.15}
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    srv = _StubTTSServer()
+    store = AudioStore(root=tmp_path / "audio")
+    monkeypatch.setattr(tts_client, "API_BASE", srv.base_url)
+    monkeypatch.setattr(tts_client, "get_elevenlabs_config", lambda: dict(CONFIG))
+    monkeypatch.setattr(tts_client, "get_audio_store", lambda: store)
+    monkeypatch.setattr(tts_client, "MAX_RETRIES", 0)
+    srv.store = store
+    yield srv
+    srv.close()
+
+
+def test_synthesize_round_trip_and_cache(server):
+    audio = tts_client.synthesize("Hello **there**")
+    assert audio.startswith(b"ID3")
+    assert len(server.requests) == 1
+    request = server.requests[0]
+    assert request["path"] == "/v1/text-to-speech/voice-1?output_format=mp3_44100_128"
+    assert request["key"] == "test-key"
+    assert request["body"]["text"] == "Hello there"
+
+    # Markdown-only differences clean to the same text and share the clip
+    assert tts_client.synthesize("Hello *there*") == audio
+    assert len(server.requests) == 1
+
+
+def test_cache_is_shared_across_sessions(server, tmp_path, monkeypatch):
+    audio = tts_client.synthesize("Shared answer")
+    # A new process: fresh memory tier, same directory, no API key
+    fresh = AudioStore(root=tmp_path / "audio")
+    monkeypatch.setattr(tts_client, "get_audio_store", lambda: fresh)
+    monkeypatch.setattr(tts_client, "get_elevenlabs_config", lambda: {**CONFIG, "api_key": None})
+    assert tts_client.synthesize("Shared answer") == audio
+    assert fresh.stats()["disk_hits"] == 1
+    assert len(server.requests) == 1
+
+
+def test_key_covers_voice_and_settings(server, monkeypatch):
+    tts_client.synthesize("Same text")
+    tts_client.synthesize("Same text", voice_id="voice-2")
+    monkeypatch.setattr(tts_client, "get_elevenlabs_config", lambda: {**CONFIG, "stability": 0.9})
+    tts_client.synthesize("Same text")
+    assert len(server.requests) == 3
+    assert len({r["path"] + json.dumps(r["body"], sort_keys=True) for r in server.requests}) == 3
+
+
+def test_failures_are_not_cached(server):
+    server.status = 400
+    assert tts_client.synthesize("Bad request") is None
+    server.status = 200
+    assert tts_client.synthesize("Bad request") is not None
+    assert len(server.requests) == 2
+    assert tts_client.cached_audio("Bad request") is not None
+
+
+def test_cache_lookups_survive_config_errors(server, monkeypatch):
+    tts_client.synthesize("Configured answer")
+
+    def broken():
+        raise RuntimeError("secrets unavailable")
+
+    monkeypatch.setattr(tts_client, "get_elevenlabs_config", broken)
+    assert tts_client.cached_audio("Configured answer") is None
+    assert not tts_client.stream_is_cached("Configured answer")
+
+
+def _key(i):
+    return audio_cache_key(f"text {i}", "voice", "model", {}, "mp3")
+
+
+def test_disk_lru_eviction(tmp_path):
+    store = AudioStore(root=tmp_path, max_bytes=250, memory_entries=0)
+    for i in range(3):
+        store.put(_key(i), bytes(100))
+        path = store._path(_key(i))
+        os.utime(path, (1000 + i, 1000 + i))
+        store._index[_key(i)] = (1000 + i, 100)
+    # The oldest clip was evicted once the third pushed the total over 250 bytes
+    assert _key(0) not in store and _key(1) in store and _key(2) in store
+    assert store.stats()["evictions"] == 1
+
+    assert store.get(_key(1)) is not None  # Touch: now most recently used
+    store.put(_key(3), bytes(100))
+    assert _key(1) in store and _key(2) not in store
+    assert store.disk_bytes() <= 250
+
+
+def test_memory_tier_is_bounded(tmp_path):
+    store = AudioStore(root=None, memory_entries=2)
+    for i in range(3):
+        store.put(_key(i), b"x")
+    assert store.get(_key(0)) is None
+    assert store.get(_key(2)) == b"x"
+    assert store.stats()["memory_entries"] == 2
+
+
+def test_store_from_environment(tmp_path, monkeypatch):
+    audio_store.get_audio_store.cache_clear()
+    try:
+        monkeypatch.setenv("TTS_AUDIO_CACHE", "off")
+        assert audio_store.get_audio_store() is None
+        audio_store.get_audio_store.cache_clear()
+        monkeypatch.setenv("TTS_AUDIO_CACHE", "on")
+        monkeypatch.setenv("TTS_AUDIO_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("TTS_AUDIO_CACHE_MB", "1")
+        store = audio_store.get_audio_store()
+        assert store.root == tmp_path and store.max_bytes == 1024 * 1024
+    finally:
+        audio_store.get_audio_store.cache_clear()
+
+
+LONG_ANSWER = (
+    "Assisted living offers help with daily tasks in a residential setting. "
+    "Memory care adds secured spaces and staff trained for dementia. "
+    "Costs vary widely by region, so the Cost Planner uses your ZIP code. "
+    "Many families combine savings, VA benefits and long-term care insurance. "
+) * 8
+
+
+def test_split_for_speech():
+    chunks = tts_client.split_for_speech(
+        'Yes. He said "we should visit the community first." Then we went! It was lovely, really. Ok?'
+    )
+    # Short sentences merge forward (or into the last chunk); closing quotes stay with their sentence
+    assert chunks == ['Yes. He said "we should visit the community first."', "Then we went! It was lovely, really. Ok?"]
+
+    long_sentence = "word, " * 200 + "end."
+    chunks = tts_client.split_for_speech(long_sentence)
+    assert all(len(c) <= tts_client.CHUNK_MAX_CHARS for c in chunks)
+    assert " ".join(chunks).split() == long_sentence.split()
+
+    assert tts_client.split_for_speech(LONG_ANSWER) == tts_client.split_for_speech(LONG_ANSWER)
+    assert tts_client.split_for_speech("") == []
+
+
+def test_stream_yields_in_order_while_later_chunks_synthesize(server):
+    chunks = tts_client.split_for_speech(LONG_ANSWER[:300])
+    assert len(chunks) == 4
+    server.delays = {chunks[0]: 0.05, chunks[1]: 0.4, chunks[2]: 0.1, chunks[3]: 0.1}
+
+    start = time.perf_counter()
+    stream = tts_client.synthesize_stream(LONG_ANSWER[:300])
+    first = next(stream)
+    first_at = time.perf_counter() - start
+    rest = list(stream)
+    total = time.perf_counter() - start
+
+    assert first_at < 0.3 < total
+    assert [first, *rest] == [tts_client.synthesize(c) for c in chunks]  # In order, and now cached
+    assert server.max_active > 1
+    assert len(server.requests) == 4
+
+
+def test_stream_is_not_truncated_and_reuses_sentences(server):
+    assert len(LONG_ANSWER) > tts_client.MAX_TEXT_LENGTH
+    clips = list(tts_client.synthesize_stream(LONG_ANSWER))
+    assert all(clips)
+    chunks = tts_client.split_for_speech(LONG_ANSWER)
+    assert " ".join(chunks) == LONG_ANSWER.strip()
+    assert len(clips) == len(chunks)
+    # The answer repeats the same four sentences: each distinct chunk is synthesized once
+    assert sorted(r["body"]["text"] for r in server.requests) == sorted(set(chunks))
+
+    # Another answer sharing a sentence only synthesizes the new one
+    before = len(server.requests)
+    other = "Memory care adds secured spaces and staff trained for dementia. Call us today and we can help you plan."
+    list(tts_client.synthesize_stream(other))
+    assert len(server.requests) == before + 1
+    assert tts_client.stream_is_cached(LONG_ANSWER)
+
+
+def test_stream_marks_failed_chunks(server):
+    server.status = 500
+    text = "The first sentence is long enough to stand alone. The second sentence is long enough as well."
+    assert list(tts_client.synthesize_stream(text)) == [None, None]
+    assert not tts_client.stream_is_cached(text)
+
+
+def test_player_delivers_chunks_progressively(monkeypatch):
+    calls = []
+    monkeypatch.setattr(player, "_media_file_mgr", lambda: None)
+    monkeypatch.setattr(player, "_components_html", lambda: lambda body, height: calls.append((body, height)))
+
+    assert player.render_streaming_audio(iter([None, b"a", b"b"]), key="k1", autoplay=True) == 2
+    heights = [h for _, h in calls]
+    assert heights == [0, 54, 0, 0]  # Player appears with the first playable chunk
+    assert "started = true" in calls[1][0]
+    assert 'q.chunks[0] = "";' in calls[0][0]
+    assert "data:audio/mpeg;base64,YQ==" in calls[2][0]
+
+    calls.clear()
+    assert player.render_streaming_audio(iter([None]), key="k2") == 0
+    assert [h for _, h in calls] == [0]
+
+
+def test_player_serves_chunks_from_media_manager(monkeypatch):
+    added = []
+
+    class MediaFiles:
+        def add(self, data, mimetype, coordinates):
+            added.append((data, mimetype, coordinates))
+            return f"/media/{len(added)}.mp3"
+
+    monkeypatch.setattr(player, "_media_file_mgr", MediaFiles)
+    monkeypatch.setattr(player, "_base_url_path", lambda: "")
+    calls = []
+    monkeypatch.setattr(player, "_components_html", lambda: lambda body, height: calls.append(body if height == 0 else ""))
+
+    assert player.render_streaming_audio(iter([b"a", None, b"b"]), key="k3") == 2
+    assert added == [(b"a", "audio/mpeg", "cca-audio.k3.0"), (b"b", "audio/mpeg", "cca-audio.k3.2")]
+    assert 'q.chunks[0] = "/media/1.mp3";' in calls[1]
+    assert 'q.chunks[2] = "/media/2.mp3";' in calls[3]
+    assert not any("base64" in body for body in calls)
+
+
+def test_older_answers_play_as_one_clip(monkeypatch):
+    import streamlit as st
+
+    clips = []
+    monkeypatch.setattr(st, "audio", lambda data, format: clips.append((data, format)))
+    assert player.render_joined_audio(iter([b"a", None, b"b"])) == 2
+    assert player.render_joined_audio(iter([None])) == 0
+    assert clips == [(b"ab", "audio/mp3")]
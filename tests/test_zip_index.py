@@ -0,0 +1,111 @@
+"""
+Tests for the array-backed ZIP cost index
+(products/cost_planner_v2/utils/zip_index.py) and the lookups built on it.
+"""
+
+import pytest
+
+from products.cost_planner_v2.utils import zip_index
+from products.cost_planner_v2.utils.zip_index import ZipCostIndex, build_from_csv, get_zip_index
+
+CSV = """﻿ZipCode,MedianMonthlyCost,renter_monthly
+00601,154,90
+00602,175,-
+00603,234,110
+98101,2100,1800
+98103,1900,
+98105,-,1500
+10001,0,2000
+"""
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "monthly_median_cost.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def index(csv_path):
+    return build_from_csv(csv_path)
+
+
+class TestZipCostIndex:
+    def test_exact_lookup(self, index):
+        assert index.exact("00601") == 154.0
+        assert index.exact(98101) == 2100.0
+        assert index.exact("98101-1234") == 2100.0
+        assert index.exact("98102") is None
+
+    def test_non_numeric_and_non_positive_dropped(self, index):
+        assert index.exact("98105") is None
+        assert index.exact("10001") is None
+        assert index.exact("10001", "renter") == 2000.0
+        assert index.count("owner") == 5
+
+    def test_zip3_median(self, index):
+        assert index.zip3_median("00699") == 175.0
+        assert index.zip3_median("98199") == 2000.0
+        assert index.zip3_median("55555") is None
+
+    def test_lookup_falls_back_to_zip3(self, index):
+        assert index.lookup("00601") == (154.0, "exact")
+        assert index.lookup("98107") == (2000.0, "zip3")
+        assert index.lookup("abcde") is None
+
+    def test_as_dict_and_frame(self, index):
+        assert index.as_dict()["00603"] == 234.0
+        frame = index.to_frame()
+        assert set(frame["kind"]) == {"owner", "renter"}
+        assert frame["zip"].str.len().eq(5).all()
+
+
+class TestSidecar:
+    def test_roundtrip_and_stale_stamp(self, index, tmp_path):
+        path = tmp_path / "idx.npz"
+        index.save(path, (1, 2))
+        loaded = ZipCostIndex.load(path, (1, 2))
+        assert loaded.exact("98101") == 2100.0
+        assert loaded.zip3_median("00699") == 175.0
+        assert ZipCostIndex.load(path, (1, 3)) is None
+
+    def test_get_zip_index_rebuilds_when_csv_changes(self, csv_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(zip_index, "_INDEX", None)
+        sidecar = tmp_path / "side.npz"
+        first = get_zip_index(csv_path, sidecar)
+        assert sidecar.exists()
+        assert get_zip_index(csv_path, sidecar) is first
+
+        csv_path.write_text(CSV + "55555,999,\n", encoding="utf-8")
+        assert get_zip_index(csv_path, sidecar).exact("55555") == 999.0
+
+    def test_missing_csv_is_empty(self, tmp_path):
+        assert len(get_zip_index(tmp_path / "nope.csv", tmp_path / "side.npz")) == 0
+
+
+class TestCallers:
+    def test_lookup_zip(self, monkeypatch, index):
+        from products.cost_planner_v2.utils import home_costs
+
+        monkeypatch.setattr(home_costs, "get_zip_index", lambda: index)
+        assert home_costs.lookup_zip("98101")["confidence"] == 1.0
+        result = home_costs.lookup_zip("98109")
+        assert result["source"] == "ZIP3 bucket (981xx)"
+        assert result["amount"] == 2000.0
+        assert home_costs.lookup_zip("55555") is None
+
+    def test_lookup_home_cost(self, monkeypatch, index):
+        from products.cost_planner_v2 import data
+
+        monkeypatch.setattr(data, "get_zip_index", lambda: index)
+        assert data.lookup_home_cost("00602") == 175.0
+        assert data.lookup_home_cost(None) is None
+
+    def test_home_carry_effective_prefers_zip_cost(self, monkeypatch, index):
+        from products.cost_planner_v2 import comparison_calcs
+
+        monkeypatch.setattr(comparison_calcs, "get_zip_index", lambda: index)
+        assert comparison_calcs.get_home_carry_effective("98101") == 2100.0
+        # Explicit override still goes through regional scaling
+        assert comparison_calcs.get_home_carry_effective("98101", 3000.0) != 2100.0
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Headless GCP / hours batch evaluator
+
+Replays logged cases through the pure evaluation core
+(care_recommendation.evaluation, ai.hours_batch for weighted hours)
+across a process pool and reports throughput plus regressions against the
+deterministic results stored when each case was logged.
+
+- gcp_cases.jsonl:   replayed tier vs stored det_tier (+ confusion table)
+- hours_cases.jsonl: replayed weighted band vs stored base_band; rows logged
+                     before badls_list/iadls_list were captured only carry
+                     counts and are reported as not replayable
+- --synthetic N:     N random answer sets drawn from module.json (throughput)
+
+Usage:
+    python tools/batch_eval.py
+    python tools/batch_eval.py --synthetic 1000000 --workers 8
+    python tools/batch_eval.py --json --fail-on-regression
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+GCP_CASES = ROOT / "data" / "training" / "gcp_cases.jsonl"
+HOURS_CASES = ROOT / "data" / "training" / "hours_cases.jsonl"
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REGRESSION_EXAMPLES = 20
+
+
+# ====================================================================
+# LOADING
+# ====================================================================
+
+
+def load_jsonl(path: pathlib.Path) -> tuple[list[dict], int]:
+    """Load a JSONL file, skipping (and counting) malformed lines."""
+    if not path.exists():
+        return [], 0
+    rows, malformed = [], 0
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                malformed += 1
+                continue
+            if isinstance(row, dict):
+                rows.append(row)
+            else:
+                malformed += 1
+    return rows, malformed
+
+
+def normalize_gcp_case(row: dict) -> dict | None:
+    """Answers and stored tier from either gcp_cases.jsonl row format.
+
+    Older rows carry answers at the top level; newer rows nest them under
+    gcp_context. Stored flags are rendered outcome flags rather than the
+    flag IDs the gates read, so flags are re-derived from the answers.
+    Returns None for rows without answers.
+    """
+    context = row.get("gcp_context") or {}
+    answers = row.get("answers", context.get("answers"))
+    if not isinstance(answers, dict) or not answers:
+        return None
+    return {
+        "id": row.get("id"),
+        "answers": answers,
+        "expected": row.get("det_tier"),
+    }
+
+
+def normalize_hours_case(row: dict) -> dict | None:
+    """HoursContext fields from an hours_cases.jsonl row, or None if not replayable."""
+    if "badls_list" not in row or "iadls_list" not in row:
+        return None
+    fields = {
+        "badls_count": row.get("badls_count", len(row["badls_list"])),
+        "iadls_count": row.get("iadls_count", len(row["iadls_list"])),
+        "badls_list": row["badls_list"],
+        "iadls_list": row["iadls_list"],
+        "cognitive_level": row.get("cognitive_level"),
+    }
+    for key in ("falls", "mobility", "risky_behaviors", "meds_complexity",
+                "primary_support", "overnight_needed"):
+        if row.get(key) is not None:
+            fields[key] = row[key]
+    fields.update(row.get("behaviors") or {})
+    return {"context": fields, "expected": row.get("base_band")}
+
+
+def synthetic_answers(spec: dict, rng: random.Random) -> dict[str, Any]:
+    """Random answer set drawn from module.json options."""
+    answers = {}
+    for section in spec.get("sections", []):
+        for question in section.get("questions", []):
+            values = [o["value"] for o in question.get("options", []) if "value" in o]
+            if not values or rng.random() < 0.1:
+                continue
+            if question.get("select") == "multi":
+                answers[question["id"]] = rng.sample(values, rng.randint(0, len(values)))
+            else:
+                answers[question["id"]] = rng.choice(values)
+    return answers
+
+
+# ====================================================================
+# WORKERS (module-level so they pickle into the process pool)
+# ====================================================================
+
+
+def _evaluate_gcp_chunk(cases: list[dict], behavior_gate: bool) -> list[tuple[Any, str, str]]:
+    from products.gcp_v4.modules.care_recommendation.evaluation import evaluate_gcp
+
+    return [
+        (
+            case["id"],
+            case["expected"],
+            evaluate_gcp(case["answers"], behavior_gate=behavior_gate).tier,
+        )
+        for case in cases
+    ]
+
+
+def _evaluate_hours_chunk(cases: list[dict]) -> list[tuple[Any, str, str]]:
+    from ai.hours_batch import weighted_hours_batch
+    from ai.hours_schemas import HoursContext
+
+    valid, results = [], []
+    for index, case in enumerate(cases):
+        try:
+            HoursContext(**case["context"])
+        except Exception:
+            results.append((index, case["expected"], "invalid"))
+            continue
+        valid.append(index)
+    bands = weighted_hours_batch(cases[i]["context"] for i in valid).bands
+    results.extend((i, cases[i]["expected"], band) for i, band in zip(valid, bands, strict=True))
+    return sorted(results, key=lambda r: r[0])
+
+
+def _evaluate_synthetic_chunk(seed: int, count: int, behavior_gate: bool) -> Counter:
+    from products.gcp_v4.modules.care_recommendation.evaluation import evaluate_gcp, evaluate_hours
+    from products.gcp_v4.modules.care_recommendation.scoring_tables import get_scoring_model
+
+    spec = get_scoring_model().spec
+    rng = random.Random(seed)
+    tiers = Counter()
+    for _ in range(count):
+        answers = synthetic_answers(spec, rng)
+        result = evaluate_gcp(answers, behavior_gate=behavior_gate)
+        tiers[result.tier] += 1
+        tiers["hours:" + evaluate_hours(answers, result.flags)[0]] += 1
+    return tiers
+
+
+# ====================================================================
+# RUNNER
+# ====================================================================
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def run_chunks(fn, chunk_args: list[tuple], workers: int) -> list:
+    """Run fn(*args) for each chunk, in-process when workers <= 1."""
+    if workers <= 1 or len(chunk_args) <= 1:
+        return [fn(*args) for args in chunk_args]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *zip(*chunk_args, strict=True)))
+
+
+def _replay_report(name: str, results: list[tuple[Any, str, str]], elapsed: float, **extra) -> dict:
+    regressions = [
+        {"id": case_id, "stored": expected, "replayed": actual}
+        for case_id, expected, actual in results
+        if expected is not None and expected != actual
+    ]
+    confusion = Counter(f"{expected} -> {actual}" for _, expected, actual in results)
+    return {
+        "dataset": name,
+        "cases": len(results),
+        "seconds": round(elapsed, 3),
+        "cases_per_sec": round(len(results) / elapsed, 1) if elapsed > 0 else None,
+        "matches": len(results) - len(regressions),
+        "regressions": len(regressions),
+        "regression_examples": regressions[:MAX_REGRESSION_EXAMPLES],
+        "confusion": dict(sorted(confusion.items())),
+        **extra,
+    }
+
+
+def replay_gcp(path: pathlib.Path, workers: int, chunk_size: int, behavior_gate: bool) -> dict:
+    rows, malformed = load_jsonl(path)
+    cases = [c for c in (normalize_gcp_case(r) for r in rows) if c is not None]
+    start = time.perf_counter()
+    chunks = run_chunks(
+        _evaluate_gcp_chunk, [(chunk, behavior_gate) for chunk in _chunks(cases, chunk_size)], workers
+    )
+    elapsed = time.perf_counter() - start
+    results = [r for chunk in chunks for r in chunk]
+    return _replay_report(
+        "gcp", results, elapsed, malformed=malformed, skipped=len(rows) - len(cases)
+    )
+
+
+def replay_hours(path: pathlib.Path, workers: int, chunk_size: int) -> dict:
+    rows, malformed = load_jsonl(path)
+    cases = [c for c in (normalize_hours_case(r) for r in rows) if c is not None]
+    start = time.perf_counter()
+    chunks = run_chunks(_evaluate_hours_chunk, [(chunk,) for chunk in _chunks(cases, chunk_size)], workers)
+    elapsed = time.perf_counter() - start
+    results = []
+    for chunk_index, chunk in enumerate(chunks):
+        for index, expected, actual in chunk:
+            results.append((chunk_index * chunk_size + index, expected, actual))
+    return _replay_report(
+        "hours", results, elapsed, malformed=malformed, not_replayable=len(rows) - len(cases)
+    )
+
+
+def run_synthetic(n: int, workers: int, chunk_size: int, behavior_gate: bool, seed: int = 0) -> dict:
+    counts = [chunk_size] * (n // chunk_size) + ([n % chunk_size] if n % chunk_size else [])
+    start = time.perf_counter()
+    chunks = run_chunks(
+        _evaluate_synthetic_chunk,
+        [(seed + i, count, behavior_gate) for i, count in enumerate(counts)],
+        workers,
+    )
+    elapsed = time.perf_counter() - start
+    totals = Counter()
+    for chunk in chunks:
+        totals.update(chunk)
+    return {
+        "dataset": "synthetic",
+        "cases": n,
+        "seconds": round(elapsed, 3),
+        "cases_per_sec": round(n / elapsed, 1) if elapsed > 0 else None,
+        "tiers": {k: v for k, v in sorted(totals.items()) if not k.startswith("hours:")},
+        "hours_bands": {k[6:]: v for k, v in sorted(totals.items()) if k.startswith("hours:")},
+    }
+
+
+def _print_report(report: dict) -> None:
+    print("=" * 70)
+    print(f"{report['dataset'].upper()}: {report['cases']} cases in {report['seconds']}s "
+          f"({report['cases_per_sec']} cases/sec)")
+    print("=" * 70)
+    for key in ("malformed", "skipped", "not_replayable"):
+        if key in report:
+            print(f"{key.replace('_', ' ').capitalize()}: {report[key]}")
+    if "regressions" in report:
+        print(f"Matches:     {report['matches']}")
+        print(f"Regressions: {report['regressions']}")
+        for example in report["regression_examples"]:
+            print(f"  {example['id']}: stored={example['stored']} replayed={example['replayed']}")
+        print("\nstored -> replayed:")
+        for pair, count in report["confusion"].items():
+            print(f"  {pair:40s} {count}")
+    for key in ("tiers", "hours_bands"):
+        if key in report:
+            print(f"\n{key}:")
+            for name, count in report[key].items():
+                print(f"  {name:25s} {count}")
+    print()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay GCP/hours cases through the headless evaluation core.")
+    parser.add_argument("--gcp-cases", type=pathlib.Path, default=GCP_CASES)
+    parser.add_argument("--hours-cases", type=pathlib.Path, default=HOURS_CASES)
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="also evaluate N random answer sets")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--behavior-gate", action="store_true", help="replay with FEATURE_GCP_MC_BEHAVIOR_GATE on")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    chunk_size = max(1, args.chunk_size)
+    reports = [
+        replay_gcp(args.gcp_cases, args.workers, chunk_size, args.behavior_gate),
+        replay_hours(args.hours_cases, args.workers, chunk_size),
+    ]
+    if args.synthetic > 0:
+        reports.append(run_synthetic(args.synthetic, args.workers, chunk_size, args.behavior_gate))
+
+    if args.json:
+        print(json.dumps(reports, indent=2, default=str))
+    else:
+        for report in reports:
+            _print_report(report)
+
+    if args.fail_on_regression and any(r.get("regressions") for r in reports):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
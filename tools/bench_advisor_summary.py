@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Advisor summary drawer benchmark
+
+Times AdvisorSummaryEngine.generate_all_drawers for the example context
+against a local fake LLM (no network) that sleeps --latency seconds per
+call:
+
+- sequential: ADVISOR_SUMMARY_PARALLEL=off, the four calls one after another
+- parallel:   the four calls fanned out under one deadline
+- cached:     the same context again, served from the prompt cache
+
+Each run starts from an empty in-memory prompt cache (the shared SQLite
+tier is not touched), except the cached phase.
+
+Usage:
+    python tools/bench_advisor_summary.py
+    python tools/bench_advisor_summary.py --latency 1.5 --runs 5 --json
+"""
+
+import argparse
+import json
+import logging
+import pathlib
+import statistics
+import sys
+import threading
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_LATENCY = 0.8
+DEFAULT_RUNS = 3
+
+
+class FakeLLMClient:
+    """LLMClient stand-in: fixed latency, deterministic text, call counter."""
+
+    latency = DEFAULT_LATENCY
+    calls = 0
+    _lock = threading.Lock()
+
+    def generate_completion(self, system_prompt=None, user_prompt="", **kwargs):
+        with FakeLLMClient._lock:
+            FakeLLMClient.calls += 1
+        time.sleep(self.latency)
+        return f"Narrative ({len(user_prompt)} prompt chars)."
+
+
+def _time_all(engine, context, parallel: bool) -> float:
+    start = time.perf_counter()
+    drawers = engine.AdvisorSummaryEngine.generate_all_drawers(context, parallel=parallel)
+    elapsed = time.perf_counter() - start
+    assert set(drawers) == set(engine.DRAWER_TYPES)
+    return elapsed
+
+
+def benchmark(latency: float, runs: int) -> dict:
+    from ai import advisor_summary_engine as engine
+    from ai.advisor_summary_templates import EXAMPLE_CONTEXT
+    from ai.llm_cache import MemoryLRUBackend, PromptCache
+
+    cache = PromptCache(MemoryLRUBackend())
+    engine.LLMClient = FakeLLMClient
+    engine.get_prompt_cache = lambda: cache
+    FakeLLMClient.latency = latency
+
+    timings = {"sequential": [], "parallel": [], "cached": []}
+    for _ in range(runs):
+        for mode in ("sequential", "parallel"):
+            cache.clear()
+            timings[mode].append(_time_all(engine, EXAMPLE_CONTEXT, parallel=mode == "parallel"))
+        timings["cached"].append(_time_all(engine, EXAMPLE_CONTEXT, parallel=True))
+
+    report = {"latency_s": latency, "runs": runs, "llm_calls": FakeLLMClient.calls}
+    for mode, values in timings.items():
+        report[f"{mode}_s"] = round(statistics.median(values), 4)
+    report["speedup_parallel"] = round(report["sequential_s"] / max(report["parallel_s"], 1e-9), 2)
+    return report
+
+
+def _print_report(report: dict) -> None:
+    print(f"\n=== Advisor summary drawers: fake LLM {report['latency_s']}s/call (median of {report['runs']} runs) ===")
+    print(f"sequential {report['sequential_s']:>8.3f} s")
+    print(f"parallel   {report['parallel_s']:>8.3f} s")
+    print(f"cached     {report['cached_s']:>8.3f} s")
+    print(f"speedup    {report['speedup_parallel']:>8.1f}x (parallel vs sequential)")
+    print(f"llm calls  {report['llm_calls']:>8d}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs parallel advisor summary drawer generation.")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help="fake LLM seconds per call")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    report = benchmark(max(0.0, args.latency), max(1, args.runs))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for nav route loading
+
+Measures cold time-to-first-render and peak resident memory of a fresh
+process that builds the nav (core.nav.load_nav) and renders one route:
+
+- eager: every route's render module imported up front (the behaviour
+         before LazyRender; what load_nav used to do on every run)
+- lazy:  only the requested route is imported
+
+Each sample runs in its own interpreter so imports are cold. Rendering
+happens outside `streamlit run` (bare mode); render errors are counted but
+do not abort the run, since import cost dominates first paint.
+
+Usage:
+    python tools/bench_startup.py
+    python tools/bench_startup.py --route hub_lobby --runs 5 --json
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+DEFAULT_RUNS = 3
+
+# Executed in a fresh interpreter per sample: prints one JSON line
+_CHILD = r"""
+import json, resource, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from core.nav import load_nav
+pages = load_nav({{"auth": {{"role": "guest", "is_authenticated": False}}, "flags": {{}}}})
+errors = []
+if {eager!r}:
+    for key, page in pages.items():
+        try:
+            page["render"].resolve()
+        except Exception as e:
+            errors.append(f"{{key}}: {{type(e).__name__}}")
+nav_ms = (time.perf_counter() - start) * 1000
+render_error = None
+try:
+    pages[{route!r}]["render"]()
+except BaseException as e:
+    render_error = type(e).__name__
+print(json.dumps({{
+    "nav_ms": nav_ms,
+    "first_render_ms": (time.perf_counter() - start) * 1000,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": len(sys.modules),
+    "import_errors": errors,
+    "render_error": render_error,
+}}))
+"""
+
+
+def run_sample(route: str, eager: bool) -> dict:
+    code = _CHILD.format(root=str(ROOT), eager=eager, route=route)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=600
+    )
+    lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"benchmark child failed:\n{proc.stderr[-2000:]}")
+    return json.loads(lines[-1])
+
+
+def benchmark(route: str, runs: int) -> dict:
+    report = {"route": route, "runs": runs}
+    for mode in ("eager", "lazy"):
+        samples = [run_sample(route, mode == "eager") for _ in range(runs)]
+        report[mode] = {
+            "nav_ms": statistics.median(s["nav_ms"] for s in samples),
+            "first_render_ms": statistics.median(s["first_render_ms"] for s in samples),
+            "max_rss_mb": statistics.median(s["max_rss_mb"] for s in samples),
+            "modules": samples[-1]["modules"],
+            "import_errors": samples[-1]["import_errors"],
+            "render_error": samples[-1]["render_error"],
+        }
+    return report
+
+
+def _print_report(report: dict) -> None:
+    print(f"\n=== Startup: route={report['route']} (median of {report['runs']} cold runs) ===")
+    print(f"{'':8} {'nav ms':>10} {'first render ms':>16} {'max RSS MB':>11} {'modules':>8}")
+    for mode in ("eager", "lazy"):
+        r = report[mode]
+        print(f"{mode:8} {r['nav_ms']:>10.0f} {r['first_render_ms']:>16.0f} {r['max_rss_mb']:>11.1f} {r['modules']:>8}")
+    eager, lazy = report["eager"], report["lazy"]
+    print(
+        f"lazy saves {eager['first_render_ms'] - lazy['first_render_ms']:.0f} ms "
+        f"and {eager['max_rss_mb'] - lazy['max_rss_mb']:.1f} MB"
+    )
+    if eager["import_errors"]:
+        print(f"routes failing to import: {', '.join(eager['import_errors'])}")
+    if lazy["render_error"]:
+        print(f"render outside streamlit run raised {lazy['render_error']} (timing still valid)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold time-to-first-render with eager vs lazy route imports.")
+    parser.add_argument("--route", default="welcome", help="nav key to render")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = benchmark(args.route, max(1, args.runs))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Lobby tile render benchmark
+
+Times the hub_lobby tile grid (tiles built with their state, then rendered
+through core.base_hub.render_dashboard_body, as hub_lobby.render does) over
+repeated reruns:
+
+- uncached: FEATURE_TILE_RENDER_CACHE off and requirement strings re-parsed
+            every rerun (the behaviour before the render cache)
+- cached:   steady-state reruns with nothing changed
+- one edit: reruns where one tile's progress changes each time
+
+Rendering happens outside `streamlit run` (bare mode). tile.rendered events
+go to a temporary log file rather than data/events.log.
+
+Usage:
+    python tools/bench_tiles.py
+    python tools/bench_tiles.py --tiles 40 --reruns 200 --json
+"""
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_TILES = 24
+DEFAULT_RERUNS = 100
+
+PHASES = ("discovery", "planning", "engagement", "completed")
+REQUIREMENTS = (
+    [],
+    ["gcp:complete"],
+    ["gcp:complete", "cost:>=50"],
+    ["flag:fall_risk|memory_support"],
+    ["care_tier:assisted_living"],
+    ["auth:required"],
+)
+
+STATE = {
+    "gcp": {"progress": 100, "care_tier": "assisted_living", "flags": {"fall_risk": True}},
+    "cost": {"progress": 40},
+    "pfma": {"progress": 0},
+    "auth": {"is_authenticated": False},
+}
+
+
+def build_tiles(count: int, state: dict, bump: int | None = None) -> list:
+    """Lobby-style tiles: varied phases, progress, badges and unlock rules."""
+    from core.product_tile import ProductTileHub, tile_requirements_satisfied
+
+    tiles = []
+    for i in range(count):
+        requires = REQUIREMENTS[i % len(REQUIREMENTS)]
+        progress = (i * 17) % 101
+        if bump is not None and i == 0:
+            progress = bump
+        unlocked = tile_requirements_satisfied(requires, state)
+        tiles.append(
+            ProductTileHub(
+                key=f"tile_{i}",
+                title=f"Planning tool {i}",
+                desc="Compare care options and costs for your situation.",
+                blurb="Answer a few questions and we'll tailor the next steps to you.",
+                primary_route=f"?page=tool_{i}",
+                secondary_label="Learn more" if i % 3 == 0 else None,
+                secondary_route=f"?page=faq&topic={i}",
+                progress=progress,
+                variant=("brand", "teal", "violet")[i % 3],
+                order=10 + i,
+                phase=PHASES[i % len(PHASES)],
+                locked=not unlocked,
+                lock_msg="Finish your Guided Care Plan first." if not unlocked else None,
+                unlock_requires=requires,
+                badges=[{"label": "New", "tone": "success"}] if i % 4 == 0 else [],
+                meta_lines=["≈10 min", "Saves automatically"],
+                recommended_order=i + 1 if i < 3 else None,
+                recommended_total=3 if i < 3 else None,
+                is_next_step=i == 1,
+            )
+        )
+    return tiles
+
+
+def _rerun(count: int, bump: int | None = None) -> float:
+    from core.base_hub import render_dashboard_body
+
+    start = time.perf_counter()
+    render_dashboard_body(title="", cards=build_tiles(count, STATE, bump), additional_services=[])
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark(count: int, reruns: int) -> dict:
+    from core import product_tile
+
+    product_tile.clear_tile_cache()
+    os.environ["FEATURE_TILE_RENDER_CACHE"] = "off"
+    uncached = []
+    for _ in range(reruns):
+        product_tile.compile_requirement.cache_clear()
+        uncached.append(_rerun(count))
+
+    os.environ["FEATURE_TILE_RENDER_CACHE"] = "on"
+    _rerun(count)  # Fill the cache
+    cached = [_rerun(count) for _ in range(reruns)]
+    edited = [_rerun(count, bump=i % 100) for i in range(reruns)]
+
+    return {
+        "tiles": count,
+        "reruns": reruns,
+        "uncached_ms": statistics.median(uncached),
+        "cached_ms": statistics.median(cached),
+        "one_edit_ms": statistics.median(edited),
+        "cache": product_tile.tile_cache_stats(),
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(f"\n=== Lobby tile grid: {report['tiles']} tiles (median of {report['reruns']} reruns) ===")
+    print(f"uncached   {report['uncached_ms']:>8.2f} ms")
+    print(f"cached     {report['cached_ms']:>8.2f} ms")
+    print(f"one edit   {report['one_edit_ms']:>8.2f} ms")
+    print(f"speedup    {report['uncached_ms'] / max(report['cached_ms'], 1e-9):>8.1f}x")
+    print(f"cache      {report['cache']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark lobby tile rendering with and without the render cache.")
+    parser.add_argument("--tiles", type=int, default=DEFAULT_TILES)
+    parser.add_argument("--reruns", type=int, default=DEFAULT_RERUNS)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["APP_EVENT_LOG"] = os.path.join(tmp, "events.log")
+        report = benchmark(max(1, args.tiles), max(1, args.reruns))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
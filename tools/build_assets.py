@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Image asset build step
+
+Generates resized WebP (and optionally AVIF) variants of assets/images/*
+with content-hashed filenames under static/img/, plus static/img/manifest.json
+mapping each source image to its variants. core.ui.img_src() reads the
+manifest and emits static URLs (Streamlit static serving) instead of
+base64-inlining the source PNG into every page render.
+
+Images at or under --inline-max bytes are skipped and stay base64-inlined
+(one fewer request beats a few KB). Unchanged sources are not re-encoded;
+byte-identical sources share one set of variants.
+
+Requires Pillow (build-time only; not needed to run the app).
+
+Usage:
+    python tools/build_assets.py
+    python tools/build_assets.py --avif --quality 78
+    python tools/build_assets.py --report          # per-page payload before/after
+"""
+
+import argparse
+import base64
+import hashlib
+import importlib.util
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SOURCE_DIR = ROOT / "assets" / "images"
+OUTPUT_DIR = ROOT / "static" / "img"
+MANIFEST = OUTPUT_DIR / "manifest.json"
+
+SOURCE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+WIDTHS = (480, 800, 1200)
+DEFAULT_QUALITY = 80
+INLINE_MAX_BYTES = 24 * 1024
+
+# Images each page renders through img_src/safe_img_src/static_url
+PAGE_IMAGES = {
+    "welcome": [
+        "assets/images/logos/cca_logo.png",
+        "assets/images/hero.png",
+        "assets/images/welcome_someone_else.png",
+        "assets/images/welcome_self.png",
+        "assets/images/contextual_someone_else.png",
+    ],
+    "audience (someone)": ["assets/images/logos/cca_logo.png", "assets/images/tell_us_about_them.png"],
+    "audience (self)": ["assets/images/logos/cca_logo.png", "assets/images/tell_us_about_you.png"],
+    "stubs.render_welcome": [
+        "assets/images/logos/cca_logo.png",
+        "assets/images/hero.png",
+        "assets/images/welcome_someone_else.png",
+        "assets/images/welcome_self.png",
+    ],
+}
+
+
+def _sha1(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _encode(image, width: int, fmt: str, quality: int) -> bytes:
+    import io
+
+    from PIL import Image
+
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    options = {"quality": quality}
+    if fmt == "WEBP":
+        options["method"] = 6
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def build_asset(source: pathlib.Path, formats: list[str], quality: int) -> dict:
+    """Write the variants of one source image; returns its manifest entry."""
+    from PIL import Image
+
+    data = source.read_bytes()
+    with Image.open(source) as opened:
+        image = opened.convert("RGBA" if opened.mode in ("RGBA", "LA", "P") else "RGB")
+
+    widths = sorted({min(w, image.width) for w in WIDTHS})
+    variants: dict[str, dict[str, str]] = {}
+    for fmt in formats:
+        ext = fmt.lower()
+        variants[ext] = {}
+        for width in widths:
+            encoded = _encode(image, width, fmt, quality)
+            name = f"{source.stem}.{width}.{_sha1(encoded)[:10]}.{ext}"
+            target = OUTPUT_DIR / name
+            if not target.exists():
+                target.write_bytes(encoded)
+            variants[ext][str(width)] = f"img/{name}"
+    return {
+        "sha1": _sha1(data),
+        "bytes": len(data),
+        "width": image.width,
+        "height": image.height,
+        "variants": variants,
+    }
+
+
+def build(formats: list[str], quality: int, inline_max: int, force: bool = False) -> dict:
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    previous = {}
+    if MANIFEST.exists():
+        previous = json.loads(MANIFEST.read_text(encoding="utf-8")).get("assets", {})
+
+    assets = {}
+    by_sha1: dict[str, dict] = {}
+    built = reused = 0
+    for source in sorted(SOURCE_DIR.rglob("*")):
+        if source.suffix.lower() not in SOURCE_SUFFIXES or source.stat().st_size <= inline_max:
+            continue
+        rel = source.relative_to(ROOT).as_posix()
+        sha1 = _sha1(source.read_bytes())
+        if sha1 in by_sha1:
+            # Byte-identical copy of an image already built: share its variants
+            assets[rel] = by_sha1[sha1]
+            reused += 1
+            continue
+        entry = previous.get(rel)
+        if (
+            not force
+            and entry
+            and entry["sha1"] == sha1
+            and set(entry["variants"]) == {f.lower() for f in formats}
+            and all((OUTPUT_DIR.parent / p).exists() for v in entry["variants"].values() for p in v.values())
+        ):
+            assets[rel] = by_sha1[sha1] = entry
+            reused += 1
+            continue
+        assets[rel] = by_sha1[sha1] = build_asset(source, formats, quality)
+        built += 1
+        print(f"[ASSETS] {rel}: {len(assets[rel]['variants'])} format(s) × {len(next(iter(assets[rel]['variants'].values())))} width(s)")
+
+    # Drop variants no manifest entry references any more
+    referenced = {p for e in assets.values() for v in e["variants"].values() for p in v.values()}
+    for stale in OUTPUT_DIR.iterdir():
+        if stale.name != MANIFEST.name and f"img/{stale.name}" not in referenced:
+            stale.unlink()
+
+    manifest = {"version": 1, "widths": list(WIDTHS), "assets": assets}
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"[ASSETS] {built} built, {reused} unchanged → {MANIFEST.relative_to(ROOT)}")
+    return manifest
+
+
+def payload_report(manifest: dict) -> list[dict]:
+    """Bytes sent per page render (inline HTML) and per first load (HTML + image fetches)."""
+    assets = manifest.get("assets", {})
+    rows = []
+    for page, images in PAGE_IMAGES.items():
+        before = after_html = after_fetch = 0
+        for rel in images:
+            path = ROOT / rel
+            if not path.exists():
+                continue
+            inline = len(base64.b64encode(path.read_bytes())) + len("data:image/png;base64,")
+            before += inline
+            entry = assets.get(rel)
+            if entry is None:
+                after_html += inline
+                continue
+            variants = entry["variants"].get("webp") or next(iter(entry["variants"].values()))
+            largest = variants[max(variants, key=int)]
+            after_html += len(f"app/static/{largest}?v={entry['sha1'][:10]}")
+            after_fetch += (OUTPUT_DIR.parent / largest).stat().st_size
+        rows.append({"page": page, "before": before, "after_html": after_html, "after_fetch": after_fetch})
+    return rows
+
+
+def _print_report(rows: list[dict]) -> None:
+    print(f"\n{'page':24} {'before (inline)':>16} {'after (html)':>13} {'after (fetched, cacheable)':>27}")
+    for r in rows:
+        print(f"{r['page']:24} {r['before'] / 1024:>13.0f} KB {r['after_html'] / 1024:>10.1f} KB {r['after_fetch'] / 1024:>24.0f} KB")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build resized, content-hashed image variants and their manifest.")
+    parser.add_argument("--avif", action="store_true", help="also emit AVIF variants (needs Pillow with AVIF support)")
+    parser.add_argument("--quality", type=int, default=DEFAULT_QUALITY)
+    parser.add_argument("--inline-max", type=int, default=INLINE_MAX_BYTES, help="keep images this small base64-inlined")
+    parser.add_argument("--force", action="store_true", help="re-encode unchanged sources")
+    parser.add_argument("--report", action="store_true", help="print per-page payload before/after")
+    args = parser.parse_args(argv)
+
+    if importlib.util.find_spec("PIL") is None:
+        print("[ASSETS] Pillow is required: pip install pillow", file=sys.stderr)
+        return 1
+
+    formats = ["WEBP"] + (["AVIF"] if args.avif else [])
+    manifest = build(formats, args.quality, args.inline_max, force=args.force)
+    if args.report:
+        _print_report(payload_report(manifest))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,22 +4,48 @@ Build and save RAG corpus index for fast loading.
 
 Creates a pre-built TF-IDF index from config/corp_knowledge.jsonl
 and saves it to config/corp_index.pkl for instant loading at runtime.
+
+Incremental: each index row is keyed by a hash of the text it was built
+from (title + heading + text). When an index already exists, rows whose
+text is unchanged are reused, rows for removed chunks are dropped, and only
+new/changed chunks are transformed with the existing vectorizer. The
+vocabulary and IDF weights are refit from scratch (full rebuild) when more
+than --refit-ratio of the rows changed, or with --full.
+
+Usage:
+    python tools/build_corp_index.py
+    python tools/build_corp_index.py --full
 """
 from __future__ import annotations
+import argparse
+import hashlib
 import json
 import pickle
 from pathlib import Path
 from datetime import datetime
+from typing import Any
 
-def main():
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    
-    corpus_path = Path("config/corp_knowledge.jsonl")
-    index_path = Path("config/corp_index.pkl")
-    
-    print(f"[RAG_BUILD] Loading corpus from {corpus_path}")
-    
-    # Load all chunks
+CORPUS_PATH = Path("config/corp_knowledge.jsonl")
+INDEX_PATH = Path("config/corp_index.pkl")
+
+# Above this fraction of new/changed rows the vocabulary is refit
+DEFAULT_REFIT_RATIO = 0.25
+
+
+def index_text(chunk: dict[str, Any]) -> str:
+    """Text a chunk is indexed by."""
+    # Combine title, heading/section, and text for better matching
+    title = chunk.get("title", "")
+    heading = chunk.get("heading") or chunk.get("section", "")
+    text = chunk.get("text", "")
+    return f"{title} {heading} {text}"
+
+
+def row_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def load_chunks(corpus_path: Path = CORPUS_PATH) -> list[dict[str, Any]]:
     chunks = []
     with corpus_path.open("r", encoding="utf-8") as f:
         for line in f:
@@ -29,51 +55,127 @@ def main():
             except Exception as e:
                 print(f"[RAG_BUILD] WARNING: Failed to parse line: {e}")
                 continue
-    
-    print(f"[RAG_BUILD] Loaded {len(chunks)} chunks")
-    
-    # Build TF-IDF index
-    print("[RAG_BUILD] Building TF-IDF index...")
-    texts = []
-    for c in chunks:
-        # Combine title, heading/section, and text for better matching
-        title = c.get("title", "")
-        heading = c.get("heading") or c.get("section", "")
-        text = c.get("text", "")
-        combined = f"{title} {heading} {text}"
-        texts.append(combined)
-    
-    vectorizer = TfidfVectorizer(stop_words="english", max_features=500)
-    X = vectorizer.fit_transform(texts)
-    
-    # Save index
-    index_data = {
+    return chunks
+
+
+def load_index(index_path: Path = INDEX_PATH) -> dict[str, Any] | None:
+    """Previous index, if it exists and carries row hashes (incremental-capable)."""
+    if not index_path.exists():
+        return None
+    try:
+        with index_path.open("rb") as f:
+            data = pickle.load(f)
+    except Exception as e:
+        print(f"[RAG_BUILD] WARNING: Could not read previous index ({e}); full rebuild")
+        return None
+    if not data.get("row_hashes") or data["matrix"].shape[0] != len(data["row_hashes"]):
+        return None
+    return data
+
+
+def build_index(
+    chunks: list[dict[str, Any]],
+    previous: dict[str, Any] | None = None,
+    refit_ratio: float = DEFAULT_REFIT_RATIO,
+) -> dict[str, Any]:
+    """Index data for chunks, reusing previous rows where the text is unchanged."""
+    from scipy.sparse import vstack
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    texts = [index_text(c) for c in chunks]
+    hashes = [row_hash(t) for t in texts]
+
+    old_rows: dict[str, int] = {}
+    if previous is not None:
+        old_rows = {h: i for i, h in enumerate(previous["row_hashes"])}
+    stale = [i for i, h in enumerate(hashes) if h not in old_rows]
+
+    if previous is not None and chunks and len(stale) <= refit_ratio * len(chunks):
+        vectorizer = previous["vectorizer"]
+        old_matrix = previous["matrix"].tocsr()
+        if stale:
+            fresh = vectorizer.transform([texts[i] for i in stale])
+            combined = vstack([old_matrix, fresh]).tocsr()
+        else:
+            combined = old_matrix
+        fresh_row = {i: old_matrix.shape[0] + n for n, i in enumerate(stale)}
+        order = [fresh_row[i] if i in fresh_row else old_rows[h] for i, h in enumerate(hashes)]
+        X = combined[order]
+        mode = "incremental"
+    else:
+        vectorizer = TfidfVectorizer(stop_words="english", max_features=500)
+        X = vectorizer.fit_transform(texts)
+        stale = list(range(len(chunks)))
+        mode = "full"
+
+    return {
         "vectorizer": vectorizer,
         "matrix": X,
         "chunks": chunks,
+        "row_hashes": hashes,
         "built_at": datetime.utcnow().isoformat() + "Z",
-        "chunk_count": len(chunks)
+        "chunk_count": len(chunks),
+        "build": {
+            "mode": mode,
+            "rows_transformed": len(stale),
+            "rows_reused": len(chunks) - len(stale),
+            "rows_removed": len(set(old_rows) - set(hashes)),
+        },
     }
-    
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build config/corp_index.pkl from config/corp_knowledge.jsonl.")
+    parser.add_argument("--full", action="store_true", help="refit the vectorizer on the whole corpus")
+    parser.add_argument(
+        "--refit-ratio",
+        type=float,
+        default=DEFAULT_REFIT_RATIO,
+        help="refit when more than this fraction of rows changed (default 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    corpus_path = CORPUS_PATH
+    index_path = INDEX_PATH
+
+    print(f"[RAG_BUILD] Loading corpus from {corpus_path}")
+
+    # Load all chunks
+    chunks = load_chunks(corpus_path)
+    print(f"[RAG_BUILD] Loaded {len(chunks)} chunks")
+
+    # Build TF-IDF index
+    previous = None if args.full else load_index(index_path)
+    print("[RAG_BUILD] Building TF-IDF index" + (" (incremental)..." if previous else "..."))
+    index_data = build_index(chunks, previous, args.refit_ratio)
+    build = index_data["build"]
+    print(
+        f"[RAG_BUILD] Mode: {build['mode']} | transformed {build['rows_transformed']} | "
+        f"reused {build['rows_reused']} | removed {build['rows_removed']}"
+    )
+
     print(f"[RAG_BUILD] Saving index to {index_path}")
-    with index_path.open("wb") as f:
+    tmp_path = index_path.with_suffix(".pkl.tmp")
+    with tmp_path.open("wb") as f:
         pickle.dump(index_data, f, protocol=pickle.HIGHEST_PROTOCOL)
-    
+    tmp_path.replace(index_path)
+
     file_size = index_path.stat().st_size / (1024 * 1024)  # MB
     print(f"[RAG_BUILD] ✅ Index built successfully")
     print(f"[RAG_BUILD] Chunks: {len(chunks)}")
     print(f"[RAG_BUILD] Size: {file_size:.2f} MB")
     print(f"[RAG_BUILD] Output: {index_path}")
-    
+
     # Show source breakdown
     sources = {}
     for c in chunks:
         src = c.get("source", c.get("type", "unknown"))
         sources[src] = sources.get(src, 0) + 1
-    
+
     print("\n[RAG_BUILD] Source breakdown:")
     for src, count in sorted(sources.items(), key=lambda x: -x[1]):
         print(f"  {src}: {count} chunks")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Config registry report
+
+Warms core.config_registry (config/*.json, config/*/*.json and every
+products/*/modules/**.json) and lists, per file, the parse + validate time,
+the size on disk and the size of the frozen in-memory structure. Files that
+fail to parse or validate are reported and make the exit status non-zero.
+
+Usage:
+    python tools/config_report.py
+    python tools/config_report.py --json
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def build_report() -> dict:
+    from core.config_registry import REGISTRY, config_report
+
+    REGISTRY.clear()
+    start = time.perf_counter()
+    paths = REGISTRY.discover()
+    loaded = REGISTRY.warm(paths)
+    total_ms = (time.perf_counter() - start) * 1000
+    rows = config_report()
+    return {
+        "configs": loaded,
+        "failed": len(paths) - loaded,
+        "warm_ms": total_ms,
+        "file_bytes": sum(r["file_bytes"] for r in rows),
+        "memory_bytes": sum(r["memory_bytes"] for r in rows),
+        "files": rows,
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(f"\n=== Config registry: {report['configs']} files warmed in {report['warm_ms']:.1f} ms ===")
+    print(f"{'load ms':>8}  {'file KB':>8}  {'memory KB':>9}  path")
+    for row in report["files"]:
+        print(
+            f"{row['load_ms']:>8.2f}  {row['file_bytes'] / 1024:>8.1f}  "
+            f"{row['memory_bytes'] / 1024:>9.1f}  {row['path']}"
+        )
+    print(f"{'':>8}  {report['file_bytes'] / 1024:>8.1f}  {report['memory_bytes'] / 1024:>9.1f}  total")
+    if report["failed"]:
+        print(f"\n{report['failed']} file(s) failed to load (see [CONFIG] messages above)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Parse every JSON config once and report load time and memory.")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = build_report()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
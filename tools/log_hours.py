@@ -9,6 +9,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# HoursContext boolean behavior fields (logged only when set)
+BEHAVIOR_FIELDS = (
+    "wandering",
+    "aggression",
+    "sundowning",
+    "repetitive_questions",
+    "elopement",
+    "confusion",
+    "judgment",
+    "hoarding",
+    "sleep",
+)
 
 def log_hours_case(
     context: Any,
@@ -53,6 +65,13 @@ def log_hours_case(
             "meds_complexity": getattr(context, "meds_complexity", None),
             "primary_support": getattr(context, "primary_support", None),
             "overnight_needed": getattr(context, "overnight_needed", False),
+            # Full inputs so tools/batch_eval.py can replay the weighted baseline
+            "badls_list": list(getattr(context, "badls_list", []) or []),
+            "iadls_list": list(getattr(context, "iadls_list", []) or []),
+            "cognitive_level": getattr(context, "cognitive_level", None),
+            "behaviors": {
+                name: True for name in BEHAVIOR_FIELDS if getattr(context, name, False)
+            },
             "user_band": getattr(context, "current_hours", None),
             "base_band": base_band,
             "llm_band": llm_band,
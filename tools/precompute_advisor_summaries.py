@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Precompute CRM advisor summaries
+
+Walks the Navigator customers the CRM lists, builds each one's
+AdvisorSummaryContext from the persisted user document (no Streamlit
+session), and stores the four advisor summary drawers plus the Smart
+Timeline insights and events in shared.data_access.advisor_summary_store.
+Customer 360 and Smart Timeline then read finished text.
+
+Incremental: a customer is skipped while its stored record was built from
+the same assessment hash of the user document. Records where a drawer fell
+back to static text are retried on the next run. The insights and timeline
+events are relative to today and the customer's last activity; when only
+those moved on, they are refreshed without regenerating the drawers.
+Customers run on a worker pool; LLM calls are rate limited by a shared
+token bucket (--rate calls/s). Drawers are generated through the prompt
+cache, and only drawers missing from it take a token, so a rerun after a
+format bump only pays for contexts it has not seen.
+
+Run it on a schedule (e.g. every few minutes from cron).
+
+Usage:
+    python tools/precompute_advisor_summaries.py
+    python tools/precompute_advisor_summaries.py --workers 8 --rate 4 --json
+    python tools/precompute_advisor_summaries.py --customer demo_mary_memory_care --force
+"""
+
+import argparse
+import json
+import logging
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 2.0  # LLM calls per second across all workers
+STATUSES = ("generated", "partial", "refreshed", "current", "missing", "failed")
+
+
+def _timeline_fields(customer: dict) -> dict:
+    """Smart Timeline insights and events, with the as-of key they depend on."""
+    from apps.crm.pages.smart_timeline import (
+        compute_ai_insights,
+        generate_smart_timeline,
+        timeline_as_of,
+    )
+
+    return {
+        "as_of": timeline_as_of(customer),
+        "insights": compute_ai_insights(customer),
+        "timeline": generate_smart_timeline(customer),
+    }
+
+
+def precompute_customer(user_id: str, reader, store, limiter, force: bool = False) -> dict:
+    """Generate and store one customer's summaries unless they are current."""
+    from ai.advisor_summary_engine import DRAWER_TYPES, AdvisorSummaryEngine
+    from apps.crm.pages.smart_timeline import timeline_as_of
+    from shared.data_access.advisor_summary_store import SUMMARY_FORMAT_VERSION, assessment_hash
+
+    user_doc = reader.get_customer_raw_data(user_id)
+    if not user_doc:
+        return {"user_id": user_id, "status": "missing"}
+
+    customer = reader.get_customer_by_id(user_id) or {}
+    digest = assessment_hash(user_doc)
+    if not force and store.is_current(user_id, digest):
+        record = store.get(user_id)
+        if record.get("as_of") == timeline_as_of(customer):
+            return {"user_id": user_id, "status": "current"}
+        # Drawers still match the assessment; only the date-relative parts moved on
+        store.put(user_id, {**record, **_timeline_fields(customer)})
+        return {"user_id": user_id, "status": "refreshed"}
+
+    context = AdvisorSummaryEngine.build_advisor_context_from_user(user_doc)
+    if context is None:
+        return {"user_id": user_id, "status": "failed"}
+
+    start = time.perf_counter()
+    # Drawers already in the prompt cache cost no LLM call
+    for _ in AdvisorSummaryEngine.uncached_drawers(context):
+        limiter.acquire()
+    drawers = AdvisorSummaryEngine.generate_all_drawers(context, parallel=True)
+    fallbacks = [d for d in DRAWER_TYPES if drawers[d] == AdvisorSummaryEngine.fallback_narrative(d, context)]
+
+    store.put(user_id, {
+        "user_id": user_id,
+        "assessment_hash": digest,
+        "format_version": SUMMARY_FORMAT_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "complete": not fallbacks,
+        "fallback_drawers": fallbacks,
+        "drawers": drawers,
+        **_timeline_fields(customer),
+    })
+    return {
+        "user_id": user_id,
+        "status": "partial" if fallbacks else "generated",
+        "seconds": round(time.perf_counter() - start, 2),
+    }
+
+
+def precompute(
+    user_ids: list[str] | None = None,
+    workers: int = DEFAULT_WORKERS,
+    rate: float = DEFAULT_RATE,
+    force: bool = False,
+    data_root: str = "data",
+) -> dict:
+    from core.rate_limit import TokenBucket
+    from shared.data_access.advisor_summary_store import AdvisorSummaryStore
+    from shared.data_access.navigator_reader import NavigatorDataReader
+
+    reader = NavigatorDataReader(data_root)
+    store = AdvisorSummaryStore(data_root)
+    limiter = TokenBucket(rate)
+    if user_ids is None:
+        user_ids = [c["user_id"] for c in reader.get_all_customers()]
+
+    def run(user_id: str) -> dict:
+        try:
+            return precompute_customer(user_id, reader, store, limiter, force)
+        except Exception as e:
+            print(f"[ADVISOR_PRECOMPUTE] {user_id} failed: {e}")
+            return {"user_id": user_id, "status": "failed"}
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        customers = list(pool.map(run, user_ids))
+
+    counts = dict.fromkeys(STATUSES, 0)
+    for item in customers:
+        counts[item["status"]] += 1
+    return {
+        "customers": len(customers),
+        **counts,
+        "seconds": round(time.perf_counter() - start, 2),
+        "results": customers,
+    }
+
+
+def _print_report(result: dict) -> None:
+    print(f"\n=== Advisor summaries: {result['customers']} customers in {result['seconds']:.1f}s ===")
+    for status in STATUSES:
+        print(f"{status:<10}{result[status]}")
+    for item in result["results"]:
+        if item["status"] in ("partial", "failed", "missing"):
+            print(f"  {item['status']:<9} {item['user_id']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute CRM advisor summary drawers and timeline insights.")
+    parser.add_argument("--customer", action="append", dest="customers", help="only this user id (repeatable)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="customers processed at once")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="LLM calls per second (default 2)")
+    parser.add_argument("--force", action="store_true", help="regenerate even if the assessment hash is unchanged")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    result = precompute(args.customers, args.workers, args.rate, args.force)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        _print_report(result)
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
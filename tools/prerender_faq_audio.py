@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Pre-render FAQ answer audio
+
+Synthesizes every config/faq.json answer through
+shared.audio.tts_client.synthesize_stream (the sentence chunks the FAQ
+page plays), so the clips land in the shared audio cache
+(TTS_AUDIO_CACHE_DIR, default .cache/tts_audio) before any user asks.
+Answers whose chunks are all cached already are skipped without calling
+the API. Uses the same voice and settings as the app (ELEVENLABS_* /
+AUDIO_* configuration).
+
+Usage:
+    python tools/prerender_faq_audio.py
+    python tools/prerender_faq_audio.py --dry-run
+    python tools/prerender_faq_audio.py --workers 8 --json
+"""
+
+import argparse
+import json
+import logging
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_WORKERS = 4
+
+
+def faq_answers() -> list[tuple[str, str]]:
+    """(faq id, answer text) for every FAQ with an answer."""
+    from core.config_registry import get_config
+
+    return [(item["id"], item["answer"]) for item in get_config("faq.json") if item.get("answer")]
+
+
+def prerender(answers: list[tuple[str, str]], workers: int, dry_run: bool = False) -> dict:
+    from shared.audio.audio_store import get_audio_store
+    from shared.audio.tts_client import stream_is_cached, synthesize_stream
+
+    if get_audio_store() is None:
+        raise SystemExit("TTS_AUDIO_CACHE=off: nothing to pre-render into")
+
+    missing = [(faq_id, text) for faq_id, text in answers if not stream_is_cached(text)]
+    result = {
+        "answers": len(answers),
+        "cached": len(answers) - len(missing),
+        "rendered": 0,
+        "failed": [],
+        "seconds": 0.0,
+    }
+    if dry_run or not missing:
+        result["missing"] = [faq_id for faq_id, _ in missing]
+        return result
+
+    from core.config import validate_elevenlabs_config
+
+    ok, message = validate_elevenlabs_config()
+    if not ok:
+        raise SystemExit(f"{message} ({len(missing)} answers not cached)")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        clips = list(pool.map(lambda item: list(synthesize_stream(item[1])), missing))
+    result["seconds"] = round(time.perf_counter() - start, 2)
+    for (faq_id, _), audio in zip(missing, clips, strict=True):
+        if audio and all(audio):
+            result["rendered"] += 1
+        else:
+            result["failed"].append(faq_id)
+    result["store"] = get_audio_store().stats()
+    return result
+
+
+def _print_report(result: dict, dry_run: bool) -> None:
+    print(f"\n=== FAQ audio: {result['answers']} answers, {result['cached']} already cached ===")
+    if dry_run:
+        for faq_id in result.get("missing", []):
+            print(f"missing   {faq_id}")
+        return
+    print(f"rendered  {result['rendered']} in {result['seconds']:.1f}s")
+    for faq_id in result["failed"]:
+        print(f"failed    {faq_id}")
+    if "store" in result:
+        print(f"store     {result['store']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Synthesize all FAQ answers into the shared TTS audio cache.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="answers rendered at once (each streams its chunks concurrently)")
+    parser.add_argument("--dry-run", action="store_true", help="only report which answers are not cached yet")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    result = prerender(faq_answers(), args.workers, dry_run=args.dry_run)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        _print_report(result, args.dry_run)
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
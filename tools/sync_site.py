@@ -4,15 +4,34 @@
 Crawls conciergecareadvisors.com per policy, extracts text sections,
 saves to config/corp_knowledge.jsonl for FAQ/AI Advisor grounding.
 
+Crawling is concurrent and incremental:
+- Pages are fetched by a bounded thread pool (--workers) sharing one pooled
+  session; a per-host token bucket keeps each host at rate_limit_per_sec.
+- config/corp_knowledge.state.json keeps ETag / Last-Modified and a content
+  hash per URL. Requests are conditional (304 = unchanged), and a 200 whose
+  body hashes the same is not re-extracted or re-chunked.
+- Only chunks of new/changed pages are replaced in corp_knowledge.jsonl;
+  chunks from other sources (va.gov, alz.org syncs) are left untouched, and
+  the file is only rewritten when something changed.
+
 Usage:
     python tools/sync_site.py
+    python tools/sync_site.py --workers 4 --full
     make sync-site
 """
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import sys
+import tempfile
+import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,12 +40,24 @@ from urllib.robotparser import RobotFileParser
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.rate_limit import TokenBucket  # noqa: E402
 
 # Paths
 CONFIG_DIR = Path(__file__).parent.parent / "config"
 POLICY_PATH = CONFIG_DIR / "crawl_policy.json"
 OUTPUT_PATH = CONFIG_DIR / "corp_knowledge.jsonl"
 META_PATH = CONFIG_DIR / "corp_knowledge.meta.json"
+STATE_PATH = CONFIG_DIR / "corp_knowledge.state.json"
+
+USER_AGENT = "CCA-SnapshotBot/1.0 (+https://www.conciergecareadvisors.com)"
+DEFAULT_WORKERS = 8
+REQUEST_TIMEOUT = 10
 
 
 def load_policy() -> dict[str, Any]:
@@ -40,16 +71,44 @@ def matches_pattern(url: str, patterns: list[str]) -> bool:
     return any(re.search(pat, url) for pat in patterns)
 
 
-def fetch_sitemap(root: str) -> list[str]:
+# ==============================================================================
+# HTTP: POOLED SESSION + PER-HOST RATE LIMIT
+# ==============================================================================
+class HostRateLimiter:
+    """One TokenBucket per host, so concurrency never exceeds the policy rate per site."""
+
+    def __init__(self, rate_per_sec: float):
+        self.rate = rate_per_sec
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.setdefault(host, TokenBucket(self.rate))
+        bucket.acquire()
+
+
+def make_session(workers: int = DEFAULT_WORKERS) -> requests.Session:
+    """Keep-alive session with a connection pool sized for the worker count."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, workers))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+def fetch_sitemap(root: str, session: requests.Session | None = None) -> list[str]:
     """Fetch sitemap.xml and extract URLs. Try multiple sitemap locations."""
     sitemap_candidates = ["/sitemap.xml", "/sitemap_index.xml"]
-    headers = {"User-Agent": "CCA-SnapshotBot/1.0 (+https://www.conciergecareadvisors.com)"}
+    session = session or make_session(1)
     
     for sitemap_path in sitemap_candidates:
         sitemap_url = urljoin(root, sitemap_path)
         try:
             print(f"  Trying {sitemap_url}...")
-            resp = requests.get(sitemap_url, timeout=10, headers=headers)
+            resp = session.get(sitemap_url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
             
             # Parse with xml.etree
@@ -83,7 +142,7 @@ def fetch_sitemap(root: str) -> list[str]:
                 for child_sitemap in sitemap_locs[:10]:  # Limit to 10 child sitemaps
                     try:
                         print(f"    Fetching child sitemap: {child_sitemap}")
-                        child_resp = requests.get(child_sitemap, timeout=10, headers=headers)
+                        child_resp = session.get(child_sitemap, timeout=REQUEST_TIMEOUT)
                         child_resp.raise_for_status()
                         child_root = ET.fromstring(child_resp.content)
                         
@@ -120,10 +179,17 @@ def check_robots(root: str) -> RobotFileParser:
     return rp
 
 
-def bfs_fallback(root: str, policy: dict[str, Any], robots: RobotFileParser | None) -> list[str]:
+def bfs_fallback(
+    root: str,
+    policy: dict[str, Any],
+    robots: RobotFileParser | None,
+    session: requests.Session | None = None,
+    limiter: HostRateLimiter | None = None,
+) -> list[str]:
     """Fallback BFS crawl from root if sitemap fails."""
     print("⚠ Starting BFS fallback from root URL")
-    headers = {"User-Agent": "CCA-SnapshotBot/1.0 (+https://www.conciergecareadvisors.com)"}
+    session = session or make_session(1)
+    limiter = limiter or HostRateLimiter(policy.get("rate_limit_per_sec", 2))
     
     allow = policy.get("allow", [])
     exclude = policy.get("exclude", [])
@@ -153,9 +219,10 @@ def bfs_fallback(root: str, policy: dict[str, Any], robots: RobotFileParser | No
         discovered_urls.append(url)
         print(f"  BFS discovered [{len(discovered_urls)}]: {url} (depth={depth})")
         
-        # Fetch and extract links
+        # Fetch and extract links (rate limited per host)
         try:
-            resp = requests.get(url, timeout=10, headers=headers)
+            limiter.acquire(url)
+            resp = session.get(url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
             soup = BeautifulSoup(resp.text, "html.parser")
             
@@ -174,9 +241,6 @@ def bfs_fallback(root: str, policy: dict[str, Any], robots: RobotFileParser | No
         
         except Exception as e:
             print(f"    ⚠ BFS fetch failed: {e}")
-        
-        # Rate limit
-        time.sleep(0.5)
     
     print(f"✓ BFS discovered {len(discovered_urls)} URLs")
     return discovered_urls
@@ -329,46 +393,155 @@ def extract_text_sections(html: str, url: str) -> list[dict[str, Any]]:
     ]
 
 
-def crawl(policy: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Crawl site per policy, return chunks and metadata."""
+# ==============================================================================
+# INCREMENTAL CRAWL
+# ==============================================================================
+@dataclass
+class PageResult:
+    """Outcome of fetching one URL."""
+
+    url: str
+    status: str  # "new" | "changed" | "unchanged" | "skipped" | "failed"
+    chunks: list[dict[str, Any]] = field(default_factory=list)
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    reason: str = ""
+
+    def state(self, chunks: int) -> dict[str, Any]:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
+            "chunks": chunks,
+        }
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def page_chunks(url: str, html: str, min_chars: int) -> list[dict[str, Any]]:
+    """Extract and chunk one page (sections shorter than min_chars are dropped)."""
+    # Extract sections (now includes type and hygiene filtering)
+    sections = extract_text_sections(html, url)
+
+    # Sections are already filtered by hygiene rules (200-1800 chars)
+    # Just need to check min_chars policy (though hygiene already enforces 200 minimum)
+    valid_sections = []
+    for sec in sections:
+        combined = sec["heading"] + " " + sec["text"]
+        # Note: min_chars from policy, but hygiene already enforces >= 200
+        if len(combined) >= max(200, min_chars):
+            valid_sections.append(sec)
+
+    # Create chunks
+    fetched = _now()
+    doc_id_base = urlparse(url).path.strip("/").replace("/", "_") or "home"
+    return [
+        {
+            "doc_id": f"{doc_id_base}_{j}",
+            "url": url,
+            "title": sec["title"],
+            "heading": sec["heading"],
+            "text": sec["text"],
+            "type": sec["type"],  # about, leadership, services, or blog
+            "last_fetched": fetched,
+            "tags": _extract_tags(url, sec["heading"]),
+        }
+        for j, sec in enumerate(valid_sections)
+    ]
+
+
+def fetch_page(
+    session: requests.Session,
+    limiter: HostRateLimiter,
+    url: str,
+    previous: dict[str, Any] | None,
+    max_bytes: int,
+    min_chars: int,
+) -> PageResult:
+    """Conditional GET of one page; only re-extracts when the content changed."""
+    previous = previous or {}
+    headers = {}
+    if previous.get("etag"):
+        headers["If-None-Match"] = previous["etag"]
+    if previous.get("last_modified"):
+        headers["If-Modified-Since"] = previous["last_modified"]
+
+    try:
+        limiter.acquire(url)
+        resp = session.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
+        if resp.status_code == 304:
+            return PageResult(
+                url,
+                "unchanged",
+                etag=previous.get("etag"),
+                last_modified=previous.get("last_modified"),
+                content_hash=previous.get("content_hash"),
+                reason="304",
+            )
+        resp.raise_for_status()
+    except Exception as e:
+        return PageResult(url, "failed", reason=str(e))
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+
+    # Check size
+    if len(resp.content) > max_bytes:
+        return PageResult(url, "skipped", reason=f"too large ({len(resp.content)} bytes)")
+
+    content_hash = hashlib.sha256(resp.content).hexdigest()
+    if previous.get("content_hash") == content_hash:
+        return PageResult(url, "unchanged", etag=etag, last_modified=last_modified, content_hash=content_hash)
+
+    chunks = page_chunks(url, resp.text, min_chars)
+    if not chunks:
+        # Remember the hash so an unchanged empty page is not re-parsed next run
+        return PageResult(
+            url, "skipped", etag=etag, last_modified=last_modified, content_hash=content_hash, reason="no valid text sections"
+        )
+    return PageResult(
+        url,
+        "changed" if previous else "new",
+        chunks=chunks,
+        etag=etag,
+        last_modified=last_modified,
+        content_hash=content_hash,
+    )
+
+
+def discover_urls(
+    policy: dict[str, Any],
+    session: requests.Session,
+    limiter: HostRateLimiter,
+) -> list[str]:
+    """Sitemap (or BFS fallback) URLs that pass allow/exclude/robots, capped at max_pages."""
     root = policy["root"]
-    use_sitemap = policy.get("use_sitemap", True)
     allow = policy.get("allow", [])
     exclude = policy.get("exclude", [])
     max_pages = policy.get("max_pages", 200)
-    rate_limit = policy.get("rate_limit_per_sec", 2)
-    max_bytes = policy.get("max_bytes_per_page", 300000)
-    min_chars = policy.get("min_text_chars", 400)
-    respect_robots = policy.get("respect_robots", True)
-    
-    headers = {"User-Agent": "CCA-SnapshotBot/1.0 (+https://www.conciergecareadvisors.com)"}
 
     # Load robots.txt
-    robots = check_robots(root) if respect_robots else None
+    robots = check_robots(root) if policy.get("respect_robots", True) else None
 
     # Collect URLs
     candidate_urls = []
-    if use_sitemap:
-        candidate_urls = fetch_sitemap(root)
-    
+    if policy.get("use_sitemap", True):
+        candidate_urls = fetch_sitemap(root, session)
+
     # Fallback to BFS if sitemap failed
     if not candidate_urls:
-        candidate_urls = bfs_fallback(root, policy, robots)
-    
-    if not candidate_urls:
-        print("✗ No URLs discovered - check your allow patterns or site availability")
-        return [], {
-            "total_urls": 0,
-            "success": 0,
-            "failed": 0,
-            "skipped": 0,
-            "total_chunks": 0,
-            "crawled_at": datetime.utcnow().isoformat() + "Z",
-        }
+        candidate_urls = bfs_fallback(root, policy, robots, session, limiter)
 
     # Filter URLs (already done in BFS, but sitemap URLs need filtering)
     allowed_urls = []
+    seen = set()
     for url in candidate_urls:
+        if url in seen:
+            continue
+        seen.add(url)
         if exclude and matches_pattern(url, exclude):
             continue
         if allow and not matches_pattern(url, allow):
@@ -378,77 +551,122 @@ def crawl(policy: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str, Any]]
             continue
         allowed_urls.append(url)
 
-    allowed_urls = allowed_urls[:max_pages]
-    print(f"✓ {len(allowed_urls)} URLs to crawl (after filtering)")
+    return allowed_urls[:max_pages]
 
-    # Crawl
-    chunks = []
+
+def crawl(
+    policy: dict[str, Any],
+    state: dict[str, dict[str, Any]] | None = None,
+    workers: int = DEFAULT_WORKERS,
+) -> tuple[list[PageResult], dict[str, Any]]:
+    """Crawl site per policy, return per-URL results (in URL order) and metadata.
+
+    Args:
+        policy: Crawl policy (config/crawl_policy.json)
+        state: Per-URL ETag/Last-Modified/content hash from the previous run
+        workers: Concurrent fetches (the per-host rate limit still applies)
+    """
+    state = state or {}
+    rate_limit = policy.get("rate_limit_per_sec", 2)
+    max_bytes = policy.get("max_bytes_per_page", 300000)
+    min_chars = policy.get("min_text_chars", 400)
+
+    session = make_session(workers)
+    limiter = HostRateLimiter(rate_limit)
+    started = time.perf_counter()
+
+    allowed_urls = discover_urls(policy, session, limiter)
     stats = {
         "total_urls": len(allowed_urls),
         "success": 0,
         "failed": 0,
         "skipped": 0,
+        "new": 0,
+        "changed": 0,
+        "unchanged": 0,
         "total_chunks": 0,
-        "crawled_at": datetime.utcnow().isoformat() + "Z",
+        "workers": workers,
+        "crawled_at": _now(),
     }
+    if not allowed_urls:
+        print("✗ No URLs discovered - check your allow patterns or site availability")
+        return [], stats
 
-    for i, url in enumerate(allowed_urls, 1):
-        print(f"[{i}/{len(allowed_urls)}] Fetching {url}")
+    print(f"✓ {len(allowed_urls)} URLs to crawl (after filtering), {workers} workers, {rate_limit}/s per host")
 
-        try:
-            resp = requests.get(url, timeout=10, headers=headers)
-            resp.raise_for_status()
+    def fetch(url: str) -> PageResult:
+        result = fetch_page(session, limiter, url, state.get(url), max_bytes, min_chars)
+        label = {"new": "✓", "changed": "✓", "unchanged": "=", "skipped": "⊘", "failed": "✗"}[result.status]
+        detail = f"{len(result.chunks)} sections" if result.chunks else result.reason
+        print(f"  {label} {result.status:<9} {url} {detail}".rstrip())
+        return result
 
-            # Check size
-            if len(resp.content) > max_bytes:
-                print(f"  ⊘ Too large ({len(resp.content)} bytes)")
-                stats["skipped"] += 1
-                continue
-
-            # Extract sections (now includes type and hygiene filtering)
-            sections = extract_text_sections(resp.text, url)
-
-            # Sections are already filtered by hygiene rules (200-1800 chars)
-            # Just need to check min_chars policy (though hygiene already enforces 200 minimum)
-            valid_sections = []
-            for sec in sections:
-                combined = sec["heading"] + " " + sec["text"]
-                # Note: min_chars from policy, but hygiene already enforces >= 200
-                if len(combined) >= max(200, min_chars):
-                    valid_sections.append(sec)
-
-            if not valid_sections:
-                print(f"  ⊘ No valid text sections")
-                stats["skipped"] += 1
-                continue
-
-            # Create chunks
-            doc_id_base = urlparse(url).path.strip("/").replace("/", "_") or "home"
-            for j, sec in enumerate(valid_sections):
-                chunk = {
-                    "doc_id": f"{doc_id_base}_{j}",
-                    "url": url,
-                    "title": sec["title"],
-                    "heading": sec["heading"],
-                    "text": sec["text"],
-                    "type": sec["type"],  # about, leadership, services, or blog
-                    "last_fetched": datetime.utcnow().isoformat() + "Z",
-                    "tags": _extract_tags(url, sec["heading"]),
-                }
-                chunks.append(chunk)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="crawl") as pool:
+        results = list(pool.map(fetch, allowed_urls))
 
+    for result in results:
+        if result.status in ("new", "changed", "unchanged"):
             stats["success"] += 1
-            stats["total_chunks"] += len(valid_sections)
-            print(f"  ✓ Extracted {len(valid_sections)} sections")
+            if result.status != "unchanged":
+                stats[result.status] += 1
+                stats["total_chunks"] += len(result.chunks)
+            else:
+                stats["unchanged"] += 1
+        else:
+            stats[result.status] += 1
+    stats["seconds"] = round(time.perf_counter() - started, 2)
+    return results, stats
+
+
+def same_site(url: str, root: str) -> bool:
+    """Whether url is on the crawled site (www. ignored)."""
+    def host(u: str) -> str:
+        netloc = urlparse(u).netloc.lower()
+        return netloc[4:] if netloc.startswith("www.") else netloc
+
+    return host(url) == host(root)
+
+
+def merge_chunks(
+    existing: list[dict[str, Any]],
+    results: list[PageResult],
+    root: str,
+) -> list[dict[str, Any]]:
+    """New corpus: fresh chunks for new/changed pages, previous chunks for the rest.
+
+    Site pages are written in crawl order. Pages that failed this run keep
+    their previous chunks; site pages no longer listed are dropped. Chunks
+    from other sources (other hosts, e.g. the va.gov / alz.org syncs) are
+    kept as-is after the site chunks.
+    """
+    previous: dict[str, list[dict[str, Any]]] = {}
+    others = []
+    for chunk in existing:
+        url = chunk.get("url", "")
+        if same_site(url, root):
+            previous.setdefault(url, []).append(chunk)
+        else:
+            others.append(chunk)
 
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-            stats["failed"] += 1
+    merged = []
+    for result in results:
+        if result.status in ("new", "changed"):
+            merged.extend(result.chunks)
+        elif result.status in ("unchanged", "failed"):
+            merged.extend(previous.get(result.url, []))
+    return merged + others
 
-        # Rate limiting
-        time.sleep(1.0 / rate_limit)
 
-    return chunks, stats
+def usable_state(state: dict[str, dict[str, Any]], existing: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """State entries that still match the corpus on disk.
+
+    If corp_knowledge.jsonl was replaced (e.g. pulled from git) and no
+    longer holds the chunks a URL had, that URL is fetched unconditionally.
+    """
+    counts: dict[str, int] = {}
+    for chunk in existing:
+        counts[chunk.get("url", "")] = counts.get(chunk.get("url", ""), 0) + 1
+    return {url: entry for url, entry in state.items() if counts.get(url, 0) == entry.get("chunks", 0)}
 
 
 def _extract_tags(url: str, heading: str) -> list[str]:
@@ -480,27 +698,98 @@ def _extract_tags(url: str, heading: str) -> list[str]:
     return list(set(tags)) or ["general"]
 
 
-def save_output(chunks: list[dict[str, Any]], stats: dict[str, Any]) -> None:
-    """Save chunks to JSONL and stats to meta.json with versioning."""
-    # Save chunks
-    with open(OUTPUT_PATH, "w") as f:
-        for chunk in chunks:
-            f.write(json.dumps(chunk) + "\n")
+def load_existing_chunks(path: Path = OUTPUT_PATH) -> list[dict[str, Any]]:
+    """Chunks currently in corp_knowledge.jsonl (all sources)."""
+    if not path.exists():
+        return []
+    chunks = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    chunks.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return chunks
 
-    print(f"✓ Saved {len(chunks)} chunks to {OUTPUT_PATH}")
 
-    # Add version for cache busting
-    stats["version"] = int(time.time())
-    
+def load_state(path: Path = STATE_PATH) -> dict[str, dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("pages", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def save_state(results: list[PageResult], chunks: list[dict[str, Any]], path: Path = STATE_PATH) -> None:
+    """Per-URL validators, content hashes and chunk counts for the next incremental run."""
+    counts: dict[str, int] = {}
+    for chunk in chunks:
+        counts[chunk.get("url", "")] = counts.get(chunk.get("url", ""), 0) + 1
+    pages = {r.url: r.state(counts.get(r.url, 0)) for r in results if r.content_hash}
+    _write_atomic(path, json.dumps({"saved_at": _now(), "pages": pages}, indent=2) + "\n")
+
+
+def save_output(
+    chunks: list[dict[str, Any]],
+    stats: dict[str, Any],
+    output_path: Path = OUTPUT_PATH,
+    meta_path: Path = META_PATH,
+) -> bool:
+    """Save chunks to JSONL (only if changed) and stats to meta.json with versioning.
+
+    Returns:
+        True if corp_knowledge.jsonl was rewritten
+    """
+    text = "".join(json.dumps(chunk) + "\n" for chunk in chunks)
+    try:
+        current = output_path.read_text(encoding="utf-8")
+    except OSError:
+        current = None
+
+    previous_version = None
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            previous_version = json.load(f).get("version")
+    except (OSError, ValueError):
+        pass
+
+    changed = text != current
+    if changed:
+        _write_atomic(output_path, text)
+        print(f"✓ Saved {len(chunks)} chunks to {output_path}")
+    else:
+        print(f"✓ {output_path} unchanged ({len(chunks)} chunks)")
+
+    # Add version for cache busting (only bumped when the corpus changed)
+    stats["version"] = int(time.time()) if changed or previous_version is None else previous_version
+    stats["corpus_chunks"] = len(chunks)
+
     # Save metadata
-    with open(META_PATH, "w") as f:
-        json.dump(stats, f, indent=2)
+    _write_atomic(meta_path, json.dumps(stats, indent=2))
 
-    print(f"✓ Saved metadata to {META_PATH} (version: {stats['version']})")
+    print(f"✓ Saved metadata to {meta_path} (version: {stats['version']})")
+    return changed
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Crawl the CCA site into config/corp_knowledge.jsonl.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="concurrent page fetches")
+    parser.add_argument("--full", action="store_true", help="ignore saved ETags/hashes and re-extract every page")
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("Site Snapshot Crawler")
     print("=" * 60)
@@ -509,22 +798,39 @@ def main():
     policy = load_policy()
     print(f"✓ Loaded policy from {POLICY_PATH}")
 
+    existing = load_existing_chunks()
+    state = {} if args.full else usable_state(load_state(), existing)
+    print(f"✓ {len(existing)} existing chunks, {len(state)} pages with saved validators")
+
     # Crawl
-    chunks, stats = crawl(policy)
+    results, stats = crawl(policy, state, workers=max(1, args.workers))
+    if not results:
+        print("✗ Nothing crawled - leaving corp_knowledge.jsonl as is")
+        return 1
 
     # Save
+    chunks = merge_chunks(existing, results, policy["root"])
+    stats["removed_urls"] = sorted(
+        {c["url"] for c in existing if same_site(c.get("url", ""), policy["root"])}
+        - {c["url"] for c in chunks}
+    )
     save_output(chunks, stats)
+    save_state(results, chunks)
 
     # Summary
     print("\n" + "=" * 60)
     print("Summary:")
     print(f"  Total URLs: {stats['total_urls']}")
-    print(f"  Success: {stats['success']}")
+    print(f"  Success: {stats['success']} (new {stats['new']}, changed {stats['changed']}, unchanged {stats['unchanged']})")
     print(f"  Failed: {stats['failed']}")
     print(f"  Skipped: {stats['skipped']}")
-    print(f"  Total chunks: {stats['total_chunks']}")
+    print(f"  Re-extracted chunks: {stats['total_chunks']}")
+    print(f"  Removed pages: {len(stats['removed_urls'])}")
+    print(f"  Time: {stats['seconds']}s")
     print("=" * 60)
+    print("Run tools/build_corp_index.py to update the prebuilt index.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())